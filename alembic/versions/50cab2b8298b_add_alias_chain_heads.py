@@ -0,0 +1,55 @@
+"""add alias chain heads
+
+Revision ID: 50cab2b8298b
+Revises: 0cde04133f8e
+Create Date: 2026-10-18 16:40:12.208113
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "50cab2b8298b"
+down_revision: Union[str, None] = "0cde04133f8e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alias_chain_heads",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("alias_normalized", sa.Text(), nullable=False),
+        sa.Column("current_hash", sa.String(length=64), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("tenant_id", "alias_normalized"),
+    )
+
+    # Backfill: una cabeza por cadena existente con su último hash y largo
+    op.execute(
+        """
+        INSERT INTO alias_chain_heads (tenant_id, alias_normalized, current_hash, seq)
+        SELECT DISTINCT ON (tenant_id, alias_normalized)
+            tenant_id,
+            alias_normalized,
+            current_hash,
+            COUNT(*) OVER (PARTITION BY tenant_id, alias_normalized)
+        FROM alias_events
+        ORDER BY tenant_id, alias_normalized, timestamp DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("alias_chain_heads")
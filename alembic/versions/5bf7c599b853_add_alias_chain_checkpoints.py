@@ -0,0 +1,41 @@
+"""add alias chain checkpoints
+
+Revision ID: 5bf7c599b853
+Revises: e1d56eba9ff0
+Create Date: 2026-10-18 17:32:09.114726
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5bf7c599b853"
+down_revision: Union[str, None] = "e1d56eba9ff0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alias_chain_checkpoints",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("alias_normalized", sa.Text(), nullable=False),
+        sa.Column("last_verified_seq", sa.BigInteger(), nullable=False),
+        sa.Column("last_verified_hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "verified_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("tenant_id", "alias_normalized"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("alias_chain_checkpoints")
@@ -0,0 +1,87 @@
+"""add worm merkle seals
+
+Revision ID: 9a3e6c1f2b47
+Revises: 5bf7c599b853
+Create Date: 2026-10-18 18:10:27.604331
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a3e6c1f2b47"
+down_revision: Union[str, None] = "5bf7c599b853"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rango por timestamp para las hojas del día (reemplaza cast(timestamp, Date))
+    op.create_index(
+        "ix_alias_events_timestamp", "alias_events", ["timestamp"], unique=False
+    )
+
+    op.create_table(
+        "worm_merkle_leaves",
+        sa.Column("seal_date", sa.Date(), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("leaf_index", sa.BigInteger(), nullable=False),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("leaf_hash", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("seal_date", "tenant_id", "leaf_index"),
+        sa.UniqueConstraint("event_id"),
+    )
+    op.create_table(
+        "worm_merkle_nodes",
+        sa.Column("seal_date", sa.Date(), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("level", sa.SmallInteger(), nullable=False),
+        sa.Column("node_index", sa.BigInteger(), nullable=False),
+        sa.Column("node_hash", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("seal_date", "tenant_id", "level", "node_index"),
+    )
+    op.create_table(
+        "worm_daily_seals",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("seal_date", sa.Date(), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("tenant_id_hash", sa.String(length=16), nullable=True),
+        sa.Column("root_hash", sa.String(length=64), nullable=False),
+        sa.Column("leaf_count", sa.BigInteger(), nullable=False),
+        sa.Column("signature", sa.Text(), nullable=False),
+        sa.Column(
+            "sealed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_worm_daily_seals_tenant_day",
+        "worm_daily_seals",
+        ["seal_date", "tenant_id"],
+        unique=True,
+        postgresql_where=sa.text("tenant_id IS NOT NULL"),
+    )
+    op.create_index(
+        "uq_worm_daily_seals_global_day",
+        "worm_daily_seals",
+        ["seal_date"],
+        unique=True,
+        postgresql_where=sa.text("tenant_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_worm_daily_seals_global_day", table_name="worm_daily_seals")
+    op.drop_index("uq_worm_daily_seals_tenant_day", table_name="worm_daily_seals")
+    op.drop_table("worm_daily_seals")
+    op.drop_table("worm_merkle_nodes")
+    op.drop_table("worm_merkle_leaves")
+    op.drop_index("ix_alias_events_timestamp", table_name="alias_events")
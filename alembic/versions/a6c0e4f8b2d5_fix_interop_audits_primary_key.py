@@ -0,0 +1,43 @@
+"""fix interop audits primary key
+
+Revision ID: a6c0e4f8b2d5
+Revises: f3a8c2d9e6b1
+Create Date: 2026-10-18 21:12:44.903518
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c0e4f8b2d5"
+down_revision: Union[str, None] = "f3a8c2d9e6b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bases creadas desde el modelo tenían PK (id, alias_normalized) y un
+    # índice único por alias: una consulta repetida chocaba. Una fila por
+    # consulta, identificada solo por id.
+    op.execute("DROP INDEX IF EXISTS idx_interop_audit_unique")
+    op.execute(
+        "ALTER TABLE interop_audits DROP CONSTRAINT IF EXISTS interop_audits_pkey"
+    )
+    op.execute(
+        "ALTER TABLE interop_audits ADD CONSTRAINT interop_audits_pkey PRIMARY KEY (id)"
+    )
+    op.execute(
+        "ALTER TABLE interop_audits ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+    )
+    op.execute("ALTER TABLE interop_audits ALTER COLUMN created_at SET DEFAULT now()")
+    op.execute(
+        "ALTER TABLE interop_audits ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE interop_audits DROP COLUMN IF EXISTS deleted_at")
+    op.execute("ALTER TABLE interop_audits ALTER COLUMN created_at DROP DEFAULT")
+    op.execute("ALTER TABLE interop_audits ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,70 @@
+"""add chain verification jobs
+
+Revision ID: b8d2f4a61c93
+Revises: a6c0e4f8b2d5
+Create Date: 2026-10-18 22:05:31.447120
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d2f4a61c93"
+down_revision: Union[str, None] = "a6c0e4f8b2d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chain_verification_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("scope", sa.Text(), nullable=False),
+        sa.Column("workers", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", "COMPLETED", "FAILED", name="job_status"),
+            nullable=False,
+        ),
+        sa.Column(
+            "requested_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("report", postgresql.JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_chain_verification_jobs_active_scope",
+        "chain_verification_jobs",
+        ["scope"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"),
+    )
+    op.create_index(
+        "ix_chain_verification_jobs_status",
+        "chain_verification_jobs",
+        ["status", "requested_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_chain_verification_jobs_status", table_name="chain_verification_jobs"
+    )
+    op.drop_index(
+        "uq_chain_verification_jobs_active_scope",
+        table_name="chain_verification_jobs",
+    )
+    op.drop_table("chain_verification_jobs")
+    op.execute("DROP TYPE IF EXISTS job_status")
@@ -0,0 +1,124 @@
+"""partition alias events by month
+
+Revision ID: c4b81f0e7d25
+Revises: 9a3e6c1f2b47
+Create Date: 2026-10-18 18:52:13.418920
+
+"""
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4b81f0e7d25"
+down_revision: Union[str, None] = "9a3e6c1f2b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Meses futuros creados por adelantado; luego los mantiene el job diario
+# (ALIAS_EVENTS_PARTITION_MONTHS_AHEAD).
+#
+# Sin partición DEFAULT a propósito: con una DEFAULT no se puede usar DETACH
+# PARTITION CONCURRENTLY al archivar, y crear más tarde el mes que ya tiene
+# filas en la DEFAULT falla. Un INSERT con timestamp fuera de las particiones
+# existentes falla ("no partition of relation alias_events found for row"):
+# el job diario debe correr, y su error se vigila como el de cualquier job.
+MONTHS_AHEAD = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    years, month_index = divmod(value.month - 1 + months, 12)
+    return date(value.year + years, month_index + 1, 1)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.execute("ALTER TABLE alias_events RENAME TO alias_events_legacy")
+    op.execute(
+        "ALTER TABLE alias_events_legacy "
+        "RENAME CONSTRAINT alias_events_pkey TO alias_events_legacy_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_alias_events_id")
+    op.execute("DROP INDEX IF EXISTS ix_alias_events_timestamp")
+    op.execute("DROP INDEX IF EXISTS uq_alias_events_chain_seq")
+
+    # LIKE conserva columnas, tipos (eeventtype) y defaults de la tabla actual
+    op.execute(
+        """
+        CREATE TABLE alias_events (
+            LIKE alias_events_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE ("timestamp")
+        """
+    )
+    op.execute('ALTER TABLE alias_events ALTER COLUMN "timestamp" SET NOT NULL')
+    op.execute('ALTER TABLE alias_events ADD PRIMARY KEY (id, "timestamp")')
+
+    first_ts = bind.execute(
+        sa.text('SELECT MIN("timestamp") FROM alias_events_legacy')
+    ).scalar()
+    today = datetime.now(timezone.utc).date()
+    first_day = first_ts.astimezone(timezone.utc).date() if first_ts else today
+    month = date(first_day.year, first_day.month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE alias_events_p{month:%Y%m} PARTITION OF alias_events "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute("INSERT INTO alias_events SELECT * FROM alias_events_legacy")
+
+    # Índices en la tabla padre: Postgres los crea en cada partición
+    op.create_index(
+        "ix_alias_events_chain_seq",
+        "alias_events",
+        ["tenant_id", "alias_normalized", "seq"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_alias_events_timestamp", "alias_events", ["timestamp"], unique=False
+    )
+
+    op.execute("DROP TABLE alias_events_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE alias_events RENAME TO alias_events_partitioned")
+    op.execute(
+        "ALTER TABLE alias_events_partitioned "
+        "RENAME CONSTRAINT alias_events_pkey TO alias_events_partitioned_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_alias_events_chain_seq")
+    op.execute("DROP INDEX IF EXISTS ix_alias_events_timestamp")
+
+    op.execute(
+        """
+        CREATE TABLE alias_events (
+            LIKE alias_events_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        )
+        """
+    )
+    op.execute('ALTER TABLE alias_events ALTER COLUMN "timestamp" DROP NOT NULL')
+    op.execute("ALTER TABLE alias_events ADD PRIMARY KEY (id)")
+    op.execute("INSERT INTO alias_events SELECT * FROM alias_events_partitioned")
+
+    op.create_index(op.f("ix_alias_events_id"), "alias_events", ["id"], unique=False)
+    op.create_index(
+        "uq_alias_events_chain_seq",
+        "alias_events",
+        ["tenant_id", "alias_normalized", "seq"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_alias_events_timestamp", "alias_events", ["timestamp"], unique=False
+    )
+
+    # Elimina también todas las particiones
+    op.execute("DROP TABLE alias_events_partitioned")
@@ -0,0 +1,62 @@
+"""add tenant api keys
+
+Revision ID: d7e2a9b4c1f3
+Revises: c4b81f0e7d25
+Create Date: 2026-10-18 19:34:51.207316
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e2a9b4c1f3"
+down_revision: Union[str, None] = "c4b81f0e7d25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_api_keys",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("key_id", sa.String(length=16), nullable=False),
+        sa.Column("key_hash", sa.String(length=64), nullable=False),
+        sa.Column("scopes", postgresql.ARRAY(sa.String(length=32)), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_tenant_api_keys_id"), "tenant_api_keys", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_tenant_api_keys_key_id"), "tenant_api_keys", ["key_id"], unique=True
+    )
+    op.create_index(
+        op.f("ix_tenant_api_keys_tenant_id"),
+        "tenant_api_keys",
+        ["tenant_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tenant_api_keys_tenant_id"), table_name="tenant_api_keys")
+    op.drop_index(op.f("ix_tenant_api_keys_key_id"), table_name="tenant_api_keys")
+    op.drop_index(op.f("ix_tenant_api_keys_id"), table_name="tenant_api_keys")
+    op.drop_table("tenant_api_keys")
@@ -0,0 +1,84 @@
+"""add seq to alias events
+
+Revision ID: e1d56eba9ff0
+Revises: 50cab2b8298b
+Create Date: 2026-10-18 17:05:41.530218
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1d56eba9ff0"
+down_revision: Union[str, None] = "50cab2b8298b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("alias_events", sa.Column("seq", sa.BigInteger(), nullable=True))
+
+    # Backfill: orden histórico por timestamp; id desempata eventos del mismo
+    # microsegundo para que la numeración sea determinista
+    op.execute(
+        """
+        UPDATE alias_events AS e
+        SET seq = numbered.seq
+        FROM (
+            SELECT
+                id,
+                ROW_NUMBER() OVER (
+                    PARTITION BY tenant_id, alias_normalized
+                    ORDER BY timestamp, id
+                ) AS seq
+            FROM alias_events
+        ) AS numbered
+        WHERE e.id = numbered.id
+        """
+    )
+    op.alter_column("alias_events", "seq", nullable=False)
+
+    op.create_index(
+        "uq_alias_events_chain_seq",
+        "alias_events",
+        ["tenant_id", "alias_normalized", "seq"],
+        unique=True,
+    )
+    # El índice compuesto cubre los filtros por tenant y por (tenant, alias)
+    op.drop_index(op.f("ix_alias_events_alias_normalized"), table_name="alias_events")
+    op.drop_index(op.f("ix_alias_events_tenant_id"), table_name="alias_events")
+
+    # Las cabezas ya guardan el largo de cada cadena; se alinean con el último
+    # evento según el nuevo orden
+    op.execute(
+        """
+        UPDATE alias_chain_heads AS h
+        SET current_hash = e.current_hash, seq = e.seq
+        FROM alias_events AS e
+        WHERE e.tenant_id = h.tenant_id
+          AND e.alias_normalized = h.alias_normalized
+          AND e.seq = (
+              SELECT MAX(seq) FROM alias_events
+              WHERE tenant_id = h.tenant_id
+                AND alias_normalized = h.alias_normalized
+          )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_alias_events_tenant_id"), "alias_events", ["tenant_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_alias_events_alias_normalized"),
+        "alias_events",
+        ["alias_normalized"],
+        unique=False,
+    )
+    op.drop_index("uq_alias_events_chain_seq", table_name="alias_events")
+    op.drop_column("alias_events", "seq")
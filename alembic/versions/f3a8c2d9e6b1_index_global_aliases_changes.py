@@ -0,0 +1,32 @@
+"""index global aliases changes
+
+Revision ID: f3a8c2d9e6b1
+Revises: d7e2a9b4c1f3
+Create Date: 2026-10-18 20:41:07.582163
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a8c2d9e6b1"
+down_revision: Union[str, None] = "d7e2a9b4c1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sincronización incremental del filtro de existencia de alias globales
+    op.create_index(
+        "ix_global_aliases_created_at", "global_aliases", ["created_at"], unique=False
+    )
+    op.create_index(
+        "ix_global_aliases_updated_at", "global_aliases", ["updated_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_global_aliases_updated_at", table_name="global_aliases")
+    op.drop_index("ix_global_aliases_created_at", table_name="global_aliases")
@@ -1,7 +1,8 @@
 from .health_router import health_router
 from .v1.endpoints import routers as v1_routers
+from .well_known_router import well_known_router
 
-routers = [(health_router, "/health")]
+routers = [(health_router, "/health"), (well_known_router, "/.well-known")]
 
 for router, prefix in v1_routers:
     routers.append((router, f"/v1{prefix}"))
@@ -1,11 +1,31 @@
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.security import HTTPBearer
 
 from core.config import settings
+from core.dependencies.alias import get_resolve_cache
+from core.dependencies.alias_event import (
+    get_chain_head_cache,
+    get_resolve_event_writer,
+)
+from core.dependencies.interop import (
+    get_bank_routing_service,
+    get_global_alias_filter,
+    get_interop_audit_writer,
+)
+from core.dependencies.tenant import (
+    get_api_key_cache,
+    get_tenant_cache,
+    require_admin_role,
+)
+from infrastructure.security import get_jwt_validation_service
 
 health_router = APIRouter(tags=["Health"])
 
+# Métricas internas del worker: solo con JWT de rol ADMIN; "/" sigue público
+admin_only = [Depends(HTTPBearer(auto_error=False)), Depends(require_admin_role)]
+
 app_start_time = datetime.now()
 
 
@@ -18,3 +38,53 @@ async def health_basic():
         "environment": settings.ENVIRONMENT,
         "version": settings.VERSION,
     }
+
+
+@health_router.get("/caches", dependencies=admin_only)
+async def health_caches():
+    """Contadores hit/miss de las cachés en proceso de este worker"""
+    resolve_cache = get_resolve_cache()
+    global_alias_filter = get_global_alias_filter()
+    try:
+        jwt_service = get_jwt_validation_service()
+    except ValueError:
+        # JWT sin configurar en este entorno: no hay caché de payloads
+        jwt_service = None
+    return {
+        "resolve": resolve_cache.stats() if resolve_cache else None,
+        "chain_head": get_chain_head_cache().stats(),
+        "tenant": get_tenant_cache().stats(),
+        "api_key": get_api_key_cache().stats(),
+        "global_alias_filter": (
+            global_alias_filter.stats() if global_alias_filter else None
+        ),
+        "jwt_payload": (
+            jwt_service.payload_cache.stats()
+            if hasattr(jwt_service, "payload_cache")
+            else None
+        ),
+    }
+
+
+@health_router.get("/resolve-audit", dependencies=admin_only)
+async def health_resolve_audit():
+    """Cola y lotes del escritor de eventos RESOLVE de este worker"""
+    writer = get_resolve_event_writer()
+    if not writer:
+        return {"durability": settings.RESOLVE_AUDIT_DURABILITY}
+    return writer.stats()
+
+
+@health_router.get("/interop-audit", dependencies=admin_only)
+async def health_interop_audit():
+    """Cola y lotes del escritor de auditoría interop de este worker"""
+    writer = get_interop_audit_writer()
+    if not writer:
+        return {"durability": settings.INTEROP_AUDIT_DURABILITY}
+    return writer.stats()
+
+
+@health_router.get("/bank-routing", dependencies=admin_only)
+async def health_bank_routing():
+    """Versión y tamaño del catálogo de bancos cargado en este worker"""
+    return get_bank_routing_service().stats()
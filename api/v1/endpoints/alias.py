@@ -1,14 +1,21 @@
-from datetime import date
-from typing import Optional
-from uuid import uuid4
+import json
+from datetime import date, datetime
+from typing import Literal, Optional
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from application.dtos import (
     AliasCreate,
     AliasEventHistoryResponse,
     AliasResponse,
+    BulkRegisterAliasCommand,
+    BulkValidateAliasRequest,
+    ChainVerificationJobResponse,
     DeactivateAliasCommand,
     GetAliasEventHistoryQuery,
     HashChainVerificationResponse,
@@ -16,31 +23,52 @@ from application.dtos import (
     ResolveAliasQuery,
     ResolveAliasResponse,
     VerifyHashChainQuery,
+    VerifyWormSignaturesRequest,
     WormEvidenceResponse,
+    WormInclusionProofResponse,
+    WormSignatureVerificationResponse,
 )
 from application.use_cases import (
+    BulkRegisterAliasUseCase,
+    ChainVerificationJobsUseCase,
     DeactivateAliasUseCase,
+    ExportWormEvidenceUseCase,
     GenerateWormEvidenceUseCase,
     GetAliasEventHistoryUseCase,
+    GetWormInclusionProofUseCase,
     RegisterAliasUseCase,
     ResolveAliasUseCase,
     VerifyHashChainUseCase,
+    VerifyWormSignaturesUseCase,
 )
 from core.auth import get_current_tenant
+from core.config import settings
+from core.database import get_streaming_async_db, get_streaming_db
 from core.dependencies.alias import (
+    get_bulk_register_alias_use_case,
     get_deactivate_alias_use_case,
     get_register_alias_use_case,
     get_resolve_alias_use_case,
 )
 from core.dependencies.alias_event import (
     get_alias_event_history_use_case,
+    get_chain_verification_jobs_use_case,
+    get_streaming_alias_event_history_use_case,
+    get_streaming_verify_hash_chain_use_case,
     get_verify_hash_chain_use_case,
 )
 from core.dependencies.interop import get_interop_service
 from core.dependencies.tenant import get_current_roles
-from core.dependencies.worm import get_worm_evidence_use_case, validate_regulator_access
+from core.dependencies.worm import (
+    get_streaming_worm_export_use_case,
+    get_verify_worm_signatures_use_case,
+    get_worm_evidence_use_case,
+    get_worm_inclusion_proof_use_case,
+    validate_regulator_access,
+)
+from core.streaming import ndjson_response
 from domain.services.interop_service import InteropService
-from utils import MESSAGES
+from utils import MESSAGES, EEventType
 
 tenant_security = HTTPBearer(auto_error=False)
 
@@ -61,8 +89,10 @@ async def register_alias(
         correlation_id=str(correlation_id),
     )
     try:
-        return use_case.execute(command)
+        return await use_case.execute(command)
     except ValueError as e:
+        if str(e) == MESSAGES.ERROR.VALIDATION.CHAIN_HEAD_CONFLICT.CODE:
+            raise HTTPException(status_code=409, detail=str(e)) from e
         if "already exists" in str(e).lower():
             raise HTTPException(
                 status_code=409,
@@ -77,6 +107,64 @@ async def register_alias(
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+def _parse_bulk_items(body: bytes, content_type: str) -> list:
+    """Arreglo JSON o NDJSON; las líneas NDJSON ilegibles quedan como INVALID"""
+    if "ndjson" in content_type:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                items.append(line.decode(errors="replace"))
+        return items
+
+    try:
+        items = json.loads(body)
+    except ValueError as e:
+        raise ValueError(MESSAGES.ERROR.VALIDATION.BULK_PAYLOAD_INVALID.CODE) from e
+    if not isinstance(items, list):
+        raise ValueError(MESSAGES.ERROR.VALIDATION.BULK_PAYLOAD_INVALID.CODE)
+    return items
+
+
+@alias_router.post("/bulk")
+async def bulk_register_alias(
+    request: Request,
+    tenant_id: str = Depends(get_current_tenant),
+    use_case: BulkRegisterAliasUseCase = Depends(get_bulk_register_alias_use_case),
+    db: AsyncSession = Depends(get_streaming_async_db),
+):
+    """
+    Registro masivo de alias (onboarding de bancos)
+    - Entrada: arreglo JSON o NDJSON (application/x-ndjson) de AliasCreate
+    - Salida: NDJSON con un resultado por ítem (en orden) y un resumen final
+    - Cada bloque de BULK_ALIAS_CHUNK_SIZE se confirma en su propia transacción
+    """
+    correlation_id = getattr(request.state, "correlation_id", uuid4())
+    try:
+        items = _parse_bulk_items(
+            await request.body(), request.headers.get("content-type", "")
+        )
+        if len(items) > settings.BULK_ALIAS_MAX_ITEMS:
+            raise HTTPException(
+                status_code=413,
+                detail=MESSAGES.ERROR.VALIDATION.BULK_TOO_MANY_ITEMS.CODE,
+            )
+    except ValueError as e:
+        await db.close()
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except HTTPException:
+        await db.close()
+        raise
+
+    command = BulkRegisterAliasCommand(
+        tenant_id=tenant_id, correlation_id=str(correlation_id)
+    )
+    return ndjson_response(use_case.execute(command, items), db=db)
+
+
 @alias_router.get("/{alias}", response_model=ResolveAliasResponse)
 async def resolve_alias(
     request: Request,
@@ -88,32 +176,75 @@ async def resolve_alias(
 
     query = ResolveAliasQuery(tenant_id=tenant_id, alias=alias)
     try:
-        return use_case.execute(query, correlation_id)
+        return await use_case.execute(query, correlation_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
-@alias_router.get("/{alias}/history", response_model=AliasEventHistoryResponse)
-async def get_alias_history(
+def get_alias_event_history_query(
     alias: str = Path(..., min_length=4, max_length=30),
+    after: Optional[int] = Query(
+        None, ge=0, description="Cursor: seq del último evento recibido"
+    ),
+    limit: Optional[int] = Query(None, ge=1, description="Eventos por página"),
+    order: Literal["asc", "desc"] = Query("asc", description="Orden por seq"),
+    event_type: Optional[list[EEventType]] = Query(
+        None, description="Filtrar por tipo de evento (repetible)"
+    ),
+    since: Optional[datetime] = Query(None, description="Desde (inclusive)"),
+    until: Optional[datetime] = Query(None, description="Hasta (exclusivo)"),
     tenant_id: str = Depends(get_current_tenant),
+) -> GetAliasEventHistoryQuery:
+    return GetAliasEventHistoryQuery(
+        tenant_id=tenant_id,
+        alias=alias,
+        correlation_id=uuid4(),
+        after=after,
+        limit=limit,
+        order=order,
+        event_types=event_type,
+        since=since,
+        until=until,
+    )
+
+
+@alias_router.get("/{alias}/history", response_model=AliasEventHistoryResponse)
+def get_alias_history(
+    query: GetAliasEventHistoryQuery = Depends(get_alias_event_history_query),
     use_case: GetAliasEventHistoryUseCase = Depends(get_alias_event_history_use_case),
 ):
     """
-    Obtener el historial completo de eventos de un alias
+    Obtener el historial de eventos de un alias, paginado por cursor
+    - limit: eventos por página (ALIAS_HISTORY_PAGE_SIZE por defecto, tope
+      ALIAS_HISTORY_MAX_PAGE_SIZE)
+    - after: next_cursor de la página anterior
+    - Filtros por tipo de evento y rango de fechas aplicados en la consulta
     """
-    query = GetAliasEventHistoryQuery(
-        tenant_id=tenant_id, alias=alias, correlation_id=uuid4()
-    )
     try:
         return use_case.execute(query)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@alias_router.get("/{alias}/history/stream")
+async def get_alias_history_stream(
+    query: GetAliasEventHistoryQuery = Depends(get_alias_event_history_query),
+    use_case: GetAliasEventHistoryUseCase = Depends(
+        get_streaming_alias_event_history_use_case
+    ),
+    db: Session = Depends(get_streaming_db),
+):
+    """
+    Historial completo (o desde after, con los mismos filtros) como NDJSON:
+    una línea por evento y un resumen final, sin cargar la cadena en memoria
+    """
+    return ndjson_response(use_case.execute_stream(query), db=db)
+
+
 @alias_router.get("/{alias}/verify-chain", response_model=HashChainVerificationResponse)
-async def verify_hash_chain(
+def verify_hash_chain(
     alias: str = Path(..., min_length=4, max_length=30),
+    full: bool = Query(False, description="Ignorar checkpoint y verificar todo"),
     tenant_id: str = Depends(get_current_tenant),
     use_case: VerifyHashChainUseCase = Depends(get_verify_hash_chain_use_case),
 ):
@@ -122,9 +253,10 @@ async def verify_hash_chain(
     - Valida que cada hash se calcule correctamente del anterior
     - Detecta manipulación o corrupción de datos
     - Proporciona reporte detallado de integridad
+    - Incremental: parte del último checkpoint verificado salvo full=true
     """
     query = VerifyHashChainQuery(
-        tenant_id=tenant_id, alias=alias, correlation_id=uuid4()
+        tenant_id=tenant_id, alias=alias, correlation_id=uuid4(), full=full
     )
     try:
         return use_case.execute(query)
@@ -132,6 +264,26 @@ async def verify_hash_chain(
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@alias_router.get("/{alias}/verify-chain/stream")
+async def verify_hash_chain_stream(
+    alias: str = Path(..., min_length=4, max_length=30),
+    full: bool = Query(False, description="Ignorar checkpoint y verificar todo"),
+    tenant_id: str = Depends(get_current_tenant),
+    use_case: VerifyHashChainUseCase = Depends(
+        get_streaming_verify_hash_chain_use_case
+    ),
+    db: Session = Depends(get_streaming_db),
+):
+    """
+    Verificación de cadenas largas con progreso: NDJSON con una línea de
+    avance cada VERIFY_CHAIN_PROGRESS_EVERY eventos y el resultado final
+    """
+    query = VerifyHashChainQuery(
+        tenant_id=tenant_id, alias=alias, correlation_id=uuid4(), full=full
+    )
+    return ndjson_response(use_case.execute_stream(query), db=db)
+
+
 @alias_router.delete("/{alias}")
 async def deactivate_alias(
     request: Request,
@@ -146,7 +298,13 @@ async def deactivate_alias(
         alias=alias,
         correlation_id=str(correlation_id),
     )
-    success = use_case.execute(command)
+    try:
+        success = await use_case.execute(command)
+    except ValueError as e:
+        # Cabeza de cadena disputada tras agotar reintentos: el cliente reintenta
+        if str(e) == MESSAGES.ERROR.VALIDATION.CHAIN_HEAD_CONFLICT.CODE:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     if not success:
         error_detail = MESSAGES.ERROR.VALIDATION.ALIAS_NOT_FOUND.CODE
@@ -158,9 +316,9 @@ async def deactivate_alias(
 @alias_router.get(
     "/regulatory/worm-evidence/{evidence_date}", response_model=WormEvidenceResponse
 )
-async def get_worm_evidence(
+def get_worm_evidence(
     evidence_date: date,
-    tenant_filter: Optional[str] = Query(
+    tenant_filter: Optional[UUID] = Query(
         None, description="Filtrar por tenant específico"
     ),
     regulator_access: bool = Depends(validate_regulator_access),
@@ -171,10 +329,155 @@ async def get_worm_evidence(
     Endpoint WORM para reguladores
     - RBAC: Solo tenants con rol ADMIN
     - DLP: No expone PII, solo hashes anonimizados
+    - Sello diario precalculado: raíz de Merkle firmada (del tenant o global)
     - Audit: Debes implementar logging de acceso
     """
+    try:
+        return use_case.execute(evidence_date, tenant_filter)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+
+@alias_router.get("/regulatory/worm-evidence/{evidence_date}/export")
+def export_worm_evidence(
+    evidence_date: date,
+    tenant_filter: Optional[UUID] = Query(
+        None, description="Filtrar por tenant específico"
+    ),
+    regulator_access: bool = Depends(validate_regulator_access),
+    use_case: ExportWormEvidenceUseCase = Depends(get_streaming_worm_export_use_case),
+    db: Session = Depends(get_streaming_db),
+):
+    """
+    Exportación WORM completa del día en NDJSON
+    - RBAC: Solo tenants con rol ADMIN
+    - Una línea WormEvidenceItem por evento, leída con cursor del servidor
+    - Última línea: raíz de Merkle recalculada, coincidencia con el sello y firma
+    """
+    try:
+        records = use_case.execute_stream(evidence_date, tenant_filter)
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return ndjson_response(records, db=db)
+
+
+@alias_router.get(
+    "/regulatory/worm-proof/{event_id}", response_model=WormInclusionProofResponse
+)
+def get_worm_inclusion_proof(
+    event_id: UUID,
+    regulator_access: bool = Depends(validate_regulator_access),
+    use_case: GetWormInclusionProofUseCase = Depends(get_worm_inclusion_proof_use_case),
+):
+    """
+    Prueba de inclusión de un evento en el sello WORM de su día
+    - RBAC: Solo tenants con rol ADMIN
+    - Camino hoja → raíz del tenant → raíz global, ambas raíces firmadas
+    """
+    try:
+        return use_case.execute(event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@alias_router.post(
+    "/regulatory/verify-chains",
+    response_model=ChainVerificationJobResponse,
+    status_code=202,
+)
+def verify_all_chains(
+    tenant_filter: Optional[UUID] = Query(
+        None, description="Verificar solo las cadenas de un tenant"
+    ),
+    workers: Optional[int] = Query(None, ge=1, le=64),
+    regulator_access: bool = Depends(validate_regulator_access),
+    use_case: ChainVerificationJobsUseCase = Depends(
+        get_chain_verification_jobs_use_case
+    ),
+):
+    """
+    Encola la verificación masiva de cadenas de hashes (job de auditoría)
+    - RBAC: Solo tenants con rol ADMIN
+    - Devuelve el job (202); si ya hay uno activo para el mismo alcance,
+      devuelve ese
+    - El job corre en segundo plano (pool de procesos) y el reporte queda en
+      GET /regulatory/verify-chains/{job_id}
+    """
+    return use_case.enqueue(tenant_filter, workers)
+
+
+@alias_router.get(
+    "/regulatory/verify-chains/{job_id}", response_model=ChainVerificationJobResponse
+)
+def get_chain_verification_job(
+    job_id: UUID,
+    regulator_access: bool = Depends(validate_regulator_access),
+    use_case: ChainVerificationJobsUseCase = Depends(
+        get_chain_verification_jobs_use_case
+    ),
+):
+    """
+    Estado de una verificación masiva; con status COMPLETED incluye el
+    reporte (solo cadenas rotas: tenant, alias y seq de la primera ruptura)
+    """
+    job = use_case.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=MESSAGES.ERROR.VALIDATION.CHAIN_VERIFICATION_JOB_NOT_FOUND.CODE,
+        )
+    return job
+
+
+@alias_router.post(
+    "/regulatory/worm-signatures/verify",
+    response_model=WormSignatureVerificationResponse,
+)
+async def verify_worm_signatures(
+    request_dto: VerifyWormSignaturesRequest,
+    regulator_access: bool = Depends(validate_regulator_access),
+    use_case: VerifyWormSignaturesUseCase = Depends(
+        get_verify_worm_signatures_use_case
+    ),
+):
+    """
+    Verificación en lote de firmas de sellos WORM (period, root_hash, signature)
+    - RBAC: Solo tenants con rol ADMIN
+    - Hasta WORM_VERIFY_MAX_ITEMS sellos; tenant_id_hash en los sellos de tenant
+    - Lotes grandes repartidos en un pool de procesos; resultados en orden
+    """
+    if len(request_dto.items) > settings.WORM_VERIFY_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=MESSAGES.ERROR.VALIDATION.BULK_TOO_MANY_ITEMS.CODE,
+        )
+
+    return await run_in_threadpool(use_case.execute, request_dto.items)
+
+
+@alias_router.post("/validate/bulk", response_model=dict)
+async def validate_global_aliases(
+    request_dto: BulkValidateAliasRequest,
+    tenant_id: str = Depends(get_current_tenant),
+    interop_service: InteropService = Depends(get_interop_service),
+):
+    """
+    Validación interop de un lote de alias (archivos de pagos)
+    - Hasta INTEROP_BULK_MAX_ALIASES alias; resultados en el orden de entrada
+    - Mismo resultado anonimizado por alias que GET /{alias}/validate
+    - Una consulta a global_aliases y una transacción para auditorías y eventos
+    """
+    if len(request_dto.aliases) > settings.INTEROP_BULK_MAX_ALIASES:
+        raise HTTPException(
+            status_code=413,
+            detail=MESSAGES.ERROR.VALIDATION.BULK_TOO_MANY_ITEMS.CODE,
+        )
 
-    return use_case.execute(evidence_date, tenant_filter)
+    results = await interop_service.validate_aliases_global(
+        request_dto.aliases, tenant_id
+    )
+    return {"count": len(results), "results": results}
 
 
 @alias_router.get("/{alias}/validate", response_model=dict)
@@ -186,4 +489,4 @@ async def validate_global_alias(
     """
     Validación segura de alias - solo expone información anonimizada
     """
-    return interop_service.validate_alias_global(alias, tenant_id)
+    return await interop_service.validate_alias_global(alias, tenant_id)
@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 
 from application.dtos.tenant import (
+    TenantApiKeyCreate,
+    TenantApiKeyResponse,
     TenantAuthRequest,
     TenantAuthResponse,
     TenantCreate,
@@ -11,20 +13,25 @@ from application.dtos.tenant import (
 )
 from application.use_cases import (
     ActivateTenantUseCase,
+    AuthenticateTenantUseCase,
+    GenerateAPIKeyUseCase,
     GetTenantListUseCase,
     GetTenantUseCase,
+    ListAPIKeysUseCase,
+    RevokeAPIKeyUseCase,
 )
 from application.use_cases.tenant.create_tenant import CreateTenantUseCase
+from core.auth import get_current_tenant
 from core.dependencies.tenant import (
     get_activate_tenant_use_case,
+    get_authenticate_tenant_use_case,
     get_create_tenant_use_case,
-    get_jwt_service,
+    get_generate_api_key_use_case,
+    get_list_api_keys_use_case,
+    get_revoke_api_key_use_case,
     get_tenant_list,
-    get_tenant_repository,
     get_tenant_use_case,
 )
-from domain.services import JWTValidationService
-from infrastructure.database.repositories import TenantRepository
 from utils import MESSAGES
 
 tenant_security = HTTPBearer()
@@ -85,42 +92,65 @@ async def list_tenants(
 @router.post("/auth/token", response_model=TenantAuthResponse)
 async def authenticate_tenant_mvp(
     auth_request: TenantAuthRequest,
-    tenant_repo: TenantRepository = Depends(get_tenant_repository),
-    jwt_service: JWTValidationService = Depends(get_jwt_service),
+    use_case: AuthenticateTenantUseCase = Depends(get_authenticate_tenant_use_case),
 ):
     """
-    MVP: Auth simplificado - solo verifica que el tenant exista
+    Emite un JWT para el tenant verificando su API key contra tenant_api_keys
     """
-    tenant = tenant_repo.find_by_code(auth_request.tenant_code)
-
-    if not tenant:
+    try:
+        return use_case.execute(auth_request)
+    except ValueError as e:
         raise HTTPException(
-            status_code=401, detail=MESSAGES.ERROR.AUTH.TENANT_NOT_FOUND.CODE
-        )
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e)
+        ) from e
 
-    if not tenant.is_active():
-        raise HTTPException(
-            status_code=401, detail=MESSAGES.ERROR.AUTH.TENANT_INACTIVE.CODE
-        )
 
-    if not tenant.verify_api_key(auth_request.api_key):
+@router.post(
+    "/me/api-keys",
+    response_model=TenantApiKeyResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate API key",
+)
+async def generate_api_key(
+    create_dto: TenantApiKeyCreate,
+    tenant_id: str = Depends(get_current_tenant),
+    use_case: GenerateAPIKeyUseCase = Depends(get_generate_api_key_use_case),
+):
+    """
+    Genera una API key para el tenant del token (se muestra una sola vez)
+    """
+    try:
+        return use_case.execute(UUID(tenant_id), create_dto)
+    except ValueError as e:
         raise HTTPException(
-            status_code=401, detail=MESSAGES.ERROR.AUTH.INVALID_API_KEY.CODE
-        )
-
-    token = jwt_service.create_tenant_token(
-        tenant.code, str(tenant.id), tenant.type, tenant.roles
-    )
-
-    return TenantAuthResponse(
-        access_token=token,
-        token_type="bearer",
-        expires_in=86400,
-        tenant_id=str(tenant.id),
-        tenant_code=tenant.code,
-        tenant_type=tenant.type,
-        roles=tenant.roles,
-    )
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+@router.get("/me/api-keys", response_model=list[TenantApiKeyResponse])
+async def list_api_keys(
+    tenant_id: str = Depends(get_current_tenant),
+    use_case: ListAPIKeysUseCase = Depends(get_list_api_keys_use_case),
+):
+    """
+    Lista las API keys del tenant del token (sin secretos)
+    """
+    return use_case.execute(UUID(tenant_id))
+
+
+@router.delete("/me/api-keys/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_api_key(
+    key_id: str,
+    tenant_id: str = Depends(get_current_tenant),
+    use_case: RevokeAPIKeyUseCase = Depends(get_revoke_api_key_use_case),
+):
+    """
+    Revoca una API key del tenant del token
+    """
+    try:
+        use_case.execute(UUID(tenant_id), key_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
 
 @router.post(
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Response
+
+from core.config import settings
+from domain.repositories import IJWTKeyProvider
+from infrastructure.security import get_jwt_key_provider
+
+well_known_router = APIRouter(tags=["Well-known"])
+
+
+@well_known_router.get("/jwks.json")
+async def jwks(
+    response: Response,
+    key_provider: Optional[IJWTKeyProvider] = Depends(get_jwt_key_provider),
+):
+    """Claves públicas para verificar los JWT emitidos (vacío con HS256)"""
+    response.headers[
+        "Cache-Control"
+    ] = f"public, max-age={settings.JWT_JWKS_REFRESH_SECONDS}"
+    return key_provider.get_jwks() if key_provider else {"keys": []}
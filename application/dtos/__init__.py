@@ -2,15 +2,24 @@ from .alias import (
     AccountHint,
     AliasCreate,
     AliasResponse,
+    BrokenChainItem,
+    BulkAliasItemResult,
+    BulkAliasSummary,
+    BulkValidateAliasRequest,
+    ChainBatchVerificationResponse,
+    ChainVerificationJobResponse,
+    HashChainVerificationProgress,
     HashChainVerificationResponse,
     ResolveAliasResponse,
 )
 from .alias_event import (
     AliasEventHistoryItem,
     AliasEventHistoryResponse,
+    AliasEventHistorySummary,
     GetAliasEventHistoryQuery,
 )
 from .alias_queries import (
+    BulkRegisterAliasCommand,
     DeactivateAliasCommand,
     RegisterAliasCommand,
     ResolveAliasQuery,
@@ -18,13 +27,26 @@ from .alias_queries import (
 )
 from .banner import BannerCreate, BannerUpdate
 from .tenant import (
+    TenantApiKeyCreate,
+    TenantApiKeyResponse,
     TenantAuthRequest,
     TenantAuthResponse,
     TenantCreate,
     TenantResponse,
     TenantUpdate,
 )
-from .worm import WormEvidenceItem, WormEvidenceResponse
+from .worm import (
+    MerkleProofStepItem,
+    VerifyWormSignaturesRequest,
+    WormEvidenceExportTrailer,
+    WormEvidenceItem,
+    WormEvidenceResponse,
+    WormInclusionProofResponse,
+    WormSignatureItem,
+    WormSignatureResultItem,
+    WormSignatureVerificationResponse,
+    WormTenantRootItem,
+)
 
 __all__ = [
     "BannerCreate",
@@ -40,12 +62,31 @@ __all__ = [
     "TenantAuthRequest",
     "TenantAuthResponse",
     "TenantUpdate",
+    "TenantApiKeyCreate",
+    "TenantApiKeyResponse",
     "AliasEventHistoryItem",
     "AliasEventHistoryResponse",
+    "AliasEventHistorySummary",
     "HashChainVerificationResponse",
+    "HashChainVerificationProgress",
     "WormEvidenceItem",
     "WormEvidenceResponse",
     "RegisterAliasCommand",
     "GetAliasEventHistoryQuery",
     "VerifyHashChainQuery",
+    "BulkAliasItemResult",
+    "BulkAliasSummary",
+    "BulkValidateAliasRequest",
+    "BulkRegisterAliasCommand",
+    "BrokenChainItem",
+    "ChainBatchVerificationResponse",
+    "ChainVerificationJobResponse",
+    "MerkleProofStepItem",
+    "WormInclusionProofResponse",
+    "WormTenantRootItem",
+    "WormEvidenceExportTrailer",
+    "VerifyWormSignaturesRequest",
+    "WormSignatureItem",
+    "WormSignatureResultItem",
+    "WormSignatureVerificationResponse",
 ]
@@ -1,16 +1,33 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from utils import EAccountType
+from domain.services.alias_normalizer import (
+    ALIAS_MAX_LENGTH,
+    ALIAS_MIN_LENGTH,
+    alias_normalizer,
+)
+from utils import EAccountType, EBulkItemStatus, EJobStatus
 
 
 class AliasCreate(BaseModel):
-    alias: str = Field(..., pattern=r"^[A-Za-z0-9._-]{4,30}$")
+    alias: str = Field(..., min_length=ALIAS_MIN_LENGTH, max_length=ALIAS_MAX_LENGTH)
     bank: str = Field(..., min_length=2, max_length=64)
     account_type: EAccountType = Field(..., min_length=2, max_length=32)
-    last_4: str = Field(..., pattern=r"^\d{4}$")
+    last_4: str
+
+    @field_validator("alias")
+    def validate_alias(cls, v):
+        # Se valida la forma normalizada; alias_raw guarda la forma visible
+        # (sin espacios extremos, ancho completo ni invisibles)
+        alias_normalizer.validate(v)
+        return alias_normalizer.display_form(v)
+
+    @field_validator("last_4")
+    def validate_last_4(cls, v):
+        return alias_normalizer.validate_last_4(v)
 
 
 class AliasResponse(BaseModel):
@@ -54,6 +71,30 @@ class ResolveAliasResponse(BaseModel):
         )
 
 
+class BulkAliasItemResult(BaseModel):
+    """Resultado por ítem (una línea NDJSON) de la carga masiva"""
+
+    index: int
+    alias: Optional[str] = None
+    status: EBulkItemStatus
+    detail: Optional[str] = None
+
+
+class BulkAliasSummary(BaseModel):
+    """Registro final del stream de la carga masiva"""
+
+    total: int
+    created: int
+    duplicate: int
+    invalid: int
+
+
+class BulkValidateAliasRequest(BaseModel):
+    """Lote de alias a validar por interoperabilidad (archivos de pagos)"""
+
+    aliases: list[str] = Field(..., min_length=1)
+
+
 class HashChainVerificationResponse(BaseModel):
     alias: str
     is_valid: bool
@@ -64,3 +105,73 @@ class HashChainVerificationResponse(BaseModel):
     expected_hash: str
     actual_hash: str
     details: str
+    from_seq: int = 0
+    verified_events: Optional[int] = None
+    last_verified_seq: Optional[int] = None
+
+
+class HashChainVerificationProgress(BaseModel):
+    """Avance de la verificación de cadenas largas (una línea NDJSON)"""
+
+    alias: str
+    from_seq: int
+    verified_events: int
+    last_seq: int
+    corrupted_count: int
+
+
+class BrokenChainItem(BaseModel):
+    """Cadena rota dentro del reporte de verificación masiva"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    tenant_id: UUID
+    alias_normalized: str
+    break_seq: int
+    expected_hash: str
+    actual_hash: str
+
+
+class ChainBatchVerificationResponse(BaseModel):
+    """Reporte de la verificación masiva de cadenas"""
+
+    tenant_id: Optional[UUID] = None
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    workers: int
+    partitions: int
+    total_chains: int
+    total_events: int
+    events_per_second: float
+    broken_count: int
+    broken_chains: list[BrokenChainItem]
+    report_path: Optional[str] = None
+
+
+class ChainVerificationJobResponse(BaseModel):
+    """Estado de una verificación masiva encolada; report al completarse"""
+
+    job_id: UUID
+    status: EJobStatus
+    tenant_id: Optional[UUID] = None
+    workers: Optional[int] = None
+    requested_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    report: Optional[ChainBatchVerificationResponse] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_entity(cls, job):
+        return cls(
+            job_id=job.id,
+            status=job.status,
+            tenant_id=job.tenant_id,
+            workers=job.workers,
+            requested_at=job.requested_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            report=job.report,
+            error=job.error,
+        )
@@ -1,14 +1,18 @@
 from datetime import datetime
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from utils import EEventType
+
 
 class AliasEventHistoryItem(BaseModel):
     """Item individual del historial de eventos"""
 
     model_config = ConfigDict(from_attributes=True)
 
+    seq: Optional[int] = None
     event_type: str
     timestamp: datetime
     correlation_id: UUID
@@ -17,14 +21,35 @@ class AliasEventHistoryItem(BaseModel):
 
 
 class AliasEventHistoryResponse(BaseModel):
-    """Respuesta completa del historial"""
+    """
+    Página del historial; total_events es el largo de la cadena (seq del
+    último evento) y next_cursor el valor de after para la página siguiente
+    """
 
     alias: str
     total_events: int
     events: list[AliasEventHistoryItem]
+    has_more: bool = False
+    next_cursor: Optional[int] = None
+
+
+class AliasEventHistorySummary(BaseModel):
+    """Registro final del stream NDJSON del historial"""
+
+    alias: str
+    total_events: int
+    streamed_events: int
+    last_seq: Optional[int] = None
 
 
 class GetAliasEventHistoryQuery(BaseModel):
     tenant_id: UUID
     alias: str
     correlation_id: UUID
+    # Keyset sobre seq: eventos después de after en el orden pedido
+    after: Optional[int] = None
+    limit: Optional[int] = None
+    order: Literal["asc", "desc"] = "asc"
+    event_types: Optional[list[EEventType]] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
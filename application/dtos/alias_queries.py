@@ -28,7 +28,15 @@ class RegisterAliasCommand(BaseModel):
     correlation_id: UUID
 
 
+class BulkRegisterAliasCommand(BaseModel):
+    """DTO para comandos de registro masivo de alias"""
+
+    tenant_id: UUID
+    correlation_id: UUID
+
+
 class VerifyHashChainQuery(BaseModel):
     tenant_id: UUID
     alias: str
     correlation_id: UUID
+    full: bool = False  # Ignora el checkpoint y verifica desde el génesis
@@ -65,3 +65,21 @@ class TenantUpdate(BaseModel):
     contact_phone: Optional[str] = Field(None, pattern=r"^\+?[\d\s-]{10,}$")
     website: Optional[str] = Field(None, pattern=r"^https?://[^\s/$.?#].[^\s]*$")
     tenant_metadata: Optional[dict] = None
+
+
+class TenantApiKeyCreate(BaseModel):
+    # Roles que puede obtener un token emitido con esta key (vacío = todos)
+    scopes: list[TenantRole] = []
+    expires_at: Optional[datetime] = None
+
+
+class TenantApiKeyResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    key_id: str
+    scopes: list[str] = []
+    expires_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    # Solo al generarla
+    api_key: Optional[str] = None
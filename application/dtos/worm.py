@@ -1,9 +1,15 @@
-from pydantic import BaseModel
+from datetime import date
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from core.config import settings
 
 
 class WormEvidenceItem(BaseModel):
+    event_id: Optional[UUID] = None
+    leaf_index: Optional[int] = None
     timestamp: str
     event_type: str
     tenant_id_hash: str
@@ -12,12 +18,108 @@ class WormEvidenceItem(BaseModel):
     current_hash: str
 
 
+class WormTenantRootItem(BaseModel):
+    """Hoja del árbol global: raíz diaria de un tenant (anonimizado)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    tenant_id_hash: str
+    root_hash: str
+    leaf_count: int
+
+
 class WormEvidenceResponse(BaseModel):
     version: str = settings.WORM_VERSION
     issuer: str = settings.WORM_ISSUER
     issued_at: str
     period: str
     root_hash: str
-    hash_chain: list[WormEvidenceItem]
+    leaf_count: int
+    merkle_algorithm: str
+    tenant_id_hash: Optional[str] = None
+    tenant_roots: list[WormTenantRootItem] = []
     digital_signature: str
     public_key: str
+
+
+class WormEvidenceExportTrailer(BaseModel):
+    """
+    Último registro del export NDJSON: raíz y firma del sello persistido, y
+    la raíz recalculada sobre las líneas emitidas (sin firma) comparada con
+    él. digital_signature es None para un tenant sin sello ese día.
+    """
+
+    version: str = settings.WORM_VERSION
+    issuer: str = settings.WORM_ISSUER
+    issued_at: str
+    period: str
+    event_count: int
+    merkle_algorithm: str
+    tenant_id_hash: Optional[str] = None
+    tenant_roots: list[WormTenantRootItem] = []
+    root_hash: str
+    recomputed_root_hash: str
+    matches_seal: bool
+    digital_signature: Optional[str] = None
+    public_key: str
+
+
+class MerkleProofStepItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    position: Literal["left", "right"]
+    hash: str
+
+
+class WormInclusionProofResponse(BaseModel):
+    """
+    Prueba de inclusión de un evento: hoja → raíz del tenant (firmada) y
+    raíz del tenant → raíz global del día (firmada)
+    """
+
+    event_id: UUID
+    period: str
+    merkle_algorithm: str
+    leaf_index: int
+    leaf_hash: str
+    tenant_id_hash: str
+    tenant_root_hash: str
+    tenant_leaf_count: int
+    tenant_proof: list[MerkleProofStepItem]
+    tenant_signature: str
+    global_leaf_index: int
+    global_leaf_hash: str
+    global_root_hash: str
+    global_proof: list[MerkleProofStepItem]
+    global_signature: str
+    public_key: str
+
+
+class WormSignatureItem(BaseModel):
+    """Sello a verificar: tenant_id_hash solo en los sellos de un tenant"""
+
+    period: date
+    root_hash: str
+    signature: str
+    tenant_id_hash: Optional[str] = None
+
+
+class VerifyWormSignaturesRequest(BaseModel):
+    items: list[WormSignatureItem] = Field(..., min_length=1)
+
+
+class WormSignatureResultItem(BaseModel):
+    period: str
+    tenant_id_hash: Optional[str] = None
+    root_hash: str
+    valid: bool
+
+
+class WormSignatureVerificationResponse(BaseModel):
+    """Resultado por sello, en el orden recibido, y la clave usada"""
+
+    count: int
+    valid_count: int
+    invalid_count: int
+    results: list[WormSignatureResultItem]
+    public_key: str
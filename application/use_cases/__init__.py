@@ -1,9 +1,16 @@
 from .alias.alias_event_history import GetAliasEventHistoryUseCase
+from .alias.bulk_register_alias import BulkRegisterAliasUseCase
+from .alias.chain_verification_jobs import ChainVerificationJobsUseCase
 from .alias.deactivate_alias import DeactivateAliasUseCase
+from .alias.export_worm_evidence import ExportWormEvidenceUseCase
 from .alias.generate_worm_evidence import GenerateWormEvidenceUseCase
+from .alias.get_worm_inclusion_proof import GetWormInclusionProofUseCase
 from .alias.register_alias import RegisterAliasUseCase
 from .alias.resolve_alias import ResolveAliasUseCase
+from .alias.seal_worm_day import SealWormDayUseCase
+from .alias.verify_all_chains import VerifyAllChainsUseCase
 from .alias.verify_hash_chain import VerifyHashChainUseCase
+from .alias.verify_worm_signatures import VerifyWormSignaturesUseCase
 from .banner_service import BannerService
 from .error_log_service import ErrorLogService
 from .tenant.activate_tenant import ActivateTenantUseCase
@@ -12,12 +19,15 @@ from .tenant.create_tenant import CreateTenantUseCase
 from .tenant.generate_api_key import GenerateAPIKeyUseCase
 from .tenant.get_tenant import GetTenantUseCase
 from .tenant.get_tenant_list import GetTenantListUseCase
+from .tenant.list_api_keys import ListAPIKeysUseCase
+from .tenant.revoke_api_key import RevokeAPIKeyUseCase
 from .tenant.update_tenant import UpdateTenantUseCase
 
 __all__ = [
     "BannerService",
     "ErrorLogService",
     "RegisterAliasUseCase",
+    "BulkRegisterAliasUseCase",
     "ResolveAliasUseCase",
     "DeactivateAliasUseCase",
     "CreateTenantUseCase",
@@ -25,10 +35,18 @@ __all__ = [
     "GetTenantUseCase",
     "UpdateTenantUseCase",
     "GenerateAPIKeyUseCase",
+    "ListAPIKeysUseCase",
+    "RevokeAPIKeyUseCase",
     "ActivateTenantUseCase",
     "GetAliasEventHistoryUseCase",
     "VerifyHashChainUseCase",
+    "VerifyAllChainsUseCase",
+    "ChainVerificationJobsUseCase",
     "GenerateWormEvidenceUseCase",
     "GenerateWormEvidenceUseCase",
     "GetTenantListUseCase",
+    "SealWormDayUseCase",
+    "GetWormInclusionProofUseCase",
+    "ExportWormEvidenceUseCase",
+    "VerifyWormSignaturesUseCase",
 ]
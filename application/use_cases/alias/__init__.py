@@ -1,9 +1,17 @@
 from .alias_event_history import GetAliasEventHistoryUseCase
+from .export_worm_evidence import ExportWormEvidenceUseCase
 from .generate_worm_evidence import GenerateWormEvidenceUseCase
+from .get_worm_inclusion_proof import GetWormInclusionProofUseCase
+from .seal_worm_day import SealWormDayUseCase
 from .verify_hash_chain import VerifyHashChainUseCase
+from .verify_worm_signatures import VerifyWormSignaturesUseCase
 
 __all__ = [
     "GetAliasEventHistoryUseCase",
     "VerifyHashChainUseCase",
     "GenerateWormEvidenceUseCase",
+    "SealWormDayUseCase",
+    "GetWormInclusionProofUseCase",
+    "ExportWormEvidenceUseCase",
+    "VerifyWormSignaturesUseCase",
 ]
@@ -1,32 +1,102 @@
-from application.dtos import AliasEventHistoryItem, AliasEventHistoryResponse
+from collections.abc import Iterator
+
+from application.dtos import (
+    AliasEventHistoryItem,
+    AliasEventHistoryResponse,
+    AliasEventHistorySummary,
+)
 from application.dtos.alias_event import GetAliasEventHistoryQuery
+from core.config import settings
+from domain.entities import AliasEventEntity
 from domain.repositories.alias_event_repository import IAliasEventRepository
+from domain.services import alias_normalizer
 
 
 class GetAliasEventHistoryUseCase:
+    """
+    Historial de eventos de un alias paginado por keyset sobre seq: cada
+    página es un range scan de limit + 1 filas desde el cursor, sin importar
+    el largo de la cadena.
+    """
+
     def __init__(self, alias_event_repository: IAliasEventRepository):
         self.alias_event_repository = alias_event_repository
 
     def execute(self, query: GetAliasEventHistoryQuery) -> AliasEventHistoryResponse:
-        alias_normalized = query.alias.strip().lower()
-
-        events = self.alias_event_repository.get_events_for_alias(
-            alias_normalized, query.tenant_id
+        alias_normalized = alias_normalizer.normalize(query.alias)
+        limit = min(
+            query.limit or settings.ALIAS_HISTORY_PAGE_SIZE,
+            settings.ALIAS_HISTORY_MAX_PAGE_SIZE,
         )
 
-        event_items = [
-            AliasEventHistoryItem(
-                event_type=event.event_type,
-                timestamp=event.timestamp,
-                correlation_id=event.correlation_id,
-                previous_hash=event.previous_hash,
-                current_hash=event.current_hash,
-            )
-            for event in events
-        ]
+        # Una fila extra indica si hay página siguiente sin contar la cadena
+        events = self.alias_event_repository.get_event_history_page(
+            alias_normalized,
+            query.tenant_id,
+            limit=limit + 1,
+            after_seq=query.after,
+            descending=query.order == "desc",
+            event_types=query.event_types,
+            since=query.since,
+            until=query.until,
+        )
+        has_more = len(events) > limit
+        events = events[:limit]
 
         return AliasEventHistoryResponse(
             alias=alias_normalized,
-            total_events=len(event_items),
-            events=event_items,
+            total_events=self._chain_length(alias_normalized, query),
+            events=[self._to_item(event) for event in events],
+            has_more=has_more,
+            next_cursor=events[-1].seq if has_more else None,
+        )
+
+    def execute_stream(
+        self, query: GetAliasEventHistoryQuery
+    ) -> Iterator[AliasEventHistoryItem | AliasEventHistorySummary]:
+        """Una línea NDJSON por evento y el resumen al final"""
+        alias_normalized = alias_normalizer.normalize(query.alias)
+
+        events = self.alias_event_repository.iter_event_history(
+            alias_normalized,
+            query.tenant_id,
+            after_seq=query.after,
+            descending=query.order == "desc",
+            event_types=query.event_types,
+            since=query.since,
+            until=query.until,
+        )
+        streamed_events, last_seq = 0, None
+        for event in events:
+            if query.limit is not None and streamed_events >= query.limit:
+                break
+            yield self._to_item(event)
+            streamed_events += 1
+            last_seq = event.seq
+
+        yield AliasEventHistorySummary(
+            alias=alias_normalized,
+            total_events=self._chain_length(alias_normalized, query),
+            streamed_events=streamed_events,
+            last_seq=last_seq,
+        )
+
+    def _chain_length(
+        self, alias_normalized: str, query: GetAliasEventHistoryQuery
+    ) -> int:
+        # seq del último evento (lookup por índice) en vez de COUNT(*)
+        last_event = self.alias_event_repository.get_last_event_for_alias(
+            alias_normalized, query.tenant_id
+        )
+        return (last_event.seq or 0) if last_event else 0
+
+    @staticmethod
+    def _to_item(event: AliasEventEntity) -> AliasEventHistoryItem:
+        return AliasEventHistoryItem(
+            seq=event.seq,
+            event_type=event.event_type,
+            timestamp=event.timestamp,
+            correlation_id=event.correlation_id,
+            previous_hash=event.previous_hash,
+            current_hash=event.current_hash,
         )
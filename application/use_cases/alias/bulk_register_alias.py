@@ -0,0 +1,238 @@
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from application.dtos import (
+    AliasCreate,
+    BulkAliasItemResult,
+    BulkAliasSummary,
+    BulkRegisterAliasCommand,
+)
+from core.config import settings
+from domain.entities import AliasRegistryEntity, GlobalAliasEntity
+from domain.repositories import (
+    IAliasExistenceFilter,
+    IAliasResolveCache,
+    IAsyncAliasRepository,
+    IAsyncGlobalAliasRepository,
+    IUnitOfWork,
+)
+from domain.services import (
+    BankRoutingService,
+    ChainAppendService,
+    HashChainService,
+    alias_normalizer,
+)
+from utils import MESSAGES, AliasStatus, EBulkItemStatus, EEventType
+
+
+class BulkRegisterAliasUseCase:
+    """
+    Registro masivo de alias para onboarding de bancos.
+
+    Procesa la entrada en bloques de BULK_ALIAS_CHUNK_SIZE: valida y normaliza
+    el bloque completo, calcula CUB y hashes REGISTER en lote y escribe
+    registros, alias globales y eventos con INSERT multi-fila en una
+    transacción por bloque. Los resultados se emiten en orden de entrada.
+    """
+
+    def __init__(
+        self,
+        alias_repository: IAsyncAliasRepository,
+        chain_append_service: ChainAppendService,
+        hash_chain_service: HashChainService,
+        global_alias_repository: IAsyncGlobalAliasRepository,
+        bank_routing_service: BankRoutingService,
+        unit_of_work: IUnitOfWork,
+        chunk_size: int = settings.BULK_ALIAS_CHUNK_SIZE,
+        resolve_cache: Optional[IAliasResolveCache] = None,
+        existence_filter: Optional[IAliasExistenceFilter] = None,
+    ):
+        self.alias_repository = alias_repository
+        self.chain_append_service = chain_append_service
+        self.hash_chain_service = hash_chain_service
+        self.global_alias_repository = global_alias_repository
+        self.bank_routing_service = bank_routing_service
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+        self.resolve_cache = resolve_cache
+        self.existence_filter = existence_filter
+
+    async def execute(
+        self, command: BulkRegisterAliasCommand, items: Iterable[Any]
+    ) -> AsyncIterator[BulkAliasItemResult | BulkAliasSummary]:
+        counts: Counter[EBulkItemStatus] = Counter()
+        batch: list[tuple[int, Any]] = []
+        for index, raw_item in enumerate(items):
+            batch.append((index, raw_item))
+            if len(batch) < self.chunk_size:
+                continue
+            for result in await self._register_batch(command, batch):
+                counts[result.status] += 1
+                yield result
+            batch = []
+
+        if batch:
+            for result in await self._register_batch(command, batch):
+                counts[result.status] += 1
+                yield result
+
+        yield BulkAliasSummary(
+            total=sum(counts.values()),
+            created=counts[EBulkItemStatus.CREATED],
+            duplicate=counts[EBulkItemStatus.DUPLICATE],
+            invalid=counts[EBulkItemStatus.INVALID],
+        )
+
+    async def _register_batch(
+        self, command: BulkRegisterAliasCommand, batch: list[tuple[int, Any]]
+    ) -> list[BulkAliasItemResult]:
+        results: dict[int, BulkAliasItemResult] = {}
+        candidates: dict[str, tuple[int, AliasCreate]] = {}
+        valid: list[tuple[int, AliasCreate]] = []
+
+        for index, raw_item in batch:
+            try:
+                create_dto = AliasCreate.model_validate(raw_item)
+            except ValidationError as e:
+                results[index] = BulkAliasItemResult(
+                    index=index,
+                    alias=raw_item.get("alias") if isinstance(raw_item, dict) else None,
+                    status=EBulkItemStatus.INVALID,
+                    detail=e.errors()[0]["msg"],
+                )
+                continue
+
+            valid.append((index, create_dto))
+
+        for (index, create_dto), alias_normalized in zip(
+            valid, alias_normalizer.normalize_many([dto.alias for _, dto in valid])
+        ):
+            if alias_normalized in candidates:
+                results[index] = self._duplicate(index, create_dto.alias)
+                continue
+            candidates[alias_normalized] = (index, create_dto)
+
+        while candidates:
+            conflicts = await self._write_candidates(command, candidates, results)
+            if not conflicts:
+                break
+            # Reservado en global_aliases pero con registro ACTIVE previo del
+            # tenant (desalineación entre tablas): se revierte el bloque y se
+            # reintenta sin esos alias para no dejar reservas huérfanas.
+            for alias_normalized in conflicts:
+                index, create_dto = candidates.pop(alias_normalized)
+                results[index] = self._duplicate(index, create_dto.alias)
+
+        return [results[index] for index, _ in batch]
+
+    async def _write_candidates(
+        self,
+        command: BulkRegisterAliasCommand,
+        candidates: dict[str, tuple[int, AliasCreate]],
+        results: dict[int, BulkAliasItemResult],
+    ) -> set[str]:
+        routing_codes: dict[str, str] = {}
+        global_entities = []
+        registry_entities = []
+
+        for alias_normalized, (_, create_dto) in candidates.items():
+            routing_code = routing_codes.get(create_dto.bank)
+            if routing_code is None:
+                routing_code = self.bank_routing_service.get_routing_code(
+                    create_dto.bank
+                )
+                routing_codes[create_dto.bank] = routing_code
+
+            global_entities.append(
+                GlobalAliasEntity.create(
+                    alias_normalized=alias_normalized,
+                    owning_tenant_id=command.tenant_id,
+                    routing_code=routing_code,
+                )
+            )
+            registry_entities.append(
+                AliasRegistryEntity(
+                    tenant_id=command.tenant_id,
+                    alias_raw=create_dto.alias,
+                    alias_normalized=alias_normalized,
+                    bank=create_dto.bank,
+                    account_type=create_dto.account_type,
+                    last_4=create_dto.last_4,
+                    status=AliasStatus.ACTIVE,
+                    acc_hash=self.hash_chain_service.calculate_cub_hash(
+                        tenant_id=command.tenant_id,
+                        bank=create_dto.bank,
+                        account_type=create_dto.account_type,
+                        last_4=create_dto.last_4,
+                        alias_normalized=alias_normalized,
+                    ),
+                )
+            )
+
+        try:
+            reserved = await self.global_alias_repository.bulk_insert_if_available(
+                global_entities
+            )
+            to_register = [
+                entity
+                for entity in registry_entities
+                if entity.alias_normalized in reserved
+            ]
+            saved_aliases = await self.alias_repository.bulk_insert_if_absent(
+                to_register
+            )
+
+            saved_normalized = {alias.alias_normalized for alias in saved_aliases}
+            conflicts = {
+                entity.alias_normalized
+                for entity in to_register
+                if entity.alias_normalized not in saved_normalized
+            }
+            if conflicts:
+                await self.unit_of_work.rollback()
+                return conflicts
+
+            await self.chain_append_service.append_many(
+                tenant_id=command.tenant_id,
+                aliases_normalized=[alias.alias_normalized for alias in saved_aliases],
+                event_type=EEventType.REGISTER,
+                correlation_id=command.correlation_id,
+                timestamps={
+                    alias.alias_normalized: alias.created_at for alias in saved_aliases
+                },
+            )
+
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        if self.resolve_cache and saved_normalized:
+            await self.resolve_cache.invalidate(
+                command.tenant_id, list(saved_normalized)
+            )
+        if self.existence_filter and saved_normalized:
+            await self.existence_filter.announce(list(saved_normalized))
+
+        for alias_normalized, (index, create_dto) in candidates.items():
+            if alias_normalized in saved_normalized:
+                results[index] = BulkAliasItemResult(
+                    index=index,
+                    alias=create_dto.alias,
+                    status=EBulkItemStatus.CREATED,
+                )
+            else:
+                results[index] = self._duplicate(index, create_dto.alias)
+
+        return set()
+
+    def _duplicate(self, index: int, alias: str) -> BulkAliasItemResult:
+        return BulkAliasItemResult(
+            index=index,
+            alias=alias,
+            status=EBulkItemStatus.DUPLICATE,
+            detail=MESSAGES.ERROR.VALIDATION.ALIAS_ALREADY_EXISTS.CODE,
+        )
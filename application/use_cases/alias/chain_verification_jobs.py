@@ -0,0 +1,55 @@
+from typing import Optional
+from uuid import UUID
+
+from application.dtos import ChainVerificationJobResponse
+from application.use_cases.alias.verify_all_chains import VerifyAllChainsUseCase
+from core.config import settings
+from core.logger import get_logger
+from domain.repositories import IChainVerificationJobRepository
+
+logger = get_logger("application.use_cases.chain_verification_jobs")
+
+
+class ChainVerificationJobsUseCase:
+    """
+    Verificación masiva de cadenas fuera del request: la API encola el job y
+    lo consulta por id; run_next lo ejecuta en segundo plano (scheduler o
+    scripts/db/verify_chains.py --run-queued) y guarda el reporte en la base.
+    """
+
+    def __init__(
+        self,
+        job_repository: IChainVerificationJobRepository,
+        verify_all_chains: Optional[VerifyAllChainsUseCase] = None,
+    ):
+        self.job_repository = job_repository
+        self.verify_all_chains = verify_all_chains
+
+    def enqueue(
+        self, tenant_id: Optional[UUID] = None, workers: Optional[int] = None
+    ) -> ChainVerificationJobResponse:
+        job = self.job_repository.enqueue(tenant_id, workers)
+        return ChainVerificationJobResponse.from_entity(job)
+
+    def get(self, job_id: UUID) -> Optional[ChainVerificationJobResponse]:
+        job = self.job_repository.get(job_id)
+        return ChainVerificationJobResponse.from_entity(job) if job else None
+
+    def run_next(self) -> Optional[UUID]:
+        """Ejecuta el próximo job pendiente; None si la cola está vacía"""
+        job = self.job_repository.claim_next(settings.CHAIN_VERIFY_JOB_STALE_SECONDS)
+        if job is None:
+            return None
+
+        try:
+            report = self.verify_all_chains.verify(
+                tenant_id=job.tenant_id, workers=job.workers
+            )
+        except Exception as e:
+            logger.error(
+                "Chain verification job failed", job_id=str(job.id), error=str(e)
+            )
+            self.job_repository.fail(job.id, str(e))
+        else:
+            self.job_repository.complete(job.id, report.model_dump(mode="json"))
+        return job.id
@@ -1,63 +1,84 @@
-from datetime import datetime
+from typing import Optional
 
 from application.dtos import DeactivateAliasCommand
-from domain.entities import AliasEventEntity
-from domain.repositories import IAliasEventRepository, IAliasRepository
-from domain.services import HashChainService
+from domain.repositories import (
+    IAliasExistenceFilter,
+    IAliasResolveCache,
+    IAsyncAliasRepository,
+    IAsyncGlobalAliasRepository,
+    IUnitOfWork,
+)
+from domain.services import ChainAppendService, alias_normalizer
 from utils import EEventType
 
 
 class DeactivateAliasUseCase:
     def __init__(
         self,
-        alias_repository: IAliasRepository,
-        alias_event_repository: IAliasEventRepository,
-        hash_chain_service: HashChainService,
+        alias_repository: IAsyncAliasRepository,
+        chain_append_service: ChainAppendService,
+        unit_of_work: IUnitOfWork,
+        global_alias_repository: Optional[IAsyncGlobalAliasRepository] = None,
+        resolve_cache: Optional[IAliasResolveCache] = None,
+        existence_filter: Optional[IAliasExistenceFilter] = None,
     ):
         self.alias_repository = alias_repository
-        self.alias_event_repository = alias_event_repository
-        self.hash_chain_service = hash_chain_service
+        self.chain_append_service = chain_append_service
+        self.unit_of_work = unit_of_work
+        self.global_alias_repository = global_alias_repository
+        self.resolve_cache = resolve_cache
+        self.existence_filter = existence_filter
 
-    def execute(self, command: DeactivateAliasCommand) -> bool:
-        alias_normalized = command.alias.strip().lower()
+    async def execute(self, command: DeactivateAliasCommand) -> bool:
+        alias_normalized = alias_normalizer.normalize(command.alias)
 
-        alias_entity = self.alias_repository.find_by_normalized_alias(
+        # Tras liberar la reserva global el tenant puede volver a registrar el
+        # alias: conviven filas INACTIVE con a lo sumo una ACTIVE, que es la
+        # que se desactiva
+        alias_entity = await self.alias_repository.find_active_by_normalized_alias(
             command.tenant_id, alias_normalized
         )
 
         if not alias_entity:
-            return False
+            # Sin fila ACTIVE: ya desactivado (idempotente) o inexistente
+            return (
+                await self.alias_repository.find_by_normalized_alias(
+                    command.tenant_id, alias_normalized
+                )
+                is not None
+            )
 
-        if alias_entity.status == "INACTIVE":
-            return True
+        try:
+            success = await self.alias_repository.update_status(
+                alias_entity.id, "INACTIVE"
+            )
+            if not success:
+                await self.unit_of_work.rollback()
+                return False
 
-        success = self.alias_repository.update_status(alias_entity.id, "INACTIVE")
+            # Libera también la reserva global: deja de validarse por interop y
+            # el alias vuelve a estar disponible para registro
+            if self.global_alias_repository:
+                await self.global_alias_repository.deactivate_alias(
+                    alias_normalized, owning_tenant_id=command.tenant_id
+                )
 
-        if not success:
-            return False
+            await self.chain_append_service.append(
+                tenant_id=command.tenant_id,
+                alias_normalized=alias_normalized,
+                event_type=EEventType.DEACTIVATE,
+                correlation_id=command.correlation_id,
+            )
+            # Cambio de estado, alias global y evento DEACTIVATE en la misma
+            # transacción
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
-        last_event = self.alias_event_repository.get_last_event_for_alias(
-            alias_normalized, command.tenant_id
-        )
-        previous_hash = last_event.current_hash if last_event else "0" * 64
-
-        current_hash = self.hash_chain_service.calculate_event_hash(
-            tenant_id=command.tenant_id,
-            alias=alias_normalized,
-            event_type=EEventType.DEACTIVATE,
-            timestamp=datetime.now(),
-            previous_hash=previous_hash,
-        )
-
-        event_entity = AliasEventEntity(
-            alias_normalized=alias_normalized,
-            tenant_id=command.tenant_id,
-            event_type=EEventType.DEACTIVATE,
-            correlation_id=command.correlation_id,
-            previous_hash=previous_hash,
-            current_hash=current_hash,
-            timestamp=datetime.now(),
-        )
-        self.alias_event_repository.create(event_entity)
+        if self.resolve_cache:
+            await self.resolve_cache.invalidate(command.tenant_id, [alias_normalized])
+        if self.existence_filter:
+            self.existence_filter.discard([alias_normalized])
 
         return True
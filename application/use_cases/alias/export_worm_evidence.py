@@ -0,0 +1,209 @@
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from application.dtos import (
+    WormEvidenceExportTrailer,
+    WormEvidenceItem,
+    WormTenantRootItem,
+)
+from core.logger import get_logger
+from domain.entities import WormSealEntity
+from domain.repositories import IWormSealRepository
+from domain.services import DigitalSignatureService, MerkleTreeService
+from domain.services.merkle_tree_service import EMPTY_ROOT
+
+from .seal_worm_day import (
+    SealWormDayUseCase,
+    worm_tenant_id_hash,
+)
+
+logger = get_logger("use_cases.worm_export")
+
+
+class ExportWormEvidenceUseCase:
+    """
+    Exportación WORM de un día completo en streaming: recorre las hojas con
+    cursor del servidor en el orden del sello, emite un WormEvidenceItem por
+    evento y acumula la raíz de Merkle en O(log n). El trailer trae la raíz y
+    la firma del sello persistido, y la raíz recalculada (sin firma) con su
+    comparación.
+    """
+
+    def __init__(
+        self,
+        worm_seal_repository: IWormSealRepository,
+        seal_worm_day_use_case: SealWormDayUseCase,
+        merkle_tree_service: MerkleTreeService,
+        signature_service: DigitalSignatureService,
+    ):
+        self.repo = worm_seal_repository
+        self.sealer = seal_worm_day_use_case
+        self.merkle = merkle_tree_service
+        self.signer = signature_service
+
+    def execute_stream(
+        self, target_date: date, tenant_id: Optional[UUID] = None
+    ) -> Iterator[WormEvidenceItem | WormEvidenceExportTrailer]:
+        # Sellado y validación antes del primer byte: los errores aún son HTTP
+        global_seal = self.repo.get_seal(target_date) or self.sealer.execute(
+            target_date
+        )
+        tenant_seals = {
+            seal.tenant_id: seal for seal in self.repo.get_tenant_seals(target_date)
+        }
+        return self._stream(target_date, tenant_id, global_seal, tenant_seals)
+
+    def _stream(
+        self,
+        target_date: date,
+        tenant_id: Optional[UUID],
+        global_seal: WormSealEntity,
+        tenant_seals: dict[UUID, WormSealEntity],
+    ) -> Iterator[WormEvidenceItem | WormEvidenceExportTrailer]:
+        # (tenant_id_hash, tenant_id, raíz, hojas): una entrada por tenant
+        tenant_roots: list[tuple[str, UUID, str, int]] = []
+        current_tenant = None
+        tenant_id_hash = ""
+        frontier: list[tuple[int, str]] = []
+        tenant_count = 0
+        event_count = 0
+
+        for leaf in self.repo.iter_leaf_events(target_date, tenant_id):
+            if leaf.tenant_id != current_tenant:
+                if current_tenant is not None:
+                    tenant_roots.append(
+                        (
+                            tenant_id_hash,
+                            current_tenant,
+                            self.merkle.frontier_root(frontier),
+                            tenant_count,
+                        )
+                    )
+                current_tenant = leaf.tenant_id
+                tenant_id_hash = worm_tenant_id_hash(current_tenant)
+                frontier = []
+                tenant_count = 0
+
+            # Hoja recalculada desde el evento: detecta alteraciones posteriores
+            self.merkle.push_leaf(
+                frontier, self.merkle.event_leaf(leaf.event_id, leaf.current_hash)
+            )
+            tenant_count += 1
+            event_count += 1
+
+            yield WormEvidenceItem(
+                event_id=leaf.event_id,
+                leaf_index=leaf.leaf_index,
+                timestamp=leaf.timestamp.astimezone(timezone.utc)
+                .isoformat()
+                .replace("+00:00", "Z"),
+                event_type=leaf.event_type,
+                tenant_id_hash=tenant_id_hash,
+                payload_hash=leaf.current_hash,
+                previous_hash=leaf.previous_hash,
+                current_hash=leaf.current_hash,
+            )
+
+        if current_tenant is not None:
+            tenant_roots.append(
+                (
+                    tenant_id_hash,
+                    current_tenant,
+                    self.merkle.frontier_root(frontier),
+                    tenant_count,
+                )
+            )
+
+        if tenant_id:
+            trailer = self._tenant_trailer(
+                target_date, event_count, tenant_id, tenant_roots, tenant_seals
+            )
+        else:
+            trailer = self._global_trailer(
+                target_date, event_count, tenant_roots, global_seal
+            )
+
+        if not trailer.matches_seal:
+            logger.error(
+                "WORM export root does not match daily seal",
+                period=target_date.isoformat(),
+                root_hash=trailer.root_hash,
+                recomputed_root_hash=trailer.recomputed_root_hash,
+            )
+        yield trailer
+
+    def _tenant_trailer(
+        self,
+        target_date: date,
+        event_count: int,
+        tenant_id: UUID,
+        tenant_roots: list[tuple[str, UUID, str, int]],
+        tenant_seals: dict[UUID, WormSealEntity],
+    ) -> WormEvidenceExportTrailer:
+        tenant_id_hash = worm_tenant_id_hash(tenant_id)
+        recomputed = tenant_roots[0][2] if tenant_roots else EMPTY_ROOT
+        seal = tenant_seals.get(tenant_id)
+        return self._trailer(
+            target_date,
+            event_count,
+            seal,
+            recomputed,
+            tenant_id_hash=tenant_id_hash,
+        )
+
+    def _global_trailer(
+        self,
+        target_date: date,
+        event_count: int,
+        tenant_roots: list[tuple[str, UUID, str, int]],
+        global_seal: WormSealEntity,
+    ) -> WormEvidenceExportTrailer:
+        # Mismo orden de hojas globales que el sellado
+        tenant_roots.sort(key=lambda item: (item[0], item[1]))
+        recomputed = self.merkle.root(
+            [
+                self.merkle.tenant_leaf(tenant_id_hash, tenant_root)
+                for tenant_id_hash, _, tenant_root, _ in tenant_roots
+            ]
+        )
+        return self._trailer(
+            target_date,
+            event_count,
+            global_seal,
+            recomputed,
+            tenant_roots=[
+                WormTenantRootItem(
+                    tenant_id_hash=tenant_id_hash,
+                    root_hash=tenant_root,
+                    leaf_count=leaf_count,
+                )
+                for tenant_id_hash, _, tenant_root, leaf_count in tenant_roots
+            ],
+        )
+
+    def _trailer(
+        self,
+        target_date: date,
+        event_count: int,
+        seal: Optional[WormSealEntity],
+        recomputed_root_hash: str,
+        **extra,
+    ) -> WormEvidenceExportTrailer:
+        # Raíz y firma del sello persistido: el export nunca firma. La raíz
+        # recalculada va sin firma; si los eventos se alteraron tras el
+        # sellado, firmarla certificaría la alteración.
+        sealed_root = seal.root_hash if seal else EMPTY_ROOT
+        return WormEvidenceExportTrailer(
+            issued_at=datetime.now(timezone.utc).isoformat(),
+            period=target_date.isoformat(),
+            event_count=event_count,
+            merkle_algorithm=MerkleTreeService.ALGORITHM,
+            root_hash=sealed_root,
+            recomputed_root_hash=recomputed_root_hash,
+            matches_seal=recomputed_root_hash == sealed_root,
+            digital_signature=seal.signature if seal else None,
+            public_key=self.signer.get_public_key_pem(),
+            **extra,
+        )
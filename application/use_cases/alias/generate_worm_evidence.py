@@ -1,88 +1,95 @@
-import hashlib
-import os
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
+from uuid import UUID
 
-from application.dtos import WormEvidenceItem, WormEvidenceResponse
+from application.dtos import WormEvidenceResponse, WormTenantRootItem
 from core.config import settings
 from core.logger import get_logger, log_execution_time
-from domain.entities import AliasEventEntity
-from domain.repositories import IAliasEventRepository
-from domain.services import DigitalSignatureService
+from domain.entities import WormSealEntity
+from domain.repositories import IWormSealRepository
+from domain.services import DigitalSignatureService, MerkleTreeService
+from domain.services.merkle_tree_service import EMPTY_ROOT
+
+from .seal_worm_day import (
+    SealWormDayUseCase,
+    worm_signature_payload,
+    worm_tenant_id_hash,
+)
 
 logger = get_logger("use_cases.worm")
 
 
 class GenerateWormEvidenceUseCase:
+    """
+    Evidencia WORM diaria a partir del sello precalculado: una lectura por
+    índice en vez de recorrer y hashear todos los eventos del día. Un día
+    cerrado que aún no tiene sello se sella en la primera consulta.
+    """
+
     def __init__(
         self,
-        alias_event_repository: IAliasEventRepository,
+        worm_seal_repository: IWormSealRepository,
+        seal_worm_day_use_case: SealWormDayUseCase,
         signature_service: DigitalSignatureService,
     ):
-        self.repo = alias_event_repository
+        self.repo = worm_seal_repository
+        self.sealer = seal_worm_day_use_case
         self.signer = signature_service
 
     def execute(
-        self, target_date: date, tenant_id: Optional[str] = None
+        self, target_date: date, tenant_id: Optional[UUID] = None
     ) -> WormEvidenceResponse:
-        # ejemplo de uso de logger de tiempo de ejecución
-
-        # Medir solo la parte de base de datos + procesamiento
-        with log_execution_time(logger, "WORM data processing"):
-            daily_events = self.repo.get_events_by_date(target_date, tenant_id)
-            worm_events = self._build_worm_events(daily_events)
-            root_hash = self._calculate_period_root(worm_events)
+        with log_execution_time(logger, "WORM seal lookup"):
+            global_seal = self.repo.get_seal(target_date)
+            if not global_seal:
+                global_seal = self.sealer.execute(target_date)
 
-        # Medir solo la firma digital (operación criptográfica)
-        with log_execution_time(logger, "Digital signature"):
-            signature_payload = f"{target_date.isoformat()}:{root_hash}"
-            digital_signature = self.signer.sign(signature_payload)
+            if tenant_id:
+                seal = self.repo.get_seal(
+                    target_date, tenant_id
+                ) or self._empty_tenant_seal(target_date, tenant_id)
+                tenant_roots = []
+            else:
+                seal = global_seal
+                tenant_roots = [
+                    WormTenantRootItem.model_validate(tenant_seal)
+                    for tenant_seal in self.repo.get_tenant_seals(target_date)
+                ]
 
         logger.info(
-            "WORM evidence generated successfully",
-            events_count=len(worm_events),
-            root_hash=root_hash,
+            "WORM evidence served from seal",
+            events_count=seal.leaf_count,
+            root_hash=seal.root_hash,
         )
 
         return WormEvidenceResponse(
             version=settings.WORM_VERSION,
             issuer=settings.WORM_ISSUER,
-            issued_at=datetime.now().isoformat() + "Z",
+            issued_at=(
+                seal.sealed_at.isoformat()
+                if seal.sealed_at
+                else target_date.isoformat()
+            ),
             period=target_date.isoformat(),
-            root_hash=root_hash,
-            hash_chain=worm_events,
-            digital_signature=digital_signature,
+            root_hash=seal.root_hash,
+            leaf_count=seal.leaf_count,
+            merkle_algorithm=MerkleTreeService.ALGORITHM,
+            tenant_id_hash=seal.tenant_id_hash,
+            tenant_roots=tenant_roots,
+            digital_signature=seal.signature,
             public_key=self.signer.get_public_key_pem(),
         )
 
-    def _build_worm_events(
-        self, events: list[AliasEventEntity]
-    ) -> list[WormEvidenceItem]:
-        """Convierte eventos en formato WORM sin PII"""
-        worm_events = []
-
-        for event in events:
-            tenant_id_hash = hashlib.sha256(
-                f"{event.tenant_id}_{os.getenv('CUB_PEPPER')}".encode()
-            ).hexdigest()
-
-            worm_events.append(
-                WormEvidenceItem(
-                    timestamp=event.timestamp.isoformat() + "Z",
-                    event_type=event.event_type,
-                    tenant_id_hash=tenant_id_hash[:16],
-                    payload_hash=event.current_hash,
-                    previous_hash=event.previous_hash,
-                    current_hash=event.current_hash,
-                )
-            )
-
-        return worm_events
-
-    def _calculate_period_root(self, worm_events: list[WormEvidenceItem]) -> str:
-        """Calcula hash raíz concatenando todos los current_hash finales"""
-        if not worm_events:
-            return hashlib.sha256(b"empty_day").hexdigest()
-
-        hash_material = "".join(event.current_hash for event in worm_events)
-        return hashlib.sha256(hash_material.encode()).hexdigest()
+    def _empty_tenant_seal(self, target_date: date, tenant_id: UUID) -> WormSealEntity:
+        """Tenant sin eventos en un día sellado: raíz vacía firmada al vuelo"""
+        tenant_id_hash = worm_tenant_id_hash(tenant_id)
+        return WormSealEntity(
+            seal_date=target_date,
+            tenant_id=tenant_id,
+            tenant_id_hash=tenant_id_hash,
+            root_hash=EMPTY_ROOT,
+            leaf_count=0,
+            signature=self.signer.sign(
+                worm_signature_payload(target_date, EMPTY_ROOT, tenant_id_hash)
+            ),
+        )
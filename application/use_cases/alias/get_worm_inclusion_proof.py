@@ -0,0 +1,97 @@
+from uuid import UUID
+
+from application.dtos import MerkleProofStepItem, WormInclusionProofResponse
+from core.config import settings
+from domain.entities import MerkleProofStep
+from domain.repositories import IWormSealRepository
+from domain.services import DigitalSignatureService, MerkleTreeService
+from utils import MESSAGES
+
+
+class GetWormInclusionProofUseCase:
+    """
+    Prueba de inclusión de un evento en el sello diario sin descargar el día:
+    el bloque de 2^WORM_MERKLE_STORED_LEVEL hojas del evento se recalcula y
+    los hermanos superiores se leen de los nodos persistidos (O(log n)).
+    """
+
+    def __init__(
+        self,
+        worm_seal_repository: IWormSealRepository,
+        merkle_tree_service: MerkleTreeService,
+        signature_service: DigitalSignatureService,
+    ):
+        self.repo = worm_seal_repository
+        self.merkle = merkle_tree_service
+        self.signer = signature_service
+
+    def execute(self, event_id: UUID) -> WormInclusionProofResponse:
+        leaf = self.repo.get_leaf_by_event(event_id)
+        if not leaf:
+            raise ValueError(MESSAGES.ERROR.VALIDATION.WORM_EVENT_NOT_SEALED.CODE)
+
+        tenant_seal = self.repo.get_seal(leaf.seal_date, leaf.tenant_id)
+        global_seal = self.repo.get_seal(leaf.seal_date)
+        if not tenant_seal or not global_seal:
+            raise ValueError(MESSAGES.ERROR.VALIDATION.WORM_DAY_NOT_SEALED.CODE)
+
+        tenant_proof = self._tenant_proof(
+            leaf.tenant_id, leaf.seal_date, leaf.leaf_index, tenant_seal.leaf_count
+        )
+
+        tenant_seals = self.repo.get_tenant_seals(leaf.seal_date)
+        global_leaves = [
+            self.merkle.tenant_leaf(seal.tenant_id_hash, seal.root_hash)
+            for seal in tenant_seals
+        ]
+        global_index = next(
+            index
+            for index, seal in enumerate(tenant_seals)
+            if seal.tenant_id == leaf.tenant_id
+        )
+        global_proof = self.merkle.proof(
+            self.merkle.build_levels(global_leaves), global_index
+        )
+
+        return WormInclusionProofResponse(
+            event_id=event_id,
+            period=leaf.seal_date.isoformat(),
+            merkle_algorithm=MerkleTreeService.ALGORITHM,
+            leaf_index=leaf.leaf_index,
+            leaf_hash=leaf.leaf_hash,
+            tenant_id_hash=tenant_seal.tenant_id_hash,
+            tenant_root_hash=tenant_seal.root_hash,
+            tenant_leaf_count=tenant_seal.leaf_count,
+            tenant_proof=[MerkleProofStepItem.model_validate(s) for s in tenant_proof],
+            tenant_signature=tenant_seal.signature,
+            global_leaf_index=global_index,
+            global_leaf_hash=global_leaves[global_index],
+            global_root_hash=global_seal.root_hash,
+            global_proof=[MerkleProofStepItem.model_validate(s) for s in global_proof],
+            global_signature=global_seal.signature,
+            public_key=self.signer.get_public_key_pem(),
+        )
+
+    def _tenant_proof(
+        self, tenant_id: UUID, seal_date, leaf_index: int, leaf_count: int
+    ) -> list[MerkleProofStep]:
+        stored_level = settings.WORM_MERKLE_STORED_LEVEL
+        block = leaf_index >> stored_level
+        start = block << stored_level
+
+        block_leaves = self.repo.get_leaf_hashes(
+            tenant_id, seal_date, start, start + (1 << stored_level)
+        )
+        steps = self.merkle.proof(
+            self.merkle.build_levels(block_leaves), leaf_index - start
+        )
+
+        path = self.merkle.sibling_path(leaf_count, stored_level, block)
+        nodes = self.repo.get_nodes(
+            tenant_id, seal_date, [(level, index) for level, index, _ in path]
+        )
+        steps.extend(
+            MerkleProofStep(position=position, hash=nodes[(level, index)])
+            for level, index, position in path
+        )
+        return steps
@@ -1,40 +1,46 @@
+from typing import Optional
+
 from application.dtos import AliasResponse, RegisterAliasCommand
-from domain.entities import AliasEventEntity, AliasRegistryEntity, GlobalAliasEntity
+from domain.entities import AliasRegistryEntity, GlobalAliasEntity
 from domain.repositories import (
-    IAliasEventRepository,
-    IAliasRepository,
-    IGlobalAliasRepository,
+    IAliasExistenceFilter,
+    IAliasResolveCache,
+    IAsyncAliasRepository,
+    IAsyncGlobalAliasRepository,
+    IUnitOfWork,
+)
+from domain.services import (
+    BankRoutingService,
+    ChainAppendService,
+    HashChainService,
+    alias_normalizer,
 )
-from domain.services import BankRoutingService, HashChainService
 from utils import MESSAGES, AliasStatus, EEventType
 
 
 class RegisterAliasUseCase:
     def __init__(
         self,
-        alias_repository: IAliasRepository,
-        alias_event_repository: IAliasEventRepository,
+        alias_repository: IAsyncAliasRepository,
+        chain_append_service: ChainAppendService,
         hash_chain_service: HashChainService,
-        global_alias_repository: IGlobalAliasRepository,
+        global_alias_repository: IAsyncGlobalAliasRepository,
         bank_routing_service: BankRoutingService,
+        unit_of_work: IUnitOfWork,
+        resolve_cache: Optional[IAliasResolveCache] = None,
+        existence_filter: Optional[IAliasExistenceFilter] = None,
     ):
         self.alias_repository = alias_repository
-        self.alias_event_repository = alias_event_repository
+        self.chain_append_service = chain_append_service
         self.hash_chain_service = hash_chain_service
         self.global_alias_repository = global_alias_repository
         self.bank_routing_service = bank_routing_service
+        self.unit_of_work = unit_of_work
+        self.resolve_cache = resolve_cache
+        self.existence_filter = existence_filter
 
-    def execute(self, command: RegisterAliasCommand) -> AliasResponse:
-        alias_normalized = command.create_dto.alias.strip().lower()
-
-        existing_alias = self.alias_repository.find_active_by_normalized_alias(
-            command.tenant_id, alias_normalized
-        )
-        existing_global_alias = self.global_alias_repository.find_active_alias(
-            alias_normalized
-        )
-        if existing_alias or existing_global_alias:
-            raise ValueError(MESSAGES.ERROR.VALIDATION.ALIAS_ALREADY_EXISTS.CODE)
+    async def execute(self, command: RegisterAliasCommand) -> AliasResponse:
+        alias_normalized = alias_normalizer.normalize(command.create_dto.alias)
 
         alias_entity = AliasRegistryEntity(
             tenant_id=command.tenant_id,
@@ -54,8 +60,6 @@ class RegisterAliasUseCase:
             alias_normalized=alias_normalized,
         )
 
-        saved_alias = self.alias_repository.create(alias_entity)
-
         routing_code = self.bank_routing_service.get_routing_code(
             command.create_dto.bank
         )
@@ -66,30 +70,38 @@ class RegisterAliasUseCase:
             routing_code=routing_code,
         )
 
-        self.global_alias_repository.create(global_alias_entity)
+        # Registro, alias global y evento REGISTER en una sola transacción.
+        # Los duplicados los detectan los índices únicos (ON CONFLICT), sin
+        # SELECT previo ni ventana de carrera entre el chequeo y el INSERT.
+        try:
+            reserved = await self.global_alias_repository.insert_if_available(
+                global_alias_entity
+            )
+            if not reserved:
+                raise ValueError(MESSAGES.ERROR.VALIDATION.ALIAS_ALREADY_EXISTS.CODE)
 
-        last_event = self.alias_event_repository.get_last_event_for_alias(
-            alias_normalized, command.tenant_id
-        )
-        previous_hash = last_event.current_hash if last_event else "0" * 64
-        current_hash = self.hash_chain_service.calculate_event_hash(
-            tenant_id=command.tenant_id,
-            alias=alias_normalized,
-            event_type=EEventType.REGISTER,
-            timestamp=saved_alias.created_at,
-            previous_hash=previous_hash,
-        )
+            saved_alias = await self.alias_repository.insert_if_absent(alias_entity)
+            if not saved_alias:
+                raise ValueError(MESSAGES.ERROR.VALIDATION.ALIAS_ALREADY_EXISTS.CODE)
 
-        event_entity = AliasEventEntity(
-            alias_normalized=alias_normalized,
-            tenant_id=command.tenant_id,
-            event_type=EEventType.REGISTER,
-            correlation_id=command.correlation_id,
-            previous_hash=previous_hash,
-            current_hash=current_hash,
-            timestamp=saved_alias.created_at,
-        )
-        self.alias_event_repository.create(event_entity)
+            await self.chain_append_service.append(
+                tenant_id=command.tenant_id,
+                alias_normalized=alias_normalized,
+                event_type=EEventType.REGISTER,
+                correlation_id=command.correlation_id,
+                timestamp=saved_alias.created_at,
+            )
+
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        # Descarta un not_found cacheado para este alias
+        if self.resolve_cache:
+            await self.resolve_cache.invalidate(command.tenant_id, [alias_normalized])
+        if self.existence_filter:
+            await self.existence_filter.announce([alias_normalized])
 
         return AliasResponse(
             id=saved_alias.id,
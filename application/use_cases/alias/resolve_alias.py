@@ -1,62 +1,87 @@
-from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
 from application.dtos import ResolveAliasQuery, ResolveAliasResponse
-from domain.entities import AliasEventEntity
-from domain.repositories import IAliasEventRepository, IAliasRepository
-from domain.services import HashChainService
+from domain.repositories import (
+    IAliasResolveCache,
+    IAsyncAliasRepository,
+    IChainEventSink,
+    IUnitOfWork,
+)
+from domain.services import ChainAppendService, alias_normalizer
 from utils import EEventType
 
 
 class ResolveAliasUseCase:
     def __init__(
         self,
-        alias_repository: IAliasRepository,
-        alias_event_repository: IAliasEventRepository,
-        hash_chain_service: HashChainService,
+        alias_repository: IAsyncAliasRepository,
+        chain_append_service: ChainAppendService,
+        unit_of_work: IUnitOfWork,
+        resolve_cache: Optional[IAliasResolveCache] = None,
+        event_sink: Optional[IChainEventSink] = None,
     ):
         self.alias_repository = alias_repository
-        self.alias_event_repository = alias_event_repository
-        self.hash_chain_service = hash_chain_service
+        self.chain_append_service = chain_append_service
+        self.unit_of_work = unit_of_work
+        self.resolve_cache = resolve_cache
+        self.event_sink = event_sink
 
-    def execute(
+    async def execute(
         self, query: ResolveAliasQuery, correlation_id: UUID
     ) -> ResolveAliasResponse:
-        alias_normalized = query.alias.strip().lower()
+        alias_normalized = alias_normalizer.normalize(query.alias)
 
-        alias_entity = self.alias_repository.find_active_by_normalized_alias(
-            tenant_id=query.tenant_id, alias_normalized=alias_normalized
-        )
-
-        if not alias_entity:
-            return ResolveAliasResponse.not_found()
+        response = await self._lookup(query.tenant_id, alias_normalized)
+        if not response.exists:
+            return response
 
-        if alias_entity.tenant_id != query.tenant_id:
-            return ResolveAliasResponse.not_found()
+        # El evento RESOLVE se registra también cuando la respuesta sale de caché;
+        # con event_sink se encadena en lote fuera de la transacción de la request
+        if self.event_sink:
+            await self.event_sink.submit(
+                tenant_id=query.tenant_id,
+                alias_normalized=alias_normalized,
+                event_type=EEventType.RESOLVE,
+                correlation_id=correlation_id,
+            )
+        else:
+            await self.chain_append_service.append(
+                tenant_id=query.tenant_id,
+                alias_normalized=alias_normalized,
+                event_type=EEventType.RESOLVE,
+                correlation_id=correlation_id,
+            )
+            await self.unit_of_work.commit()
 
-        last_event = self.alias_event_repository.get_last_event_for_alias(
-            alias_normalized, alias_entity.tenant_id
-        )
+        return response
 
-        previous_hash = last_event.current_hash if last_event else "0" * 64
-        timestamp = datetime.now(timezone.utc)
-        current_hash = self.hash_chain_service.calculate_event_hash(
-            tenant_id=query.tenant_id,
-            alias=alias_normalized,
-            event_type=EEventType.RESOLVE,
-            timestamp=timestamp,
-            previous_hash=previous_hash,
-        )
+    async def _lookup(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> ResolveAliasResponse:
+        generation = None
+        if self.resolve_cache:
+            cached, generation = await self.resolve_cache.get(
+                tenant_id, alias_normalized
+            )
+            if cached is not None:
+                return cached
 
-        event_entity = AliasEventEntity(
-            alias_normalized=alias_normalized,
-            tenant_id=query.tenant_id,
-            event_type=EEventType.RESOLVE,
-            correlation_id=correlation_id,
-            previous_hash=previous_hash,
-            current_hash=current_hash,
-            timestamp=timestamp,
+        alias_entity = await self.alias_repository.find_active_by_normalized_alias(
+            tenant_id=tenant_id, alias_normalized=alias_normalized
         )
-        self.alias_event_repository.create(event_entity)
+        if not alias_entity or alias_entity.tenant_id != tenant_id:
+            response = ResolveAliasResponse.not_found()
+        else:
+            response = ResolveAliasResponse.found(alias_entity)
 
-        return ResolveAliasResponse.found(alias_entity)
+        if self.resolve_cache:
+            # Si una baja invalidó la clave durante la consulta no se cachea
+            await self.resolve_cache.set(
+                tenant_id,
+                alias_normalized,
+                response,
+                generation,
+                negative=not response.exists,
+            )
+        return response
@@ -0,0 +1,184 @@
+import hashlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from core.config import settings
+from core.logger import get_logger, log_execution_time
+from domain.entities import WormSealEntity
+from domain.repositories import IWormSealRepository
+from domain.services import DigitalSignatureService, MerkleTreeService
+from utils import MESSAGES
+
+logger = get_logger("use_cases.worm_seal")
+
+
+def worm_tenant_id_hash(tenant_id: UUID) -> str:
+    """Identificador anonimizado del tenant en evidencias WORM (sin PII)"""
+    return hashlib.sha256(f"{tenant_id}_{settings.CUB_PEPPER}".encode()).hexdigest()[
+        :16
+    ]
+
+
+def worm_signature_payload(
+    period: date, root_hash: str, tenant_id_hash: Optional[str] = None
+) -> str:
+    """Texto firmado de un sello: día, tenant anonimizado (si aplica) y raíz"""
+    if tenant_id_hash:
+        return f"{period.isoformat()}:{tenant_id_hash}:{root_hash}"
+    return f"{period.isoformat()}:{root_hash}"
+
+
+class SealWormDayUseCase:
+    """
+    Sellado WORM diario. Durante el día los eventos se agregan como hojas del
+    árbol de su tenant (append_leaves, periódico); al cierre se calculan las
+    raíces por bloques en streaming, se persisten los nodos altos y se firman
+    la raíz de cada tenant y la raíz global sobre las raíces de los tenants,
+    todas en un solo lote (sign_many reparte los lotes grandes en procesos).
+    """
+
+    def __init__(
+        self,
+        worm_seal_repository: IWormSealRepository,
+        merkle_tree_service: MerkleTreeService,
+        signature_service: DigitalSignatureService,
+    ):
+        self.repo = worm_seal_repository
+        self.merkle = merkle_tree_service
+        self.signer = signature_service
+
+    def append_leaves(self, seal_date: Optional[date] = None) -> Optional[int]:
+        seal_date = seal_date or datetime.now(timezone.utc).date()
+        return self.repo.append_leaves(seal_date, self.merkle.event_leaf)
+
+    def execute(self, seal_date: date) -> WormSealEntity:
+        if seal_date >= datetime.now(timezone.utc).date():
+            raise ValueError(MESSAGES.ERROR.VALIDATION.WORM_DAY_NOT_SEALED.CODE)
+
+        existing = self.repo.get_seal(seal_date)
+        if existing:
+            return existing
+
+        # Hojas pendientes desde la última ejecución periódica
+        if self.repo.append_leaves(seal_date, self.merkle.event_leaf) is None:
+            raise ValueError(MESSAGES.ERROR.VALIDATION.WORM_DAY_NOT_SEALED.CODE)
+
+        if not self.repo.try_lock_day(seal_date):
+            raise ValueError(MESSAGES.ERROR.VALIDATION.WORM_DAY_NOT_SEALED.CODE)
+        existing = self.repo.get_seal(seal_date)
+        if existing:
+            return existing
+
+        with log_execution_time(logger, "WORM day sealing"):
+            tenant_seals, nodes = self._seal_tenants(seal_date)
+            global_seal = self._seal_global(seal_date, tenant_seals)
+            self._sign_seals([*tenant_seals, global_seal])
+            self.repo.save_seals([*tenant_seals, global_seal], nodes)
+
+        logger.info(
+            "WORM day sealed",
+            seal_date=seal_date.isoformat(),
+            tenants=len(tenant_seals),
+            events_count=sum(seal.leaf_count for seal in tenant_seals),
+            root_hash=global_seal.root_hash,
+        )
+        return global_seal
+
+    def check_late_events(self, seal_date: date) -> int:
+        """
+        Eventos del día confirmados después de su sello (escritores en lote,
+        transacciones lentas, relojes desfasados): no tienen hoja, así que no
+        están en el sello, el export ni las pruebas. Un sello es inmutable; se
+        registran como error para revisión.
+        """
+        if self.repo.get_seal(seal_date) is None:
+            return 0
+        late = self.repo.count_events_without_leaf(seal_date)
+        if late:
+            logger.error(
+                "WORM events committed after the day seal",
+                seal_date=seal_date.isoformat(),
+                events_count=late,
+            )
+        return late
+
+    def execute_range(self, start: date, end: date) -> list[WormSealEntity]:
+        """
+        Backfill de [start, end]: sella cada día cerrado sin sello y devuelve
+        los sellos globales; un día que no se puede sellar no corta el resto
+        """
+        seals = []
+        day = start
+        while day <= end:
+            try:
+                seals.append(self.execute(day))
+            except ValueError as e:
+                logger.warning(
+                    "WORM backfill day skipped", seal_date=day.isoformat(), error=str(e)
+                )
+            day += timedelta(days=1)
+        return seals
+
+    def _seal_tenants(
+        self, seal_date: date
+    ) -> tuple[list[WormSealEntity], list[tuple[UUID, int, int, str]]]:
+        stored_level = settings.WORM_MERKLE_STORED_LEVEL
+        seals = []
+        nodes = []
+
+        for tenant_id, leaf_count in self.repo.get_leaf_counts(seal_date).items():
+            block_roots = self.merkle.block_roots(
+                self.repo.iter_leaf_hashes(tenant_id, seal_date), stored_level
+            )
+            levels = self.merkle.build_levels(block_roots)
+            nodes.extend(
+                (tenant_id, stored_level + height, index, node_hash)
+                for height, level in enumerate(levels)
+                for index, node_hash in enumerate(level)
+            )
+
+            root_hash = levels[-1][0]
+            tenant_id_hash = worm_tenant_id_hash(tenant_id)
+            seals.append(
+                WormSealEntity(
+                    seal_date=seal_date,
+                    tenant_id=tenant_id,
+                    tenant_id_hash=tenant_id_hash,
+                    root_hash=root_hash,
+                    leaf_count=leaf_count,
+                    signature="",
+                )
+            )
+
+        # Mismo orden que get_tenant_seals: define las hojas del árbol global
+        seals.sort(key=lambda seal: (seal.tenant_id_hash, seal.tenant_id))
+        return seals, nodes
+
+    def _seal_global(
+        self, seal_date: date, tenant_seals: list[WormSealEntity]
+    ) -> WormSealEntity:
+        root_hash = self.merkle.root(
+            [
+                self.merkle.tenant_leaf(seal.tenant_id_hash, seal.root_hash)
+                for seal in tenant_seals
+            ]
+        )
+        return WormSealEntity(
+            seal_date=seal_date,
+            root_hash=root_hash,
+            leaf_count=len(tenant_seals),
+            signature="",
+        )
+
+    def _sign_seals(self, seals: list[WormSealEntity]) -> None:
+        signatures = self.signer.sign_many(
+            [
+                worm_signature_payload(
+                    seal.seal_date, seal.root_hash, seal.tenant_id_hash
+                )
+                for seal in seals
+            ]
+        )
+        for seal, signature in zip(seals, signatures):
+            seal.signature = signature
@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from application.dtos import BrokenChainItem, ChainBatchVerificationResponse
+from core.config import settings
+from domain.entities import ChainBatchReportEntity
+from domain.repositories import IChainBatchVerifier
+
+
+class VerifyAllChainsUseCase:
+    """
+    Verificación masiva de todas las cadenas de un tenant (o de todos) y
+    persistencia del reporte JSON para auditoría.
+    """
+
+    def __init__(
+        self,
+        chain_batch_verifier: IChainBatchVerifier,
+        report_dir: str = settings.CHAIN_VERIFY_REPORT_DIR,
+    ):
+        self.chain_batch_verifier = chain_batch_verifier
+        self.report_dir = Path(report_dir)
+
+    def verify(
+        self, tenant_id: Optional[UUID] = None, workers: Optional[int] = None
+    ) -> ChainBatchVerificationResponse:
+        """Solo el reporte, sin escribirlo en disco (jobs encolados por la API)"""
+        return self._to_response(
+            self.chain_batch_verifier.verify_all(tenant_id=tenant_id, workers=workers)
+        )
+
+    def execute(
+        self,
+        tenant_id: Optional[UUID] = None,
+        workers: Optional[int] = None,
+        output: Optional[str] = None,
+    ) -> ChainBatchVerificationResponse:
+        response = self.verify(tenant_id=tenant_id, workers=workers)
+
+        report_path = Path(output) if output else self._default_report_path(response)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        response.report_path = str(report_path)
+        report_path.write_text(response.model_dump_json(indent=2), encoding="utf-8")
+
+        return response
+
+    def _default_report_path(self, report: ChainBatchVerificationResponse) -> Path:
+        scope = str(report.tenant_id) if report.tenant_id else "all"
+        stamp = report.started_at.strftime("%Y%m%dT%H%M%SZ")
+        return self.report_dir / f"chains_{scope}_{stamp}.json"
+
+    def _to_response(
+        self, report: ChainBatchReportEntity
+    ) -> ChainBatchVerificationResponse:
+        duration = report.duration_seconds
+        return ChainBatchVerificationResponse(
+            tenant_id=report.tenant_id,
+            started_at=report.started_at,
+            finished_at=report.finished_at,
+            duration_seconds=duration,
+            workers=report.workers,
+            partitions=report.partitions,
+            total_chains=report.total_chains,
+            total_events=report.total_events,
+            events_per_second=report.total_events / duration if duration else 0.0,
+            broken_count=report.broken_count,
+            broken_chains=[
+                BrokenChainItem.model_validate(broken)
+                for broken in report.broken_chains
+            ],
+        )
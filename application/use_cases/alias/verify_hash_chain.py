@@ -1,60 +1,105 @@
-from application.dtos import HashChainVerificationResponse
+from collections.abc import Iterator
+
+from application.dtos import (
+    HashChainVerificationProgress,
+    HashChainVerificationResponse,
+)
 from application.dtos.alias_queries import VerifyHashChainQuery
-from domain.repositories import IAliasEventRepository
-from domain.services import HashChainService
+from core.config import settings
+from domain.entities import GENESIS_HASH, ChainCheckpointEntity, ChainVerificationResult
+from domain.repositories import IAliasEventRepository, IChainCheckpointRepository
+from domain.services import HashChainService, alias_normalizer
 from utils import MESSAGES
 
 
 class VerifyHashChainUseCase:
+    """
+    Verificación incremental: recorre con cursor solo los eventos posteriores
+    al último checkpoint (salvo query.full) y lo avanza hasta el último evento
+    válido contiguo.
+    """
+
     def __init__(
         self,
         alias_event_repository: IAliasEventRepository,
         hash_chain_service: HashChainService,
+        checkpoint_repository: IChainCheckpointRepository,
     ):
         self.alias_event_repository = alias_event_repository
         self.hash_chain_service = hash_chain_service
+        self.checkpoint_repository = checkpoint_repository
 
     def execute(self, query: VerifyHashChainQuery) -> HashChainVerificationResponse:
-        alias_normalized = query.alias.strip().lower()
+        *_, response = self.execute_stream(query, progress_every=0)
+        return response
+
+    def execute_stream(
+        self,
+        query: VerifyHashChainQuery,
+        progress_every: int = settings.VERIFY_CHAIN_PROGRESS_EVERY,
+    ) -> Iterator[HashChainVerificationProgress | HashChainVerificationResponse]:
+        alias_normalized = alias_normalizer.normalize(query.alias)
 
-        events = self.alias_event_repository.get_events_for_alias(
-            alias_normalized, query.tenant_id
+        checkpoint = None
+        if not query.full:
+            checkpoint = self.checkpoint_repository.get_checkpoint(
+                query.tenant_id, alias_normalized
+            )
+        start_seq = checkpoint.last_verified_seq if checkpoint else 0
+        start_hash = checkpoint.last_verified_hash if checkpoint else GENESIS_HASH
+
+        events = self.alias_event_repository.iter_events_for_alias(
+            alias_normalized, query.tenant_id, after_seq=start_seq
         )
+        for result in self.hash_chain_service.iter_chain_verification(
+            events, start_seq, start_hash, progress_every
+        ):
+            if not result.completed:
+                yield HashChainVerificationProgress(
+                    alias=alias_normalized,
+                    from_seq=result.from_seq,
+                    verified_events=result.verified_events,
+                    last_seq=result.last_seq,
+                    corrupted_count=result.corrupted_count,
+                )
 
-        if not events:
-            return HashChainVerificationResponse(
-                alias=alias_normalized,
-                is_valid=True,
-                total_events=0,
-                valid_events=0,
-                corrupted_events=[],
-                chain_break_at=None,
-                expected_hash="",
-                actual_hash="",
-                details=MESSAGES.ERROR.VALIDATION.NO_EVENTS_FOUND_FOR_VERIFICATION.CODE,
+        if result.checkpoint_seq > start_seq:
+            self.checkpoint_repository.save_checkpoint(
+                ChainCheckpointEntity(
+                    tenant_id=query.tenant_id,
+                    alias_normalized=alias_normalized,
+                    last_verified_seq=result.checkpoint_seq,
+                    last_verified_hash=result.checkpoint_hash,
+                )
             )
 
-        (
-            is_valid,
-            corrupted_indices,
-            chain_break_at,
-            expected_hash,
-            actual_hash,
-        ) = self.hash_chain_service.verify_chain_integrity(events)
+        yield self._to_response(alias_normalized, result)
+
+    def _to_response(
+        self, alias_normalized: str, result: ChainVerificationResult
+    ) -> HashChainVerificationResponse:
+        total_events = result.last_seq
 
-        if is_valid:
-            details = f"Hash chain integrity verified - all {len(events)} events are consistent"
+        if total_events == 0:
+            details = MESSAGES.ERROR.VALIDATION.NO_EVENTS_FOUND_FOR_VERIFICATION.CODE
+        elif result.is_valid:
+            details = f"Hash chain integrity verified - all {total_events} events are consistent"
+            if result.from_seq:
+                details += f" ({result.verified_events} verified since checkpoint seq {result.from_seq})"
         else:
-            details = f"Chain broken at {len(corrupted_indices)} point(s) - events at indices {corrupted_indices} are corrupted"
+            details = f"Chain broken at {result.corrupted_count} point(s) - events at indices {result.corrupted_events} are corrupted"
 
         return HashChainVerificationResponse(
             alias=alias_normalized,
-            is_valid=is_valid,
-            total_events=len(events),
-            valid_events=len(events) - len(corrupted_indices),
-            corrupted_events=corrupted_indices,
-            chain_break_at=chain_break_at,
-            expected_hash=expected_hash,
-            actual_hash=actual_hash,
+            is_valid=result.is_valid,
+            total_events=total_events,
+            valid_events=total_events - result.corrupted_count,
+            corrupted_events=result.corrupted_events,
+            chain_break_at=result.chain_break_at,
+            expected_hash=result.expected_hash if total_events else "",
+            actual_hash=result.actual_hash if total_events else "",
             details=details,
+            from_seq=result.from_seq,
+            verified_events=result.verified_events,
+            last_verified_seq=result.checkpoint_seq,
         )
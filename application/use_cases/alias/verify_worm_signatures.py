@@ -0,0 +1,60 @@
+from application.dtos import (
+    WormSignatureItem,
+    WormSignatureResultItem,
+    WormSignatureVerificationResponse,
+)
+from core.logger import get_logger, log_execution_time
+from domain.services import DigitalSignatureService
+
+from .seal_worm_day import worm_signature_payload
+
+logger = get_logger("use_cases.worm_verify")
+
+
+class VerifyWormSignaturesUseCase:
+    """
+    Verificación en lote de firmas de sellos WORM (auditoría de meses de
+    evidencia): reconstruye el texto firmado de cada sello y verifica todas
+    las firmas con verify_many, que reparte los lotes grandes en procesos.
+    """
+
+    def __init__(self, signature_service: DigitalSignatureService):
+        self.signer = signature_service
+
+    def execute(
+        self, items: list[WormSignatureItem]
+    ) -> WormSignatureVerificationResponse:
+        with log_execution_time(logger, "WORM signatures verification"):
+            valid = self.signer.verify_many(
+                [
+                    (
+                        worm_signature_payload(
+                            item.period, item.root_hash, item.tenant_id_hash
+                        ),
+                        item.signature,
+                    )
+                    for item in items
+                ]
+            )
+
+        valid_count = sum(valid)
+        logger.info(
+            "WORM signatures verified",
+            count=len(items),
+            invalid_count=len(items) - valid_count,
+        )
+        return WormSignatureVerificationResponse(
+            count=len(items),
+            valid_count=valid_count,
+            invalid_count=len(items) - valid_count,
+            results=[
+                WormSignatureResultItem(
+                    period=item.period.isoformat(),
+                    tenant_id_hash=item.tenant_id_hash,
+                    root_hash=item.root_hash,
+                    valid=is_valid,
+                )
+                for item, is_valid in zip(items, valid)
+            ],
+            public_key=self.signer.get_public_key_pem(),
+        )
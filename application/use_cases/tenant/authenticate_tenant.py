@@ -1,6 +1,8 @@
+from datetime import datetime, timezone
+
 from application.dtos import TenantAuthRequest, TenantAuthResponse
-from domain.repositories import ITenantRepository
-from domain.services import JWTValidationService
+from domain.repositories import ITenantApiKeyRepository, ITenantRepository
+from domain.services import ApiKeyService, JWTValidationService
 from utils import MESSAGES
 
 
@@ -8,28 +10,47 @@ class AuthenticateTenantUseCase:
     def __init__(
         self,
         tenant_repository: ITenantRepository,
+        api_key_repository: ITenantApiKeyRepository,
+        api_key_service: ApiKeyService,
         jwt_service: JWTValidationService,
     ):
         self.tenant_repository = tenant_repository
+        self.api_key_repository = api_key_repository
+        self.api_key_service = api_key_service
         self.jwt_service = jwt_service
 
     def execute(self, auth_request: TenantAuthRequest) -> TenantAuthResponse:
-        tenant = self.tenant_repository.find_by_code(auth_request.tenant_code)
+        # Formato primero: keys mal formadas no llegan a caché ni a base de datos
+        parsed = self.api_key_service.parse(auth_request.api_key)
+        if not parsed or parsed[0] != auth_request.tenant_code:
+            raise ValueError(MESSAGES.ERROR.AUTH.INVALID_API_KEY.CODE)
+        _, key_id, secret = parsed
 
+        tenant = self.tenant_repository.find_by_code(auth_request.tenant_code)
         if not tenant:
             raise ValueError(MESSAGES.ERROR.AUTH.INVALID_CREDENTIALS.CODE)
 
         if not tenant.is_active():
             raise ValueError(MESSAGES.ERROR.AUTH.TENANT_INACTIVE.CODE)
 
-        if not tenant.verify_api_key(auth_request.api_key):
-            raise ValueError(MESSAGES.ERROR.AUTH.INVALID_CREDENTIALS.CODE)
+        api_key = self.api_key_repository.find_by_key_id(key_id)
+        if (
+            not api_key
+            or api_key.tenant_id != tenant.id
+            or not api_key.is_usable(datetime.now(timezone.utc))
+            or not self.api_key_service.verify(key_id, secret, api_key.key_hash)
+        ):
+            raise ValueError(MESSAGES.ERROR.AUTH.INVALID_API_KEY.CODE)
+
+        roles = tenant.roles
+        if api_key.scopes:
+            roles = [role for role in tenant.roles if role.value in api_key.scopes]
 
         token = self.jwt_service.create_tenant_token(
             tenant_code=tenant.code,
             tenant_id=str(tenant.id),
             tenant_type=tenant.type,
-            roles=tenant.roles,
+            roles=roles,
         )
 
         return TenantAuthResponse(
@@ -39,5 +60,5 @@ class AuthenticateTenantUseCase:
             tenant_id=str(tenant.id),
             tenant_code=tenant.code,
             tenant_type=tenant.type,
-            roles=tenant.roles,
+            roles=roles,
         )
@@ -1,9 +1,9 @@
-import secrets
 from uuid import uuid4
 
 from application.dtos import TenantCreate, TenantResponse
-from domain.entities import TenantEntity
-from domain.repositories import ITenantRepository
+from domain.entities import TenantApiKeyEntity, TenantEntity
+from domain.repositories import ITenantApiKeyRepository, ITenantRepository
+from domain.services import ApiKeyService
 from utils import MESSAGES, TenantStatus
 
 
@@ -11,8 +11,12 @@ class CreateTenantUseCase:
     def __init__(
         self,
         tenant_repository: ITenantRepository,
+        api_key_repository: ITenantApiKeyRepository,
+        api_key_service: ApiKeyService,
     ):
         self.tenant_repository = tenant_repository
+        self.api_key_repository = api_key_repository
+        self.api_key_service = api_key_service
 
     def execute(self, create_dto: TenantCreate) -> TenantResponse:
         if self.tenant_repository.find_by_code(create_dto.code):
@@ -43,7 +47,13 @@ class CreateTenantUseCase:
 
         saved_tenant = self.tenant_repository.create(tenant_entity)
 
-        api_key = f"tk_{saved_tenant.code}_{secrets.token_urlsafe(24)}"
+        # Key inicial: se muestra una sola vez y solo se guarda su digest
+        api_key, key_id, key_hash = self.api_key_service.generate(saved_tenant.code)
+        self.api_key_repository.create(
+            TenantApiKeyEntity(
+                tenant_id=saved_tenant.id, key_id=key_id, key_hash=key_hash
+            )
+        )
 
         return TenantResponse(
             id=saved_tenant.id,
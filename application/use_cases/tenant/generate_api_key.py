@@ -1,7 +1,11 @@
-import secrets
+from typing import Optional
 from uuid import UUID
 
+from application.dtos import TenantApiKeyCreate, TenantApiKeyResponse
+from domain.entities import TenantApiKeyEntity
+from domain.repositories import ITenantApiKeyRepository
 from domain.repositories.tenant_repository import ITenantRepository
+from domain.services import ApiKeyService
 from utils import MESSAGES
 
 
@@ -9,10 +13,16 @@ class GenerateAPIKeyUseCase:
     def __init__(
         self,
         tenant_repository: ITenantRepository,
+        api_key_repository: ITenantApiKeyRepository,
+        api_key_service: ApiKeyService,
     ):
         self.tenant_repository = tenant_repository
+        self.api_key_repository = api_key_repository
+        self.api_key_service = api_key_service
 
-    def execute(self, tenant_id: UUID) -> str:
+    def execute(
+        self, tenant_id: UUID, create_dto: Optional[TenantApiKeyCreate] = None
+    ) -> TenantApiKeyResponse:
         tenant = self.tenant_repository.get_by_id(tenant_id)
 
         if not tenant:
@@ -21,4 +31,18 @@ class GenerateAPIKeyUseCase:
         if not tenant.is_active():
             raise ValueError(MESSAGES.ERROR.AUTH.TENANT_INACTIVE.CODE)
 
-        return f"tk_{tenant.code}_{secrets.token_urlsafe(24)}"
+        create_dto = create_dto or TenantApiKeyCreate()
+        api_key, key_id, key_hash = self.api_key_service.generate(tenant.code)
+        saved = self.api_key_repository.create(
+            TenantApiKeyEntity(
+                tenant_id=tenant.id,
+                key_id=key_id,
+                key_hash=key_hash,
+                scopes=[scope.value for scope in create_dto.scopes],
+                expires_at=create_dto.expires_at,
+            )
+        )
+
+        response = TenantApiKeyResponse.model_validate(saved)
+        response.api_key = api_key
+        return response
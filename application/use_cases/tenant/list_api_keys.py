@@ -0,0 +1,15 @@
+from uuid import UUID
+
+from application.dtos import TenantApiKeyResponse
+from domain.repositories import ITenantApiKeyRepository
+
+
+class ListAPIKeysUseCase:
+    def __init__(self, api_key_repository: ITenantApiKeyRepository):
+        self.api_key_repository = api_key_repository
+
+    def execute(self, tenant_id: UUID) -> list[TenantApiKeyResponse]:
+        return [
+            TenantApiKeyResponse.model_validate(api_key)
+            for api_key in self.api_key_repository.list_by_tenant(tenant_id)
+        ]
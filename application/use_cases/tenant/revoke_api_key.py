@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from domain.repositories import ITenantApiKeyRepository
+from utils import MESSAGES
+
+
+class RevokeAPIKeyUseCase:
+    def __init__(self, api_key_repository: ITenantApiKeyRepository):
+        self.api_key_repository = api_key_repository
+
+    def execute(self, tenant_id: UUID, key_id: str) -> None:
+        if not self.api_key_repository.revoke(tenant_id, key_id):
+            raise ValueError(MESSAGES.ERROR.VALIDATION.API_KEY_NOT_FOUND.CODE)
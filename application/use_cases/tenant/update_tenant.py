@@ -26,7 +26,7 @@ class UpdateTenantUseCase:
         if update_dto.roles is not None:
             tenant_entity.roles = update_dto.roles
 
-        updated_tenant = self.tenant_repository.update(tenant_entity)
+        updated_tenant = self.tenant_repository.update(tenant_entity.id, tenant_entity)
 
         return TenantResponse(
             id=updated_tenant.id,
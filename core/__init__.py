@@ -1,15 +1,43 @@
-from .config import settings  # noqa: I001
-from .auth import get_current_tenant, get_current_user_payload, require_role
-from .database import engine, get_db
-from .error_handler import http_error_handler_middleware
-from .setup_logger import setup_logging
+from importlib import import_module
+
+from .config import settings
+
+# Solo settings se importa al cargar el paquete: el resto (auth, database,
+# error_handler) importa infraestructura y casos de uso, y cargarlo aquí
+# cerraba un ciclo con domain.services (hash_chain_service -> core -> auth
+# -> infrastructure.security -> domain.services) en todo proceso que no
+# empezara por main, como los hijos spawn de los pools de procesos.
+_LAZY_EXPORTS = {
+    "get_auth_context": ".auth",
+    "get_current_tenant": ".auth",
+    "get_current_user_payload": ".auth",
+    "require_role": ".auth",
+    "async_engine": ".database",
+    "engine": ".database",
+    "get_async_db": ".database",
+    "get_db": ".database",
+    "http_error_handler_middleware": ".error_handler",
+    "setup_logging": ".setup_logger",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+    return getattr(import_module(module, __name__), name)
+
 
 __all__ = [
     "get_db",
+    "get_async_db",
     "setup_logging",
     "http_error_handler_middleware",
     "settings",
     "engine",
+    "async_engine",
+    "get_auth_context",
     "get_current_user_payload",
     "get_current_tenant",
     "require_role",
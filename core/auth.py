@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
@@ -10,54 +11,75 @@ from utils import MESSAGES
 security = HTTPBearer()
 
 
-async def get_current_tenant(
-    request: Request,
-    authorization: Optional[str] = Header(None),
-) -> UUID:
-    """
-    Dependencia principal para extraer tenant_id del JWT
-    """
+@dataclass(frozen=True)
+class AuthContext:
+    """Resultado de autenticar el bearer token de una request"""
 
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=MESSAGES.ERROR.AUTH.TOKEN_REQUIRED.CODE,
-        )
+    payload: Optional[dict] = None
+    error: Optional[str] = None
 
-    try:
-        if not authorization.startswith("Bearer "):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=MESSAGES.ERROR.AUTH.INVALID_AUTH_FORMAT.CODE,
-            )
 
-        token = authorization.replace("Bearer ", "").strip()
+def _authenticate(authorization: Optional[str]) -> AuthContext:
+    if not authorization:
+        return AuthContext(error=MESSAGES.ERROR.AUTH.TOKEN_REQUIRED.CODE)
 
+    if not authorization.startswith("Bearer "):
+        return AuthContext(error=MESSAGES.ERROR.AUTH.INVALID_AUTH_FORMAT.CODE)
+
+    token = authorization.replace("Bearer ", "").strip()
+    try:
         validation_service = get_jwt_validation_service()
         payload = validation_service.validate_token(token)
+    except ValueError as e:
+        return AuthContext(error=str(e))
+    except Exception:
+        return AuthContext(error=MESSAGES.ERROR.AUTH.ERROR_GENERATING_TOKEN.CODE)
 
-        if validation_service.is_token_expired(payload):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=MESSAGES.ERROR.AUTH.TOKEN_EXPIRED.CODE,
-            )
+    if validation_service.is_token_expired(payload):
+        return AuthContext(error=MESSAGES.ERROR.AUTH.TOKEN_EXPIRED.CODE)
 
-        tenant_id = validation_service.extract_tenant_id(payload)
+    return AuthContext(payload=payload)
 
-        request.state.jwt_payload = payload
-        request.state.tenant_id = tenant_id
 
-        return tenant_id
+def get_auth_context(
+    request: Request,
+    authorization: Optional[str] = Header(None),
+) -> AuthContext:
+    """
+    Autentica el token una sola vez por request: el resultado queda en
+    request.state y lo reutilizan todas las dependencias de auth
+    """
+    context = getattr(request.state, "auth_context", None)
+    if context is None:
+        context = _authenticate(authorization)
+        request.state.auth_context = context
+    return context
+
 
+async def get_current_tenant(
+    request: Request,
+    authorization: Optional[str] = Header(None),
+) -> UUID:
+    """
+    Dependencia principal para extraer tenant_id del JWT
+    """
+    context = get_auth_context(request, authorization)
+    if context.error:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=context.error
+        )
+
+    try:
+        tenant_id = get_jwt_validation_service().extract_tenant_id(context.payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e)
         ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=MESSAGES.ERROR.AUTH.ERROR_GENERATING_TOKEN.CODE,
-        ) from e
+
+    request.state.jwt_payload = context.payload
+    request.state.tenant_id = tenant_id
+
+    return tenant_id
 
 
 async def get_current_user_payload(
@@ -64,6 +64,176 @@ class Settings(BaseSettings):
     REQUEST_TIMEOUT: int = Field(
         default=30, description="Timeout de requests en segundos"
     )
+    BULK_ALIAS_CHUNK_SIZE: int = Field(
+        default=1000, description="Alias por transacción en la carga masiva"
+    )
+    BULK_ALIAS_MAX_ITEMS: int = Field(
+        default=500_000, description="Máximo de alias por request de carga masiva"
+    )
+    INTEROP_BULK_MAX_ALIASES: int = Field(
+        default=1000, description="Máximo de alias por validación interop en lote"
+    )
+    VERIFY_CHAIN_BATCH_SIZE: int = Field(
+        default=5000, description="Filas por lote del cursor al verificar cadenas"
+    )
+    VERIFY_CHAIN_PROGRESS_EVERY: int = Field(
+        default=50_000, description="Eventos entre reportes de progreso"
+    )
+    ALIAS_HISTORY_PAGE_SIZE: int = Field(
+        default=100, description="Eventos por página del historial de un alias"
+    )
+    ALIAS_HISTORY_MAX_PAGE_SIZE: int = Field(
+        default=1000, description="Máximo de eventos por página del historial"
+    )
+    ALIAS_HISTORY_STREAM_BATCH_SIZE: int = Field(
+        default=2000, description="Filas por lote del cursor del historial NDJSON"
+    )
+    CHAIN_VERIFY_WORKERS: Optional[int] = Field(
+        default=None, description="Procesos de la verificación masiva (None = CPUs)"
+    )
+    CHAIN_VERIFY_PARTITIONS_PER_WORKER: int = Field(
+        default=4, description="Particiones por proceso para balancear carga"
+    )
+    CHAIN_VERIFY_REPORT_DIR: str = Field(
+        default="reports/chain_verification",
+        description="Directorio de reportes de verificación masiva",
+    )
+    CHAIN_VERIFY_JOB_RUNNER_ENABLED: bool = Field(
+        default=True,
+        description="Ejecutar los jobs encolados en el scheduler de la API "
+        "(False: solo scripts/db/verify_chains.py --run-queued en otro host)",
+    )
+    CHAIN_VERIFY_JOB_POLL_SECONDS: int = Field(
+        default=30, description="Intervalo de búsqueda de jobs de verificación"
+    )
+    CHAIN_VERIFY_JOB_STALE_SECONDS: int = Field(
+        default=6 * 3600,
+        description="Un job RUNNING sin terminar tras este tiempo se reintenta",
+    )
+    CHAIN_VERIFY_MAX_REPORTED_BREAKS: int = Field(
+        default=10_000, description="Cadenas rotas listadas en el reporte"
+    )
+
+    # 🧠 CACHE
+    REDIS_URL: Optional[str] = Field(
+        default=None, description="URL de Redis para caché compartida (opcional)"
+    )
+    CHAIN_HEAD_CACHE_ENABLED: bool = Field(
+        default=True, description="Caché read-through de cabezas de cadena"
+    )
+    CHAIN_HEAD_CACHE_MAX_ENTRIES: int = Field(
+        default=100_000, description="Cabezas de cadena en la caché en proceso"
+    )
+    CHAIN_HEAD_CACHE_TTL_SECONDS: int = Field(
+        default=300, description="TTL de las cabezas de cadena en caché"
+    )
+    RESOLVE_CACHE_ENABLED: bool = Field(
+        default=True, description="Caché de resolución de alias (local + Redis)"
+    )
+    RESOLVE_CACHE_MAX_ENTRIES: int = Field(
+        default=100_000, description="Resoluciones en la caché en proceso"
+    )
+    RESOLVE_CACHE_TTL_SECONDS: int = Field(
+        default=60, description="TTL de una resolución encontrada"
+    )
+    RESOLVE_CACHE_LOCAL_TTL_SECONDS: int = Field(
+        default=2,
+        description="TTL local sin Redis (sin aviso de invalidación entre workers)",
+    )
+    RESOLVE_CACHE_NEGATIVE_TTL_SECONDS: int = Field(
+        default=5, description="TTL de un not_found (tráfico de enumeración)"
+    )
+    RESOLVE_AUDIT_DURABILITY: Literal["sync", "group_commit", "async"] = Field(
+        default="group_commit",
+        description=(
+            "Evento RESOLVE: sync (append y commit en la request), group_commit "
+            "(lote en segundo plano, la request espera su commit) o async "
+            "(lote en segundo plano sin esperar)"
+        ),
+    )
+    RESOLVE_AUDIT_BATCH_SIZE: int = Field(
+        default=500, description="Eventos RESOLVE máximos por transacción"
+    )
+    RESOLVE_AUDIT_FLUSH_INTERVAL_MS: int = Field(
+        default=10, description="Espera máxima para completar un lote"
+    )
+    RESOLVE_AUDIT_QUEUE_MAX_SIZE: int = Field(
+        default=10_000, description="Eventos en cola antes de frenar las requests"
+    )
+    INTEROP_AUDIT_DURABILITY: Literal["sync", "group_commit", "async"] = Field(
+        default="group_commit",
+        description=(
+            "Auditoría interop: sync (INSERT y commit por consulta), group_commit "
+            "(lote en segundo plano, la request espera su commit) o async"
+        ),
+    )
+    INTEROP_AUDIT_BATCH_SIZE: int = Field(
+        default=1000, description="Filas de interop_audits por INSERT multi-fila"
+    )
+    INTEROP_AUDIT_FLUSH_INTERVAL_MS: int = Field(
+        default=10, description="Espera máxima para completar un lote de auditoría"
+    )
+    INTEROP_AUDIT_QUEUE_MAX_SIZE: int = Field(
+        default=20_000, description="Filas en cola antes de frenar las requests"
+    )
+    GLOBAL_ALIAS_FILTER_ENABLED: bool = Field(
+        default=True,
+        description="Filtro de Bloom en proceso para negativos de global_aliases",
+    )
+    GLOBAL_ALIAS_FILTER_FALSE_POSITIVE_RATE: float = Field(
+        default=0.01, description="Tasa de falsos positivos objetivo del filtro"
+    )
+    GLOBAL_ALIAS_FILTER_MIN_CAPACITY: int = Field(
+        default=100_000, description="Capacidad mínima del filtro al reconstruir"
+    )
+    GLOBAL_ALIAS_FILTER_REBUILD_SECONDS: int = Field(
+        default=3600, description="Reconstrucción completa (descarta las bajas)"
+    )
+    GLOBAL_ALIAS_FILTER_SYNC_SECONDS: int = Field(
+        default=2, description="Lectura incremental de altas de otros workers"
+    )
+    GLOBAL_ALIAS_FILTER_SYNC_OVERLAP_SECONDS: int = Field(
+        default=60, description="Solape de la lectura incremental"
+    )
+    GLOBAL_ALIAS_FILTER_BATCH_SIZE: int = Field(
+        default=50_000, description="Filas por lote del cursor al reconstruir"
+    )
+    BANK_ROUTING_FILE: Optional[str] = Field(
+        default=None,
+        description="Catálogo JSON de bancos/BIC (por defecto el catálogo CMF incluido)",
+    )
+    BANK_ROUTING_RELOAD_SECONDS: int = Field(
+        default=60, description="Revisión del catálogo de bancos (0 = sin recarga)"
+    )
+    TENANT_CACHE_ENABLED: bool = Field(
+        default=True, description="Caché read-through de tenants por id y código"
+    )
+    TENANT_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000, description="Tenants en la caché en proceso"
+    )
+    TENANT_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        description="TTL en proceso (otros workers no reciben la invalidación)",
+    )
+    TENANT_CACHE_REDIS_TTL_SECONDS: int = Field(
+        default=300, description="TTL de tenants en Redis"
+    )
+    API_KEY_CACHE_MAX_ENTRIES: int = Field(
+        default=50_000, description="API keys (y key_id inexistentes) en caché"
+    )
+    API_KEY_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="TTL de una API key en caché (revocación en otros workers)",
+    )
+    API_KEY_NEGATIVE_CACHE_TTL_SECONDS: int = Field(
+        default=10, description="TTL de un key_id inexistente en caché"
+    )
+    JWT_PAYLOAD_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000, description="Payloads JWT verificados en caché (0 = sin caché)"
+    )
+    JWT_PAYLOAD_CACHE_TTL_SECONDS: int = Field(
+        default=300, description="TTL máximo de un payload JWT en caché"
+    )
 
     model_config = ConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
@@ -72,7 +242,27 @@ class Settings(BaseSettings):
     JWT_SECRET: str = Field(
         default="not-use-default", description="Secreto para firma de JWT"
     )
-    JWT_ALG: str = Field(default="HS256", description="Algoritmo para firma de JWT")
+    JWT_ALG: str = Field(
+        default="HS256", description="Algoritmo para firma de JWT (HS256, ES256, EdDSA)"
+    )
+    JWT_PRIVATE_KEY: Optional[str] = Field(
+        default=None, description="Clave privada PEM para firmar JWT ES256/EdDSA"
+    )
+    JWT_KEY_ID: Optional[str] = Field(
+        default=None, description="kid de la clave de firma (por defecto su thumbprint)"
+    )
+    JWT_PREVIOUS_PUBLIC_KEYS: list[str] = Field(
+        default=[], description="Claves públicas PEM rotadas que aún verifican"
+    )
+    JWT_JWKS_URL: Optional[str] = Field(
+        default=None, description="JWKS del emisor para réplicas sin clave privada"
+    )
+    JWT_JWKS_REFRESH_SECONDS: int = Field(
+        default=300, description="Refresco periódico del JWKS remoto"
+    )
+    JWT_JWKS_MIN_REFRESH_SECONDS: int = Field(
+        default=30, description="Intervalo mínimo entre refrescos por kid desconocido"
+    )
     JWT_AUDIENCE: str = Field(
         default="kura-api", description="Audiencia esperada en el JWT"
     )
@@ -92,6 +282,47 @@ class Settings(BaseSettings):
     WORM_ISSUER: str = Field(
         default="Alias Chile", description="Emisor de las evidencias WORM"
     )
+    WORM_SCHEDULER_ENABLED: bool = Field(
+        default=True, description="Agregar hojas y sellar días WORM en segundo plano"
+    )
+    WORM_LEAF_INTERVAL_SECONDS: int = Field(
+        default=300, description="Cada cuánto se agregan hojas al árbol del día"
+    )
+    WORM_SEAL_HOUR_UTC: int = Field(
+        default=0, description="Hora UTC del sellado diario del día anterior"
+    )
+    WORM_SEAL_MINUTE_UTC: int = Field(
+        default=5, description="Minuto UTC del sellado diario (margen de cierre)"
+    )
+    WORM_LATE_EVENTS_CHECK_SECONDS: int = Field(
+        default=3600,
+        description="Cada cuánto se buscan eventos sin hoja en días ya sellados",
+    )
+    WORM_LATE_EVENTS_CHECK_DAYS: int = Field(
+        default=2, description="Días sellados recientes que revisa esa búsqueda"
+    )
+    WORM_LEAF_BATCH_SIZE: int = Field(
+        default=5000, description="Filas por lote al leer/escribir hojas y nodos"
+    )
+    ALIAS_EVENTS_PARTITION_MAINTENANCE: bool = Field(
+        default=True, description="Crear particiones mensuales futuras de alias_events"
+    )
+    ALIAS_EVENTS_PARTITION_MONTHS_AHEAD: int = Field(
+        default=3, description="Meses de particiones creadas por adelantado"
+    )
+    WORM_MERKLE_STORED_LEVEL: int = Field(
+        default=8,
+        description="Nivel desde el que se persisten nodos (2^n hojas por bloque)",
+    )
+    WORM_SIGN_WORKERS: Optional[int] = Field(
+        default=None, description="Procesos para firmar/verificar lotes (None = CPUs)"
+    )
+    WORM_SIGN_MIN_PARALLEL_ITEMS: int = Field(
+        default=256, description="Tamaño mínimo de lote que usa el pool de firma"
+    )
+    WORM_VERIFY_MAX_ITEMS: int = Field(
+        default=50_000, description="Máximo de firmas por request de verificación"
+    )
 
     @property
     def sqlalchemy_database_url(self) -> str:
@@ -102,6 +333,15 @@ class Settings(BaseSettings):
         encoded_password = quote_plus(self.DB_PASSWORD)
         return f"postgresql://{self.DB_USER}:{encoded_password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def async_database_url(self) -> str:
+        """URL equivalente para el driver asyncpg (AsyncEngine)"""
+        url = self.sqlalchemy_database_url
+        for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                return "postgresql+asyncpg://" + url[len(prefix) :]
+        return url
+
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -16,6 +17,19 @@ Base = declarative_base()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    echo=settings.DEBUG,
+)
+
+# expire_on_commit=False: en async no hay lazy-load implícito tras el commit
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -23,3 +37,22 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_streaming_db():
+    """Sesión sync para StreamingResponse; la cierra core.streaming.ndjson_response"""
+    return SessionLocal()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_streaming_async_db():
+    """
+    Sesión para endpoints con StreamingResponse: FastAPI cierra las
+    dependencias con yield antes de enviar el cuerpo, por lo que el cierre
+    queda a cargo del stream (ver core.streaming.ndjson_response).
+    """
+    return AsyncSessionLocal()
@@ -1,59 +1,153 @@
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
 
+from application.dtos import ResolveAliasResponse
 from application.use_cases import (
+    BulkRegisterAliasUseCase,
     DeactivateAliasUseCase,
     RegisterAliasUseCase,
     ResolveAliasUseCase,
 )
-from core.database import get_db
+from core.config import settings
+from core.database import get_async_db, get_streaming_async_db
 from core.dependencies.alias_event import (
-    get_alias_event_repository,
+    build_chain_append_service,
+    get_chain_append_service,
     get_hash_chain_service,
+    get_resolve_event_writer,
 )
 from core.dependencies.interop import (
     get_bank_routing_service,
+    get_global_alias_filter,
     get_global_alias_repository,
 )
+from core.dependencies.unit_of_work import get_unit_of_work
 from domain.repositories import (
-    IAliasEventRepository,
-    IAliasRepository,
-    IGlobalAliasRepository,
+    IAliasResolveCache,
+    IAsyncAliasRepository,
+    IAsyncGlobalAliasRepository,
+    IChainEventSink,
+    IUnitOfWork,
+)
+from domain.services import BankRoutingService, ChainAppendService, HashChainService
+from infrastructure.cache import (
+    AliasResolveCache,
+    RedisCache,
+    TTLCache,
+    get_redis_client,
+)
+from infrastructure.database.repositories import (
+    AsyncAliasRepository,
+    AsyncGlobalAliasRepository,
+    AsyncUnitOfWork,
 )
-from domain.services import BankRoutingService, HashChainService
-from infrastructure.database.repositories import AliasRepository
 
 
-def get_alias_repository(db=Depends(get_db)):
-    return AliasRepository(db)
+def get_alias_repository(db=Depends(get_async_db)):
+    return AsyncAliasRepository(db)
+
+
+@lru_cache
+def get_resolve_cache() -> Optional[IAliasResolveCache]:
+    """Caché de resolución compartida por el proceso; None si está desactivada"""
+    if not settings.RESOLVE_CACHE_ENABLED:
+        return None
+
+    redis_client = get_redis_client()
+    return AliasResolveCache(
+        model=ResolveAliasResponse,
+        # Sin Redis no hay aviso de invalidación a otros workers: TTL local corto
+        local_cache=TTLCache(
+            max_entries=settings.RESOLVE_CACHE_MAX_ENTRIES,
+            ttl_seconds=(
+                settings.RESOLVE_CACHE_TTL_SECONDS
+                if redis_client
+                else settings.RESOLVE_CACHE_LOCAL_TTL_SECONDS
+            ),
+        ),
+        remote_cache=(
+            RedisCache(
+                redis_client,
+                prefix="resolve",
+                ttl_seconds=settings.RESOLVE_CACHE_TTL_SECONDS,
+            )
+            if redis_client
+            else None
+        ),
+        negative_ttl_seconds=settings.RESOLVE_CACHE_NEGATIVE_TTL_SECONDS,
+    )
 
 
 def get_register_alias_use_case(
-    alias_repo: IAliasRepository = Depends(get_alias_repository),
-    alias_event_repo: IAliasEventRepository = Depends(get_alias_event_repository),
+    alias_repo: IAsyncAliasRepository = Depends(get_alias_repository),
+    chain_append_service: ChainAppendService = Depends(get_chain_append_service),
     hash_chain_service: HashChainService = Depends(get_hash_chain_service),
-    global_alias_repo: IGlobalAliasRepository = Depends(get_global_alias_repository),
+    global_alias_repo: IAsyncGlobalAliasRepository = Depends(
+        get_global_alias_repository
+    ),
     bank_routing_service: BankRoutingService = Depends(get_bank_routing_service),
+    unit_of_work: IUnitOfWork = Depends(get_unit_of_work),
 ) -> RegisterAliasUseCase:
     return RegisterAliasUseCase(
         alias_repository=alias_repo,
-        alias_event_repository=alias_event_repo,
+        chain_append_service=chain_append_service,
         hash_chain_service=hash_chain_service,
         global_alias_repository=global_alias_repo,
         bank_routing_service=bank_routing_service,
+        unit_of_work=unit_of_work,
+        resolve_cache=get_resolve_cache(),
+        existence_filter=get_global_alias_filter(),
     )
 
 
 def get_resolve_alias_use_case(
     alias_repo=Depends(get_alias_repository),
-    alias_event_repo=Depends(get_alias_event_repository),
-    hash_chain_service=Depends(get_hash_chain_service),
+    chain_append_service=Depends(get_chain_append_service),
+    unit_of_work=Depends(get_unit_of_work),
 ) -> ResolveAliasUseCase:
-    return ResolveAliasUseCase(alias_repo, alias_event_repo, hash_chain_service)
+    event_sink: Optional[IChainEventSink] = get_resolve_event_writer()
+    return ResolveAliasUseCase(
+        alias_repo,
+        chain_append_service,
+        unit_of_work,
+        resolve_cache=get_resolve_cache(),
+        event_sink=event_sink,
+    )
 
 
 def get_deactivate_alias_use_case(
     alias_repo=Depends(get_alias_repository),
-    alias_event_repo=Depends(get_alias_event_repository),
-    hash_chain_service=Depends(get_hash_chain_service),
+    chain_append_service=Depends(get_chain_append_service),
+    unit_of_work=Depends(get_unit_of_work),
+    global_alias_repo: IAsyncGlobalAliasRepository = Depends(
+        get_global_alias_repository
+    ),
 ) -> DeactivateAliasUseCase:
-    return DeactivateAliasUseCase(alias_repo, alias_event_repo, hash_chain_service)
+    return DeactivateAliasUseCase(
+        alias_repo,
+        chain_append_service,
+        unit_of_work,
+        global_alias_repository=global_alias_repo,
+        resolve_cache=get_resolve_cache(),
+        existence_filter=get_global_alias_filter(),
+    )
+
+
+def get_bulk_register_alias_use_case(
+    db=Depends(get_streaming_async_db),
+    hash_chain_service: HashChainService = Depends(get_hash_chain_service),
+    bank_routing_service: BankRoutingService = Depends(get_bank_routing_service),
+) -> BulkRegisterAliasUseCase:
+    # Todos los repositorios comparten la sesión del stream NDJSON
+    return BulkRegisterAliasUseCase(
+        alias_repository=AsyncAliasRepository(db),
+        chain_append_service=build_chain_append_service(db, hash_chain_service),
+        hash_chain_service=hash_chain_service,
+        global_alias_repository=AsyncGlobalAliasRepository(db),
+        bank_routing_service=bank_routing_service,
+        unit_of_work=AsyncUnitOfWork(db),
+        resolve_cache=get_resolve_cache(),
+        existence_filter=get_global_alias_filter(),
+    )
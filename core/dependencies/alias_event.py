@@ -1,13 +1,38 @@
+from functools import lru_cache, partial
+from typing import Optional
+
 from fastapi import Depends
 
 from application.use_cases import (
+    ChainVerificationJobsUseCase,
     GetAliasEventHistoryUseCase,
+    VerifyAllChainsUseCase,
     VerifyHashChainUseCase,
 )
-from core.database import get_db
-from domain.repositories import IAliasEventRepository
-from domain.services import HashChainService
-from infrastructure.database.repositories import AliasEventRepository
+from core.config import settings
+from core.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_db,
+    get_db,
+    get_streaming_db,
+)
+from domain.repositories import (
+    IAliasEventRepository,
+    IAsyncAliasChainHeadRepository,
+    IChainCheckpointRepository,
+)
+from domain.services import ChainAppendService, HashChainService
+from infrastructure.cache import RedisCache, TTLCache, get_redis_client
+from infrastructure.database.repositories import (
+    AliasEventRepository,
+    AsyncAliasChainHeadRepository,
+    AsyncAliasEventRepository,
+    CachedAliasChainHeadRepository,
+    ChainCheckpointRepository,
+    ChainVerificationJobRepository,
+)
+from infrastructure.jobs import BatchedChainEventWriter, ProcessPoolChainBatchVerifier
 
 
 def get_alias_event_repository(db=Depends(get_db)):
@@ -20,12 +45,120 @@ def get_alias_event_history_use_case(
     return GetAliasEventHistoryUseCase(alias_event_repo)
 
 
-def get_hash_chain_service():
+def get_streaming_alias_event_history_use_case(
+    db=Depends(get_streaming_db),
+) -> GetAliasEventHistoryUseCase:
+    # Cursor sobre la sesión que cierra el stream NDJSON
+    return GetAliasEventHistoryUseCase(AliasEventRepository(db))
+
+
+@lru_cache
+def get_hash_chain_service() -> HashChainService:
     return HashChainService()
 
 
+def get_chain_checkpoint_repository(db=Depends(get_db)) -> IChainCheckpointRepository:
+    return ChainCheckpointRepository(db)
+
+
 def get_verify_hash_chain_use_case(
     alias_event_repo: IAliasEventRepository = Depends(get_alias_event_repository),
     hash_chain_service: HashChainService = Depends(get_hash_chain_service),
+    checkpoint_repo: IChainCheckpointRepository = Depends(
+        get_chain_checkpoint_repository
+    ),
 ) -> VerifyHashChainUseCase:
-    return VerifyHashChainUseCase(alias_event_repo, hash_chain_service)
+    return VerifyHashChainUseCase(alias_event_repo, hash_chain_service, checkpoint_repo)
+
+
+def get_streaming_verify_hash_chain_use_case(
+    db=Depends(get_streaming_db),
+    hash_chain_service: HashChainService = Depends(get_hash_chain_service),
+) -> VerifyHashChainUseCase:
+    # Eventos y checkpoint sobre la sesión que cierra el stream NDJSON
+    return VerifyHashChainUseCase(
+        AliasEventRepository(db), hash_chain_service, ChainCheckpointRepository(db)
+    )
+
+
+def get_verify_all_chains_use_case() -> VerifyAllChainsUseCase:
+    # Cada proceso del pool abre su propia conexión; aquí solo se particiona
+    return VerifyAllChainsUseCase(ProcessPoolChainBatchVerifier(SessionLocal))
+
+
+def build_chain_verification_jobs_use_case(db) -> ChainVerificationJobsUseCase:
+    """Cola de verificaciones con el verificador en pool (scheduler y CLI)"""
+    return ChainVerificationJobsUseCase(
+        ChainVerificationJobRepository(db), get_verify_all_chains_use_case()
+    )
+
+
+def get_chain_verification_jobs_use_case(
+    db=Depends(get_db),
+) -> ChainVerificationJobsUseCase:
+    # La API solo encola y consulta: la verificación corre en segundo plano
+    return ChainVerificationJobsUseCase(ChainVerificationJobRepository(db))
+
+
+@lru_cache
+def get_chain_head_cache() -> TTLCache:
+    """Caché en proceso de cabezas de cadena, compartida entre requests"""
+    return TTLCache(
+        max_entries=settings.CHAIN_HEAD_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CHAIN_HEAD_CACHE_TTL_SECONDS,
+    )
+
+
+def build_chain_append_service(
+    db, hash_chain_service: HashChainService
+) -> ChainAppendService:
+    chain_head_repo: IAsyncAliasChainHeadRepository = AsyncAliasChainHeadRepository(db)
+    if settings.CHAIN_HEAD_CACHE_ENABLED:
+        redis_client = get_redis_client()
+        chain_head_repo = CachedAliasChainHeadRepository(
+            chain_head_repo,
+            local_cache=get_chain_head_cache(),
+            remote_cache=(
+                RedisCache(
+                    redis_client,
+                    prefix="chain_head",
+                    ttl_seconds=settings.CHAIN_HEAD_CACHE_TTL_SECONDS,
+                )
+                if redis_client
+                else None
+            ),
+        )
+
+    return ChainAppendService(
+        alias_event_repository=AsyncAliasEventRepository(db),
+        chain_head_repository=chain_head_repo,
+        hash_chain_service=hash_chain_service,
+    )
+
+
+def get_chain_append_service(
+    db=Depends(get_async_db),
+    hash_chain_service: HashChainService = Depends(get_hash_chain_service),
+) -> ChainAppendService:
+    return build_chain_append_service(db, hash_chain_service)
+
+
+@lru_cache
+def get_resolve_event_writer() -> Optional[BatchedChainEventWriter]:
+    """
+    Escritor en lote de eventos RESOLVE e INTEROP_RESOLVE del proceso (arranca en el lifespan);
+    None con RESOLVE_AUDIT_DURABILITY=sync
+    """
+    if settings.RESOLVE_AUDIT_DURABILITY == "sync":
+        return None
+
+    return BatchedChainEventWriter(
+        session_factory=AsyncSessionLocal,
+        chain_append_factory=partial(
+            build_chain_append_service, hash_chain_service=get_hash_chain_service()
+        ),
+        durability=settings.RESOLVE_AUDIT_DURABILITY,
+        batch_size=settings.RESOLVE_AUDIT_BATCH_SIZE,
+        flush_interval_ms=settings.RESOLVE_AUDIT_FLUSH_INTERVAL_MS,
+        max_queue_size=settings.RESOLVE_AUDIT_QUEUE_MAX_SIZE,
+    )
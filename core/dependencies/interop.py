@@ -1,42 +1,121 @@
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
 
-from core.database import get_db
-from core.dependencies.alias import get_alias_event_repository, get_hash_chain_service
+from core.config import settings
+from core.database import AsyncSessionLocal, get_async_db
+from core.dependencies.alias_event import (
+    get_chain_append_service,
+    get_resolve_event_writer,
+)
+from core.dependencies.unit_of_work import get_unit_of_work
+from core.logger import get_logger
 from domain.repositories import (
-    IAliasEventRepository,
-    IGlobalAliasRepository,
-    IInteropAuditRepository,
+    IAsyncGlobalAliasRepository,
+    IAsyncInteropAuditRepository,
+    IChainEventSink,
+    IInteropAuditSink,
+    IUnitOfWork,
 )
-from domain.services import BankRoutingService, HashChainService, InteropService
+from domain.services import (
+    BankRoutingRegistry,
+    BankRoutingService,
+    ChainAppendService,
+    InteropService,
+)
+from infrastructure.cache import GlobalAliasExistenceFilter, get_redis_client
 from infrastructure.database.repositories import (
-    GlobalAliasRepository,
-    InteropAuditRepository,
+    AsyncGlobalAliasRepository,
+    AsyncInteropAuditRepository,
 )
+from infrastructure.jobs import InteropAuditWriter
+from infrastructure.routing import FileBankRoutingSource
+
+logger = get_logger("core.dependencies.interop")
+
+
+def get_global_alias_repository(
+    db=Depends(get_async_db),
+) -> IAsyncGlobalAliasRepository:
+    return AsyncGlobalAliasRepository(db)
+
 
+def get_interop_audit_repository(
+    db=Depends(get_async_db),
+) -> IAsyncInteropAuditRepository:
+    return AsyncInteropAuditRepository(db)
 
-def get_global_alias_repository(db=Depends(get_db)) -> IGlobalAliasRepository:
-    return GlobalAliasRepository(db)
+
+@lru_cache
+def get_global_alias_filter() -> Optional[GlobalAliasExistenceFilter]:
+    """
+    Filtro de existencia compartido por el proceso; lo cargan jobs del
+    scheduler. Requiere Redis: sin el aviso de altas entre workers un negativo
+    podría ser falso.
+    """
+    if not settings.GLOBAL_ALIAS_FILTER_ENABLED:
+        return None
+    redis_client = get_redis_client()
+    if redis_client is None:
+        logger.warning("Global alias filter disabled: REDIS_URL not configured")
+        return None
+
+    return GlobalAliasExistenceFilter(
+        redis_client,
+        false_positive_rate=settings.GLOBAL_ALIAS_FILTER_FALSE_POSITIVE_RATE,
+        min_capacity=settings.GLOBAL_ALIAS_FILTER_MIN_CAPACITY,
+        sync_overlap_seconds=settings.GLOBAL_ALIAS_FILTER_SYNC_OVERLAP_SECONDS,
+    )
+
+
+@lru_cache
+def get_interop_audit_writer() -> Optional[InteropAuditWriter]:
+    """
+    Auditoría interop en lote del proceso (arranca en el lifespan); None con
+    INTEROP_AUDIT_DURABILITY=sync
+    """
+    if settings.INTEROP_AUDIT_DURABILITY == "sync":
+        return None
+
+    return InteropAuditWriter(
+        session_factory=AsyncSessionLocal,
+        durability=settings.INTEROP_AUDIT_DURABILITY,
+        batch_size=settings.INTEROP_AUDIT_BATCH_SIZE,
+        flush_interval_ms=settings.INTEROP_AUDIT_FLUSH_INTERVAL_MS,
+        max_queue_size=settings.INTEROP_AUDIT_QUEUE_MAX_SIZE,
+    )
 
 
-def get_interop_audit_repository(db=Depends(get_db)) -> IInteropAuditRepository:
-    return InteropAuditRepository(db)
+@lru_cache
+def get_bank_routing_source() -> FileBankRoutingSource:
+    return FileBankRoutingSource(settings.BANK_ROUTING_FILE)
 
 
+@lru_cache
 def get_bank_routing_service() -> BankRoutingService:
-    return BankRoutingService()
+    """Registro de bancos indexado una vez por proceso; lo recarga el scheduler"""
+    return BankRoutingService(BankRoutingRegistry(get_bank_routing_source().load()))
 
 
 def get_interop_service(
-    global_alias_repo: IGlobalAliasRepository = Depends(get_global_alias_repository),
-    audit_repo: IInteropAuditRepository = Depends(get_interop_audit_repository),
+    global_alias_repo: IAsyncGlobalAliasRepository = Depends(
+        get_global_alias_repository
+    ),
+    audit_repo: IAsyncInteropAuditRepository = Depends(get_interop_audit_repository),
     bank_routing: BankRoutingService = Depends(get_bank_routing_service),
-    alias_event_repo: IAliasEventRepository = Depends(get_alias_event_repository),
-    hash_chain_service: HashChainService = Depends(get_hash_chain_service),
+    chain_append_service: ChainAppendService = Depends(get_chain_append_service),
+    unit_of_work: IUnitOfWork = Depends(get_unit_of_work),
 ) -> InteropService:
+    event_sink: Optional[IChainEventSink] = get_resolve_event_writer()
+    audit_sink: Optional[IInteropAuditSink] = get_interop_audit_writer()
     return InteropService(
         global_alias_repo,
         audit_repo,
         bank_routing,
-        alias_event_repo,
-        hash_chain_service,
+        chain_append_service,
+        unit_of_work,
+        event_sink=event_sink,
+        existence_filter=get_global_alias_filter(),
+        audit_sink=audit_sink,
     )
@@ -1,9 +1,11 @@
-from typing import Optional
+from functools import lru_cache
 
-from fastapi import Depends, Request
+from fastapi import Depends, HTTPException
 
 from application.use_cases import (
     GetTenantUseCase,
+    ListAPIKeysUseCase,
+    RevokeAPIKeyUseCase,
     UpdateTenantUseCase,
 )
 from application.use_cases.tenant.activate_tenant import ActivateTenantUseCase
@@ -11,28 +13,78 @@ from application.use_cases.tenant.authenticate_tenant import AuthenticateTenantU
 from application.use_cases.tenant.create_tenant import CreateTenantUseCase
 from application.use_cases.tenant.generate_api_key import GenerateAPIKeyUseCase
 from application.use_cases.tenant.get_tenant_list import GetTenantListUseCase
+from core.auth import AuthContext, get_auth_context
 from core.config import settings
 from core.database import get_db
-from domain.repositories import ITenantRepository
-from domain.services import JWTValidationService
+from domain.repositories import ITenantApiKeyRepository, ITenantRepository
+from domain.services import ApiKeyService, JWTValidationService
+from infrastructure.cache import SyncRedisCache, TTLCache, get_sync_redis_client
 from infrastructure.database.repositories import (
+    CachedTenantApiKeyRepository,
+    CachedTenantRepository,
+    TenantApiKeyRepository,
     TenantRepository,
 )
+from infrastructure.security import get_jwt_validation_service
+from utils.messages import MESSAGES
 from utils.value_objects.enums import TenantRole
 
 
 def get_jwt_service() -> JWTValidationService:
     """Servicio JWT unificado para toda la aplicación"""
-    return JWTValidationService(
-        secret=settings.JWT_SECRET,
-        algorithm=settings.JWT_ALG,
-        audience=settings.JWT_AUDIENCE,
-        issuer=settings.JWT_ISSUER,
+    return get_jwt_validation_service()
+
+
+@lru_cache
+def get_tenant_cache() -> TTLCache:
+    """Caché en proceso de tenants, compartida entre requests"""
+    return TTLCache(
+        max_entries=settings.TENANT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.TENANT_CACHE_TTL_SECONDS,
+    )
+
+
+def get_tenant_repository(db=Depends(get_db)) -> ITenantRepository:
+    tenant_repo: ITenantRepository = TenantRepository(db)
+    if not settings.TENANT_CACHE_ENABLED:
+        return tenant_repo
+
+    redis_client = get_sync_redis_client()
+    return CachedTenantRepository(
+        tenant_repo,
+        local_cache=get_tenant_cache(),
+        remote_cache=(
+            SyncRedisCache(
+                redis_client,
+                prefix="tenant",
+                ttl_seconds=settings.TENANT_CACHE_REDIS_TTL_SECONDS,
+            )
+            if redis_client
+            else None
+        ),
+    )
+
+
+@lru_cache
+def get_api_key_service() -> ApiKeyService:
+    return ApiKeyService(settings.CUB_PEPPER)
+
+
+@lru_cache
+def get_api_key_cache() -> TTLCache:
+    """Caché en proceso de API keys por key_id (positiva y negativa)"""
+    return TTLCache(
+        max_entries=settings.API_KEY_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.API_KEY_CACHE_TTL_SECONDS,
     )
 
 
-def get_tenant_repository(db=Depends(get_db)):
-    return TenantRepository(db)
+def get_tenant_api_key_repository(db=Depends(get_db)) -> ITenantApiKeyRepository:
+    return CachedTenantApiKeyRepository(
+        TenantApiKeyRepository(db),
+        cache=get_api_key_cache(),
+        negative_ttl_seconds=settings.API_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+    )
 
 
 def get_activate_tenant_use_case(
@@ -43,21 +95,41 @@ def get_activate_tenant_use_case(
 
 def get_generate_api_key_use_case(
     tenant_repo: ITenantRepository = Depends(get_tenant_repository),
+    api_key_repo: ITenantApiKeyRepository = Depends(get_tenant_api_key_repository),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
 ) -> GenerateAPIKeyUseCase:
-    return GenerateAPIKeyUseCase(tenant_repo)
+    return GenerateAPIKeyUseCase(tenant_repo, api_key_repo, api_key_service)
+
+
+def get_list_api_keys_use_case(
+    api_key_repo: ITenantApiKeyRepository = Depends(get_tenant_api_key_repository),
+) -> ListAPIKeysUseCase:
+    return ListAPIKeysUseCase(api_key_repo)
+
+
+def get_revoke_api_key_use_case(
+    api_key_repo: ITenantApiKeyRepository = Depends(get_tenant_api_key_repository),
+) -> RevokeAPIKeyUseCase:
+    return RevokeAPIKeyUseCase(api_key_repo)
 
 
 def get_create_tenant_use_case(
     tenant_repo: ITenantRepository = Depends(get_tenant_repository),
+    api_key_repo: ITenantApiKeyRepository = Depends(get_tenant_api_key_repository),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
 ) -> CreateTenantUseCase:
-    return CreateTenantUseCase(tenant_repo)
+    return CreateTenantUseCase(tenant_repo, api_key_repo, api_key_service)
 
 
 def get_authenticate_tenant_use_case(
     tenant_repo: ITenantRepository = Depends(get_tenant_repository),
+    api_key_repo: ITenantApiKeyRepository = Depends(get_tenant_api_key_repository),
+    api_key_service: ApiKeyService = Depends(get_api_key_service),
     jwt_service: JWTValidationService = Depends(get_jwt_service),
 ) -> AuthenticateTenantUseCase:
-    return AuthenticateTenantUseCase(tenant_repo, jwt_service)
+    return AuthenticateTenantUseCase(
+        tenant_repo, api_key_repo, api_key_service, jwt_service
+    )
 
 
 def get_update_tenant_use_case(
@@ -73,58 +145,48 @@ def get_tenant_use_case(
 
 
 def get_current_tenant_data(
-    jwt_service: JWTValidationService = Depends(get_jwt_service),
-    request: Request = None,
+    auth: AuthContext = Depends(get_auth_context),
 ) -> dict:
     """Obtiene los datos del tenant actual desde el token JWT"""
-    auth: Optional[str] = None
-    if "Authorization" in request.headers:
-        auth = request.headers["Authorization"]
-    if not auth:
+    if not auth.payload:
         return {}
-
-    scheme, _, token = auth.partition(" ")
-    if scheme.lower() != "bearer" or not token:
-        return {}
-
-    payload = jwt_service.validate_token(token)
-    return payload.get("tenant", {})
+    return auth.payload.get("tenant", {})
 
 
 def get_current_roles(
-    jwt_service: JWTValidationService = Depends(get_jwt_service),
-    request: Request = None,
+    auth: AuthContext = Depends(get_auth_context),
 ) -> list[TenantRole]:
-    """Extrae roles directamente del token JWT - VERSIÓN MEJORADA"""
-    auth = request.headers.get("Authorization", "")
-
-    if not auth.startswith("Bearer "):
+    """Extrae roles del token JWT ya verificado en la request"""
+    if not auth.payload:
         return [TenantRole.OPERATOR]
 
-    token = auth[7:]
-    try:
-        payload = jwt_service.validate_token(token)
-        roles = payload.get("roles", [TenantRole.OPERATOR.value])
-
-        tenant_roles = []
-        for role in roles:
-            if isinstance(role, str):
-                try:
-                    for tenant_role in TenantRole:
-                        if tenant_role.value == role.lower():
-                            tenant_roles.append(tenant_role)
-                            break
-                    else:
-                        tenant_roles.append(TenantRole[role.upper()])
-                except (ValueError, KeyError):
-                    continue
-            elif isinstance(role, TenantRole):
-                tenant_roles.append(role)
-
-        return tenant_roles if tenant_roles else [TenantRole.OPERATOR]
-
-    except Exception:
-        return [TenantRole.OPERATOR]
+    roles = auth.payload.get("roles", [TenantRole.OPERATOR.value])
+
+    tenant_roles = []
+    for role in roles:
+        if isinstance(role, str):
+            try:
+                for tenant_role in TenantRole:
+                    if tenant_role.value == role.lower():
+                        tenant_roles.append(tenant_role)
+                        break
+                else:
+                    tenant_roles.append(TenantRole[role.upper()])
+            except (ValueError, KeyError):
+                continue
+        elif isinstance(role, TenantRole):
+            tenant_roles.append(role)
+
+    return tenant_roles if tenant_roles else [TenantRole.OPERATOR]
+
+
+def require_admin_role(roles: list = Depends(get_current_roles)) -> bool:
+    """Exige rol ADMIN en el JWT (endpoints internos y de operación)"""
+    if TenantRole.ADMIN not in roles:
+        raise HTTPException(
+            status_code=403, detail=MESSAGES.ERROR.AUTH.ADMIN_ROLE_REQUIRED.CODE
+        )
+    return True
 
 
 def get_tenant_list(
@@ -0,0 +1,10 @@
+from fastapi import Depends
+
+from core.database import get_async_db
+from domain.repositories import IUnitOfWork
+from infrastructure.database.repositories import AsyncUnitOfWork
+
+
+def get_unit_of_work(db=Depends(get_async_db)) -> IUnitOfWork:
+    """Comparte la AsyncSession del request con los repositorios Async*"""
+    return AsyncUnitOfWork(db)
@@ -1,11 +1,22 @@
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException
 
-from application.use_cases import GenerateWormEvidenceUseCase
+from application.use_cases import (
+    ExportWormEvidenceUseCase,
+    GenerateWormEvidenceUseCase,
+    GetWormInclusionProofUseCase,
+    SealWormDayUseCase,
+    VerifyWormSignaturesUseCase,
+)
 from core.config import settings
-from domain.services import DigitalSignatureService
+from core.database import get_db, get_streaming_db
+from domain.repositories import IWormSealRepository
+from domain.services import DigitalSignatureService, MerkleTreeService
+from infrastructure.database.repositories import WormSealRepository
+from infrastructure.jobs import ProcessPoolSignatureService
 from utils import MESSAGES, TenantRole
 
-from .alias import get_alias_event_repository
 from .tenant import get_current_roles
 
 
@@ -18,12 +29,72 @@ def validate_regulator_access(roles: list = Depends(get_current_roles)):
     return True
 
 
+@lru_cache
 def get_digital_signature_service() -> DigitalSignatureService:
-    return DigitalSignatureService(settings.WORM_PRIVATE_KEY)
+    """
+    Clave WORM parseada una vez por proceso (la pública ya serializada);
+    los lotes grandes de firmas/verificaciones van a un pool de procesos
+    """
+    return ProcessPoolSignatureService(
+        settings.WORM_PRIVATE_KEY,
+        workers=settings.WORM_SIGN_WORKERS,
+        min_parallel_items=settings.WORM_SIGN_MIN_PARALLEL_ITEMS,
+    )
+
+
+@lru_cache
+def get_merkle_tree_service() -> MerkleTreeService:
+    return MerkleTreeService()
+
+
+def get_worm_seal_repository(db=Depends(get_db)) -> IWormSealRepository:
+    return WormSealRepository(db)
+
+
+def get_seal_worm_day_use_case(
+    worm_seal_repo=Depends(get_worm_seal_repository),
+    merkle_tree_service=Depends(get_merkle_tree_service),
+    signature_service=Depends(get_digital_signature_service),
+) -> SealWormDayUseCase:
+    return SealWormDayUseCase(worm_seal_repo, merkle_tree_service, signature_service)
 
 
 def get_worm_evidence_use_case(
-    alias_event_repo=Depends(get_alias_event_repository),
+    worm_seal_repo=Depends(get_worm_seal_repository),
+    seal_worm_day_use_case=Depends(get_seal_worm_day_use_case),
     signature_service=Depends(get_digital_signature_service),
 ) -> GenerateWormEvidenceUseCase:
-    return GenerateWormEvidenceUseCase(alias_event_repo, signature_service)
+    return GenerateWormEvidenceUseCase(
+        worm_seal_repo, seal_worm_day_use_case, signature_service
+    )
+
+
+def get_worm_inclusion_proof_use_case(
+    worm_seal_repo=Depends(get_worm_seal_repository),
+    merkle_tree_service=Depends(get_merkle_tree_service),
+    signature_service=Depends(get_digital_signature_service),
+) -> GetWormInclusionProofUseCase:
+    return GetWormInclusionProofUseCase(
+        worm_seal_repo, merkle_tree_service, signature_service
+    )
+
+
+def get_streaming_worm_export_use_case(
+    db=Depends(get_streaming_db),
+    merkle_tree_service=Depends(get_merkle_tree_service),
+    signature_service=Depends(get_digital_signature_service),
+) -> ExportWormEvidenceUseCase:
+    # Sellado y cursor sobre la sesión que cierra el stream NDJSON
+    worm_seal_repo = WormSealRepository(db)
+    return ExportWormEvidenceUseCase(
+        worm_seal_repo,
+        SealWormDayUseCase(worm_seal_repo, merkle_tree_service, signature_service),
+        merkle_tree_service,
+        signature_service,
+    )
+
+
+def get_verify_worm_signatures_use_case(
+    signature_service=Depends(get_digital_signature_service),
+) -> VerifyWormSignaturesUseCase:
+    return VerifyWormSignaturesUseCase(signature_service)
@@ -0,0 +1,82 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from core.config import settings
+from core.dependencies.alias import get_resolve_cache
+from core.dependencies.alias_event import (
+    get_hash_chain_service,
+    get_resolve_event_writer,
+)
+from core.dependencies.interop import (
+    get_bank_routing_service,
+    get_global_alias_filter,
+    get_interop_audit_writer,
+)
+from core.dependencies.tenant import get_api_key_service
+from core.dependencies.worm import (
+    get_digital_signature_service,
+    get_merkle_tree_service,
+)
+from core.logger import get_logger
+from core.scheduler import build_scheduler
+from infrastructure.security import get_jwt_validation_service
+
+logger = get_logger("core.lifespan")
+
+
+def build_shared_services() -> None:
+    """
+    Construye los servicios de dominio compartidos por el proceso (providers
+    con lru_cache): claves parseadas, catálogo de bancos indexado. Los
+    errores de configuración aparecen al arrancar y no en el primer request.
+    """
+    get_hash_chain_service()
+    get_api_key_service()
+    get_merkle_tree_service()
+    get_bank_routing_service()
+    try:
+        get_jwt_validation_service()
+    except ValueError as e:
+        # Sin JWT configurado solo fallan los endpoints autenticados
+        logger.error("JWT validation not configured", error=str(e))
+    if settings.WORM_PRIVATE_KEY:
+        get_digital_signature_service()
+    else:
+        logger.warning("WORM signing disabled: WORM_PRIVATE_KEY not configured")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Arranque y cierre de recursos de proceso (servicios y jobs en segundo plano)"""
+    build_shared_services()
+    scheduler = build_scheduler()
+    if scheduler:
+        scheduler.start()
+    writers = [
+        writer
+        for writer in (get_resolve_event_writer(), get_interop_audit_writer())
+        if writer
+    ]
+    for writer in writers:
+        await writer.start()
+    # Suscripciones a los avisos de otros workers (invalidaciones y altas)
+    listeners = [
+        listener
+        for listener in (get_resolve_cache(), get_global_alias_filter())
+        if listener
+    ]
+    for listener in listeners:
+        await listener.start()
+    try:
+        yield
+    finally:
+        # Escriben lo que quede en cola antes de cerrar el proceso
+        for writer in writers:
+            await writer.stop()
+        for listener in listeners:
+            await listener.stop()
+        if settings.WORM_PRIVATE_KEY:
+            get_digital_signature_service().shutdown()
+        if scheduler:
+            scheduler.shutdown(wait=False)
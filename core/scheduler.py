@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from application.use_cases import SealWormDayUseCase
+from core.config import settings
+from core.database import SessionLocal, engine
+from core.dependencies.alias_event import build_chain_verification_jobs_use_case
+from core.dependencies.interop import (
+    get_bank_routing_service,
+    get_bank_routing_source,
+    get_global_alias_filter,
+)
+from core.dependencies.worm import (
+    get_digital_signature_service,
+    get_merkle_tree_service,
+)
+from core.logger import get_logger
+from domain.services import BankRoutingRegistry
+from infrastructure.database.alias_event_partitions import AliasEventPartitionManager
+from infrastructure.database.repositories import (
+    GlobalAliasRepository,
+    WormSealRepository,
+)
+from infrastructure.security import RemoteJWKSKeyProvider, get_jwt_key_provider
+
+logger = get_logger("core.scheduler")
+
+
+def _run_with_seal_use_case(action) -> None:
+    db = SessionLocal()
+    try:
+        action(
+            SealWormDayUseCase(
+                WormSealRepository(db),
+                get_merkle_tree_service(),
+                get_digital_signature_service(),
+            )
+        )
+    except ValueError as e:
+        # Día tomado por otro worker o aún abierto: se reintenta en la próxima corrida
+        logger.warning("WORM job skipped", error=str(e))
+    except Exception as e:
+        logger.error("WORM job failed", error=str(e))
+    finally:
+        db.close()
+
+
+def append_worm_leaves_job() -> None:
+    """Agrega al árbol del día los eventos llegados desde la última corrida"""
+    _run_with_seal_use_case(lambda use_case: use_case.append_leaves())
+
+
+def seal_worm_day_job() -> None:
+    """Sella el día UTC anterior (hojas pendientes + raíces firmadas)"""
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    _run_with_seal_use_case(lambda use_case: use_case.execute(yesterday))
+
+
+def check_worm_late_events_job() -> None:
+    """Eventos confirmados después del sello de su día (no quedan sellados)"""
+    today = datetime.now(timezone.utc).date()
+
+    def check(use_case: SealWormDayUseCase) -> None:
+        for days_ago in range(1, settings.WORM_LATE_EVENTS_CHECK_DAYS + 1):
+            use_case.check_late_events(today - timedelta(days=days_ago))
+
+    _run_with_seal_use_case(check)
+
+
+def ensure_alias_event_partitions_job() -> None:
+    """Mantiene creadas las particiones mensuales próximas de alias_events"""
+    try:
+        AliasEventPartitionManager(engine).ensure_partitions(
+            settings.ALIAS_EVENTS_PARTITION_MONTHS_AHEAD
+        )
+    except Exception as e:
+        logger.error("alias_events partition maintenance failed", error=str(e))
+
+
+def rebuild_global_alias_filter_job() -> None:
+    """Recarga completa del filtro de alias globales (descarta las bajas)"""
+    db = SessionLocal()
+    try:
+        get_global_alias_filter().rebuild(GlobalAliasRepository(db))
+    except Exception as e:
+        logger.error("Global alias filter rebuild failed", error=str(e))
+    finally:
+        db.close()
+
+
+def sync_global_alias_filter_job() -> None:
+    """Suma al filtro las altas confirmadas por otros workers"""
+    db = SessionLocal()
+    try:
+        get_global_alias_filter().sync_changes(GlobalAliasRepository(db))
+    except Exception as e:
+        logger.error("Global alias filter sync failed", error=str(e))
+    finally:
+        db.close()
+
+
+def reload_bank_routing_job() -> None:
+    """Reindexa el catálogo de bancos si el archivo cambió"""
+    source = get_bank_routing_source()
+    try:
+        if not source.has_changed():
+            return
+        registry = BankRoutingRegistry(source.load())
+    except Exception as e:
+        # Archivo inválido o a medio escribir: se mantiene el registro vigente
+        logger.error("Bank routing reload failed", error=str(e))
+        return
+    get_bank_routing_service().reload(registry)
+    logger.info("Bank routing reloaded", version=registry.version, banks=len(registry))
+
+
+def run_chain_verification_jobs_job() -> None:
+    """Ejecuta las verificaciones masivas encoladas por la API, una a la vez"""
+    db = SessionLocal()
+    try:
+        use_case = build_chain_verification_jobs_use_case(db)
+        while use_case.run_next():
+            pass
+    except Exception as e:
+        logger.error("Chain verification jobs failed", error=str(e))
+    finally:
+        db.close()
+
+
+def build_scheduler() -> Optional[BackgroundScheduler]:
+    """
+    Jobs en segundo plano. Con varios workers cada uno agenda los jobs, pero
+    el advisory lock por día (WORM) y CREATE TABLE IF NOT EXISTS
+    (particiones) dejan una sola ejecución efectiva.
+    """
+    scheduler = BackgroundScheduler(
+        timezone="UTC", job_defaults={"coalesce": True, "max_instances": 1}
+    )
+
+    if settings.ALIAS_EVENTS_PARTITION_MAINTENANCE:
+        scheduler.add_job(
+            ensure_alias_event_partitions_job,
+            CronTrigger(hour=0, minute=0, timezone="UTC"),
+            id="alias_events_partitions",
+            next_run_time=datetime.now(timezone.utc),
+        )
+
+    if settings.WORM_SCHEDULER_ENABLED and not settings.WORM_PRIVATE_KEY:
+        logger.warning("WORM jobs disabled: WORM_PRIVATE_KEY not configured")
+    elif settings.WORM_SCHEDULER_ENABLED:
+        scheduler.add_job(
+            append_worm_leaves_job,
+            IntervalTrigger(seconds=settings.WORM_LEAF_INTERVAL_SECONDS),
+            id="worm_append_leaves",
+        )
+        scheduler.add_job(
+            seal_worm_day_job,
+            CronTrigger(
+                hour=settings.WORM_SEAL_HOUR_UTC,
+                minute=settings.WORM_SEAL_MINUTE_UTC,
+                timezone="UTC",
+            ),
+            id="worm_seal_day",
+        )
+        scheduler.add_job(
+            check_worm_late_events_job,
+            IntervalTrigger(seconds=settings.WORM_LATE_EVENTS_CHECK_SECONDS),
+            id="worm_late_events",
+        )
+
+    if get_global_alias_filter():
+        scheduler.add_job(
+            rebuild_global_alias_filter_job,
+            IntervalTrigger(seconds=settings.GLOBAL_ALIAS_FILTER_REBUILD_SECONDS),
+            id="global_alias_filter_rebuild",
+            next_run_time=datetime.now(timezone.utc),
+        )
+        scheduler.add_job(
+            sync_global_alias_filter_job,
+            IntervalTrigger(seconds=settings.GLOBAL_ALIAS_FILTER_SYNC_SECONDS),
+            id="global_alias_filter_sync",
+        )
+
+    if settings.BANK_ROUTING_RELOAD_SECONDS > 0:
+        scheduler.add_job(
+            reload_bank_routing_job,
+            IntervalTrigger(seconds=settings.BANK_ROUTING_RELOAD_SECONDS),
+            id="bank_routing_reload",
+        )
+
+    if settings.CHAIN_VERIFY_JOB_RUNNER_ENABLED:
+        # FOR UPDATE SKIP LOCKED: un job lo toma un solo worker
+        scheduler.add_job(
+            run_chain_verification_jobs_job,
+            IntervalTrigger(seconds=settings.CHAIN_VERIFY_JOB_POLL_SECONDS),
+            id="chain_verification_jobs",
+        )
+
+    key_provider = get_jwt_key_provider()
+    if isinstance(key_provider, RemoteJWKSKeyProvider):
+        # JWKS remoto: primera carga al arrancar y luego en segundo plano
+        scheduler.add_job(
+            key_provider.refresh,
+            IntervalTrigger(seconds=settings.JWT_JWKS_REFRESH_SECONDS),
+            id="jwks_refresh",
+            next_run_time=datetime.now(timezone.utc),
+        )
+
+    return scheduler if scheduler.get_jobs() else None
@@ -0,0 +1,48 @@
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional, Union
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _serialize(record: Any) -> bytes:
+    if isinstance(record, BaseModel):
+        return record.model_dump_json().encode() + b"\n"
+    return json.dumps(record, default=str).encode() + b"\n"
+
+
+def ndjson_response(
+    records: Union[AsyncIterator[Any], Iterator[Any]],
+    db: Optional[Union[AsyncSession, Session]] = None,
+    status_code: int = 200,
+) -> StreamingResponse:
+    """
+    Serializa un iterador (async o sync) como NDJSON y cierra la sesión al
+    final. Los iteradores sync los consume Starlette en el threadpool.
+    """
+
+    async def async_body():
+        try:
+            async for record in records:
+                yield _serialize(record)
+        finally:
+            if db is not None:
+                await db.close()
+
+    def sync_body():
+        try:
+            for record in records:
+                yield _serialize(record)
+        finally:
+            if db is not None:
+                db.close()
+
+    body = async_body() if hasattr(records, "__aiter__") else sync_body()
+    return StreamingResponse(
+        body, status_code=status_code, media_type=NDJSON_MEDIA_TYPE
+    )
@@ -1,17 +1,44 @@
+from .alias_chain_head_entity import GENESIS_HASH, AliasChainHeadEntity
 from .alias_entity import AliasRegistryEntity
 from .alias_event_entity import AliasEventEntity
 from .alias_global_entity import GlobalAliasEntity
+from .bank_routing_entity import BankRoutingCatalogEntity, BankRoutingEntity
 from .banner import BannerEntity
+from .chain_batch_report_entity import BrokenChainEntity, ChainBatchReportEntity
+from .chain_checkpoint_entity import ChainCheckpointEntity
+from .chain_verification_entity import ChainVerificationResult
+from .chain_verification_job_entity import ChainVerificationJobEntity
 from .error_log import ErrorLogEntity
 from .interop_audit_entity import InteropAuditEntity
+from .tenant_api_key_entity import TenantApiKeyEntity
 from .tenant_entity import TenantEntity
+from .worm_seal_entity import (
+    MerkleProofStep,
+    WormLeafEntity,
+    WormLeafEventEntity,
+    WormSealEntity,
+)
 
 __all__ = [
+    "BankRoutingCatalogEntity",
+    "BankRoutingEntity",
     "BannerEntity",
     "ErrorLogEntity",
+    "AliasChainHeadEntity",
     "AliasEventEntity",
+    "GENESIS_HASH",
     "AliasRegistryEntity",
+    "BrokenChainEntity",
+    "ChainBatchReportEntity",
+    "ChainCheckpointEntity",
+    "ChainVerificationResult",
+    "ChainVerificationJobEntity",
     "GlobalAliasEntity",
+    "TenantApiKeyEntity",
     "InteropAuditEntity",
     "TenantEntity",
+    "MerkleProofStep",
+    "WormLeafEntity",
+    "WormLeafEventEntity",
+    "WormSealEntity",
 ]
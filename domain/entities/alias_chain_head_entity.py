@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+GENESIS_HASH = "0" * 64
+
+
+class AliasChainHeadEntity(BaseModel):
+    """Cabeza de la cadena de eventos de un alias (último hash y secuencia)"""
+
+    tenant_id: UUID
+    alias_normalized: str
+    current_hash: str
+    seq: int
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
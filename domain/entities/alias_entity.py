@@ -45,8 +45,5 @@ class AliasRegistryEntity(BaseModel):
     def deactivate(self):
         self.status = AliasStatus.INACTIVE
 
-    def normalize_alias(self) -> str:
-        return self.alias_raw.strip().lower()
-
     class Config:
         from_attributes = True
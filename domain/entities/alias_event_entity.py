@@ -18,6 +18,7 @@ class AliasEventEntity(BaseModel):
     previous_hash: str
     current_hash: str
     timestamp: datetime
+    seq: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BankRoutingEntity(BaseModel):
+    """Banco del catálogo CMF con su código SWIFT/BIC y nombres alternativos"""
+
+    name: str
+    routing_code: str
+    cmf_code: Optional[str] = None
+    aliases: list[str] = []
+
+
+class BankRoutingCatalogEntity(BaseModel):
+    """Catálogo versionado de bancos de un país (archivo de datos)"""
+
+    version: str
+    country: str
+    fallback_routing_code: str
+    banks: list[BankRoutingEntity]
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BrokenChainEntity(BaseModel):
+    """Primera ruptura encontrada en una cadena (tenant_id, alias_normalized)"""
+
+    tenant_id: UUID
+    alias_normalized: str
+    break_seq: int
+    expected_hash: str
+    actual_hash: str
+
+
+class ChainBatchReportEntity(BaseModel):
+    """Resumen de la verificación masiva de cadenas de un tenant o global"""
+
+    tenant_id: Optional[UUID] = None
+    started_at: datetime
+    finished_at: datetime
+    workers: int
+    partitions: int
+    total_chains: int = 0
+    total_events: int = 0
+    broken_count: int = 0
+    broken_chains: list[BrokenChainEntity] = []
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.finished_at - self.started_at).total_seconds()
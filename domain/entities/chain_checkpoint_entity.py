@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ChainCheckpointEntity(BaseModel):
+    """Último punto verificado de una cadena: la re-verificación parte desde aquí"""
+
+    tenant_id: UUID
+    alias_normalized: str
+    last_verified_seq: int
+    last_verified_hash: str
+    verified_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ChainVerificationResult(BaseModel):
+    """
+    Estado de una verificación incremental de cadena.
+
+    Los índices (corrupted_events, chain_break_at) son posiciones en la
+    cadena completa (seq - 1), aunque la verificación parta de un checkpoint.
+    """
+
+    is_valid: bool = True
+    completed: bool = False
+    from_seq: int = 0
+    verified_events: int = 0
+    corrupted_events: list[int] = []
+    corrupted_count: int = 0
+    chain_break_at: Optional[int] = None
+    expected_hash: str = ""
+    actual_hash: str = ""
+    last_seq: int = 0
+    last_hash: str = ""
+    checkpoint_seq: int = 0
+    checkpoint_hash: str = ""
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from utils import EJobStatus
+
+
+class ChainVerificationJobEntity(BaseModel):
+    """
+    Verificación masiva de cadenas encolada por la API; la corre un proceso
+    en segundo plano y el reporte queda en report al completarse
+    """
+
+    id: UUID
+    tenant_id: Optional[UUID] = None
+    workers: Optional[int] = None
+    status: EJobStatus = EJobStatus.PENDING
+    requested_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    report: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
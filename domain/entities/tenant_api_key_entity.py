@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TenantApiKeyEntity(BaseModel):
+    """
+    API key de un tenant: solo se guarda el digest HMAC del secreto. key_id
+    viaja en claro dentro de la key y permite buscarla por índice.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[UUID] = None
+    tenant_id: UUID
+    key_id: str
+    key_hash: str
+    scopes: list[str] = []
+    expires_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    def is_usable(self, now: datetime) -> bool:
+        if self.revoked_at is not None:
+            return False
+        return self.expires_at is None or self.expires_at > now
@@ -25,7 +25,6 @@ class TenantEntity(BaseModel):
     status: TenantStatus = TenantStatus.PENDING
     tenant_metadata: dict = {}
     roles: list[TenantRole] = [TenantRole.OPERATOR]
-    # api_keys: list[str] = [] # Placeholder "TenantAPIKey"
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
@@ -70,17 +69,3 @@ class TenantEntity(BaseModel):
 
     def is_active(self) -> bool:
         return self.status == TenantStatus.ACTIVE
-
-    def add_api_key(self, api_key: str):
-        """Agregar una nueva API Key"""
-        # TODO: Implementar lógica de hashing y almacenamiento
-        pass
-
-    def verify_api_key(self, api_key: str) -> bool:
-        """MVP: Verificación simple de API Key"""
-        expected_prefix = f"tk_{self.code}_"
-        return (
-            api_key.startswith(expected_prefix)
-            and len(api_key) >= len(expected_prefix) + 32
-            and re.match(r"^[a-zA-Z0-9_-]+$", api_key[len(expected_prefix) :])
-        )
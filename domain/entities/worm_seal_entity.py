@@ -0,0 +1,54 @@
+from datetime import date, datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from utils import EEventType
+
+
+class MerkleProofStep(BaseModel):
+    """Hermano en el camino hoja → raíz; position indica su lado"""
+
+    position: Literal["left", "right"]
+    hash: str
+
+
+class WormLeafEntity(BaseModel):
+    """Posición de un evento en el árbol de Merkle diario de su tenant"""
+
+    event_id: UUID
+    tenant_id: UUID
+    seal_date: date
+    leaf_index: int
+    leaf_hash: str
+
+    class Config:
+        from_attributes = True
+
+
+class WormLeafEventEntity(WormLeafEntity):
+    """Hoja con los campos sin PII de su evento, para la exportación WORM"""
+
+    event_type: EEventType
+    timestamp: datetime
+    previous_hash: str
+    current_hash: str
+
+
+class WormSealEntity(BaseModel):
+    """
+    Sello diario WORM: raíz firmada del árbol de un tenant o, con tenant_id
+    nulo, del árbol global cuyas hojas son las raíces de cada tenant
+    """
+
+    seal_date: date
+    tenant_id: Optional[UUID] = None
+    tenant_id_hash: Optional[str] = None
+    root_hash: str
+    leaf_count: int
+    signature: str
+    sealed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -2,12 +2,31 @@ from .base_repository import IBaseRepository  # noqa: I001
 from .alias_event_repository import IAliasEventRepository
 from .alias_repository import IAliasRepository
 from .global_alias_repository import IGlobalAliasRepository
+from .bank_routing_source import IBankRoutingSource
 from .banner_repository import IBannerRepository
 from .error_log_repository import IErrorLogRepository
 from .tenant_repository import ITenantRepository
+from .tenant_api_key_repository import ITenantApiKeyRepository
 from .interop_audit_repository import IInteropAuditRepository
+from .chain_checkpoint_repository import IChainCheckpointRepository
+from .chain_batch_verifier import IChainBatchVerifier
+from .chain_verification_job_repository import IChainVerificationJobRepository
+from .jwt_key_provider import IJWTKeyProvider
+from .alias_resolve_cache import IAliasResolveCache
+from .alias_existence_filter import IAliasExistenceFilter
+from .chain_event_sink import IChainEventSink
+from .interop_audit_sink import IInteropAuditSink
+from .worm_seal_repository import IWormSealRepository
+from .async_base_repository import IAsyncBaseRepository
+from .async_alias_chain_head_repository import IAsyncAliasChainHeadRepository
+from .async_alias_event_repository import IAsyncAliasEventRepository
+from .async_alias_repository import IAsyncAliasRepository
+from .async_global_alias_repository import IAsyncGlobalAliasRepository
+from .async_interop_audit_repository import IAsyncInteropAuditRepository
+from .unit_of_work import IUnitOfWork
 
 __all__ = [
+    "IBankRoutingSource",
     "IBannerRepository",
     "IBaseRepository",
     "IErrorLogRepository",
@@ -15,5 +34,22 @@ __all__ = [
     "IAliasRepository",
     "IGlobalAliasRepository",
     "ITenantRepository",
+    "ITenantApiKeyRepository",
     "IInteropAuditRepository",
+    "IChainCheckpointRepository",
+    "IChainBatchVerifier",
+    "IChainVerificationJobRepository",
+    "IJWTKeyProvider",
+    "IAliasResolveCache",
+    "IAliasExistenceFilter",
+    "IChainEventSink",
+    "IInteropAuditSink",
+    "IAsyncBaseRepository",
+    "IAsyncAliasChainHeadRepository",
+    "IAsyncAliasEventRepository",
+    "IAsyncAliasRepository",
+    "IAsyncGlobalAliasRepository",
+    "IAsyncInteropAuditRepository",
+    "IUnitOfWork",
+    "IWormSealRepository",
 ]
@@ -1,16 +1,44 @@
 from abc import abstractmethod
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import Optional
 
 from domain.entities import AliasEventEntity
 from domain.repositories import IBaseRepository
+from utils import EEventType
 
 
 class IAliasEventRepository(IBaseRepository[AliasEventEntity]):
     @abstractmethod
-    def get_events_for_alias(
-        self, alias_normalized: str, tenant_id: str
+    def get_event_history_page(
+        self,
+        alias_normalized: str,
+        tenant_id: str,
+        limit: int,
+        after_seq: Optional[int] = None,
+        descending: bool = False,
+        event_types: Optional[list[EEventType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> list[AliasEventEntity]:
+        """
+        Hasta limit eventos con seq después de after_seq en el orden pedido
+        (keyset), filtrados por tipo y por rango [since, until)
+        """
+        pass
+
+    @abstractmethod
+    def iter_event_history(
+        self,
+        alias_normalized: str,
+        tenant_id: str,
+        after_seq: Optional[int] = None,
+        descending: bool = False,
+        event_types: Optional[list[EEventType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[AliasEventEntity]:
+        """Mismos filtros que get_event_history_page, vía cursor del servidor"""
         pass
 
     @abstractmethod
@@ -19,6 +47,13 @@ class IAliasEventRepository(IBaseRepository[AliasEventEntity]):
     ) -> Optional[AliasEventEntity]:
         pass
 
+    @abstractmethod
+    def iter_events_for_alias(
+        self, alias_normalized: str, tenant_id: str, after_seq: int = 0
+    ) -> Iterator[AliasEventEntity]:
+        """Eventos con seq > after_seq en orden, vía cursor del servidor"""
+        pass
+
     @abstractmethod
     def get_events_by_date(
         self, target_date: date, tenant_id: Optional[str] = None
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IAliasExistenceFilter(ABC):
+    """
+    Pertenencia aproximada de alias_normalized activos en global_aliases:
+    False es un negativo del filtro local; True obliga a consultar la base de
+    datos. Entre procesos solo confirmed_absent garantiza el negativo.
+    """
+
+    @abstractmethod
+    def might_contain(self, alias_normalized: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def confirmed_absent(self, aliases_normalized: list[str]) -> set[str]:
+        """
+        Alias que seguro no existen: vacío si el filtro no incorporó todavía
+        todas las altas anunciadas por otros procesos
+        """
+        pass
+
+    @abstractmethod
+    def add(self, aliases_normalized: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def announce(self, aliases_normalized: list[str]) -> None:
+        """Altas confirmadas: se agregan y se avisan a los demás procesos"""
+        pass
+
+    @abstractmethod
+    def discard(self, aliases_normalized: list[str]) -> None:
+        """Registra bajas; salen del filtro en la próxima reconstrucción"""
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
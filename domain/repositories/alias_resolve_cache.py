@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from uuid import UUID
+
+
+class IAliasResolveCache(ABC):
+    """Resultado de resolución por (tenant_id, alias_normalized)"""
+
+    @abstractmethod
+    async def get(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> tuple[Optional[Any], Any]:
+        """(valor o None, generación); la generación se pasa a set"""
+        pass
+
+    @abstractmethod
+    async def set(
+        self,
+        tenant_id: UUID,
+        alias_normalized: str,
+        value: Any,
+        generation: Any,
+        negative: bool = False,
+    ) -> None:
+        """No escribe si la clave se invalidó después del get que dio generation"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, tenant_id: UUID, aliases_normalized: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Recursos en segundo plano (aviso de invalidaciones entre procesos)"""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import AliasChainHeadEntity
+
+
+class IAsyncAliasChainHeadRepository(ABC):
+    """
+    Cabezas de cadena por (tenant_id, alias_normalized). Las escrituras son
+    compare-and-set para que dos appends concurrentes no compartan el mismo
+    previous_hash; como el resto de repositorios Async*, solo hacen flush.
+    """
+
+    @abstractmethod
+    async def get_head(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> Optional[AliasChainHeadEntity]:
+        pass
+
+    @abstractmethod
+    async def get_heads_for_update(
+        self, tenant_id: UUID, aliases_normalized: list[str]
+    ) -> dict[str, AliasChainHeadEntity]:
+        """Lee y bloquea (FOR UPDATE) las cabezas existentes del lote"""
+        pass
+
+    @abstractmethod
+    async def lock_chains(self, tenant_id: UUID, aliases_normalized: list[str]) -> None:
+        """
+        Serializa hasta el fin de la transacción los appends a estas cadenas,
+        existan o no sus cabezas (FOR UPDATE no bloquea filas que aún no existen)
+        """
+        pass
+
+    @abstractmethod
+    async def insert_head(self, head: AliasChainHeadEntity) -> bool:
+        """Crea la cabeza de una cadena nueva; False si otra escritura la creó"""
+        pass
+
+    @abstractmethod
+    async def advance_head(
+        self, expected: AliasChainHeadEntity, head: AliasChainHeadEntity
+    ) -> bool:
+        """Mueve la cabeza solo si sigue en `expected` (seq y hash)"""
+        pass
+
+    @abstractmethod
+    async def bulk_upsert(self, heads: list[AliasChainHeadEntity]) -> None:
+        """Escribe cabezas previamente bloqueadas con get_heads_for_update"""
+        pass
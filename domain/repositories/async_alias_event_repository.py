@@ -0,0 +1,23 @@
+from abc import abstractmethod
+from typing import Optional
+
+from domain.entities import AliasEventEntity
+from domain.repositories.async_base_repository import IAsyncBaseRepository
+
+
+class IAsyncAliasEventRepository(IAsyncBaseRepository[AliasEventEntity]):
+    @abstractmethod
+    async def get_events_for_alias(
+        self, alias_normalized: str, tenant_id: str
+    ) -> list[AliasEventEntity]:
+        pass
+
+    @abstractmethod
+    async def get_last_event_for_alias(
+        self, alias_normalized: str, tenant_id: str
+    ) -> Optional[AliasEventEntity]:
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, entities: list[AliasEventEntity]) -> None:
+        pass
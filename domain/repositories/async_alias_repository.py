@@ -0,0 +1,38 @@
+from abc import abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import AliasRegistryEntity
+from domain.repositories.async_base_repository import IAsyncBaseRepository
+
+
+class IAsyncAliasRepository(IAsyncBaseRepository[AliasRegistryEntity]):
+    @abstractmethod
+    async def find_by_normalized_alias(
+        self, tenant_id: str, alias_normalized: str
+    ) -> Optional[AliasRegistryEntity]:
+        pass
+
+    @abstractmethod
+    async def find_active_by_normalized_alias(
+        self, tenant_id: str, alias_normalized: str
+    ) -> Optional[AliasRegistryEntity]:
+        pass
+
+    @abstractmethod
+    async def update_status(self, alias_id: UUID, status: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def insert_if_absent(
+        self, entity: AliasRegistryEntity
+    ) -> Optional[AliasRegistryEntity]:
+        """Inserta el alias si no hay otro ACTIVE para el tenant, o retorna None"""
+        pass
+
+    @abstractmethod
+    async def bulk_insert_if_absent(
+        self, entities: list[AliasRegistryEntity]
+    ) -> list[AliasRegistryEntity]:
+        """INSERT multi-fila; retorna solo los alias efectivamente insertados"""
+        pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class IAsyncBaseRepository(Generic[T], ABC):
+    """Puerto/Interface abstracto para repositorios asíncronos"""
+
+    @abstractmethod
+    async def get_by_id(self, id: UUID) -> Optional[T]:
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
+        pass
+
+    @abstractmethod
+    async def create(self, entity: T) -> T:
+        pass
+
+    @abstractmethod
+    async def update(self, id: UUID, update_data: dict) -> Optional[T]:
+        pass
+
+    @abstractmethod
+    async def delete(self, id: UUID) -> bool:
+        pass
@@ -0,0 +1,46 @@
+from abc import abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import GlobalAliasEntity
+from domain.repositories.async_base_repository import IAsyncBaseRepository
+
+
+class IAsyncGlobalAliasRepository(IAsyncBaseRepository[GlobalAliasEntity]):
+    @abstractmethod
+    async def find_active_alias(
+        self, alias_normalized: str
+    ) -> Optional[GlobalAliasEntity]:
+        pass
+
+    @abstractmethod
+    async def find_active_aliases(
+        self, aliases_normalized: list[str]
+    ) -> dict[str, GlobalAliasEntity]:
+        """Alias activos del lote en una consulta, por alias_normalized"""
+        pass
+
+    @abstractmethod
+    async def create(self, entity: GlobalAliasEntity) -> GlobalAliasEntity:
+        pass
+
+    @abstractmethod
+    async def deactivate_alias(
+        self, alias_normalized: str, owning_tenant_id: Optional[UUID] = None
+    ) -> bool:
+        """Con owning_tenant_id solo desactiva la reserva de ese tenant"""
+        pass
+
+    @abstractmethod
+    async def insert_if_available(
+        self, entity: GlobalAliasEntity
+    ) -> Optional[GlobalAliasEntity]:
+        """Reserva el alias global si no está activo, o retorna None"""
+        pass
+
+    @abstractmethod
+    async def bulk_insert_if_available(
+        self, entities: list[GlobalAliasEntity]
+    ) -> set[str]:
+        """Reserva varios alias globales; retorna los alias_normalized reservados"""
+        pass
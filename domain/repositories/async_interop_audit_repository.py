@@ -0,0 +1,17 @@
+from abc import abstractmethod
+
+from domain.entities import InteropAuditEntity
+from domain.repositories.async_base_repository import IAsyncBaseRepository
+
+
+class IAsyncInteropAuditRepository(IAsyncBaseRepository[InteropAuditEntity]):
+    @abstractmethod
+    async def log_validation_query(self, audit_entity: InteropAuditEntity) -> None:
+        pass
+
+    @abstractmethod
+    async def bulk_log_validation_queries(
+        self, audit_entities: list[InteropAuditEntity]
+    ) -> None:
+        """INSERT multi-fila de varias consultas (sin commit)"""
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from domain.entities import BankRoutingCatalogEntity
+
+
+class IBankRoutingSource(ABC):
+    """Origen del catálogo versionado de bancos y códigos SWIFT/BIC"""
+
+    @abstractmethod
+    def load(self) -> BankRoutingCatalogEntity:
+        pass
+
+    @abstractmethod
+    def has_changed(self) -> bool:
+        """True si el catálogo cambió desde el último load"""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import ChainBatchReportEntity
+
+
+class IChainBatchVerifier(ABC):
+    """Recorre todas las cadenas de alias_events (o las de un tenant)"""
+
+    @abstractmethod
+    def verify_all(
+        self, tenant_id: Optional[UUID] = None, workers: Optional[int] = None
+    ) -> ChainBatchReportEntity:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import ChainCheckpointEntity
+
+
+class IChainCheckpointRepository(ABC):
+    @abstractmethod
+    def get_checkpoint(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> Optional[ChainCheckpointEntity]:
+        pass
+
+    @abstractmethod
+    def save_checkpoint(self, checkpoint: ChainCheckpointEntity) -> None:
+        pass
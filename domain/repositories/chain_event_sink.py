@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from utils import EEventType
+
+
+class IChainEventSink(ABC):
+    """
+    Destino diferido de eventos de cadena: quien llama no escribe ni confirma
+    la transacción; el evento se encadena y persiste en lote
+    """
+
+    @abstractmethod
+    async def submit(
+        self,
+        tenant_id: UUID,
+        alias_normalized: str,
+        event_type: EEventType,
+        correlation_id: UUID,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from uuid import UUID
+
+from domain.entities import ChainVerificationJobEntity
+
+
+class IChainVerificationJobRepository(ABC):
+    """Cola persistente de verificaciones masivas de cadenas"""
+
+    @abstractmethod
+    def enqueue(
+        self, tenant_id: Optional[UUID], workers: Optional[int]
+    ) -> ChainVerificationJobEntity:
+        """Nuevo job PENDING, o el job activo del mismo alcance si ya existe"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: UUID) -> Optional[ChainVerificationJobEntity]:
+        pass
+
+    @abstractmethod
+    def claim_next(
+        self, stale_after_seconds: int
+    ) -> Optional[ChainVerificationJobEntity]:
+        """
+        Toma el job PENDING más antiguo (o uno RUNNING abandonado hace más de
+        stale_after_seconds) y lo marca RUNNING; None si no hay
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: UUID, report: dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: UUID, error: str) -> None:
+        pass
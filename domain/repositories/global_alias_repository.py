@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Optional
 
 from domain.entities import GlobalAliasEntity
@@ -17,3 +19,14 @@ class IGlobalAliasRepository(IBaseRepository[GlobalAliasEntity]):
     @abstractmethod
     def deactivate_alias(self, alias_normalized: str) -> bool:
         pass
+
+    @abstractmethod
+    def count_active(self) -> int:
+        pass
+
+    @abstractmethod
+    def iter_active_aliases(
+        self, changed_since: Optional[datetime] = None
+    ) -> Iterator[str]:
+        """alias_normalized activos (creados o reactivados desde changed_since)"""
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from domain.entities import InteropAuditEntity
+
+
+class IInteropAuditSink(ABC):
+    """Destino diferido de auditoría interop: se persiste en lote, sin COMMIT por consulta"""
+
+    @abstractmethod
+    async def submit(self, audit_entity: InteropAuditEntity) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class IJWTKeyProvider(ABC):
+    """Claves públicas ya parseadas para verificar JWT asimétricos por kid"""
+
+    @abstractmethod
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def get_jwks(self) -> dict:
+        pass
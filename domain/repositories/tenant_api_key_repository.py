@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import TenantApiKeyEntity
+
+
+class ITenantApiKeyRepository(ABC):
+    @abstractmethod
+    def create(self, api_key: TenantApiKeyEntity) -> TenantApiKeyEntity:
+        pass
+
+    @abstractmethod
+    def find_by_key_id(self, key_id: str) -> Optional[TenantApiKeyEntity]:
+        pass
+
+    @abstractmethod
+    def list_by_tenant(self, tenant_id: UUID) -> list[TenantApiKeyEntity]:
+        pass
+
+    @abstractmethod
+    def revoke(self, tenant_id: UUID, key_id: str) -> bool:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    """Puerto para delimitar una transacción que abarca varios repositorios"""
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
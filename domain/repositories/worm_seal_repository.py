@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import WormLeafEntity, WormLeafEventEntity, WormSealEntity
+
+
+class IWormSealRepository(ABC):
+    @abstractmethod
+    def append_leaves(
+        self, seal_date: date, leaf_hasher: Callable[[UUID, str], str]
+    ) -> Optional[int]:
+        """
+        Agrega como hojas los eventos del día aún sin hoja, en orden de llegada
+        y bajo un lock del día. Retorna None si otro proceso tiene el lock.
+        """
+        pass
+
+    @abstractmethod
+    def count_events_without_leaf(self, seal_date: date) -> int:
+        """Eventos con timestamp del día que no tienen hoja"""
+        pass
+
+    @abstractmethod
+    def try_lock_day(self, seal_date: date) -> bool:
+        """Lock transaccional del día; se libera con save_seals"""
+        pass
+
+    @abstractmethod
+    def get_leaf_counts(self, seal_date: date) -> dict[UUID, int]:
+        pass
+
+    @abstractmethod
+    def iter_leaf_hashes(self, tenant_id: UUID, seal_date: date) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def get_leaf_hashes(
+        self, tenant_id: UUID, seal_date: date, start: int, end: int
+    ) -> list[str]:
+        """Hojas con leaf_index en [start, end)"""
+        pass
+
+    @abstractmethod
+    def iter_leaf_events(
+        self, seal_date: date, tenant_id: Optional[UUID] = None
+    ) -> Iterator[WormLeafEventEntity]:
+        """Hojas del día con su evento, por (tenant_id, leaf_index), vía cursor"""
+        pass
+
+    @abstractmethod
+    def get_leaf_by_event(self, event_id: UUID) -> Optional[WormLeafEntity]:
+        pass
+
+    @abstractmethod
+    def get_nodes(
+        self, tenant_id: UUID, seal_date: date, coordinates: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], str]:
+        pass
+
+    @abstractmethod
+    def get_seal(
+        self, seal_date: date, tenant_id: Optional[UUID] = None
+    ) -> Optional[WormSealEntity]:
+        """Sello del tenant o, sin tenant_id, el sello global del día"""
+        pass
+
+    @abstractmethod
+    def get_tenant_seals(self, seal_date: date) -> list[WormSealEntity]:
+        """Sellos por tenant del día, en el orden de hojas del árbol global"""
+        pass
+
+    @abstractmethod
+    def save_seals(
+        self,
+        seals: list[WormSealEntity],
+        nodes: list[tuple[UUID, int, int, str]],
+    ) -> None:
+        """Persiste sellos y nodos (tenant_id, level, index, hash) y confirma"""
+        pass
@@ -1,13 +1,25 @@
+from .alias_normalizer import AliasNormalizer, alias_normalizer
+from .api_key_service import ApiKeyService
+from .bank_routing_registry import BankRoutingRegistry
 from .bank_routing_service import BankRoutingService
-from .digital_signature_service import DigitalSignatureService
+from .chain_append_service import ChainAppendService
+from .digital_signature_service import DigitalSignatureService, SignatureVerifier
 from .hash_chain_service import HashChainService
 from .interop_service import InteropService
 from .jwt_validation_service import JWTValidationService
+from .merkle_tree_service import MerkleTreeService
 
 __all__ = [
+    "AliasNormalizer",
+    "alias_normalizer",
+    "ApiKeyService",
     "HashChainService",
+    "ChainAppendService",
     "JWTValidationService",
     "DigitalSignatureService",
+    "SignatureVerifier",
+    "BankRoutingRegistry",
     "BankRoutingService",
     "InteropService",
+    "MerkleTreeService",
 ]
@@ -0,0 +1,159 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+from utils import MESSAGES
+
+ALIAS_MIN_LENGTH = 4
+ALIAS_MAX_LENGTH = 30
+ALIAS_PATTERN = re.compile(r"[a-z0-9._-]+")
+LAST_4_PATTERN = re.compile(r"[0-9]{4}")
+
+# Homoglifos frecuentes (cirílico, griego, latín extendido y puntuación) que
+# NFKC no une con su letra latina; ya en minúsculas porque se aplican
+# después de casefold
+_CONFUSABLES = {
+    # Cirílico
+    "а": "a",
+    "в": "b",
+    "с": "c",
+    "ԁ": "d",
+    "е": "e",
+    "һ": "h",
+    "н": "h",
+    "і": "i",
+    "ј": "j",
+    "к": "k",
+    "ӏ": "l",
+    "м": "m",
+    "о": "o",
+    "р": "p",
+    "ԛ": "q",
+    "ѕ": "s",
+    "т": "t",
+    "ԝ": "w",
+    "х": "x",
+    "у": "y",
+    # Griego
+    "α": "a",
+    "β": "b",
+    "ε": "e",
+    "η": "h",
+    "ι": "i",
+    "κ": "k",
+    "μ": "m",
+    "ν": "v",
+    "ο": "o",
+    "ρ": "p",
+    "τ": "t",
+    "υ": "u",
+    "χ": "x",
+    "ζ": "z",
+    # Latín sin descomposición NFD
+    "ı": "i",
+    "ł": "l",
+    "ø": "o",
+    "đ": "d",
+    "ɡ": "g",
+    # Guiones y puntos
+    "‐": "-",
+    "‑": "-",
+    "‒": "-",
+    "–": "-",
+    "—": "-",
+    "―": "-",
+    "−": "-",
+    "。": ".",
+    "·": ".",
+}
+# Invisibles que se eliminan: espacios de ancho cero, BOM y guion suave
+_REMOVED = "\u200b\u200c\u200d\u2060\ufeff\u00ad"
+
+_TRANSLATION = str.maketrans({**_CONFUSABLES, **dict.fromkeys(_REMOVED)})
+_REMOVE_INVISIBLE = str.maketrans(dict.fromkeys(_REMOVED))
+
+
+class AliasNormalizer:
+    """
+    Política única de normalización de alias (registro, resolución,
+    interoperabilidad y cargas masivas).
+
+    Un alias ASCII solo se recorta y pasa a minúsculas: es el caso habitual
+    y coincide con la normalización histórica, así que los alias ya
+    registrados conservan su alias_normalized (y sus hashes). El resto pasa
+    por NFKC, casefold, la tabla de homoglifos y el plegado de tildes, con
+    una caché LRU por alias crudo; así "ｊｕａｎ", "juаn" (а cirílica) y
+    "juán" colisionan con "juan" en vez de registrarse como alias distintos.
+    """
+
+    def __init__(self, cache_size: int = 65_536):
+        self._normalize_unicode = lru_cache(maxsize=cache_size)(self._fold_unicode)
+
+    @staticmethod
+    def _fold_unicode(alias: str) -> str:
+        folded = unicodedata.normalize("NFKC", alias).casefold()
+        folded = unicodedata.normalize("NFD", folded.translate(_TRANSLATION))
+        return "".join(
+            char for char in folded if not unicodedata.combining(char)
+        ).strip()
+
+    def normalize(self, alias: str) -> str:
+        if alias.isascii():
+            return alias.strip().lower()
+        return self._normalize_unicode(alias)
+
+    @staticmethod
+    def display_form(alias: str) -> str:
+        """
+        Forma que se guarda como alias_raw: NFKC, sin invisibles y recortada;
+        conserva mayúsculas y tildes (no es la forma de comparación)
+        """
+        if alias.isascii():
+            return alias.strip()
+        return unicodedata.normalize("NFKC", alias).translate(_REMOVE_INVISIBLE).strip()
+
+    def normalize_many(self, aliases: list[str]) -> list[str]:
+        """normalize por elemento, en orden, sin llamadas por alias ASCII"""
+        normalize_unicode = self._normalize_unicode
+        return [
+            alias.strip().lower() if alias.isascii() else normalize_unicode(alias)
+            for alias in aliases
+        ]
+
+    def is_valid(self, alias_normalized: str) -> bool:
+        return (
+            ALIAS_MIN_LENGTH <= len(alias_normalized) <= ALIAS_MAX_LENGTH
+            and ALIAS_PATTERN.fullmatch(alias_normalized) is not None
+        )
+
+    def validate(self, alias: str) -> str:
+        """alias normalizado; ValueError si no cumple largo o caracteres"""
+        alias_normalized = self.normalize(alias)
+        if not ALIAS_MIN_LENGTH <= len(alias_normalized) <= ALIAS_MAX_LENGTH:
+            raise ValueError(
+                MESSAGES.ERROR.VALIDATION.ALIAS_MUST_HAVE_4_TO_30_CHARACTERS.CODE
+            )
+        if ALIAS_PATTERN.fullmatch(alias_normalized) is None:
+            raise ValueError(MESSAGES.ERROR.VALIDATION.ALIAS_INVALID_CHARACTERS.CODE)
+        return alias_normalized
+
+    @staticmethod
+    def validate_last_4(last_4: str) -> str:
+        if LAST_4_PATTERN.fullmatch(last_4) is None:
+            raise ValueError(
+                MESSAGES.ERROR.VALIDATION.ALIAS_LAST_4_MUST_BE_4_DIGITS.CODE
+            )
+        return last_4
+
+    def cache_stats(self) -> dict[str, int]:
+        info = self._normalize_unicode.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
+
+# Instancia compartida: misma política y misma caché en todo el proceso
+alias_normalizer = AliasNormalizer()
@@ -0,0 +1,54 @@
+import hashlib
+import hmac
+import re
+import secrets
+from typing import Optional
+
+from utils import MESSAGES
+
+KEY_PATTERN = re.compile(
+    r"^tk_(?P<code>[a-zA-Z0-9_-]{3,20})_(?P<key_id>[0-9a-f]{12})\.(?P<secret>[A-Za-z0-9_-]{32,})$"
+)
+
+
+class ApiKeyService:
+    """
+    Formato y digest de API keys: tk_{tenant_code}_{key_id}.{secreto}
+
+    El digest es HMAC-SHA256 con pepper (no bcrypt): el secreto ya tiene
+    192 bits aleatorios, así que no hace falta un hash lento y la
+    verificación cuesta microsegundos. La comparación es en tiempo constante.
+    """
+
+    KEY_ID_BYTES = 6
+    SECRET_BYTES = 24
+
+    def __init__(self, pepper: str):
+        if not pepper:
+            raise ValueError(MESSAGES.ERROR.AUTH.CUB_PEPPER_NOT_SET.CODE)
+        self.pepper = pepper.encode()
+
+    def generate(self, tenant_code: str) -> tuple[str, str, str]:
+        """Nueva key: (api_key en claro, key_id, digest a persistir)"""
+        key_id = secrets.token_hex(self.KEY_ID_BYTES)
+        secret = secrets.token_urlsafe(self.SECRET_BYTES)
+        return (
+            f"tk_{tenant_code}_{key_id}.{secret}",
+            key_id,
+            self.digest(key_id, secret),
+        )
+
+    def parse(self, api_key: str) -> Optional[tuple[str, str, str]]:
+        """(tenant_code, key_id, secreto) o None si el formato no es válido"""
+        match = KEY_PATTERN.match(api_key)
+        if not match:
+            return None
+        return match.group("code"), match.group("key_id"), match.group("secret")
+
+    def digest(self, key_id: str, secret: str) -> str:
+        return hmac.new(
+            self.pepper, f"{key_id}.{secret}".encode(), hashlib.sha256
+        ).hexdigest()
+
+    def verify(self, key_id: str, secret: str, key_hash: str) -> bool:
+        return hmac.compare_digest(self.digest(key_id, secret), key_hash)
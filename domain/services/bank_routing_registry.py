@@ -0,0 +1,158 @@
+import re
+import unicodedata
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from domain.entities import BankRoutingCatalogEntity, BankRoutingEntity
+from utils import MESSAGES
+
+BIC_PATTERN = re.compile(r"[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}(?:[A-Z0-9]{3})?")
+
+# Palabras que no distinguen un banco de otro en los nombres del catálogo
+STOPWORDS = frozenset(
+    {"agencia", "bank", "banco", "de", "del", "e", "el", "en", "la", "s", "sa", "y"}
+)
+
+# Un token de la consulta más corto que esto solo coincide completo
+MIN_PREFIX_LENGTH = 3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def fold_bank_name(name: str) -> list[str]:
+    """Minúsculas, sin tildes ni puntuación, separado en tokens"""
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    ascii_only = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", ascii_only).split()
+
+
+class BankRoutingRegistry:
+    """
+    Índices precalculados de un catálogo de bancos; inmutable una vez creado.
+
+    - exacto: nombre plegado (completo y sin palabras vacías) -> banco
+    - prefijos: cada prefijo de cada token significativo -> nombres que lo
+      contienen (un trie aplanado en un dict)
+    - inverso: routing code -> banco
+
+    El match difuso acepta un nombre si todos sus tokens aparecen en la
+    consulta o todos los de la consulta son prefijo de los suyos, y entre
+    los aceptados elige el que cubre más caracteres (a igualdad, el nombre
+    más corto y luego el primero del catálogo).
+    """
+
+    def __init__(self, catalog: BankRoutingCatalogEntity):
+        self.version = catalog.version
+        self.country = catalog.country
+        self.fallback_routing_code = catalog.fallback_routing_code
+        self.loaded_at = datetime.now(timezone.utc)
+
+        self._banks: list[BankRoutingEntity] = []
+        self._exact: dict[str, int] = {}
+        self._by_routing_code: dict[str, int] = {}
+        # (índice del banco, tokens significativos) por nombre o alias
+        self._keys: list[tuple[int, tuple[str, ...]]] = []
+        self._prefixes: dict[str, list[tuple[int, str]]] = defaultdict(list)
+
+        for bank in catalog.banks:
+            self._add_bank(bank)
+        if not self.validate_routing_code(self.fallback_routing_code):
+            message = f"{MESSAGES.ERROR.VALIDATION.BANK_ROUTING_CATALOG_INVALID.CODE}: {self.fallback_routing_code}"
+            raise ValueError(message)
+        self._prefixes = dict(self._prefixes)
+
+    def _add_bank(self, bank: BankRoutingEntity) -> None:
+        if not self.validate_routing_code(bank.routing_code):
+            message = f"{MESSAGES.ERROR.VALIDATION.BANK_ROUTING_CATALOG_INVALID.CODE}: {bank.routing_code}"
+            raise ValueError(message)
+
+        bank_index = len(self._banks)
+        self._banks.append(bank)
+        self._by_routing_code.setdefault(bank.routing_code, bank_index)
+
+        for name in [bank.name, *bank.aliases]:
+            tokens = fold_bank_name(name)
+            significant = tuple(token for token in tokens if token not in STOPWORDS)
+            # El primero del catálogo gana si dos bancos comparten un nombre
+            self._exact.setdefault(" ".join(tokens), bank_index)
+            if not significant:
+                continue
+            self._exact.setdefault(" ".join(significant), bank_index)
+
+            key_id = len(self._keys)
+            self._keys.append((bank_index, significant))
+            for token in set(significant):
+                for end in range(MIN_PREFIX_LENGTH, len(token)):
+                    self._prefixes[token[:end]].append((key_id, token))
+                self._prefixes[token].append((key_id, token))
+
+    def __len__(self) -> int:
+        return len(self._banks)
+
+    def find_bank(self, bank_name: str) -> Optional[BankRoutingEntity]:
+        # Atajo sin plegar: el nombre ya viene en minúsculas y sin tildes
+        bank_index = self._exact.get(bank_name.strip().lower())
+        if bank_index is not None:
+            return self._banks[bank_index]
+
+        tokens = fold_bank_name(bank_name)
+        bank_index = self._exact.get(" ".join(tokens))
+        if bank_index is not None:
+            return self._banks[bank_index]
+
+        query = [token for token in tokens if token not in STOPWORDS]
+        if not query:
+            return None
+        bank_index = self._exact.get(" ".join(query))
+        if bank_index is None:
+            bank_index = self._fuzzy_match(query)
+        return self._banks[bank_index] if bank_index is not None else None
+
+    def _fuzzy_match(self, query: list[str]) -> Optional[int]:
+        covered: dict[int, set[str]] = defaultdict(set)
+        matched: dict[int, set[str]] = defaultdict(set)
+        for query_token in set(query):
+            for key_id, key_token in self._prefixes.get(query_token, ()):
+                if len(query_token) < MIN_PREFIX_LENGTH and key_token != query_token:
+                    continue
+                covered[key_id].add(key_token)
+                matched[key_id].add(query_token)
+
+        query_tokens = set(query)
+        best, best_score = None, None
+        for key_id, key_tokens in covered.items():
+            bank_index, significant = self._keys[key_id]
+            name_in_query = len(key_tokens) == len(set(significant))
+            if not name_in_query and matched[key_id] != query_tokens:
+                continue
+            score = (
+                sum(len(token) for token in key_tokens),
+                -len(significant),
+                -bank_index,
+            )
+            if best_score is None or score > best_score:
+                best, best_score = bank_index, score
+        return best
+
+    def get_routing_code(self, bank_name: str) -> str:
+        bank = self.find_bank(bank_name)
+        return bank.routing_code if bank else self.fallback_routing_code
+
+    def get_bank(self, routing_code: str) -> Optional[BankRoutingEntity]:
+        bank_index = self._by_routing_code.get(routing_code)
+        return self._banks[bank_index] if bank_index is not None else None
+
+    @staticmethod
+    def validate_routing_code(routing_code: str) -> bool:
+        return bool(routing_code) and BIC_PATTERN.fullmatch(routing_code) is not None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "country": self.country,
+            "banks": len(self._banks),
+            "names": len(self._exact),
+            "prefixes": len(self._prefixes),
+            "loaded_at": self.loaded_at.isoformat(),
+        }
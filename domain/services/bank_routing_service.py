@@ -1,50 +1,41 @@
-import re
-from typing import Optional
+from typing import Any, Optional
+
+from domain.services.bank_routing_registry import BankRoutingRegistry
 
 
 class BankRoutingService:
-    """Servicio para mapear nombres de bancos a códigos de routing estándar"""
-
-    def __init__(self):
-        self._bank_mappings = self._load_bank_mappings()
-
-    def _load_bank_mappings(self) -> dict[str, str]:
-        """Carga mapeo de nombres de bancos a códigos SWIFT/BIC para Chile"""
-        return {
-            # Bancos chilenos principales
-            "banco santander": "BSCHCLRM",
-            "banco de chile": "BCHICLRM",
-            "banco estado": "BECHCLRM",
-            "scotiabank": "SCBLCLRX",
-            "banco bci": "BCICCLRM",
-            "banco security": "BESGCLRM",
-            "banco falabella": "BFALCLRM",
-            "banco ripley": "BRIECLR1",
-            "banco internacional": "BINCCLRM",
-            "banco consorcio": "BCOCCLRM",
-            # esto deberia convertirse pronto en un utils externo
-        }
+    """
+    Servicio para mapear nombres de bancos a códigos de routing estándar.
 
-    def get_routing_code(self, bank_name: str) -> str:
-        """Convierte nombre de banco a código de routing SWIFT/BIC"""
-        bank_normalized = bank_name.strip().lower()
+    Consulta el registro vigente (índices precalculados del catálogo CMF);
+    reload lo reemplaza en un solo paso, sin reiniciar el proceso, y las
+    consultas en curso terminan con el registro que tomaron.
+    """
 
-        if bank_normalized in self._bank_mappings:
-            return self._bank_mappings[bank_normalized]
+    def __init__(self, registry: BankRoutingRegistry):
+        self._registry = registry
+        self._reloads = 0
 
-        for known_bank, swift_code in self._bank_mappings.items():
-            if known_bank in bank_normalized or bank_normalized in known_bank:
-                return swift_code
+    @property
+    def registry(self) -> BankRoutingRegistry:
+        return self._registry
 
-        # Código genérico para bancos no mapeados
-        return "CLRBCLRX"  # CL=Chile, RB=Routing Bank, CL=Location, RX=Generic
+    def reload(self, registry: BankRoutingRegistry) -> None:
+        self._registry = registry
+        self._reloads += 1
+
+    def get_routing_code(self, bank_name: str) -> str:
+        """Convierte nombre de banco a código de routing SWIFT/BIC"""
+        return self._registry.get_routing_code(bank_name)
 
     def get_bank_name_from_routing(self, routing_code: str) -> Optional[str]:
         """Resuelve código de routing a nombre de banco (solo uso interno)"""
-        reverse_map = {v: k for k, v in self._bank_mappings.items()}
-        return reverse_map.get(routing_code)
+        bank = self._registry.get_bank(routing_code)
+        return bank.name if bank else None
 
     def validate_routing_code(self, routing_code: str) -> bool:
         """Valida que un código de routing tenga formato SWIFT/BIC válido"""
-        pattern = r"^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$"
-        return bool(re.match(pattern, routing_code))
+        return BankRoutingRegistry.validate_routing_code(routing_code)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self._registry.stats(), "reloads": self._reloads}
@@ -0,0 +1,187 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import GENESIS_HASH, AliasChainHeadEntity, AliasEventEntity
+from domain.repositories import (
+    IAsyncAliasChainHeadRepository,
+    IAsyncAliasEventRepository,
+)
+from domain.services.hash_chain_service import HashChainService
+from utils import MESSAGES, EEventType
+
+
+class ChainAppendService:
+    """
+    Append de eventos a la cadena de un alias usando la cabeza persistida.
+
+    El previous_hash sale de alias_chain_heads (PK, normalmente en caché) en
+    vez de buscar el último evento, y la cabeza avanza con compare-and-set en
+    la misma transacción que el INSERT del evento, que recibe seq = cabeza + 1
+    (único por cadena en alias_events). Si el CAS pierde (caché
+    desactualizada) se reintenta leyendo la cabeza con FOR UPDATE.
+
+    Todos los appends, simples y en lote, toman antes el advisory lock de
+    cada cadena: así dos transacciones no pueden crear a la vez la cabeza de
+    una cadena nueva (el upsert del lote pisaría la cabeza insertada por un
+    append simple y bifurcaría la cadena).
+    """
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        alias_event_repository: IAsyncAliasEventRepository,
+        chain_head_repository: IAsyncAliasChainHeadRepository,
+        hash_chain_service: HashChainService,
+    ):
+        self.alias_event_repository = alias_event_repository
+        self.chain_head_repository = chain_head_repository
+        self.hash_chain_service = hash_chain_service
+
+    async def append(
+        self,
+        tenant_id: UUID,
+        alias_normalized: str,
+        event_type: EEventType,
+        correlation_id: UUID,
+        timestamp: Optional[datetime] = None,
+    ) -> AliasEventEntity:
+        timestamp = timestamp or datetime.now(timezone.utc)
+
+        # Mismo lock que los lotes, también en el primer intento
+        await self.chain_head_repository.lock_chains(tenant_id, [alias_normalized])
+        for attempt in range(self.MAX_ATTEMPTS):
+            if attempt == 0:
+                head = await self.chain_head_repository.get_head(
+                    tenant_id, alias_normalized
+                )
+            else:
+                heads = await self.chain_head_repository.get_heads_for_update(
+                    tenant_id, [alias_normalized]
+                )
+                head = heads.get(alias_normalized)
+
+            event = self._build_event(
+                head, tenant_id, alias_normalized, event_type, correlation_id, timestamp
+            )
+            new_head = self._next_head(event)
+
+            if head is None:
+                moved = await self.chain_head_repository.insert_head(new_head)
+            else:
+                moved = await self.chain_head_repository.advance_head(head, new_head)
+
+            if moved:
+                await self.alias_event_repository.create(event)
+                return event
+
+        raise ValueError(MESSAGES.ERROR.VALIDATION.CHAIN_HEAD_CONFLICT.CODE)
+
+    async def append_many(
+        self,
+        tenant_id: UUID,
+        aliases_normalized: list[str],
+        event_type: EEventType,
+        correlation_id: UUID,
+        timestamps: dict[str, datetime],
+    ) -> list[AliasEventEntity]:
+        """
+        Un evento por alias del lote: bloquea las cadenas y sus cabezas
+        existentes, escribe todas las cabezas con un upsert multi-fila y los
+        eventos con un INSERT multi-fila.
+        """
+        await self.chain_head_repository.lock_chains(tenant_id, aliases_normalized)
+        heads = await self.chain_head_repository.get_heads_for_update(
+            tenant_id, aliases_normalized
+        )
+
+        events = []
+        new_heads = []
+        for alias_normalized in aliases_normalized:
+            head = heads.get(alias_normalized)
+            event = self._build_event(
+                head,
+                tenant_id,
+                alias_normalized,
+                event_type,
+                correlation_id,
+                timestamps[alias_normalized],
+            )
+            events.append(event)
+            new_heads.append(self._next_head(event))
+
+        await self.chain_head_repository.bulk_upsert(new_heads)
+        await self.alias_event_repository.bulk_create(events)
+        return events
+
+    async def append_batch(
+        self,
+        tenant_id: UUID,
+        entries: list[tuple[str, EEventType, UUID, datetime]],
+    ) -> list[AliasEventEntity]:
+        """
+        Varios eventos por cadena, encadenados en el orden de `entries`
+        (alias_normalized, event_type, correlation_id, timestamp): bloquea las
+        cadenas, lee sus cabezas una vez, hace un upsert con la última cabeza
+        de cada cadena y un INSERT multi-fila de todos los eventos.
+        """
+        aliases_normalized = sorted({entry[0] for entry in entries})
+        await self.chain_head_repository.lock_chains(tenant_id, aliases_normalized)
+        heads = await self.chain_head_repository.get_heads_for_update(
+            tenant_id, aliases_normalized
+        )
+
+        events = []
+        for alias_normalized, event_type, correlation_id, timestamp in entries:
+            event = self._build_event(
+                heads.get(alias_normalized),
+                tenant_id,
+                alias_normalized,
+                event_type,
+                correlation_id,
+                timestamp,
+            )
+            events.append(event)
+            heads[alias_normalized] = self._next_head(event)
+
+        await self.chain_head_repository.bulk_upsert(list(heads.values()))
+        await self.alias_event_repository.bulk_create(events)
+        return events
+
+    def _build_event(
+        self,
+        head: Optional[AliasChainHeadEntity],
+        tenant_id: UUID,
+        alias_normalized: str,
+        event_type: EEventType,
+        correlation_id: UUID,
+        timestamp: datetime,
+    ) -> AliasEventEntity:
+        previous_hash = head.current_hash if head else GENESIS_HASH
+        seq = head.seq + 1 if head else 1
+        current_hash = self.hash_chain_service.calculate_event_hash(
+            tenant_id=tenant_id,
+            alias=alias_normalized,
+            event_type=event_type,
+            timestamp=timestamp,
+            previous_hash=previous_hash,
+        )
+        return AliasEventEntity(
+            alias_normalized=alias_normalized,
+            tenant_id=tenant_id,
+            event_type=event_type,
+            correlation_id=correlation_id,
+            previous_hash=previous_hash,
+            current_hash=current_hash,
+            timestamp=timestamp,
+            seq=seq,
+        )
+
+    def _next_head(self, event: AliasEventEntity) -> AliasChainHeadEntity:
+        return AliasChainHeadEntity(
+            tenant_id=event.tenant_id,
+            alias_normalized=event.alias_normalized,
+            current_hash=event.current_hash,
+            seq=event.seq,
+        )
@@ -1,14 +1,57 @@
 import base64
+import binascii
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 
 from utils import MESSAGES
 
 
-class DigitalSignatureService:
+class SignatureVerifier:
+    """
+    Verificación ECDSA P-256 de los sellos WORM solo con la clave pública:
+    para procesos que verifican y no deben recibir la clave privada.
+    """
+
+    def __init__(self, public_key_pem: str):
+        self.public_key = serialization.load_pem_public_key(public_key_pem.encode())
+        self._public_key_pem = public_key_pem
+
+    def verify(self, data: str, signature: str) -> bool:
+        """True si signature (base64) es una firma válida de data con esta clave"""
+        try:
+            self.public_key.verify(
+                base64.b64decode(signature, validate=True),
+                data.encode("utf-8"),
+                ec.ECDSA(hashes.SHA256()),
+            )
+        except (InvalidSignature, binascii.Error, ValueError):
+            return False
+        return True
+
+    def verify_many(self, items: list[tuple[str, str]]) -> list[bool]:
+        """Resultado por (data, signature), en el mismo orden"""
+        return [self.verify(data, signature) for data, signature in items]
+
+    def get_public_key_pem(self) -> str:
+        """Para que los reguladores puedan verificar"""
+        return self._public_key_pem
+
+
+class DigitalSignatureService(SignatureVerifier):
+    """
+    Firma ECDSA P-256 de los sellos WORM. La clave se parsea una vez y la
+    pública se serializa al construir: una instancia por proceso.
+    """
+
     def __init__(self, private_key_pem: str):
         self.private_key = self._load_private_key(private_key_pem)
+        self.public_key = self.private_key.public_key()
+        self._public_key_pem = self.public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode("utf-8")
 
     def _load_private_key(self, private_key_pem: str):
         """Carga la clave privada desde string PEM"""
@@ -26,10 +69,6 @@ class DigitalSignatureService:
         )
         return base64.b64encode(signature).decode("utf-8")
 
-    def get_public_key_pem(self) -> str:
-        """Para que los reguladores puedan verificar"""
-        public_key = self.private_key.public_key()
-        return public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        ).decode("utf-8")
+    def sign_many(self, payloads: list[str]) -> list[str]:
+        """Firmas en el mismo orden que payloads"""
+        return [self.sign(data) for data in payloads]
@@ -1,13 +1,17 @@
 import hashlib
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from typing import Optional
 
 from core import settings
-from domain.entities import AliasEventEntity
+from domain.entities import GENESIS_HASH, AliasEventEntity, ChainVerificationResult
 from utils import MESSAGES
 
 
 class HashChainService:
+    # Tope de índices corruptos listados; corrupted_count lleva el total
+    MAX_REPORTED_CORRUPTIONS = 1000
+
     def __init__(self):
         self.pepper = settings.CUB_PEPPER
         if not self.pepper:
@@ -43,90 +47,80 @@ class HashChainService:
 
         return hashlib.sha256(data.encode()).hexdigest()
 
-    def verify_chain_integrity(
-        self, events: list[AliasEventEntity]
-    ) -> tuple[bool, list[int], Optional[int], str, str]:
+    def iter_chain_verification(
+        self,
+        events: Iterable[AliasEventEntity],
+        start_seq: int = 0,
+        start_hash: str = GENESIS_HASH,
+        progress_every: int = 0,
+    ) -> Iterator[ChainVerificationResult]:
         """
-        Verifica la cadena REAL almacenada
+        Verifica la cadena REAL almacenada consumiendo los eventos en orden de
+        seq, en memoria constante. Parte de (start_seq, start_hash), que es el
+        génesis o un checkpoint previo. Emite un snapshot cada progress_every
+        eventos y siempre uno final con completed=True.
+
+        Un salto en seq (evento faltante o duplicado) cuenta como ruptura.
         """
-        if not events:
-            return True, [], None, "", ""
+        result = ChainVerificationResult(
+            from_seq=start_seq,
+            last_seq=start_seq,
+            last_hash=start_hash,
+            checkpoint_seq=start_seq,
+            checkpoint_hash=start_hash,
+        )
+        expected_previous_hash = start_hash
+        expected_seq = start_seq + 1
 
-        corrupted_indices = []
-        chain_break_at = None
+        for event in events:
+            seq = event.seq if event.seq is not None else expected_seq
+            broken_hashes = None
 
-        if events[0].previous_hash != "0" * 64:
-            corrupted_indices.append(0)
-            chain_break_at = 0
-        else:
-            expected_hash_0 = self.calculate_event_hash(
-                tenant_id=events[0].tenant_id,
-                alias=events[0].alias_normalized,
-                event_type=events[0].event_type,
-                timestamp=events[0].timestamp,
-                previous_hash=events[0].previous_hash,
-            )
-            if events[0].current_hash != expected_hash_0:
-                corrupted_indices.append(0)
-                chain_break_at = 0
-
-        for i in range(1, len(events)):
-            event = events[i]
-            previous_event = events[i - 1]
-
-            if event.previous_hash != previous_event.current_hash:
-                corrupted_indices.append(i)
-                if chain_break_at is None:
-                    chain_break_at = i
-                continue
-
-            expected_hash = self.calculate_event_hash(
-                tenant_id=event.tenant_id,
-                alias=event.alias_normalized,
-                event_type=event.event_type,
-                timestamp=event.timestamp,
-                previous_hash=event.previous_hash,
-            )
-            if event.current_hash != expected_hash:
-                corrupted_indices.append(i)
-                if chain_break_at is None:
-                    chain_break_at = i
-
-        is_valid = len(corrupted_indices) == 0
-
-        if is_valid:
-            expected_final_hash = events[-1].current_hash
-            actual_final_hash = events[-1].current_hash
-            return (
-                is_valid,
-                corrupted_indices,
-                chain_break_at,
-                expected_final_hash,
-                actual_final_hash,
-            )
-        first_corrupt_index = corrupted_indices[0]
-        corrupt_event = events[first_corrupt_index]
-
-        if first_corrupt_index == 0:
-            expected_hash_0 = self.calculate_event_hash(
-                tenant_id=corrupt_event.tenant_id,
-                alias=corrupt_event.alias_normalized,
-                event_type=corrupt_event.event_type,
-                timestamp=corrupt_event.timestamp,
-                previous_hash=corrupt_event.previous_hash,
-            )
-            return (
-                is_valid,
-                corrupted_indices,
-                chain_break_at,
-                expected_hash_0,
-                corrupt_event.current_hash,
-            )
-        previous_event = events[first_corrupt_index - 1]
-        return (
-            is_valid,
-            corrupted_indices,
-            chain_break_at,
-            previous_event.current_hash,
-            corrupt_event.previous_hash,
-        )
+            if event.previous_hash != expected_previous_hash or seq != expected_seq:
+                broken_hashes = (expected_previous_hash, event.previous_hash)
+            else:
+                recomputed = self.calculate_event_hash(
+                    tenant_id=event.tenant_id,
+                    alias=event.alias_normalized,
+                    event_type=event.event_type,
+                    timestamp=event.timestamp,
+                    previous_hash=event.previous_hash,
+                )
+                if recomputed != event.current_hash:
+                    broken_hashes = (recomputed, event.current_hash)
+
+            if broken_hashes:
+                if result.is_valid:
+                    result.is_valid = False
+                    result.chain_break_at = seq - 1
+                    result.expected_hash, result.actual_hash = broken_hashes
+                if len(result.corrupted_events) < self.MAX_REPORTED_CORRUPTIONS:
+                    result.corrupted_events.append(seq - 1)
+                result.corrupted_count += 1
+            elif result.is_valid:
+                result.checkpoint_seq = seq
+                result.checkpoint_hash = event.current_hash
+
+            result.verified_events += 1
+            result.last_seq = seq
+            result.last_hash = event.current_hash
+            expected_previous_hash = event.current_hash
+            expected_seq = seq + 1
+
+            if progress_every and result.verified_events % progress_every == 0:
+                yield result.model_copy(deep=True)
+
+        if result.is_valid:
+            result.expected_hash = result.actual_hash = result.last_hash
+        result.completed = True
+        yield result
+
+    def verify_chain_stream(
+        self,
+        events: Iterable[AliasEventEntity],
+        start_seq: int = 0,
+        start_hash: str = GENESIS_HASH,
+    ) -> ChainVerificationResult:
+        """Igual que iter_chain_verification, retornando solo el resultado final"""
+        *_, result = self.iter_chain_verification(events, start_seq, start_hash)
+        return result
@@ -1,16 +1,20 @@
+import asyncio
 import hashlib
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID
 
 from core.logger import get_logger
 from domain.entities import InteropAuditEntity
-from domain.entities.alias_event_entity import AliasEventEntity
 from domain.repositories import (
-    IAliasEventRepository,
-    IGlobalAliasRepository,
-    IInteropAuditRepository,
+    IAliasExistenceFilter,
+    IAsyncGlobalAliasRepository,
+    IAsyncInteropAuditRepository,
+    IChainEventSink,
+    IInteropAuditSink,
+    IUnitOfWork,
 )
-from domain.services import BankRoutingService, HashChainService
+from domain.services import BankRoutingService, ChainAppendService, alias_normalizer
 from utils import MESSAGES, EEventType
 
 logger = get_logger("domain.services.interop")
@@ -21,81 +25,207 @@ class InteropService:
 
     def __init__(
         self,
-        global_alias_repo: IGlobalAliasRepository,
-        audit_repo: IInteropAuditRepository,
+        global_alias_repo: IAsyncGlobalAliasRepository,
+        audit_repo: IAsyncInteropAuditRepository,
         bank_routing_service: BankRoutingService,
-        alias_event_repo: IAliasEventRepository,
-        hash_chain_service: HashChainService,
+        chain_append_service: ChainAppendService,
+        unit_of_work: IUnitOfWork,
+        event_sink: Optional[IChainEventSink] = None,
+        existence_filter: Optional[IAliasExistenceFilter] = None,
+        audit_sink: Optional[IInteropAuditSink] = None,
     ):
         self.global_alias_repo = global_alias_repo
         self.audit_repo = audit_repo
         self.bank_routing_service = bank_routing_service
-        self.alias_event_repo = alias_event_repo
-        self.hash_chain_service = hash_chain_service
+        self.chain_append_service = chain_append_service
+        self.unit_of_work = unit_of_work
+        self.event_sink = event_sink
+        self.existence_filter = existence_filter
+        self.audit_sink = audit_sink
 
-    def validate_alias_global(
+    async def validate_alias_global(
         self, alias: str, requesting_tenant_id: str
     ) -> dict[str, Any]:
         """
         Valida un alias a nivel global sin exponer información sensible
         Retorna información anonimizada para interoperabilidad
         """
-        alias_normalized = alias.strip().lower()
-        global_alias = self.global_alias_repo.find_active_alias(alias_normalized)
+        alias_normalized = alias_normalizer.normalize(alias)
+        # Negativo confirmado del filtro: sin consulta a global_aliases (la
+        # auditoría de la consulta se escribe igual)
+        if self.existence_filter and alias_normalized in (
+            await self.existence_filter.confirmed_absent([alias_normalized])
+        ):
+            global_alias = None
+        else:
+            global_alias = await self.global_alias_repo.find_active_alias(
+                alias_normalized
+            )
 
         audit_entity = InteropAuditEntity.create_validation_query(
             requesting_tenant_id=requesting_tenant_id,
             alias_normalized=alias_normalized,
             target_tenant_id=global_alias.owning_tenant_id if global_alias else None,
         )
-        self.audit_repo.log_validation_query(audit_entity)
 
         if not global_alias:
-            return {
-                "exists": False,
-                "alias_hash": self._hash_alias(alias_normalized),
-                "timestamp": datetime.now().isoformat() + "Z",
-                "detail": MESSAGES.ERROR.VALIDATION.ALIAS_NOT_FOUND.CODE,
-            }
+            await self._write(audit_entity)
+            return self._not_found_result(
+                alias_normalized, MESSAGES.ERROR.VALIDATION.ALIAS_NOT_FOUND.CODE
+            )
 
-        if global_alias and not self.bank_routing_service.validate_routing_code(
+        if not self.bank_routing_service.validate_routing_code(
             global_alias.routing_code
         ):
-            return {
-                "exists": False,
-                "alias_hash": self._hash_alias(alias_normalized),
-                "timestamp": datetime.now().isoformat() + "Z",
-                "detail": MESSAGES.ERROR.VALIDATION.INVALID_ROUTING_CODE.CODE,
-            }
-        if global_alias:
-            last_event = self.alias_event_repo.get_last_event_for_alias(
-                alias_normalized, global_alias.owning_tenant_id
+            await self._write(audit_entity)
+            return self._not_found_result(
+                alias_normalized, MESSAGES.ERROR.VALIDATION.INVALID_ROUTING_CODE.CODE
             )
-            previous_hash = last_event.current_hash if last_event else "0" * 64
 
-            current_hash = self.hash_chain_service.calculate_event_hash(
-                tenant_id=global_alias.owning_tenant_id,
-                alias=alias_normalized,
-                event_type=EEventType.INTEROP_RESOLVE,
-                timestamp=datetime.now(),
-                previous_hash=previous_hash,
-            )
+        await self._write(
+            audit_entity, resolved_tenant_id=global_alias.owning_tenant_id
+        )
+        return self._found_result(alias_normalized, global_alias.routing_code)
 
-            event_entity = AliasEventEntity(
+    async def validate_aliases_global(
+        self, aliases: list[str], requesting_tenant_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Validación de un lote de alias (archivos de pagos) con el mismo
+        resultado por alias que validate_alias_global, en orden de entrada:
+        una consulta a global_aliases para los que el filtro no descarta,
+        routing validado una vez por código, y auditorías y eventos
+        INTEROP_RESOLVE en una sola transacción.
+        """
+        normalized = alias_normalizer.normalize_many(aliases)
+        unique = list(dict.fromkeys(normalized))
+        absent = (
+            await self.existence_filter.confirmed_absent(unique)
+            if self.existence_filter
+            else set()
+        )
+        candidates = [
+            alias_normalized
+            for alias_normalized in unique
+            if alias_normalized not in absent
+        ]
+        global_aliases = await self.global_alias_repo.find_active_aliases(candidates)
+
+        valid_routing = {
+            routing_code: self.bank_routing_service.validate_routing_code(routing_code)
+            for routing_code in {
+                alias.routing_code for alias in global_aliases.values()
+            }
+        }
+
+        results = []
+        audit_entities = []
+        # (alias_normalized, event_type, correlation_id, timestamp) por tenant dueño
+        events: dict[UUID, list[tuple]] = {}
+        for alias_normalized in normalized:
+            global_alias = global_aliases.get(alias_normalized)
+            audit_entity = InteropAuditEntity.create_validation_query(
+                requesting_tenant_id=requesting_tenant_id,
                 alias_normalized=alias_normalized,
-                tenant_id=global_alias.owning_tenant_id,
+                target_tenant_id=global_alias.owning_tenant_id
+                if global_alias
+                else None,
+            )
+            audit_entities.append(audit_entity)
+
+            if not global_alias:
+                results.append(
+                    self._not_found_result(
+                        alias_normalized, MESSAGES.ERROR.VALIDATION.ALIAS_NOT_FOUND.CODE
+                    )
+                )
+            elif not valid_routing[global_alias.routing_code]:
+                results.append(
+                    self._not_found_result(
+                        alias_normalized,
+                        MESSAGES.ERROR.VALIDATION.INVALID_ROUTING_CODE.CODE,
+                    )
+                )
+            else:
+                events.setdefault(global_alias.owning_tenant_id, []).append(
+                    (
+                        alias_normalized,
+                        EEventType.INTEROP_RESOLVE,
+                        audit_entity.correlation_id,
+                        datetime.now(timezone.utc),
+                    )
+                )
+                results.append(
+                    self._found_result(alias_normalized, global_alias.routing_code)
+                )
+
+        try:
+            await self.audit_repo.bulk_log_validation_queries(audit_entities)
+            # Tenants en orden fijo, como el escritor en lote de eventos
+            for tenant_id in sorted(events, key=str):
+                await self.chain_append_service.append_batch(
+                    tenant_id, events[tenant_id]
+                )
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        return results
+
+    async def _write(
+        self,
+        audit_entity: InteropAuditEntity,
+        resolved_tenant_id: Optional[UUID] = None,
+    ) -> None:
+        """
+        Auditoría de la consulta y, si el alias resolvió, evento
+        INTEROP_RESOLVE en la cadena del tenant dueño. Con sinks ambos van en
+        lote (en paralelo, sin COMMIT en la request); sin ellos se escriben en
+        la transacción de la request.
+        """
+        pending = []
+        if self.audit_sink:
+            pending.append(self.audit_sink.submit(audit_entity))
+        else:
+            await self.audit_repo.log_validation_query(audit_entity)
+
+        if resolved_tenant_id and self.event_sink:
+            # Consultas concurrentes a un alias caliente se encadenan en lote
+            pending.append(
+                self.event_sink.submit(
+                    tenant_id=resolved_tenant_id,
+                    alias_normalized=audit_entity.alias_normalized,
+                    event_type=EEventType.INTEROP_RESOLVE,
+                    correlation_id=audit_entity.correlation_id,
+                )
+            )
+        elif resolved_tenant_id:
+            await self.chain_append_service.append(
+                tenant_id=resolved_tenant_id,
+                alias_normalized=audit_entity.alias_normalized,
                 event_type=EEventType.INTEROP_RESOLVE,
                 correlation_id=audit_entity.correlation_id,
-                previous_hash=previous_hash,
-                current_hash=current_hash,
-                timestamp=datetime.now(),
             )
-            self.alias_event_repo.create(event_entity)
 
+        if not self.audit_sink or (resolved_tenant_id and not self.event_sink):
+            await self.unit_of_work.commit()
+        if pending:
+            await asyncio.gather(*pending)
+
+    def _not_found_result(self, alias_normalized: str, detail: str) -> dict[str, Any]:
+        return {
+            "exists": False,
+            "alias_hash": self._hash_alias(alias_normalized),
+            "timestamp": datetime.now().isoformat() + "Z",
+            "detail": detail,
+        }
+
+    def _found_result(self, alias_normalized: str, routing_code: str) -> dict[str, Any]:
         return {
             "exists": True,
             "alias_hash": self._hash_alias(alias_normalized),
-            "routing_code": global_alias.routing_code,
+            "routing_code": routing_code,
             "account_type_category": "VALIDATED",  # Genérico por privacidad
             "validation_level": "CROSS_TENANT",
             "timestamp": datetime.now().isoformat() + "Z",
@@ -1,24 +1,42 @@
 from datetime import datetime, timedelta
+from typing import Any, Optional
 
 import jwt
 
+from domain.repositories import IJWTKeyProvider
 from utils import MESSAGES, TenantRole
 
 
 class JWTValidationService:
-    """Servicio de dominio para validación JWT - Extendido para roles"""
+    """
+    Servicio de dominio para validación JWT - Extendido para roles
+
+    Con HS256 firma y verifica con el secreto compartido. Con ES256/EdDSA
+    firma con signing_key (header kid) y verifica con la clave pública del
+    kid que entrega key_provider, sin necesitar la clave privada.
+    """
 
     def __init__(
         self,
-        secret: str,
+        secret: Optional[str] = None,
         algorithm: str = "HS256",
         audience: str = "alias-api",
         issuer: str = "https://idp.local",
+        signing_key: Optional[Any] = None,
+        key_id: Optional[str] = None,
+        key_provider: Optional[IJWTKeyProvider] = None,
     ):
         self.secret = secret
         self.algorithm = algorithm
         self.audience = audience
         self.issuer = issuer
+        self.signing_key = signing_key
+        self.key_id = key_id
+        self.key_provider = key_provider
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return not self.algorithm.startswith("HS")
 
     def create_tenant_token(
         self,
@@ -52,7 +70,19 @@ class JWTValidationService:
         if tenant_type:
             payload["tenant_type"] = tenant_type
 
-        return jwt.encode(payload, self.secret, algorithm=self.algorithm)
+        if not self.is_asymmetric:
+            return jwt.encode(payload, self.secret, algorithm=self.algorithm)
+
+        if self.signing_key is None:
+            raise ValueError(
+                MESSAGES.ERROR.VALIDATION.JWT_SIGNING_KEY_NOT_CONFIGURED.CODE
+            )
+        return jwt.encode(
+            payload,
+            self.signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_id} if self.key_id else None,
+        )
 
     def extract_tenant_id(self, payload: dict) -> str:
         """Extrae tenant_id de los claims del JWT"""
@@ -77,10 +107,20 @@ class JWTValidationService:
         try:
             return jwt.decode(
                 token,
-                self.secret,
+                self._verification_key(token),
                 algorithms=[self.algorithm],
                 audience=self.audience,
                 issuer=self.issuer,
             )
         except jwt.PyJWTError as e:
             raise ValueError(MESSAGES.ERROR.AUTH.INVALID_TOKEN.CODE) from e
+
+    def _verification_key(self, token: str) -> Any:
+        if not self.is_asymmetric:
+            return self.secret
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.key_provider.get_verification_key(kid) if self.key_provider else None
+        if key is None:
+            raise jwt.InvalidKeyError(kid)
+        return key
@@ -0,0 +1,136 @@
+import hashlib
+from collections.abc import Iterable
+
+from domain.entities import MerkleProofStep
+
+EMPTY_ROOT = hashlib.sha256(b"empty_day").hexdigest()
+
+
+class MerkleTreeService:
+    """
+    Árbol de Merkle estilo RFC 6962: prefijo 0x00 para hojas y 0x01 para nodos
+    internos; el último nodo impar de un nivel sube sin re-hashear. Así el nodo
+    (nivel h, índice j) es la raíz de las hojas [j * 2^h, (j + 1) * 2^h), lo
+    que permite calcular subárboles por bloques y persistir solo los niveles
+    altos.
+    """
+
+    ALGORITHM = "sha256-rfc6962"
+
+    def leaf_hash(self, data: str) -> str:
+        return hashlib.sha256(b"\x00" + data.encode("utf-8")).hexdigest()
+
+    def node_hash(self, left: str, right: str) -> str:
+        return hashlib.sha256(
+            b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)
+        ).hexdigest()
+
+    def event_leaf(self, event_id, current_hash: str) -> str:
+        """Hoja de un evento: compromete su id y su hash de cadena (sin PII)"""
+        return self.leaf_hash(f"{event_id}:{current_hash}")
+
+    def tenant_leaf(self, tenant_id_hash: str, tenant_root: str) -> str:
+        """Hoja del árbol global del día: raíz diaria de un tenant"""
+        return self.leaf_hash(f"{tenant_id_hash}:{tenant_root}")
+
+    def next_level(self, nodes: list[str]) -> list[str]:
+        paired = [
+            self.node_hash(nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)
+        ]
+        if len(nodes) % 2:
+            paired.append(nodes[-1])
+        return paired
+
+    def build_levels(self, leaves: list[str]) -> list[list[str]]:
+        """Todos los niveles, desde las hojas hasta la raíz"""
+        levels = [leaves]
+        while len(levels[-1]) > 1:
+            levels.append(self.next_level(levels[-1]))
+        return levels
+
+    def root(self, leaves: list[str]) -> str:
+        if not leaves:
+            return EMPTY_ROOT
+        return self.build_levels(leaves)[-1][0]
+
+    def block_roots(self, leaves: Iterable[str], block_level: int) -> list[str]:
+        """
+        Raíces de bloques consecutivos de 2^block_level hojas, consumiendo el
+        iterable en streaming (memoria acotada por un bloque)
+        """
+        block_size = 1 << block_level
+        roots = []
+        block = []
+        for leaf in leaves:
+            block.append(leaf)
+            if len(block) == block_size:
+                roots.append(self.root(block))
+                block = []
+        if block:
+            roots.append(self.root(block))
+        return roots
+
+    def push_leaf(self, frontier: list[tuple[int, str]], leaf: str) -> None:
+        """
+        Acumulador en streaming: frontier guarda solo los subárboles completos
+        (altura, raíz) de la descomposición binaria de n, O(log n) en memoria
+        """
+        height, node = 0, leaf
+        while frontier and frontier[-1][0] == height:
+            _, left = frontier.pop()
+            node = self.node_hash(left, node)
+            height += 1
+        frontier.append((height, node))
+
+    def frontier_root(self, frontier: list[tuple[int, str]]) -> str:
+        """Raíz del acumulador; coincide con root() sobre las mismas hojas"""
+        if not frontier:
+            return EMPTY_ROOT
+        node = frontier[-1][1]
+        for _, left in reversed(frontier[:-1]):
+            node = self.node_hash(left, node)
+        return node
+
+    def proof(self, levels: list[list[str]], index: int) -> list[MerkleProofStep]:
+        """Hermanos desde la hoja hasta la raíz (niveles ya construidos)"""
+        steps = []
+        for nodes in levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(nodes):
+                steps.append(
+                    MerkleProofStep(
+                        position="left" if sibling < index else "right",
+                        hash=nodes[sibling],
+                    )
+                )
+            index //= 2
+        return steps
+
+    def sibling_path(
+        self, leaf_count: int, level: int, index: int
+    ) -> list[tuple[int, int, str]]:
+        """
+        Coordenadas (nivel, índice, lado) de los hermanos de un nodo hasta la
+        raíz, sin materializar el árbol: sirve para leer nodos persistidos
+        """
+        path = []
+        size = (leaf_count + (1 << level) - 1) >> level
+        while size > 1:
+            sibling = index ^ 1
+            if sibling < size:
+                path.append((level, sibling, "left" if sibling < index else "right"))
+            index //= 2
+            level += 1
+            size = (size + 1) // 2
+        return path
+
+    def verify_proof(
+        self, leaf_hash: str, proof: list[MerkleProofStep], root: str
+    ) -> bool:
+        current = leaf_hash
+        for step in proof:
+            if step.position == "left":
+                current = self.node_hash(step.hash, current)
+            else:
+                current = self.node_hash(current, step.hash)
+        return current == root
@@ -0,0 +1,17 @@
+from .alias_resolve_cache import AliasResolveCache
+from .bloom_filter import BloomFilter
+from .global_alias_existence_filter import GlobalAliasExistenceFilter
+from .redis_cache import RedisCache, get_redis_client
+from .sync_redis_cache import SyncRedisCache, get_sync_redis_client
+from .ttl_cache import TTLCache
+
+__all__ = [
+    "AliasResolveCache",
+    "BloomFilter",
+    "GlobalAliasExistenceFilter",
+    "RedisCache",
+    "SyncRedisCache",
+    "TTLCache",
+    "get_redis_client",
+    "get_sync_redis_client",
+]
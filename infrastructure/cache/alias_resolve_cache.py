@@ -0,0 +1,181 @@
+import asyncio
+import itertools
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from core.logger import get_logger
+from domain.repositories import IAliasResolveCache
+
+from .redis_cache import RedisCache
+from .ttl_cache import TTLCache
+
+logger = get_logger("infrastructure.cache.alias_resolve_cache")
+
+INVALIDATION_CHANNEL = "resolve:invalidate"
+
+
+class AliasResolveCache(IAliasResolveCache):
+    """
+    Caché de resolución en dos niveles: TTLCache en proceso (objeto ya
+    construido) y Redis compartido (JSON del modelo).
+
+    Los resultados negativos viven negative_ttl_seconds en ambos niveles.
+    invalidate borra local y Redis, avanza la generación de la clave y lo
+    publica por pub/sub antes de responder la escritura; cada worker escucha
+    el canal y borra su copia local. Mientras un worker no está suscrito
+    (arranque, Redis caído) no lee su nivel local, y al resuscribirse lo
+    vacía porque pudo perder avisos.
+
+    get devuelve una marca de generación que set exige sin cambios: una
+    resolución que leyó la base antes de una baja no vuelve a cachear el
+    valor viejo después de la invalidación.
+    """
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        local_cache: TTLCache,
+        remote_cache: Optional[RedisCache] = None,
+        negative_ttl_seconds: int = 5,
+        invalidation_window_seconds: int = 60,
+    ):
+        self.model = model
+        self.local_cache = local_cache
+        self.remote_cache = remote_cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.remote_hits = 0
+        self.remote_misses = 0
+        self.stale_sets_skipped = 0
+        self.invalidations_received = 0
+
+        # Marca local: número de la última invalidación vista por clave,
+        # recordada lo que puede durar una resolución en curso
+        self._invalidation_seq = itertools.count(1)
+        self._last_seq = 0
+        self._invalidated = TTLCache(
+            max_entries=local_cache.max_entries,
+            ttl_seconds=invalidation_window_seconds,
+        )
+        self._subscribed = False
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def _local_enabled(self) -> bool:
+        return self.remote_cache is None or self._subscribed
+
+    async def get(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> tuple[Optional[Any], Any]:
+        key = self._key(tenant_id, alias_normalized)
+        generation = (self._last_seq, "")
+        if self._local_enabled:
+            value = self.local_cache.get(key)
+            if value is not None or not self.remote_cache:
+                return value, generation
+
+        cached, remote_generation = await self.remote_cache.get_with_generation(key)
+        generation = (generation[0], remote_generation)
+        if not cached:
+            self.remote_misses += 1
+            return None, generation
+
+        self.remote_hits += 1
+        value = self.model.model_validate_json(cached)
+        if self._local_enabled and not self._invalidated_since(key, generation):
+            self.local_cache.set(key, value)
+        return value, generation
+
+    async def set(
+        self,
+        tenant_id: UUID,
+        alias_normalized: str,
+        value: Any,
+        generation: Any,
+        negative: bool = False,
+    ) -> None:
+        key = self._key(tenant_id, alias_normalized)
+        ttl_seconds = self.negative_ttl_seconds if negative else None
+        if self.remote_cache:
+            written = await self.remote_cache.set_if_generation(
+                key, value.model_dump_json(), generation[1], ttl_seconds=ttl_seconds
+            )
+            if not written:
+                self.stale_sets_skipped += 1
+                return
+        if self._invalidated_since(key, generation):
+            self.stale_sets_skipped += 1
+            return
+        if self._local_enabled:
+            self.local_cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    async def invalidate(self, tenant_id: UUID, aliases_normalized: list[str]) -> None:
+        keys = [self._key(tenant_id, alias) for alias in aliases_normalized]
+        self._drop_local(keys)
+        if self.remote_cache:
+            await self.remote_cache.invalidate(*keys, channel=INVALIDATION_CHANNEL)
+
+    async def start(self) -> None:
+        """Suscripción a las invalidaciones de otros workers (lifespan)"""
+        if self.remote_cache and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.remote_cache.client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Avisos perdidos mientras no había suscripción
+                self.local_cache.clear()
+                self._subscribed = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.invalidations_received += 1
+                        self._drop_local(message["data"].split("\n"))
+            except Exception as e:
+                logger.warning(
+                    "Suscripción a invalidaciones caída, caché local desactivada",
+                    channel=INVALIDATION_CHANNEL,
+                    error=str(e),
+                )
+            finally:
+                self._subscribed = False
+                await pubsub.aclose()
+            await asyncio.sleep(1)
+
+    def _drop_local(self, keys: list[str]) -> None:
+        seq = next(self._invalidation_seq)
+        for key in keys:
+            self._invalidated.set(key, seq)
+            self.local_cache.delete(key)
+        self._last_seq = seq
+
+    def _invalidated_since(self, key: str, generation: Any) -> bool:
+        return self._invalidated.get(key, 0) > generation[0]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "local": self.local_cache.stats(),
+            "local_enabled": self._local_enabled,
+            "remote": (
+                {"hits": self.remote_hits, "misses": self.remote_misses}
+                if self.remote_cache
+                else None
+            ),
+            "stale_sets_skipped": self.stale_sets_skipped,
+            "invalidations_received": self.invalidations_received,
+        }
+
+    def _key(self, tenant_id: UUID, alias_normalized: str) -> str:
+        # tenant_id puede llegar como str (JWT) o UUID (entidad)
+        return f"{UUID(str(tenant_id))}:{alias_normalized}"
@@ -0,0 +1,71 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom sobre un bytearray. Las k posiciones salen de un único
+    blake2b de 128 bits con doble hashing (h1 + i·h2); sin falsos negativos
+    y sin borrado.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if not 0 < false_positive_rate < 1:
+            message = f"Invalid false positive rate: {false_positive_rate}"
+            raise ValueError(message)
+
+        self.capacity = max(capacity, 1)
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(
+            64,
+            math.ceil(
+                -self.capacity * math.log(false_positive_rate) / math.log(2) ** 2
+            ),
+        )
+        self.hash_count = max(1, round(self.bit_count / self.capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        # Elementos distintos aproximados: solo cuenta si encendió algún bit
+        self.count = 0
+
+    def add(self, value: str) -> None:
+        bits = self.bits
+        added = False
+        for position in self._positions(value):
+            index, mask = position >> 3, 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        # Corta en el primer bit apagado: los negativos son el caso frecuente
+        first, step = self._hashes(value)
+        bits, bit_count = self.bits, self.bit_count
+        for i in range(self.hash_count):
+            position = (first + i * step) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """(1 - e^(-k·n/m))^k con los elementos cargados hasta ahora"""
+        return (
+            1 - math.exp(-self.hash_count * self.count / self.bit_count)
+        ) ** self.hash_count
+
+    def _hashes(self, value: str) -> tuple[int, int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        return (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little") | 1,
+        )
+
+    def _positions(self, value: str) -> list[int]:
+        first, step = self._hashes(value)
+        bit_count = self.bit_count
+        return [(first + i * step) % bit_count for i in range(self.hash_count)]
@@ -0,0 +1,290 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from core.logger import get_logger
+from domain.repositories import IAliasExistenceFilter, IGlobalAliasRepository
+from infrastructure.cache.bloom_filter import BloomFilter
+
+logger = get_logger("infrastructure.cache.global_alias_existence_filter")
+
+REGISTRATION_CHANNEL = "global_alias:registered"
+REGISTRATION_SEQ_KEY = "global_alias:registered:seq"
+ANNOUNCE_ATTEMPTS = 3
+
+# Número de alta y aviso en un solo paso: los mensajes llegan en orden de seq
+_ANNOUNCE = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', ARGV[1], seq .. '\\n' .. ARGV[2])
+return seq
+"""
+
+
+class GlobalAliasExistenceFilter(IAliasExistenceFilter):
+    """
+    Filtro de Bloom en proceso sobre global_aliases activos.
+
+    Se reconstruye completo cada cierto tiempo (dimensionado con el conteo
+    actual, descarta las bajas) y entre reconstrucciones suma las altas de
+    otros workers con una lectura incremental por created_at/updated_at. Hasta
+    la primera carga responde siempre "puede existir".
+
+    Cada alta confirmada se anuncia por Redis antes de responder el registro:
+    un contador global (REGISTRATION_SEQ_KEY) y un mensaje pub/sub con el
+    mismo número. Un negativo solo se da por seguro si el worker ya aplicó
+    todos los anuncios hasta el valor actual del contador y, tras su última
+    suscripción, completó una lectura de la base (cubre los avisos perdidos
+    mientras no escuchaba); si no, la consulta va a la base de datos.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        false_positive_rate: float = 0.01,
+        min_capacity: int = 100_000,
+        growth_factor: float = 1.5,
+        sync_overlap_seconds: int = 60,
+    ):
+        self.redis_client = redis_client
+        self.false_positive_rate = false_positive_rate
+        self.min_capacity = min_capacity
+        self.growth_factor = growth_factor
+        self.sync_overlap = timedelta(seconds=sync_overlap_seconds)
+
+        self._bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+        # Altas recibidas mientras se carga un filtro nuevo: se reaplican al cambiarlo
+        self._pending: Optional[list[str]] = None
+        self._built_at: Optional[datetime] = None
+        self._synced_at: Optional[datetime] = None
+        self._build_ms = 0.0
+        self._removed = 0
+        self._negatives = 0
+        self._positives = 0
+        self._bypassed = 0
+        self._not_current = 0
+        self._announce_failures = 0
+
+        self._announce = redis_client.register_script(_ANNOUNCE)
+        self._listener: Optional[asyncio.Task] = None
+        # Último anuncio aplicado; None sin suscripción activa
+        self._received_seq: Optional[int] = None
+        # Momento (monotónico) de la suscripción y si una carga posterior la cubrió
+        self._subscribed_at: Optional[float] = None
+        self._caught_up = False
+
+    @property
+    def ready(self) -> bool:
+        return self._bloom is not None
+
+    def might_contain(self, alias_normalized: str) -> bool:
+        bloom = self._bloom
+        if bloom is None:
+            self._bypassed += 1
+            return True
+        if alias_normalized in bloom:
+            self._positives += 1
+            return True
+        self._negatives += 1
+        return False
+
+    async def confirmed_absent(self, aliases_normalized: list[str]) -> set[str]:
+        if self._received_seq is None or not self._caught_up:
+            self._not_current += 1
+            return set()
+        try:
+            current_seq = int(await self.redis_client.get(REGISTRATION_SEQ_KEY) or 0)
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, negativos del filtro a la base",
+                error=str(e),
+            )
+            self._not_current += 1
+            return set()
+
+        # Sin await entre esta comprobación y la lectura del filtro: las altas
+        # hasta current_seq ya están en el Bloom
+        received_seq = self._received_seq
+        if received_seq is None or received_seq < current_seq or not self._caught_up:
+            self._not_current += 1
+            return set()
+        return {
+            alias_normalized
+            for alias_normalized in aliases_normalized
+            if not self.might_contain(alias_normalized)
+        }
+
+    async def announce(self, aliases_normalized: list[str]) -> None:
+        self.add(aliases_normalized)
+        payload = "\n".join(aliases_normalized)
+        for attempt in range(1, ANNOUNCE_ATTEMPTS + 1):
+            try:
+                await self._announce(
+                    keys=[REGISTRATION_SEQ_KEY], args=[REGISTRATION_CHANNEL, payload]
+                )
+                return
+            except RedisError as e:
+                error = e
+                await asyncio.sleep(0.05 * attempt)
+        # Los demás workers no saben del alta hasta su próxima lectura de la base
+        self._announce_failures += 1
+        logger.error(
+            "Global alias registration not announced",
+            aliases=len(aliases_normalized),
+            error=str(error),
+        )
+
+    async def start(self) -> None:
+        """Suscripción a las altas de otros workers (lifespan)"""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(REGISTRATION_CHANNEL)
+                # Los anuncios previos a la suscripción los cubre la próxima carga
+                seq = int(await self.redis_client.get(REGISTRATION_SEQ_KEY) or 0)
+                self._resubscribed(seq)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    seq, _, payload = message["data"].partition("\n")
+                    if payload:
+                        self.add(payload.split("\n"))
+                    seq = int(seq)
+                    if seq > self._received_seq + 1:
+                        # Hueco en la secuencia: se espera otra carga de la base
+                        self._resubscribed(seq)
+                    self._received_seq = max(self._received_seq, seq)
+            except Exception as e:
+                logger.warning(
+                    "Suscripción a altas caída, negativos del filtro a la base",
+                    channel=REGISTRATION_CHANNEL,
+                    error=str(e),
+                )
+            finally:
+                self._received_seq = None
+                await pubsub.aclose()
+            await asyncio.sleep(1)
+
+    def _resubscribed(self, seq: int) -> None:
+        with self._lock:
+            self._received_seq = seq
+            self._subscribed_at = time.monotonic()
+            self._caught_up = False
+
+    def _loaded(self, started_at: float) -> None:
+        """Una carga que empezó después de la suscripción cubre lo anterior a ella"""
+        with self._lock:
+            if self._subscribed_at is not None and started_at >= self._subscribed_at:
+                self._caught_up = True
+
+    def add(self, aliases_normalized: list[str]) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(aliases_normalized)
+            if self._bloom is not None:
+                for alias_normalized in aliases_normalized:
+                    self._bloom.add(alias_normalized)
+
+    def discard(self, aliases_normalized: list[str]) -> None:
+        with self._lock:
+            self._removed += len(aliases_normalized)
+
+    def rebuild(self, repository: IGlobalAliasRepository) -> None:
+        started_at = time.monotonic()
+        started = time.perf_counter()
+        synced_at = datetime.now(timezone.utc)
+        with self._lock:
+            self._pending = []
+
+        try:
+            capacity = max(
+                self.min_capacity, int(repository.count_active() * self.growth_factor)
+            )
+            bloom = BloomFilter(capacity, self.false_positive_rate)
+            for alias_normalized in repository.iter_active_aliases():
+                bloom.add(alias_normalized)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            for alias_normalized in self._pending:
+                bloom.add(alias_normalized)
+            self._pending = None
+            self._bloom = bloom
+            self._removed = 0
+            self._built_at = synced_at
+            self._synced_at = synced_at
+            self._build_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._loaded(started_at)
+
+        logger.info(
+            "Global alias filter rebuilt",
+            aliases=bloom.count,
+            memory_bytes=bloom.memory_bytes,
+            build_ms=self._build_ms,
+        )
+
+    def sync_changes(self, repository: IGlobalAliasRepository) -> int:
+        """Agrega las altas confirmadas desde la última sincronización"""
+        if self._bloom is None or self._synced_at is None:
+            return 0
+
+        started_at = time.monotonic()
+        synced_at = datetime.now(timezone.utc)
+        # El solape cubre transacciones largas con created_at anterior al commit
+        aliases = list(
+            repository.iter_active_aliases(
+                changed_since=self._synced_at - self.sync_overlap
+            )
+        )
+        self.add(aliases)
+        self._synced_at = synced_at
+        self._loaded(started_at)
+        return len(aliases)
+
+    def stats(self) -> dict[str, Any]:
+        bloom = self._bloom
+        lookups = self._negatives + self._positives
+        return {
+            "ready": bloom is not None,
+            "aliases": bloom.count if bloom else 0,
+            "capacity": bloom.capacity if bloom else 0,
+            "hash_count": bloom.hash_count if bloom else 0,
+            "memory_bytes": bloom.memory_bytes if bloom else 0,
+            "target_false_positive_rate": self.false_positive_rate,
+            "estimated_false_positive_rate": (
+                round(bloom.estimated_false_positive_rate(), 6) if bloom else None
+            ),
+            "removed_since_build": self._removed,
+            "negatives": self._negatives,
+            "positives": self._positives,
+            "bypassed": self._bypassed,
+            "subscribed": self._received_seq is not None,
+            "caught_up": self._caught_up,
+            "not_current": self._not_current,
+            "announce_failures": self._announce_failures,
+            "negative_ratio": round(self._negatives / lookups, 4) if lookups else 0.0,
+            "built_at": self._built_at.isoformat() if self._built_at else None,
+            "synced_at": self._synced_at.isoformat() if self._synced_at else None,
+            "build_ms": self._build_ms,
+        }
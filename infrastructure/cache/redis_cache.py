@@ -0,0 +1,176 @@
+from functools import lru_cache
+from typing import Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from core import settings
+from core.logger import get_logger
+
+logger = get_logger("infrastructure.cache.redis")
+
+# SET solo si la generación no cambió desde la lectura ('' = sin generación)
+_SET_IF_GENERATION = """
+local current = redis.call('GET', KEYS[2])
+if (current or '') ~= ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# Las generaciones sobreviven de sobra a cualquier lectura en curso
+GENERATION_TTL_SECONDS = 86_400
+
+
+@lru_cache
+def get_redis_client() -> Optional[aioredis.Redis]:
+    """Cliente Redis compartido por el proceso; None si REDIS_URL no está definido"""
+    if not settings.REDIS_URL:
+        return None
+    return aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+class RedisCache:
+    """
+    Segundo nivel de caché compartido entre procesos.
+
+    Los errores de Redis se registran y se tratan como miss: la caché nunca
+    es fuente de verdad y no debe tumbar el request.
+    """
+
+    def __init__(self, client: aioredis.Redis, prefix: str, ttl_seconds: int):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self.client.get(self._key(key))
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_get",
+                prefix=self.prefix,
+                error=str(e),
+            )
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None):
+        try:
+            await self.client.set(
+                self._key(key), value, ex=ttl_seconds or self.ttl_seconds
+            )
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_set",
+                prefix=self.prefix,
+                error=str(e),
+            )
+
+    async def set_many(self, items: dict[str, str], ttl_seconds: Optional[int] = None):
+        if not items:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._key(key), value, ex=ttl_seconds or self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_set_many",
+                prefix=self.prefix,
+                error=str(e),
+            )
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            await self.client.delete(*[self._key(key) for key in keys])
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_delete",
+                prefix=self.prefix,
+                error=str(e),
+            )
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self.prefix}:gen:{key}"
+
+    async def get_with_generation(self, key: str) -> tuple[Optional[str], str]:
+        """Valor y generación de la clave en un round trip"""
+        try:
+            value, generation = await self.client.mget(
+                self._key(key), self._generation_key(key)
+            )
+            return value, generation or ""
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_get_with_generation",
+                prefix=self.prefix,
+                error=str(e),
+            )
+            return None, ""
+
+    async def set_if_generation(
+        self,
+        key: str,
+        value: str,
+        generation: str,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Escribe solo si nadie invalidó la clave desde get_with_generation:
+        una lectura anterior a la invalidación no vuelve a dejar el valor viejo
+        """
+        try:
+            written = await self.client.eval(
+                _SET_IF_GENERATION,
+                2,
+                self._key(key),
+                self._generation_key(key),
+                value,
+                generation,
+                ttl_seconds or self.ttl_seconds,
+            )
+            return bool(written)
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_set_if_generation",
+                prefix=self.prefix,
+                error=str(e),
+            )
+            return False
+
+    async def invalidate(self, *keys: str, channel: Optional[str] = None) -> None:
+        """
+        Borra los valores, avanza su generación y avisa por pub/sub a los
+        demás procesos, todo en una transacción
+        """
+        if not keys:
+            return
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    pipe.incr(self._generation_key(key))
+                    pipe.expire(self._generation_key(key), GENERATION_TTL_SECONDS)
+                pipe.delete(*[self._key(key) for key in keys])
+                if channel:
+                    pipe.publish(channel, "\n".join(keys))
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible al invalidar",
+                operation="redis_invalidate",
+                prefix=self.prefix,
+                error=str(e),
+            )
@@ -0,0 +1,69 @@
+from functools import lru_cache
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from core import settings
+from core.logger import get_logger
+
+logger = get_logger("infrastructure.cache.sync_redis")
+
+
+@lru_cache
+def get_sync_redis_client() -> Optional[redis.Redis]:
+    """Cliente Redis síncrono (repositorios psycopg2); None sin REDIS_URL"""
+    if not settings.REDIS_URL:
+        return None
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+class SyncRedisCache:
+    """
+    Variante síncrona de RedisCache para repositorios síncronos: los errores
+    de Redis se registran y se tratan como miss.
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str, ttl_seconds: int):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self.client.get(self._key(key))
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_get",
+                prefix=self.prefix,
+                error=str(e),
+            )
+            return None
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None):
+        try:
+            self.client.set(self._key(key), value, ex=ttl_seconds or self.ttl_seconds)
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_set",
+                prefix=self.prefix,
+                error=str(e),
+            )
+
+    def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            self.client.delete(*[self._key(key) for key in keys])
+        except RedisError as e:
+            logger.warning(
+                "Redis no disponible, se trata como miss",
+                operation="redis_delete",
+                prefix=self.prefix,
+                error=str(e),
+            )
@@ -0,0 +1,127 @@
+import re
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from core.logger import get_logger
+
+logger = get_logger("infrastructure.database.alias_event_partitions")
+
+PARENT_TABLE = "alias_events"
+PARTITION_PATTERN = re.compile(r"^alias_events_p(\d{4})(\d{2})$")
+SCHEMA_PATTERN = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    years, month_index = divmod(value.month - 1 + months, 12)
+    return date(value.year + years, month_index + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+class AliasEventPartitionManager:
+    """
+    Particiones mensuales de alias_events: creación anticipada (sin partición
+    DEFAULT, para poder usar DETACH ... CONCURRENTLY) y archivo de meses
+    antiguos moviéndolos a un esquema aparte, fuera de las consultas.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def ensure_partitions(
+        self, months_ahead: int, from_month: Optional[date] = None
+    ) -> list[str]:
+        """Crea (si faltan) las particiones desde from_month hasta months_ahead"""
+        first = month_start(from_month or datetime.now(timezone.utc).date())
+        existing = {name for name, _ in self.list_partitions()}
+        created = []
+
+        with self.engine.begin() as conn:
+            for offset in range(months_ahead + 1):
+                month = add_months(first, offset)
+                name = partition_name(month)
+                if name in existing:
+                    continue
+                conn.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                        f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+                    )
+                )
+                created.append(name)
+
+        if created:
+            logger.info("alias_events partitions created", partitions=created)
+        return created
+
+    def list_partitions(self) -> list[tuple[str, date]]:
+        """Particiones adjuntas (nombre, mes) en orden cronológico"""
+        with self.engine.connect() as conn:
+            names = conn.execute(
+                text(
+                    """
+                    SELECT child.relname
+                    FROM pg_inherits
+                    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                    WHERE parent.relname = :parent
+                    """
+                ),
+                {"parent": PARENT_TABLE},
+            ).scalars()
+
+            partitions = []
+            for name in names:
+                match = PARTITION_PATTERN.match(name)
+                if match:
+                    partitions.append(
+                        (name, date(int(match.group(1)), int(match.group(2)), 1))
+                    )
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    def archive_before(
+        self, before: date, archive_schema: str = "archive", concurrently: bool = True
+    ) -> list[str]:
+        """
+        Desacopla las particiones de meses anteriores a `before` y las mueve a
+        archive_schema: dejan de verse en alias_events pero siguen en disco
+        para pg_dump o DROP. Solo debe aplicarse a días ya sellados (WORM) y
+        a cadenas con checkpoint posterior al rango archivado.
+        """
+        if not SCHEMA_PATTERN.match(archive_schema):
+            message = f"Invalid archive schema: {archive_schema}"
+            raise ValueError(message)
+
+        cutoff = month_start(before)
+        targets = [name for name, month in self.list_partitions() if month < cutoff]
+        if not targets:
+            return []
+
+        mode = " CONCURRENTLY" if concurrently else ""
+        # CONCURRENTLY no puede ir dentro de una transacción
+        with self.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+            for name in targets:
+                conn.execute(
+                    text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}{mode}")
+                )
+                conn.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+
+        logger.info(
+            "alias_events partitions archived",
+            partitions=targets,
+            archive_schema=archive_schema,
+        )
+        return targets
@@ -2,18 +2,32 @@ from .base import BaseModel  # noqa: I001
 from .alias_global import GlobalAliasModel
 from .alias_registry import AliasRegistryModel
 from .alias_event import AliasEventModel
+from .alias_chain_head import AliasChainHeadModel
+from .alias_chain_checkpoint import AliasChainCheckpointModel
+from .chain_verification_job import ChainVerificationJobModel
 from .interop_audit import InteropAuditModel
 from .tenant_model import TenantModel
+from .tenant_api_key import TenantApiKeyModel
 from .banner import BannerModel
 from .error_log import ErrorLogModel
+from .worm_seal import WormSealModel
+from .worm_merkle_leaf import WormMerkleLeafModel
+from .worm_merkle_node import WormMerkleNodeModel
 
 __all__ = [
     "BaseModel",
     "TenantModel",
+    "TenantApiKeyModel",
     "BannerModel",
     "ErrorLogModel",
     "AliasRegistryModel",
     "AliasEventModel",
+    "AliasChainHeadModel",
+    "AliasChainCheckpointModel",
+    "ChainVerificationJobModel",
     "GlobalAliasModel",
     "InteropAuditModel",
+    "WormSealModel",
+    "WormMerkleLeafModel",
+    "WormMerkleNodeModel",
 ]
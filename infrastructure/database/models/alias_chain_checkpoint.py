@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class AliasChainCheckpointModel(Base):
+    """Último seq/hash verificado por cadena (tenant_id, alias_normalized)"""
+
+    __tablename__ = "alias_chain_checkpoints"
+
+    tenant_id = Column(UUID(as_uuid=True), primary_key=True)
+    alias_normalized = Column(Text, primary_key=True)
+    last_verified_seq = Column(BigInteger, nullable=False)
+    last_verified_hash = Column(String(64), nullable=False)
+    verified_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class AliasChainHeadModel(Base):
+    """Último hash y secuencia por cadena (tenant_id, alias_normalized)"""
+
+    __tablename__ = "alias_chain_heads"
+
+    tenant_id = Column(UUID(as_uuid=True), primary_key=True)
+    alias_normalized = Column(Text, primary_key=True)
+    current_hash = Column(String(64), nullable=False)
+    seq = Column(BigInteger, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, DateTime, String, Text
+import uuid
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, Text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -8,10 +10,21 @@ from utils import EEventType
 
 
 class AliasEventModel(BaseModel):
+    """
+    Tabla particionada por RANGE (timestamp), una partición mensual
+    (alias_events_pYYYYMM) creada por la migración y por el job de
+    mantenimiento. En la base la PK es (id, timestamp): Postgres exige la
+    clave de partición en todo índice único.
+    """
+
     __tablename__ = "alias_events"
 
-    alias_normalized = Column(Text, nullable=False, index=True)
-    tenant_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    alias_normalized = Column(Text, nullable=False)
+    tenant_id = Column(UUID(as_uuid=True), nullable=False)
+    # Posición del evento en su cadena (tenant_id, alias_normalized), desde 1
+    seq = Column(BigInteger, nullable=False)
     event_type = Column(
         SQLEnum(EEventType),
         name="event_type",
@@ -21,6 +34,15 @@ class AliasEventModel(BaseModel):
     correlation_id = Column(UUID(as_uuid=True), nullable=False)
     previous_hash = Column(String(64), nullable=False)
     current_hash = Column(String(64), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
 
     deleted_at = None
+
+    __table_args__ = (
+        # No puede ser único sin timestamp; la unicidad de seq por cadena la
+        # garantiza el compare-and-set sobre alias_chain_heads
+        Index("ix_alias_events_chain_seq", "tenant_id", "alias_normalized", "seq"),
+        Index("ix_alias_events_timestamp", "timestamp"),
+    )
@@ -21,5 +21,7 @@ class GlobalAliasModel(BaseModel):
 
     __table_args__ = (
         Index("idx_global_alias_active", "alias_normalized", "is_active"),
+        Index("ix_global_aliases_created_at", "created_at"),
+        Index("ix_global_aliases_updated_at", "updated_at"),
         ForeignKeyConstraint(["owning_tenant_id"], ["tenants.id"]),
     )
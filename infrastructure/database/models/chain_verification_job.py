@@ -0,0 +1,45 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Index, Integer, Text, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from core.database import Base
+from utils import EJobStatus
+
+
+class ChainVerificationJobModel(Base):
+    """
+    Cola de verificaciones masivas de cadenas. scope es el tenant_id o
+    "all": a lo sumo un job PENDING/RUNNING por alcance.
+    """
+
+    __tablename__ = "chain_verification_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), nullable=True)
+    scope = Column(Text, nullable=False)
+    workers = Column(Integer, nullable=True)
+    status = Column(
+        SQLEnum(EJobStatus, name="job_status"),
+        nullable=False,
+        default=EJobStatus.PENDING,
+    )
+    requested_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    report = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "uq_chain_verification_jobs_active_scope",
+            "scope",
+            unique=True,
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+        Index("ix_chain_verification_jobs_status", "status", "requested_at"),
+    )
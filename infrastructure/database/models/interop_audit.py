@@ -9,7 +9,7 @@ class InteropAuditModel(BaseModel):
     __tablename__ = "interop_audits"
 
     requesting_tenant_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    alias_normalized = Column(Text, primary_key=True)
+    alias_normalized = Column(Text, nullable=False)
     target_tenant_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     query_type = Column(
         SQLEnum(EQueryType),
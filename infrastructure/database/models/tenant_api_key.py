@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from infrastructure.database.models.base import BaseModel
+
+
+class TenantApiKeyModel(BaseModel):
+    """API keys de tenants: digest HMAC del secreto, buscadas por key_id"""
+
+    __tablename__ = "tenant_api_keys"
+
+    tenant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    key_id = Column(String(16), nullable=False, unique=True, index=True)
+    key_hash = Column(String(64), nullable=False)
+    scopes = Column(ARRAY(String(32)), nullable=False, default=list)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, Date, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from core.database import Base
+
+
+class WormMerkleLeafModel(Base):
+    """Hoja del árbol diario de un tenant; leaf_index fija el orden de llegada"""
+
+    __tablename__ = "worm_merkle_leaves"
+
+    seal_date = Column(Date, primary_key=True)
+    tenant_id = Column(UUID(as_uuid=True), primary_key=True)
+    leaf_index = Column(BigInteger, primary_key=True)
+    event_id = Column(UUID(as_uuid=True), nullable=False, unique=True)
+    leaf_hash = Column(String(64), nullable=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, Date, SmallInteger, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from core.database import Base
+
+
+class WormMerkleNodeModel(Base):
+    """
+    Nodos internos desde WORM_MERKLE_STORED_LEVEL hasta la raíz; los niveles
+    inferiores se recalculan desde las hojas al generar una prueba
+    """
+
+    __tablename__ = "worm_merkle_nodes"
+
+    seal_date = Column(Date, primary_key=True)
+    tenant_id = Column(UUID(as_uuid=True), primary_key=True)
+    level = Column(SmallInteger, primary_key=True)
+    node_index = Column(BigInteger, primary_key=True)
+    node_hash = Column(String(64), nullable=False)
@@ -0,0 +1,38 @@
+import uuid
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class WormSealModel(Base):
+    """Raíz diaria firmada por tenant; tenant_id nulo = sello global del día"""
+
+    __tablename__ = "worm_daily_seals"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    seal_date = Column(Date, nullable=False)
+    tenant_id = Column(UUID(as_uuid=True), nullable=True)
+    tenant_id_hash = Column(String(16), nullable=True)
+    root_hash = Column(String(64), nullable=False)
+    leaf_count = Column(BigInteger, nullable=False)
+    signature = Column(Text, nullable=False)
+    sealed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "uq_worm_daily_seals_tenant_day",
+            "seal_date",
+            "tenant_id",
+            unique=True,
+            postgresql_where=text("tenant_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_worm_daily_seals_global_day",
+            "seal_date",
+            unique=True,
+            postgresql_where=text("tenant_id IS NULL"),
+        ),
+    )
@@ -1,10 +1,23 @@
 from .alias_event_repository import AliasEventRepository
 from .alias_global_repository import GlobalAliasRepository
 from .alias_repository import AliasRepository
+from .async_alias_chain_head_repository import AsyncAliasChainHeadRepository
+from .async_alias_event_repository import AsyncAliasEventRepository
+from .async_alias_global_repository import AsyncGlobalAliasRepository
+from .async_alias_repository import AsyncAliasRepository
+from .async_interop_audit_repository import AsyncInteropAuditRepository
+from .async_unit_of_work import AsyncUnitOfWork
 from .banner_repository import BannerRepository
+from .cached_alias_chain_head_repository import CachedAliasChainHeadRepository
+from .cached_tenant_api_key_repository import CachedTenantApiKeyRepository
+from .cached_tenant_repository import CachedTenantRepository
+from .chain_checkpoint_repository import ChainCheckpointRepository
+from .chain_verification_job_repository import ChainVerificationJobRepository
 from .error_log_repository import ErrorLogRepository
 from .interop_audit_repository import InteropAuditRepository
+from .tenant_api_key_repository import TenantApiKeyRepository
 from .tenant_repository import TenantRepository
+from .worm_seal_repository import WormSealRepository
 
 __all__ = [
     "AliasRepository",
@@ -12,6 +25,19 @@ __all__ = [
     "ErrorLogRepository",
     "AliasEventRepository",
     "TenantRepository",
+    "TenantApiKeyRepository",
+    "CachedTenantApiKeyRepository",
     "InteropAuditRepository",
     "GlobalAliasRepository",
+    "AsyncAliasRepository",
+    "AsyncAliasEventRepository",
+    "AsyncAliasChainHeadRepository",
+    "CachedAliasChainHeadRepository",
+    "CachedTenantRepository",
+    "ChainCheckpointRepository",
+    "ChainVerificationJobRepository",
+    "AsyncGlobalAliasRepository",
+    "AsyncInteropAuditRepository",
+    "AsyncUnitOfWork",
+    "WormSealRepository",
 ]
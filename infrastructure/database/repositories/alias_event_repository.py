@@ -1,13 +1,16 @@
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import Date, cast
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from core.config import settings
 from domain.entities.alias_event_entity import AliasEventEntity
 from domain.repositories.alias_event_repository import IAliasEventRepository
 from infrastructure.database.models import AliasEventModel
 from infrastructure.database.repositories.base_sql_repository import BaseSQLRepository
+from utils import EEventType
 
 
 class AliasEventRepository(
@@ -16,19 +19,84 @@ class AliasEventRepository(
     def __init__(self, db: Session):
         super().__init__(db, AliasEventModel)
 
-    def get_events_for_alias(
-        self, alias_normalized: str, tenant_id: str
-    ) -> list[AliasEventEntity]:
-        db_events = (
-            self.db.query(self.model)
-            .filter(
-                self.model.alias_normalized == alias_normalized,
-                self.model.tenant_id == tenant_id,
+    def _history_statement(
+        self,
+        alias_normalized: str,
+        tenant_id: str,
+        after_seq: Optional[int],
+        descending: bool,
+        event_types: Optional[list[EEventType]],
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Select:
+        """
+        Range scan sobre ix_alias_events_chain_seq desde el cursor; el rango
+        de timestamp además descarta particiones mensuales fuera del rango.
+        """
+        conditions = [
+            self.model.tenant_id == tenant_id,
+            self.model.alias_normalized == alias_normalized,
+        ]
+        if after_seq is not None:
+            conditions.append(
+                self.model.seq < after_seq if descending else self.model.seq > after_seq
             )
-            .order_by(self.model.timestamp)
-            .all()
+        if event_types:
+            conditions.append(self.model.event_type.in_(event_types))
+        if since is not None:
+            conditions.append(self.model.timestamp >= since)
+        if until is not None:
+            conditions.append(self.model.timestamp < until)
+
+        return (
+            select(*self._columns())
+            .where(*conditions)
+            .order_by(self.model.seq.desc() if descending else self.model.seq)
         )
-        return [self._to_entity(event) for event in db_events]
+
+    def get_event_history_page(
+        self,
+        alias_normalized: str,
+        tenant_id: str,
+        limit: int,
+        after_seq: Optional[int] = None,
+        descending: bool = False,
+        event_types: Optional[list[EEventType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[AliasEventEntity]:
+        statement = self._history_statement(
+            alias_normalized,
+            tenant_id,
+            after_seq,
+            descending,
+            event_types,
+            since,
+            until,
+        ).limit(limit)
+        return [self._to_entity(row) for row in self.db.execute(statement)]
+
+    def iter_event_history(
+        self,
+        alias_normalized: str,
+        tenant_id: str,
+        after_seq: Optional[int] = None,
+        descending: bool = False,
+        event_types: Optional[list[EEventType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[AliasEventEntity]:
+        statement = self._history_statement(
+            alias_normalized,
+            tenant_id,
+            after_seq,
+            descending,
+            event_types,
+            since,
+            until,
+        ).execution_options(yield_per=settings.ALIAS_HISTORY_STREAM_BATCH_SIZE)
+        for row in self.db.execute(statement):
+            yield self._to_entity(row)
 
     def get_last_event_for_alias(
         self, alias_normalized: str, tenant_id: str
@@ -39,11 +107,45 @@ class AliasEventRepository(
                 self.model.alias_normalized == alias_normalized,
                 self.model.tenant_id == tenant_id,
             )
-            .order_by(self.model.timestamp.desc())
+            .order_by(self.model.seq.desc())
             .first()
         )
         return self._to_entity(db_event) if db_event else None
 
+    def iter_events_for_alias(
+        self, alias_normalized: str, tenant_id: str, after_seq: int = 0
+    ) -> Iterator[AliasEventEntity]:
+        """
+        Range scan sobre (tenant_id, alias_normalized, seq) con cursor del
+        servidor: solo VERIFY_CHAIN_BATCH_SIZE filas en memoria a la vez.
+        """
+        result = self.db.execute(
+            select(*self._columns())
+            .where(
+                self.model.tenant_id == tenant_id,
+                self.model.alias_normalized == alias_normalized,
+                self.model.seq > after_seq,
+            )
+            .order_by(self.model.seq)
+            .execution_options(yield_per=settings.VERIFY_CHAIN_BATCH_SIZE)
+        )
+        for row in result:
+            yield self._to_entity(row)
+
+    def _columns(self) -> tuple:
+        # Columnas en vez de entidades ORM: sin identity map ni estado por fila
+        return (
+            self.model.id,
+            self.model.alias_normalized,
+            self.model.tenant_id,
+            self.model.event_type,
+            self.model.correlation_id,
+            self.model.previous_hash,
+            self.model.current_hash,
+            self.model.timestamp,
+            self.model.seq,
+        )
+
     def _to_entity(self, db_event: AliasEventModel) -> AliasEventEntity:
         return AliasEventEntity(
             id=db_event.id,
@@ -54,6 +156,7 @@ class AliasEventRepository(
             previous_hash=db_event.previous_hash,
             current_hash=db_event.current_hash,
             timestamp=db_event.timestamp,
+            seq=db_event.seq,
         )
 
     def get_events_by_date(
@@ -62,8 +165,11 @@ class AliasEventRepository(
         """
         Obtiene todos los eventos de una fecha específica para WORM
         """
+        # Rango UTC en vez de cast(timestamp, Date): usa ix_alias_events_timestamp
+        day_start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
         query = self.db.query(self.model).filter(
-            cast(self.model.timestamp, Date) == target_date
+            self.model.timestamp >= day_start,
+            self.model.timestamp < day_start + timedelta(days=1),
         )
 
         if tenant_id:
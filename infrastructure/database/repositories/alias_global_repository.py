@@ -1,8 +1,11 @@
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
+from core.config import settings
 from domain.entities import GlobalAliasEntity
 from domain.repositories import IGlobalAliasRepository
 from infrastructure.database.models import GlobalAliasModel
@@ -42,6 +45,27 @@ class GlobalAliasRepository(
         self.db.commit()
         return True
 
+    def count_active(self) -> int:
+        return self.db.execute(
+            select(func.count()).select_from(self.model).where(self.model.is_active)
+        ).scalar_one()
+
+    def iter_active_aliases(
+        self, changed_since: Optional[datetime] = None
+    ) -> Iterator[str]:
+        stmt = select(self.model.alias_normalized).where(self.model.is_active)
+        if changed_since:
+            # updated_at solo se informa al reactivar; un alta nueva trae created_at
+            stmt = stmt.where(
+                or_(
+                    self.model.created_at > changed_since,
+                    self.model.updated_at > changed_since,
+                )
+            )
+        yield from self.db.execute(
+            stmt.execution_options(yield_per=settings.GLOBAL_ALIAS_FILTER_BATCH_SIZE)
+        ).scalars()
+
     def _to_entity(self, db: GlobalAliasModel) -> GlobalAliasEntity:
         return GlobalAliasEntity(
             id=db.id,
@@ -0,0 +1,142 @@
+import hashlib
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities import AliasChainHeadEntity
+from domain.repositories import IAsyncAliasChainHeadRepository
+from infrastructure.database.models import AliasChainHeadModel
+
+# Clase del advisory lock (pg_advisory_xact_lock(clase, cadena)): "CHAI"
+CHAIN_LOCK_CLASS = 0x43484149
+
+
+def chain_lock_key(tenant_id: UUID, alias_normalized: str) -> int:
+    """int4 estable por cadena; una colisión solo serializa dos cadenas"""
+    digest = hashlib.sha256(f"{UUID(str(tenant_id))}:{alias_normalized}".encode())
+    return int.from_bytes(digest.digest()[:4], "big", signed=True)
+
+
+class AsyncAliasChainHeadRepository(IAsyncAliasChainHeadRepository):
+    """
+    Adaptador SQL de alias_chain_heads: lectura por PK y escrituras
+    compare-and-set en un solo statement. Bajo READ COMMITTED, un UPDATE
+    concurrente espera el lock de fila y reevalúa el WHERE, por lo que el
+    perdedor obtiene 0 filas y reintenta con la cabeza confirmada.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.model = AliasChainHeadModel
+
+    async def get_head(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> Optional[AliasChainHeadEntity]:
+        result = await self.db.execute(
+            select(self.model).where(
+                self.model.tenant_id == tenant_id,
+                self.model.alias_normalized == alias_normalized,
+            )
+            # Tras un CAS fallido se relee en la misma sesión: sin esto el
+            # identity map devolvería la versión ya cargada
+            .execution_options(populate_existing=True)
+        )
+        db_head = result.scalars().first()
+        return self._to_entity(db_head) if db_head else None
+
+    async def get_heads_for_update(
+        self, tenant_id: UUID, aliases_normalized: list[str]
+    ) -> dict[str, AliasChainHeadEntity]:
+        if not aliases_normalized:
+            return {}
+
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.tenant_id == tenant_id,
+                self.model.alias_normalized.in_(aliases_normalized),
+            )
+            .order_by(self.model.alias_normalized)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return {
+            db_head.alias_normalized: self._to_entity(db_head)
+            for db_head in result.scalars().all()
+        }
+
+    async def lock_chains(self, tenant_id: UUID, aliases_normalized: list[str]) -> None:
+        if not aliases_normalized:
+            return
+
+        # Orden global por clave: dos transacciones nunca se esperan en cruz
+        keys = sorted(
+            {chain_lock_key(tenant_id, alias) for alias in aliases_normalized}
+        )
+        await self.db.execute(
+            text(
+                "SELECT pg_advisory_xact_lock(:lock_class, key) "
+                "FROM unnest(CAST(:keys AS integer[])) AS key"
+            ),
+            {"lock_class": CHAIN_LOCK_CLASS, "keys": keys},
+        )
+
+    async def insert_head(self, head: AliasChainHeadEntity) -> bool:
+        result = await self.db.execute(
+            pg_insert(self.model)
+            .values(**self._values(head))
+            .on_conflict_do_nothing(index_elements=["tenant_id", "alias_normalized"])
+            .returning(self.model.seq)
+        )
+        return result.first() is not None
+
+    async def advance_head(
+        self, expected: AliasChainHeadEntity, head: AliasChainHeadEntity
+    ) -> bool:
+        result = await self.db.execute(
+            update(self.model)
+            .where(
+                self.model.tenant_id == expected.tenant_id,
+                self.model.alias_normalized == expected.alias_normalized,
+                self.model.seq == expected.seq,
+                self.model.current_hash == expected.current_hash,
+            )
+            .values(current_hash=head.current_hash, seq=head.seq, updated_at=func.now())
+        )
+        return result.rowcount == 1
+
+    async def bulk_upsert(self, heads: list[AliasChainHeadEntity]) -> None:
+        if not heads:
+            return
+
+        stmt = pg_insert(self.model).values([self._values(head) for head in heads])
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["tenant_id", "alias_normalized"],
+                set_={
+                    "current_hash": stmt.excluded.current_hash,
+                    "seq": stmt.excluded.seq,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def _values(self, head: AliasChainHeadEntity) -> dict:
+        return {
+            "tenant_id": head.tenant_id,
+            "alias_normalized": head.alias_normalized,
+            "current_hash": head.current_hash,
+            "seq": head.seq,
+        }
+
+    def _to_entity(self, db_head: AliasChainHeadModel) -> AliasChainHeadEntity:
+        return AliasChainHeadEntity(
+            tenant_id=db_head.tenant_id,
+            alias_normalized=db_head.alias_normalized,
+            current_hash=db_head.current_hash,
+            seq=db_head.seq,
+            updated_at=db_head.updated_at,
+        )
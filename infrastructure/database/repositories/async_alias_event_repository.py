@@ -0,0 +1,76 @@
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.alias_event_entity import AliasEventEntity
+from domain.repositories import IAsyncAliasEventRepository
+from infrastructure.database.models import AliasEventModel
+from infrastructure.database.repositories.async_base_sql_repository import (
+    AsyncBaseSQLRepository,
+)
+
+
+class AsyncAliasEventRepository(
+    AsyncBaseSQLRepository[AliasEventEntity, AliasEventModel],
+    IAsyncAliasEventRepository,
+):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, AliasEventModel)
+
+    async def create(self, entity: AliasEventEntity) -> AliasEventEntity:
+        """Append sin refresh: todos los campos mapeados se conocen antes del INSERT"""
+        db_event = self.model(**self._entity_to_dict(entity))
+        self.db.add(db_event)
+        await self.db.flush()
+        return self._to_entity(db_event)
+
+    async def get_events_for_alias(
+        self, alias_normalized: str, tenant_id: str
+    ) -> list[AliasEventEntity]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.alias_normalized == alias_normalized,
+                self.model.tenant_id == tenant_id,
+            )
+            .order_by(self.model.seq)
+        )
+        return [self._to_entity(event) for event in result.scalars().all()]
+
+    async def get_last_event_for_alias(
+        self, alias_normalized: str, tenant_id: str
+    ) -> Optional[AliasEventEntity]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.alias_normalized == alias_normalized,
+                self.model.tenant_id == tenant_id,
+            )
+            .order_by(self.model.seq.desc())
+            .limit(1)
+        )
+        db_event = result.scalars().first()
+        return self._to_entity(db_event) if db_event else None
+
+    async def bulk_create(self, entities: list[AliasEventEntity]) -> None:
+        """INSERT multi-fila (insertmanyvalues) sin RETURNING ni refresh"""
+        if not entities:
+            return
+
+        await self.db.execute(
+            insert(self.model), [self._insert_values(entity) for entity in entities]
+        )
+
+    def _to_entity(self, db_event: AliasEventModel) -> AliasEventEntity:
+        return AliasEventEntity(
+            id=db_event.id,
+            alias_normalized=db_event.alias_normalized,
+            tenant_id=db_event.tenant_id,
+            event_type=db_event.event_type,
+            correlation_id=db_event.correlation_id,
+            previous_hash=db_event.previous_hash,
+            current_hash=db_event.current_hash,
+            timestamp=db_event.timestamp,
+            seq=db_event.seq,
+        )
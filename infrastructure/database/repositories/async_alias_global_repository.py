@@ -0,0 +1,123 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Text, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities import GlobalAliasEntity
+from domain.repositories import IAsyncGlobalAliasRepository
+from infrastructure.database.models import GlobalAliasModel
+from infrastructure.database.repositories.async_base_sql_repository import (
+    AsyncBaseSQLRepository,
+)
+
+
+class AsyncGlobalAliasRepository(
+    AsyncBaseSQLRepository[GlobalAliasEntity, GlobalAliasModel],
+    IAsyncGlobalAliasRepository,
+):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, GlobalAliasModel)
+
+    async def find_active_alias(
+        self, alias_normalized: str
+    ) -> Optional[GlobalAliasEntity]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.alias_normalized == alias_normalized,
+                self.model.is_active,
+            )
+            .limit(1)
+        )
+        db_entity = result.scalars().first()
+        return self._to_entity(db_entity) if db_entity else None
+
+    async def find_active_aliases(
+        self, aliases_normalized: list[str]
+    ) -> dict[str, GlobalAliasEntity]:
+        if not aliases_normalized:
+            return {}
+
+        # = ANY(:aliases): un solo parámetro array, mismo plan para cualquier tamaño
+        result = await self.db.execute(
+            select(self.model).where(
+                self.model.alias_normalized
+                == any_(
+                    bindparam(
+                        "aliases", list(set(aliases_normalized)), type_=ARRAY(Text)
+                    )
+                ),
+                self.model.is_active,
+            )
+        )
+        return {
+            db_entity.alias_normalized: self._to_entity(db_entity)
+            for db_entity in result.scalars().all()
+        }
+
+    async def deactivate_alias(
+        self, alias_normalized: str, owning_tenant_id: Optional[UUID] = None
+    ) -> bool:
+        stmt = update(self.model).where(self.model.alias_normalized == alias_normalized)
+        if owning_tenant_id:
+            stmt = stmt.where(self.model.owning_tenant_id == owning_tenant_id)
+        result = await self.db.execute(
+            stmt.values(is_active=False, updated_at=func.now())
+        )
+        return result.rowcount > 0
+
+    async def insert_if_available(
+        self, entity: GlobalAliasEntity
+    ) -> Optional[GlobalAliasEntity]:
+        """
+        Reserva el alias global en un solo round trip apoyándose en el índice
+        único de alias_normalized: inserta si no existe o reactiva una fila
+        inactiva. Retorna None si el alias ya está activo (duplicado).
+        """
+        result = await self.db.execute(
+            self._reserve_statement([self._insert_values(entity)]).returning(self.model)
+        )
+        db_entity = result.scalars().first()
+        return self._to_entity(db_entity) if db_entity else None
+
+    async def bulk_insert_if_available(
+        self, entities: list[GlobalAliasEntity]
+    ) -> set[str]:
+        if not entities:
+            return set()
+
+        result = await self.db.execute(
+            self._reserve_statement(
+                [self._insert_values(entity) for entity in entities]
+            ).returning(self.model.alias_normalized)
+        )
+        return set(result.scalars().all())
+
+    def _reserve_statement(self, rows: list[dict]):
+        stmt = pg_insert(self.model).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["alias_normalized"],
+            set_={
+                "owning_tenant_id": stmt.excluded.owning_tenant_id,
+                "routing_code": stmt.excluded.routing_code,
+                "is_active": True,
+                "updated_at": func.now(),
+                "deleted_at": None,
+            },
+            where=self.model.is_active.is_not(True),
+        )
+
+    def _to_entity(self, db: GlobalAliasModel) -> GlobalAliasEntity:
+        return GlobalAliasEntity(
+            id=db.id,
+            alias_normalized=db.alias_normalized,
+            owning_tenant_id=db.owning_tenant_id,
+            routing_code=db.routing_code,
+            is_active=db.is_active,
+            created_at=db.created_at,
+            updated_at=db.updated_at,
+            deleted_at=db.deleted_at,
+        )
@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities import AliasRegistryEntity
+from domain.repositories import IAsyncAliasRepository
+from infrastructure.database.models import AliasRegistryModel
+from infrastructure.database.repositories.async_base_sql_repository import (
+    AsyncBaseSQLRepository,
+)
+
+
+class AsyncAliasRepository(
+    AsyncBaseSQLRepository[AliasRegistryEntity, AliasRegistryModel],
+    IAsyncAliasRepository,
+):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, AliasRegistryModel)
+
+    async def find_by_normalized_alias(
+        self, tenant_id: str, alias_normalized: str
+    ) -> Optional[AliasRegistryEntity]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.alias_normalized == alias_normalized,
+                self.model.tenant_id == tenant_id,
+            )
+            .limit(1)
+        )
+        db_alias = result.scalars().first()
+        return self._to_entity(db_alias) if db_alias else None
+
+    async def find_active_by_normalized_alias(
+        self, tenant_id: str, alias_normalized: str
+    ) -> Optional[AliasRegistryEntity]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.alias_normalized == alias_normalized,
+                self.model.tenant_id == tenant_id,
+                self.model.status == "ACTIVE",
+                self.model.deleted_at.is_(None),
+            )
+            .limit(1)
+        )
+        db_alias = result.scalars().first()
+        return self._to_entity(db_alias) if db_alias else None
+
+    async def update_status(self, alias_id: UUID, status: str) -> bool:
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == alias_id)
+            .values(status=status, updated_at=datetime.now())
+        )
+        return result.rowcount > 0
+
+    async def insert_if_absent(
+        self, entity: AliasRegistryEntity
+    ) -> Optional[AliasRegistryEntity]:
+        """
+        INSERT ... ON CONFLICT DO NOTHING RETURNING sobre idx_alias_tenant_active.
+        Retorna None si ya existe un alias ACTIVE para el tenant.
+        """
+        result = await self.db.execute(
+            self._insert_if_absent_statement([self._insert_values(entity)])
+        )
+        db_alias = result.scalars().first()
+        return self._to_entity(db_alias) if db_alias else None
+
+    async def bulk_insert_if_absent(
+        self, entities: list[AliasRegistryEntity]
+    ) -> list[AliasRegistryEntity]:
+        if not entities:
+            return []
+
+        result = await self.db.execute(
+            self._insert_if_absent_statement(
+                [self._insert_values(entity) for entity in entities]
+            )
+        )
+        return [self._to_entity(db_alias) for db_alias in result.scalars().all()]
+
+    def _insert_if_absent_statement(self, rows: list[dict]):
+        return (
+            pg_insert(self.model)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["alias_normalized", "tenant_id", "status"],
+                index_where=text("status = 'ACTIVE'"),
+            )
+            .returning(self.model)
+        )
+
+    def _to_entity(self, db_alias: AliasRegistryModel) -> AliasRegistryEntity:
+        return AliasRegistryEntity(
+            id=db_alias.id,
+            tenant_id=db_alias.tenant_id,
+            alias_raw=db_alias.alias_raw,
+            alias_normalized=db_alias.alias_normalized,
+            bank=db_alias.bank,
+            account_type=db_alias.account_type,
+            last_4=db_alias.last_4,
+            status=db_alias.status,
+            acc_hash=db_alias.acc_hash,
+            created_at=db_alias.created_at,
+            updated_at=db_alias.updated_at,
+            deleted_at=db_alias.deleted_at,
+        )
@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.repositories import IAsyncBaseRepository
+from infrastructure.database.models.base import BaseModel
+from utils import MESSAGES
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+EntityType = TypeVar("EntityType")
+
+
+class AsyncBaseSQLRepository(
+    IAsyncBaseRepository[EntityType], Generic[ModelType, EntityType]
+):
+    """
+    Adaptador concreto para SQLAlchemy AsyncSession (asyncpg)
+
+    Las escrituras solo hacen flush: el commit lo decide la unidad de trabajo
+    (AsyncUnitOfWork) para agrupar varias escrituras en una transacción.
+    """
+
+    def __init__(self, db: AsyncSession, model: type[ModelType]):
+        self.db = db
+        self.model = model
+
+    async def get_by_id(self, id: UUID) -> Optional[EntityType]:
+        result = await self.db.execute(
+            select(self.model).where(
+                self.model.id == id, self.model.deleted_at.is_(None)
+            )
+        )
+        db_entity = result.scalars().first()
+        return self._to_entity(db_entity) if db_entity else None
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[EntityType]:
+        result = await self.db.execute(
+            select(self.model)
+            .where(self.model.deleted_at.is_(None))
+            .offset(skip)
+            .limit(limit)
+        )
+        return [self._to_entity(entity) for entity in result.scalars().all()]
+
+    async def create(self, entity: EntityType) -> EntityType:
+        db_entity = self.model(**self._entity_to_dict(entity))
+        self.db.add(db_entity)
+        await self.db.flush()
+        await self.db.refresh(db_entity)
+        return self._to_entity(db_entity)
+
+    async def update(self, id: UUID, update_data: dict) -> Optional[EntityType]:
+        db_entity = await self.db.get(self.model, id)
+        if not db_entity:
+            return None
+
+        for field, value in update_data.items():
+            if hasattr(db_entity, field) and field != "id":
+                setattr(db_entity, field, value)
+
+        await self.db.flush()
+        await self.db.refresh(db_entity)
+        return self._to_entity(db_entity)
+
+    async def delete(self, id: UUID) -> bool:
+        db_entity = await self.db.get(self.model, id)
+        if not db_entity:
+            return False
+
+        db_entity.deleted_at = datetime.now()
+        await self.db.flush()
+        return True
+
+    def _entity_to_dict(self, entity: EntityType) -> dict:
+        """Convertir entidad Pydantic a dict para operaciones de BD"""
+        if hasattr(entity, "model_dump") and callable(entity.model_dump):
+            return entity.model_dump()
+
+        raise TypeError(
+            MESSAGES.ERROR.VALIDATION.IMPOSIBLE_TO_CONVERT_ENTITY_TO_DICT.CODE
+        )
+
+    def _insert_values(self, entity: EntityType) -> dict:
+        """
+        Valores para INSERT de Core: se omiten los None para que apliquen los
+        defaults de columna (id uuid4, created_at now()).
+        """
+        return {
+            key: value
+            for key, value in self._entity_to_dict(entity).items()
+            if value is not None and hasattr(self.model, key)
+        }
+
+    def _to_entity(self, db_entity: ModelType) -> EntityType:
+        raise NotImplementedError(MESSAGES.ERROR.VALIDATION.METHOD_NOT_IMPLEMENTED.CODE)
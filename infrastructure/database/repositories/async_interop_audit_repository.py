@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities import InteropAuditEntity
+from domain.repositories import IAsyncInteropAuditRepository
+from infrastructure.database.models import InteropAuditModel
+from infrastructure.database.repositories.async_base_sql_repository import (
+    AsyncBaseSQLRepository,
+)
+
+
+class AsyncInteropAuditRepository(
+    AsyncBaseSQLRepository[InteropAuditEntity, InteropAuditModel],
+    IAsyncInteropAuditRepository,
+):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, InteropAuditModel)
+
+    async def log_validation_query(self, audit_entity: InteropAuditEntity) -> None:
+        self.db.add(InteropAuditModel(**self._values(audit_entity)))
+        await self.db.flush()
+
+    async def bulk_log_validation_queries(
+        self, audit_entities: list[InteropAuditEntity]
+    ) -> None:
+        if not audit_entities:
+            return
+        # Core insert: un INSERT multi-fila por lote, sin unit of work del ORM
+        await self.db.execute(
+            insert(self.model),
+            [self._values(audit_entity) for audit_entity in audit_entities],
+        )
+
+    def _values(self, audit_entity: InteropAuditEntity) -> dict:
+        return {
+            "id": audit_entity.id or uuid4(),
+            "requesting_tenant_id": audit_entity.requesting_tenant_id,
+            "alias_normalized": audit_entity.alias_normalized,
+            "target_tenant_id": audit_entity.target_tenant_id,
+            "query_type": audit_entity.query_type,
+            "timestamp": audit_entity.timestamp,
+            "correlation_id": audit_entity.correlation_id,
+        }
@@ -0,0 +1,21 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.repositories import IUnitOfWork
+
+
+class AsyncUnitOfWork(IUnitOfWork):
+    """
+    Unidad de trabajo sobre la AsyncSession del request.
+
+    Los repositorios Async* comparten la misma sesión (FastAPI cachea
+    get_async_db por request) y solo hacen flush; el commit es único.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def commit(self) -> None:
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        await self.db.rollback()
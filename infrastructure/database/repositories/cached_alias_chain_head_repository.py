@@ -0,0 +1,102 @@
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import AliasChainHeadEntity
+from domain.repositories import IAsyncAliasChainHeadRepository
+from infrastructure.cache import RedisCache, TTLCache
+
+
+class CachedAliasChainHeadRepository(IAsyncAliasChainHeadRepository):
+    """
+    Read-through de cabezas de cadena: caché en proceso y, opcionalmente,
+    Redis delante del repositorio SQL.
+
+    Las escrituras se reflejan en la caché antes del commit. Si la transacción
+    se revierte, la entrada queda adelantada, pero el compare-and-set por
+    (seq, current_hash) falla en el siguiente append, que descarta la entrada
+    y relee la cabeza desde la base de datos.
+    """
+
+    def __init__(
+        self,
+        repository: IAsyncAliasChainHeadRepository,
+        local_cache: TTLCache,
+        remote_cache: Optional[RedisCache] = None,
+    ):
+        self.repository = repository
+        self.local_cache = local_cache
+        self.remote_cache = remote_cache
+
+    async def get_head(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> Optional[AliasChainHeadEntity]:
+        key = self._key(tenant_id, alias_normalized)
+        head = self.local_cache.get(key)
+        if head is not None:
+            return head
+
+        if self.remote_cache:
+            cached = await self.remote_cache.get(key)
+            if cached:
+                head = AliasChainHeadEntity.model_validate_json(cached)
+                self.local_cache.set(key, head)
+                return head
+
+        head = await self.repository.get_head(tenant_id, alias_normalized)
+        if head is not None:
+            await self._store(head)
+        return head
+
+    async def get_heads_for_update(
+        self, tenant_id: UUID, aliases_normalized: list[str]
+    ) -> dict[str, AliasChainHeadEntity]:
+        # El bloqueo de fila exige ir a la base de datos
+        return await self.repository.get_heads_for_update(tenant_id, aliases_normalized)
+
+    async def lock_chains(self, tenant_id: UUID, aliases_normalized: list[str]) -> None:
+        await self.repository.lock_chains(tenant_id, aliases_normalized)
+
+    async def insert_head(self, head: AliasChainHeadEntity) -> bool:
+        inserted = await self.repository.insert_head(head)
+        if inserted:
+            await self._store(head)
+        else:
+            await self._forget(head)
+        return inserted
+
+    async def advance_head(
+        self, expected: AliasChainHeadEntity, head: AliasChainHeadEntity
+    ) -> bool:
+        advanced = await self.repository.advance_head(expected, head)
+        if advanced:
+            await self._store(head)
+        else:
+            await self._forget(head)
+        return advanced
+
+    async def bulk_upsert(self, heads: list[AliasChainHeadEntity]) -> None:
+        await self.repository.bulk_upsert(heads)
+
+        items = {}
+        for head in heads:
+            key = self._key(head.tenant_id, head.alias_normalized)
+            self.local_cache.set(key, head)
+            items[key] = head.model_dump_json()
+        if self.remote_cache:
+            await self.remote_cache.set_many(items)
+
+    async def _store(self, head: AliasChainHeadEntity):
+        key = self._key(head.tenant_id, head.alias_normalized)
+        self.local_cache.set(key, head)
+        if self.remote_cache:
+            await self.remote_cache.set(key, head.model_dump_json())
+
+    async def _forget(self, head: AliasChainHeadEntity):
+        key = self._key(head.tenant_id, head.alias_normalized)
+        self.local_cache.delete(key)
+        if self.remote_cache:
+            await self.remote_cache.delete(key)
+
+    def _key(self, tenant_id: UUID, alias_normalized: str) -> str:
+        # tenant_id puede llegar como str (JWT) o UUID (entidad)
+        return f"{UUID(str(tenant_id))}:{alias_normalized}"
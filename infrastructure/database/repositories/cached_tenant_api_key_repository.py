@@ -0,0 +1,56 @@
+from typing import Optional
+from uuid import UUID
+
+from domain.entities import TenantApiKeyEntity
+from domain.repositories import ITenantApiKeyRepository
+from infrastructure.cache import TTLCache
+
+# Marca de key_id inexistente en la caché negativa
+_MISSING = "missing"
+
+
+class CachedTenantApiKeyRepository(ITenantApiKeyRepository):
+    """
+    Caché en proceso de API keys por key_id, positiva y negativa.
+
+    Las keys inexistentes se recuerdan negative_ttl_seconds para que
+    peticiones con keys inventadas no lleguen a la base de datos. La
+    revocación borra la entrada local; en otros workers rige el TTL.
+    """
+
+    def __init__(
+        self,
+        repository: ITenantApiKeyRepository,
+        cache: TTLCache,
+        negative_ttl_seconds: float,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def create(self, api_key: TenantApiKeyEntity) -> TenantApiKeyEntity:
+        created = self.repository.create(api_key)
+        self.cache.delete(created.key_id)
+        return created
+
+    def find_by_key_id(self, key_id: str) -> Optional[TenantApiKeyEntity]:
+        cached = self.cache.get(key_id)
+        if cached is _MISSING:
+            return None
+        if cached is not None:
+            return cached
+
+        api_key = self.repository.find_by_key_id(key_id)
+        if api_key is None:
+            self.cache.set(key_id, _MISSING, ttl_seconds=self.negative_ttl_seconds)
+        else:
+            self.cache.set(key_id, api_key)
+        return api_key
+
+    def list_by_tenant(self, tenant_id: UUID) -> list[TenantApiKeyEntity]:
+        return self.repository.list_by_tenant(tenant_id)
+
+    def revoke(self, tenant_id: UUID, key_id: str) -> bool:
+        revoked = self.repository.revoke(tenant_id, key_id)
+        self.cache.delete(key_id)
+        return revoked
@@ -0,0 +1,125 @@
+from typing import Optional
+from uuid import UUID
+
+from domain.entities.tenant_entity import TenantEntity, TenantStatus, TenantType
+from domain.repositories import ITenantRepository
+from infrastructure.cache import SyncRedisCache, TTLCache
+
+
+class CachedTenantRepository(ITenantRepository):
+    """
+    Read-through de tenants por id y por código: caché en proceso y,
+    opcionalmente, Redis delante del repositorio SQL.
+
+    Cada escritura (create, update, update_status, delete) borra las dos
+    claves del tenant en ambos niveles. Otros procesos pueden servir su copia
+    local hasta que expire (TTL corto); Redis se invalida al instante.
+    Las entidades se entregan como copia: los casos de uso las mutan.
+    """
+
+    def __init__(
+        self,
+        repository: ITenantRepository,
+        local_cache: TTLCache,
+        remote_cache: Optional[SyncRedisCache] = None,
+    ):
+        self.repository = repository
+        self.local_cache = local_cache
+        self.remote_cache = remote_cache
+
+    def get_by_id(self, id: UUID) -> Optional[TenantEntity]:
+        return self._read_through(
+            self._id_key(id), lambda: self.repository.get_by_id(id)
+        )
+
+    def find_by_code(self, code: str) -> Optional[TenantEntity]:
+        return self._read_through(
+            self._code_key(code), lambda: self.repository.find_by_code(code)
+        )
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> list[TenantEntity]:
+        return self.repository.get_all(skip=skip, limit=limit)
+
+    def find_by_email(self, email: str) -> Optional[TenantEntity]:
+        return self.repository.find_by_email(email)
+
+    def find_by_tax_id(self, tax_id: str) -> Optional[TenantEntity]:
+        return self.repository.find_by_tax_id(tax_id)
+
+    def find_active_tenants(self) -> list[TenantEntity]:
+        return self.repository.find_active_tenants()
+
+    def find_tenants_by_type(self, tenant_type: TenantType) -> list[TenantEntity]:
+        return self.repository.find_tenants_by_type(tenant_type)
+
+    def create(self, entity: TenantEntity) -> TenantEntity:
+        created = self.repository.create(entity)
+        self._forget(created.id, created.code)
+        return created
+
+    def update(self, id: UUID, update_data) -> Optional[TenantEntity]:
+        previous = self.local_cache.get(self._id_key(id))
+        updated = self.repository.update(id, update_data)
+        self._forget(id, previous.code if previous else None)
+        if updated:
+            self._forget(id, updated.code)
+        return updated
+
+    def update_status(self, tenant_id: UUID, status: TenantStatus) -> bool:
+        updated = self.repository.update_status(tenant_id, status)
+        self._forget_tenant(tenant_id)
+        return updated
+
+    def delete(self, id: UUID) -> bool:
+        deleted = self.repository.delete(id)
+        self._forget_tenant(id)
+        return deleted
+
+    def _read_through(self, key: str, load) -> Optional[TenantEntity]:
+        tenant = self.local_cache.get(key)
+        if tenant is None and self.remote_cache:
+            cached = self.remote_cache.get(key)
+            if cached:
+                tenant = TenantEntity.model_validate_json(cached)
+                self._store_local(tenant)
+
+        if tenant is None:
+            tenant = load()
+            if tenant is None:
+                return None
+            self._store(tenant)
+
+        return tenant.model_copy(deep=True)
+
+    def _store_local(self, tenant: TenantEntity):
+        self.local_cache.set(self._id_key(tenant.id), tenant)
+        self.local_cache.set(self._code_key(tenant.code), tenant)
+
+    def _store(self, tenant: TenantEntity):
+        self._store_local(tenant)
+        if self.remote_cache:
+            payload = tenant.model_dump_json()
+            self.remote_cache.set(self._id_key(tenant.id), payload)
+            self.remote_cache.set(self._code_key(tenant.code), payload)
+
+    def _forget_tenant(self, tenant_id: UUID):
+        # El código hace falta para borrar la segunda clave
+        tenant = self.local_cache.get(self._id_key(tenant_id))
+        if tenant is None:
+            tenant = self.repository.get_by_id(tenant_id)
+        self._forget(tenant_id, tenant.code if tenant else None)
+
+    def _forget(self, tenant_id: UUID, code: Optional[str]):
+        keys = [self._id_key(tenant_id)]
+        if code:
+            keys.append(self._code_key(code))
+        for key in keys:
+            self.local_cache.delete(key)
+        if self.remote_cache:
+            self.remote_cache.delete(*keys)
+
+    def _id_key(self, tenant_id: UUID) -> str:
+        return f"id:{UUID(str(tenant_id))}"
+
+    def _code_key(self, code: str) -> str:
+        return f"code:{code}"
@@ -0,0 +1,45 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from domain.entities import ChainCheckpointEntity
+from domain.repositories import IChainCheckpointRepository
+from infrastructure.database.models import AliasChainCheckpointModel
+
+
+class ChainCheckpointRepository(IChainCheckpointRepository):
+    def __init__(self, db: Session):
+        self.db = db
+        self.model = AliasChainCheckpointModel
+
+    def get_checkpoint(
+        self, tenant_id: UUID, alias_normalized: str
+    ) -> Optional[ChainCheckpointEntity]:
+        db_checkpoint = self.db.get(self.model, (tenant_id, alias_normalized))
+        return (
+            ChainCheckpointEntity.model_validate(db_checkpoint)
+            if db_checkpoint
+            else None
+        )
+
+    def save_checkpoint(self, checkpoint: ChainCheckpointEntity) -> None:
+        stmt = pg_insert(self.model).values(
+            tenant_id=checkpoint.tenant_id,
+            alias_normalized=checkpoint.alias_normalized,
+            last_verified_seq=checkpoint.last_verified_seq,
+            last_verified_hash=checkpoint.last_verified_hash,
+        )
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["tenant_id", "alias_normalized"],
+                set_={
+                    "last_verified_seq": stmt.excluded.last_verified_seq,
+                    "last_verified_hash": stmt.excluded.last_verified_hash,
+                    "verified_at": func.now(),
+                },
+            )
+        )
+        self.db.commit()
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from domain.entities import ChainVerificationJobEntity
+from domain.repositories import IChainVerificationJobRepository
+from infrastructure.database.models import ChainVerificationJobModel
+from utils import EJobStatus
+
+_ACTIVE = (EJobStatus.PENDING, EJobStatus.RUNNING)
+
+
+class ChainVerificationJobRepository(IChainVerificationJobRepository):
+    def __init__(self, db: Session):
+        self.db = db
+        self.model = ChainVerificationJobModel
+
+    @staticmethod
+    def _scope(tenant_id: Optional[UUID]) -> str:
+        return str(tenant_id) if tenant_id else "all"
+
+    def enqueue(
+        self, tenant_id: Optional[UUID], workers: Optional[int]
+    ) -> ChainVerificationJobEntity:
+        scope = self._scope(tenant_id)
+        # El índice único parcial deja un solo job activo por alcance aunque
+        # dos requests lleguen a la vez
+        stmt = (
+            pg_insert(self.model)
+            .values(tenant_id=tenant_id, scope=scope, workers=workers)
+            .on_conflict_do_nothing(
+                index_elements=["scope"],
+                index_where=text("status IN ('PENDING', 'RUNNING')"),
+            )
+            .returning(self.model)
+        )
+        db_job = self.db.execute(stmt).scalar_one_or_none()
+        if db_job is None:
+            db_job = self.db.execute(
+                select(self.model).where(
+                    self.model.scope == scope, self.model.status.in_(_ACTIVE)
+                )
+            ).scalar_one()
+        self.db.commit()
+        return ChainVerificationJobEntity.model_validate(db_job)
+
+    def get(self, job_id: UUID) -> Optional[ChainVerificationJobEntity]:
+        db_job = self.db.get(self.model, job_id)
+        return ChainVerificationJobEntity.model_validate(db_job) if db_job else None
+
+    def claim_next(
+        self, stale_after_seconds: int
+    ) -> Optional[ChainVerificationJobEntity]:
+        # SKIP LOCKED: con varios workers agendando el job, cada uno toma
+        # uno distinto (o ninguno)
+        candidate = (
+            select(self.model.id)
+            .where(
+                or_(
+                    self.model.status == EJobStatus.PENDING,
+                    and_(
+                        self.model.status == EJobStatus.RUNNING,
+                        self.model.started_at
+                        < func.now() - timedelta(seconds=stale_after_seconds),
+                    ),
+                )
+            )
+            .order_by(self.model.requested_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        db_job = self.db.execute(
+            update(self.model)
+            .where(self.model.id == candidate)
+            .values(status=EJobStatus.RUNNING, started_at=func.now())
+            .returning(self.model)
+        ).scalar_one_or_none()
+        self.db.commit()
+        return ChainVerificationJobEntity.model_validate(db_job) if db_job else None
+
+    def complete(self, job_id: UUID, report: dict[str, Any]) -> None:
+        self._finish(job_id, status=EJobStatus.COMPLETED, report=report)
+
+    def fail(self, job_id: UUID, error: str) -> None:
+        self._finish(job_id, status=EJobStatus.FAILED, error=error)
+
+    def _finish(self, job_id: UUID, **values) -> None:
+        self.db.execute(
+            update(self.model)
+            .where(self.model.id == job_id)
+            .values(finished_at=func.now(), **values)
+        )
+        self.db.commit()
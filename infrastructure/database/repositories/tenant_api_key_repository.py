@@ -0,0 +1,54 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from domain.entities import TenantApiKeyEntity
+from domain.repositories import ITenantApiKeyRepository
+from infrastructure.database.models import TenantApiKeyModel
+
+
+class TenantApiKeyRepository(ITenantApiKeyRepository):
+    def __init__(self, db: Session):
+        self.db = db
+        self.model = TenantApiKeyModel
+
+    def create(self, api_key: TenantApiKeyEntity) -> TenantApiKeyEntity:
+        db_key = self.model(
+            tenant_id=api_key.tenant_id,
+            key_id=api_key.key_id,
+            key_hash=api_key.key_hash,
+            scopes=api_key.scopes,
+            expires_at=api_key.expires_at,
+        )
+        self.db.add(db_key)
+        self.db.commit()
+        self.db.refresh(db_key)
+        return TenantApiKeyEntity.model_validate(db_key)
+
+    def find_by_key_id(self, key_id: str) -> Optional[TenantApiKeyEntity]:
+        db_key = self.db.query(self.model).filter(self.model.key_id == key_id).first()
+        return TenantApiKeyEntity.model_validate(db_key) if db_key else None
+
+    def list_by_tenant(self, tenant_id: UUID) -> list[TenantApiKeyEntity]:
+        db_keys = (
+            self.db.query(self.model)
+            .filter(self.model.tenant_id == tenant_id)
+            .order_by(self.model.created_at)
+            .all()
+        )
+        return [TenantApiKeyEntity.model_validate(db_key) for db_key in db_keys]
+
+    def revoke(self, tenant_id: UUID, key_id: str) -> bool:
+        revoked = (
+            self.db.query(self.model)
+            .filter(
+                self.model.tenant_id == tenant_id,
+                self.model.key_id == key_id,
+                self.model.revoked_at.is_(None),
+            )
+            .update({self.model.revoked_at: func.now()}, synchronize_session=False)
+        )
+        self.db.commit()
+        return revoked > 0
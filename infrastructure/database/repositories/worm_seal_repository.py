@@ -0,0 +1,276 @@
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, exists, func, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from domain.entities import WormLeafEntity, WormLeafEventEntity, WormSealEntity
+from domain.repositories import IWormSealRepository
+from infrastructure.database.models import (
+    AliasEventModel,
+    WormMerkleLeafModel,
+    WormMerkleNodeModel,
+    WormSealModel,
+)
+
+# Clase del advisory lock (pg_try_advisory_xact_lock(clase, día)): "WORM"
+WORM_LOCK_CLASS = 0x574F524D
+
+
+def _day_bounds(seal_date: date) -> tuple[datetime, datetime]:
+    """Día UTC sellado como rango semiabierto de timestamp"""
+    day_start = datetime.combine(seal_date, time.min, tzinfo=timezone.utc)
+    return day_start, day_start + timedelta(days=1)
+
+
+class WormSealRepository(IWormSealRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def append_leaves(
+        self, seal_date: date, leaf_hasher: Callable[[UUID, str], str]
+    ) -> Optional[int]:
+        if not self.try_lock_day(seal_date):
+            self.db.rollback()
+            return None
+
+        next_index = self.get_leaf_counts(seal_date)
+        day_start, day_end = _day_bounds(seal_date)
+
+        events = AliasEventModel.__table__
+        leaves = WormMerkleLeafModel.__table__
+        # Range scan por ix_alias_events_timestamp (sin cast a Date) y anti-join
+        # contra las hojas ya agregadas en ejecuciones previas
+        stmt = (
+            select(events.c.id, events.c.tenant_id, events.c.current_hash)
+            .where(
+                events.c.timestamp >= day_start,
+                events.c.timestamp < day_end,
+                ~exists().where(leaves.c.event_id == events.c.id),
+            )
+            .order_by(events.c.timestamp, events.c.id)
+            .execution_options(yield_per=settings.WORM_LEAF_BATCH_SIZE)
+        )
+
+        appended = 0
+        batch = []
+        for event_id, tenant_id, current_hash in self.db.execute(stmt):
+            index = next_index.get(tenant_id, 0)
+            next_index[tenant_id] = index + 1
+            batch.append(
+                {
+                    "seal_date": seal_date,
+                    "tenant_id": tenant_id,
+                    "leaf_index": index,
+                    "event_id": event_id,
+                    "leaf_hash": leaf_hasher(event_id, current_hash),
+                }
+            )
+            if len(batch) >= settings.WORM_LEAF_BATCH_SIZE:
+                self.db.execute(insert(leaves), batch)
+                appended += len(batch)
+                batch = []
+
+        if batch:
+            self.db.execute(insert(leaves), batch)
+            appended += len(batch)
+
+        self.db.commit()
+        return appended
+
+    def count_events_without_leaf(self, seal_date: date) -> int:
+        day_start, day_end = _day_bounds(seal_date)
+        events = AliasEventModel.__table__
+        leaves = WormMerkleLeafModel.__table__
+        return self.db.execute(
+            select(func.count())
+            .select_from(events)
+            .where(
+                events.c.timestamp >= day_start,
+                events.c.timestamp < day_end,
+                ~exists().where(leaves.c.event_id == events.c.id),
+            )
+        ).scalar_one()
+
+    def try_lock_day(self, seal_date: date) -> bool:
+        return bool(
+            self.db.execute(
+                select(
+                    func.pg_try_advisory_xact_lock(
+                        WORM_LOCK_CLASS, seal_date.toordinal()
+                    )
+                )
+            ).scalar()
+        )
+
+    def get_leaf_counts(self, seal_date: date) -> dict[UUID, int]:
+        rows = self.db.execute(
+            select(WormMerkleLeafModel.tenant_id, func.count())
+            .where(WormMerkleLeafModel.seal_date == seal_date)
+            .group_by(WormMerkleLeafModel.tenant_id)
+        )
+        return dict(rows.all())
+
+    def iter_leaf_hashes(self, tenant_id: UUID, seal_date: date) -> Iterator[str]:
+        result = self.db.execute(
+            select(WormMerkleLeafModel.leaf_hash)
+            .where(
+                WormMerkleLeafModel.seal_date == seal_date,
+                WormMerkleLeafModel.tenant_id == tenant_id,
+            )
+            .order_by(WormMerkleLeafModel.leaf_index)
+            .execution_options(yield_per=settings.WORM_LEAF_BATCH_SIZE)
+        )
+        for (leaf_hash,) in result:
+            yield leaf_hash
+
+    def get_leaf_hashes(
+        self, tenant_id: UUID, seal_date: date, start: int, end: int
+    ) -> list[str]:
+        return list(
+            self.db.execute(
+                select(WormMerkleLeafModel.leaf_hash)
+                .where(
+                    WormMerkleLeafModel.seal_date == seal_date,
+                    WormMerkleLeafModel.tenant_id == tenant_id,
+                    WormMerkleLeafModel.leaf_index >= start,
+                    WormMerkleLeafModel.leaf_index < end,
+                )
+                .order_by(WormMerkleLeafModel.leaf_index)
+            ).scalars()
+        )
+
+    def iter_leaf_events(
+        self, seal_date: date, tenant_id: Optional[UUID] = None
+    ) -> Iterator[WormLeafEventEntity]:
+        leaves = WormMerkleLeafModel.__table__
+        events = AliasEventModel.__table__
+        day_start, day_end = _day_bounds(seal_date)
+        stmt = (
+            select(
+                leaves.c.event_id,
+                leaves.c.tenant_id,
+                leaves.c.seal_date,
+                leaves.c.leaf_index,
+                leaves.c.leaf_hash,
+                events.c.event_type,
+                events.c.timestamp,
+                events.c.previous_hash,
+                events.c.current_hash,
+            )
+            # El rango del día (las hojas son eventos de seal_date) deja a
+            # Postgres podar las particiones mensuales de alias_events
+            .join(
+                events,
+                and_(
+                    events.c.id == leaves.c.event_id,
+                    events.c.timestamp >= day_start,
+                    events.c.timestamp < day_end,
+                ),
+            )
+            .where(leaves.c.seal_date == seal_date)
+            .order_by(leaves.c.tenant_id, leaves.c.leaf_index)
+            .execution_options(yield_per=settings.WORM_LEAF_BATCH_SIZE)
+        )
+        if tenant_id:
+            stmt = stmt.where(leaves.c.tenant_id == tenant_id)
+
+        for row in self.db.execute(stmt).mappings():
+            yield WormLeafEventEntity.model_validate(row)
+
+    def get_leaf_by_event(self, event_id: UUID) -> Optional[WormLeafEntity]:
+        db_leaf = self.db.execute(
+            select(WormMerkleLeafModel).where(WormMerkleLeafModel.event_id == event_id)
+        ).scalar_one_or_none()
+        return WormLeafEntity.model_validate(db_leaf) if db_leaf else None
+
+    def get_nodes(
+        self, tenant_id: UUID, seal_date: date, coordinates: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], str]:
+        if not coordinates:
+            return {}
+        rows = self.db.execute(
+            select(
+                WormMerkleNodeModel.level,
+                WormMerkleNodeModel.node_index,
+                WormMerkleNodeModel.node_hash,
+            ).where(
+                WormMerkleNodeModel.seal_date == seal_date,
+                WormMerkleNodeModel.tenant_id == tenant_id,
+                tuple_(WormMerkleNodeModel.level, WormMerkleNodeModel.node_index).in_(
+                    coordinates
+                ),
+            )
+        )
+        return {(level, index): node_hash for level, index, node_hash in rows}
+
+    def get_seal(
+        self, seal_date: date, tenant_id: Optional[UUID] = None
+    ) -> Optional[WormSealEntity]:
+        tenant_filter = (
+            WormSealModel.tenant_id == tenant_id
+            if tenant_id
+            else WormSealModel.tenant_id.is_(None)
+        )
+        db_seal = self.db.execute(
+            select(WormSealModel).where(
+                WormSealModel.seal_date == seal_date, tenant_filter
+            )
+        ).scalar_one_or_none()
+        return WormSealEntity.model_validate(db_seal) if db_seal else None
+
+    def get_tenant_seals(self, seal_date: date) -> list[WormSealEntity]:
+        db_seals = self.db.execute(
+            select(WormSealModel)
+            .where(
+                WormSealModel.seal_date == seal_date,
+                WormSealModel.tenant_id.is_not(None),
+            )
+            .order_by(WormSealModel.tenant_id_hash, WormSealModel.tenant_id)
+        ).scalars()
+        return [WormSealEntity.model_validate(db_seal) for db_seal in db_seals]
+
+    def save_seals(
+        self,
+        seals: list[WormSealEntity],
+        nodes: list[tuple[UUID, int, int, str]],
+    ) -> None:
+        if not seals:
+            return
+        seal_date = seals[0].seal_date
+
+        # Idempotente: un sellado concurrente produce los mismos valores
+        for start in range(0, len(nodes), settings.WORM_LEAF_BATCH_SIZE):
+            chunk = nodes[start : start + settings.WORM_LEAF_BATCH_SIZE]
+            self.db.execute(
+                pg_insert(WormMerkleNodeModel)
+                .values(
+                    [
+                        {
+                            "seal_date": seal_date,
+                            "tenant_id": tenant_id,
+                            "level": level,
+                            "node_index": index,
+                            "node_hash": node_hash,
+                        }
+                        for tenant_id, level, index, node_hash in chunk
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+        self.db.execute(
+            pg_insert(WormSealModel)
+            .values(
+                [
+                    {"id": uuid4(), **seal.model_dump(exclude={"sealed_at"})}
+                    for seal in seals
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        self.db.commit()
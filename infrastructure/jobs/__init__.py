@@ -0,0 +1,13 @@
+from .batched_chain_event_writer import BatchedChainEventWriter
+from .batched_queue_writer import BatchedQueueWriter
+from .chain_batch_verifier import ProcessPoolChainBatchVerifier
+from .interop_audit_writer import InteropAuditWriter
+from .process_pool_signature_service import ProcessPoolSignatureService
+
+__all__ = [
+    "BatchedChainEventWriter",
+    "BatchedQueueWriter",
+    "InteropAuditWriter",
+    "ProcessPoolChainBatchVerifier",
+    "ProcessPoolSignatureService",
+]
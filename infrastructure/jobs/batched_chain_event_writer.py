@@ -0,0 +1,79 @@
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from domain.repositories import IChainEventSink
+from domain.services import ChainAppendService
+from infrastructure.jobs.batched_queue_writer import BatchedQueueWriter
+from utils import EEventType
+
+
+class PendingChainEvent(NamedTuple):
+    tenant_id: UUID
+    alias_normalized: str
+    event_type: EEventType
+    correlation_id: UUID
+    timestamp: datetime
+
+
+class BatchedChainEventWriter(BatchedQueueWriter[PendingChainEvent], IChainEventSink):
+    """
+    Escritor en segundo plano de eventos de cadena (RESOLVE, INTEROP_RESOLVE).
+
+    Cada lote se encadena por (tenant, alias) en orden de llegada con
+    ChainAppendService.append_batch y se persiste en una única transacción;
+    con group_commit la respuesta implica evento persistido, como el append
+    en línea.
+    """
+
+    NAME = "Chain event writer"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        chain_append_factory: Callable[[Any], ChainAppendService],
+        **options,
+    ):
+        super().__init__(session_factory, **options)
+        self.chain_append_factory = chain_append_factory
+
+    async def submit(
+        self,
+        tenant_id: UUID,
+        alias_normalized: str,
+        event_type: EEventType,
+        correlation_id: UUID,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        await self._enqueue(
+            PendingChainEvent(
+                tenant_id,
+                alias_normalized,
+                event_type,
+                correlation_id,
+                timestamp or datetime.now(timezone.utc),
+            )
+        )
+
+    def _partition_key(self, item: PendingChainEvent) -> tuple[UUID, str]:
+        # Un lote fallido se reintenta por cadena
+        return item.tenant_id, item.alias_normalized
+
+    async def _write(self, db, items: list[PendingChainEvent]) -> None:
+        by_tenant: dict[UUID, list[tuple]] = defaultdict(list)
+        for item in items:
+            by_tenant[item.tenant_id].append(
+                (
+                    item.alias_normalized,
+                    item.event_type,
+                    item.correlation_id,
+                    item.timestamp,
+                )
+            )
+
+        chain_append_service = self.chain_append_factory(db)
+        # Tenants en orden fijo: dos escritores bloquean las cadenas en el mismo orden
+        for tenant_id in sorted(by_tenant, key=str):
+            await chain_append_service.append_batch(tenant_id, by_tenant[tenant_id])
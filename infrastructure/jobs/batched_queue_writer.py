@@ -0,0 +1,245 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from core.logger import get_logger
+
+logger = get_logger("infrastructure.jobs.batched_queue_writer")
+
+T = TypeVar("T")
+
+
+class BatchedQueueWriter(ABC, Generic[T]):
+    """
+    Base de los escritores en segundo plano: cola acotada en proceso, una
+    tarea que agrupa hasta batch_size elementos o flush_interval_ms y una
+    transacción por lote (_write + COMMIT).
+
+    Durabilidad:
+    - group_commit: quien encola espera al COMMIT del lote que lo contiene
+    - async: vuelve al encolar; lo que siga en cola se pierde si el proceso
+      muere sin pasar por stop()
+
+    Con la cola llena el productor espera (contrapresión): no se descarta nada.
+
+    Si un lote falla se reintenta por partes (grupos de _partition_key y,
+    dentro de un grupo, mitades) hasta aislar los elementos que fallan: solo
+    sus productores reciben el error y el resto se escribe. Los errores de
+    conexión no se reparten: fallaría cada parte igual.
+    """
+
+    DURABILITY_MODES = ("group_commit", "async")
+    MAX_ATTEMPTS = 2
+    NAME = "Batched writer"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        durability: str = "group_commit",
+        batch_size: int = 500,
+        flush_interval_ms: int = 10,
+        max_queue_size: int = 10_000,
+    ):
+        if durability not in self.DURABILITY_MODES:
+            message = f"Invalid {self.NAME.lower()} durability: {durability}"
+            raise ValueError(message)
+
+        self.session_factory = session_factory
+        self.durability = durability
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._submitted = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._split_batches = 0
+        self._queue_full_waits = 0
+        self._queue_wait_ms = 0.0
+        self._max_queue_depth = 0
+        self._last_batch_size = 0
+        self._last_flush_ms = 0.0
+
+    @abstractmethod
+    async def _write(self, db, items: list[T]) -> None:
+        """Escribe el lote en la sesión; el COMMIT lo hace la base"""
+        pass
+
+    def _partition_key(self, item: T) -> Hashable:
+        """Grupo independiente del resto al reintentar un lote fallido"""
+        return None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"{self.NAME} started",
+            durability=self.durability,
+            batch_size=self.batch_size,
+            flush_interval_ms=int(self.flush_interval * 1000),
+        )
+
+    async def stop(self) -> None:
+        """Vacía la cola (último lote incluido) y detiene la tarea"""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        logger.info(f"{self.NAME} stopped", **self.stats())
+
+    async def _enqueue(self, item: T) -> None:
+        committed = (
+            asyncio.get_running_loop().create_future()
+            if self.durability == "group_commit"
+            else None
+        )
+        entry = (item, committed)
+        self._submitted += 1
+
+        if not self.running:
+            # Sin tarea (arranque, apagado o scripts): escritura en línea
+            await self._flush([entry])
+        else:
+            if self._queue.full():
+                self._queue_full_waits += 1
+                started = time.perf_counter()
+                await self._queue.put(entry)
+                self._queue_wait_ms += (time.perf_counter() - started) * 1000
+            else:
+                self._queue.put_nowait(entry)
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+        if committed is not None:
+            await committed
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+
+            batch = [entry]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if self._queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    entry = self._queue.get_nowait()
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[T, Optional[asyncio.Future]]]) -> None:
+        started = time.perf_counter()
+        failed = await self._write_isolating(batch, self.MAX_ATTEMPTS)
+
+        self._last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        self._last_batch_size = len(batch)
+        self._batches += 1
+        self._failed += failed
+        self._written += len(batch) - failed
+
+    async def _write_isolating(
+        self, batch: list[tuple[T, Optional[asyncio.Future]]], attempts: int
+    ) -> int:
+        """Escribe el lote o, si falla, sus partes; devuelve los elementos fallidos"""
+        error = await self._commit([item for item, _ in batch], attempts)
+        if error is None:
+            self._resolve(batch, None)
+            return 0
+
+        if len(batch) == 1 or isinstance(error, (OperationalError, InterfaceError)):
+            logger.error(
+                f"{self.NAME} batch failed", items=len(batch), error=str(error)
+            )
+            self._resolve(batch, error)
+            return len(batch)
+
+        self._split_batches += 1
+        failed = 0
+        for part in self._split(batch):
+            failed += await self._write_isolating(part, 1)
+        return failed
+
+    async def _commit(self, items: list[T], attempts: int) -> Optional[Exception]:
+        error: Optional[Exception] = None
+        for _ in range(attempts):
+            try:
+                async with self.session_factory() as db:
+                    await self._write(db, items)
+                    await db.commit()
+                return None
+            except Exception as exc:
+                error = exc
+        return error
+
+    def _split(self, batch: list[tuple[T, Optional[asyncio.Future]]]) -> list[list]:
+        groups: dict[Hashable, list] = {}
+        for entry in batch:
+            groups.setdefault(self._partition_key(entry[0]), []).append(entry)
+        if len(groups) > 1:
+            return list(groups.values())
+        # Mitades en orden: un grupo (cadena) conserva el orden de llegada
+        middle = len(batch) // 2
+        return [batch[:middle], batch[middle:]]
+
+    @staticmethod
+    def _resolve(
+        batch: list[tuple[T, Optional[asyncio.Future]]], error: Optional[Exception]
+    ) -> None:
+        for _, committed in batch:
+            if committed is None or committed.done():
+                continue
+            if error is not None:
+                committed.set_exception(error)
+            else:
+                committed.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "durability": self.durability,
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "queue_max_size": self.max_queue_size,
+            "queue_full_waits": self._queue_full_waits,
+            "queue_wait_ms": round(self._queue_wait_ms, 2),
+            "submitted": self._submitted,
+            "written": self._written,
+            "failed": self._failed,
+            "batches": self._batches,
+            "split_batches": self._split_batches,
+            "avg_batch_size": (
+                round((self._written + self._failed) / self._batches, 1)
+                if self._batches
+                else 0
+            ),
+            "last_batch_size": self._last_batch_size,
+            "last_flush_ms": self._last_flush_ms,
+        }
@@ -0,0 +1,247 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import create_engine, func, select, tuple_
+from sqlalchemy.pool import NullPool
+
+from core.config import settings
+from core.logger import get_logger
+from domain.entities import GENESIS_HASH, BrokenChainEntity, ChainBatchReportEntity
+from domain.repositories import IChainBatchVerifier
+from domain.services import HashChainService
+from infrastructure.database.models import AliasChainHeadModel, AliasEventModel
+
+logger = get_logger("infrastructure.jobs.chain_batch_verifier")
+
+ChainKey = tuple[UUID, str]
+
+
+def _verify_partition(
+    database_url: str,
+    tenant_id: Optional[UUID],
+    lower: Optional[ChainKey],
+    upper: Optional[ChainKey],
+    batch_size: int,
+    max_reported: int,
+) -> dict:
+    """
+    Verifica las cadenas con clave en [lower, upper) en un proceso hijo.
+
+    Lee tuplas crudas con cursor del servidor (sin ORM ni pydantic) y solo
+    llama a HashChainService.calculate_event_hash por evento; una cadena rota
+    deja de hashearse tras su primera ruptura.
+    """
+    hash_chain_service = HashChainService()
+    events = AliasEventModel.__table__
+    chain_key = tuple_(events.c.tenant_id, events.c.alias_normalized)
+
+    stmt = select(
+        events.c.tenant_id,
+        events.c.alias_normalized,
+        events.c.seq,
+        events.c.event_type,
+        events.c.timestamp,
+        events.c.previous_hash,
+        events.c.current_hash,
+    ).order_by(events.c.tenant_id, events.c.alias_normalized, events.c.seq)
+    if tenant_id:
+        stmt = stmt.where(events.c.tenant_id == tenant_id)
+    if lower:
+        stmt = stmt.where(chain_key >= tuple_(*lower))
+    if upper:
+        stmt = stmt.where(chain_key < tuple_(*upper))
+
+    total_chains = 0
+    total_events = 0
+    broken: list[dict] = []
+    broken_count = 0
+
+    current_key = None
+    expected_previous_hash = GENESIS_HASH
+    expected_seq = 1
+    chain_broken = False
+
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(stmt)
+            for (
+                row_tenant_id,
+                alias_normalized,
+                seq,
+                event_type,
+                timestamp,
+                previous_hash,
+                current_hash,
+            ) in result:
+                key = (row_tenant_id, alias_normalized)
+                if key != current_key:
+                    current_key = key
+                    total_chains += 1
+                    expected_previous_hash = GENESIS_HASH
+                    expected_seq = 1
+                    chain_broken = False
+
+                total_events += 1
+                if not chain_broken:
+                    hashes = None
+                    if previous_hash != expected_previous_hash or seq != expected_seq:
+                        hashes = (expected_previous_hash, previous_hash)
+                    else:
+                        recomputed = hash_chain_service.calculate_event_hash(
+                            tenant_id=row_tenant_id,
+                            alias=alias_normalized,
+                            event_type=event_type,
+                            timestamp=timestamp,
+                            previous_hash=previous_hash,
+                        )
+                        if recomputed != current_hash:
+                            hashes = (recomputed, current_hash)
+
+                    if hashes:
+                        chain_broken = True
+                        broken_count += 1
+                        if len(broken) < max_reported:
+                            broken.append(
+                                {
+                                    "tenant_id": row_tenant_id,
+                                    "alias_normalized": alias_normalized,
+                                    "break_seq": seq,
+                                    "expected_hash": hashes[0],
+                                    "actual_hash": hashes[1],
+                                }
+                            )
+
+                expected_previous_hash = current_hash
+                expected_seq = seq + 1
+    finally:
+        engine.dispose()
+
+    return {
+        "total_chains": total_chains,
+        "total_events": total_events,
+        "broken_count": broken_count,
+        "broken": broken,
+    }
+
+
+class ProcessPoolChainBatchVerifier(IChainBatchVerifier):
+    """
+    Verificación masiva de cadenas repartida en un ProcessPoolExecutor.
+
+    Las claves (tenant_id, alias_normalized) se cortan en rangos contiguos a
+    partir de alias_chain_heads (una fila por cadena), así cada proceso hace
+    un range scan del índice (tenant_id, alias_normalized, seq) sin leer las
+    filas de otras particiones. Se crean varias particiones por proceso para
+    que una cadena muy larga no deje al resto de los núcleos ociosos.
+    """
+
+    def __init__(self, db_session_factory, database_url: Optional[str] = None):
+        self.db_session_factory = db_session_factory
+        self.database_url = database_url or settings.sqlalchemy_database_url
+
+    def verify_all(
+        self, tenant_id: Optional[UUID] = None, workers: Optional[int] = None
+    ) -> ChainBatchReportEntity:
+        started_at = datetime.now(timezone.utc)
+        workers = workers or settings.CHAIN_VERIFY_WORKERS or os.cpu_count() or 1
+        boundaries = self._partition_boundaries(
+            tenant_id, workers * settings.CHAIN_VERIFY_PARTITIONS_PER_WORKER
+        )
+        ranges = list(zip([None, *boundaries], [*boundaries, None]))
+
+        report = ChainBatchReportEntity(
+            tenant_id=tenant_id,
+            started_at=started_at,
+            finished_at=started_at,
+            workers=workers,
+            partitions=len(ranges),
+        )
+
+        # spawn: los hijos no heredan el pool de conexiones ni hilos del padre
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _verify_partition,
+                    self.database_url,
+                    tenant_id,
+                    lower,
+                    upper,
+                    settings.VERIFY_CHAIN_BATCH_SIZE,
+                    settings.CHAIN_VERIFY_MAX_REPORTED_BREAKS,
+                )
+                for lower, upper in ranges
+            ]
+            for future in as_completed(futures):
+                partial = future.result()
+                report.total_chains += partial["total_chains"]
+                report.total_events += partial["total_events"]
+                report.broken_count += partial["broken_count"]
+                room = settings.CHAIN_VERIFY_MAX_REPORTED_BREAKS - len(
+                    report.broken_chains
+                )
+                report.broken_chains.extend(
+                    BrokenChainEntity(**item) for item in partial["broken"][:room]
+                )
+
+        report.broken_chains.sort(key=lambda b: (str(b.tenant_id), b.alias_normalized))
+        report.finished_at = datetime.now(timezone.utc)
+        logger.info(
+            "Verificación masiva de cadenas finalizada",
+            operation="chain_batch_verification",
+            tenant_id=str(tenant_id) if tenant_id else None,
+            total_chains=report.total_chains,
+            total_events=report.total_events,
+            broken_count=report.broken_count,
+            duration_seconds=report.duration_seconds,
+        )
+        return report
+
+    def _partition_boundaries(
+        self, tenant_id: Optional[UUID], partitions: int
+    ) -> list[ChainKey]:
+        """Claves de inicio de cada rango (excepto el primero, sin cota inferior)"""
+        heads = AliasChainHeadModel.__table__
+        bucketed = select(
+            heads.c.tenant_id,
+            heads.c.alias_normalized,
+            func.ntile(partitions)
+            .over(order_by=(heads.c.tenant_id, heads.c.alias_normalized))
+            .label("bucket"),
+        )
+        if tenant_id:
+            bucketed = bucketed.where(heads.c.tenant_id == tenant_id)
+        bucketed = bucketed.subquery()
+
+        first_key = (
+            select(
+                bucketed.c.tenant_id,
+                bucketed.c.alias_normalized,
+                func.row_number()
+                .over(
+                    partition_by=bucketed.c.bucket,
+                    order_by=(bucketed.c.tenant_id, bucketed.c.alias_normalized),
+                )
+                .label("rn"),
+                bucketed.c.bucket,
+            )
+        ).subquery()
+        stmt = (
+            select(first_key.c.tenant_id, first_key.c.alias_normalized)
+            .where(first_key.c.rn == 1, first_key.c.bucket > 1)
+            .order_by(first_key.c.bucket)
+        )
+
+        db = self.db_session_factory()
+        try:
+            return [tuple(row) for row in db.execute(stmt)]
+        finally:
+            db.close()
@@ -0,0 +1,19 @@
+from domain.entities import InteropAuditEntity
+from domain.repositories import IInteropAuditSink
+from infrastructure.database.repositories import AsyncInteropAuditRepository
+from infrastructure.jobs.batched_queue_writer import BatchedQueueWriter
+
+
+class InteropAuditWriter(BatchedQueueWriter[InteropAuditEntity], IInteropAuditSink):
+    """
+    Auditoría de consultas interop en lote: cada flush es un INSERT
+    multi-fila en interop_audits y un único COMMIT.
+    """
+
+    NAME = "Interop audit writer"
+
+    async def submit(self, audit_entity: InteropAuditEntity) -> None:
+        await self._enqueue(audit_entity)
+
+    async def _write(self, db, items: list[InteropAuditEntity]) -> None:
+        await AsyncInteropAuditRepository(db).bulk_log_validation_queries(items)
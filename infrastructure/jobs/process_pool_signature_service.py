@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from core.logger import get_logger
+from domain.services import DigitalSignatureService, SignatureVerifier
+
+logger = get_logger("infrastructure.jobs.process_pool_signature_service")
+
+# Servicio de cada proceso hijo, construido una vez por el initializer del pool
+_worker_service: Optional[SignatureVerifier] = None
+
+
+def _init_signer(private_key_pem: str) -> None:
+    global _worker_service
+    _worker_service = DigitalSignatureService(private_key_pem)
+
+
+def _init_verifier(public_key_pem: str) -> None:
+    global _worker_service
+    _worker_service = SignatureVerifier(public_key_pem)
+
+
+def _sign_chunk(payloads: list[str]) -> list[str]:
+    return _worker_service.sign_many(payloads)
+
+
+def _verify_chunk(items: list[tuple[str, str]]) -> list[bool]:
+    return _worker_service.verify_many(items)
+
+
+class ProcessPoolSignatureService(DigitalSignatureService):
+    """
+    DigitalSignatureService que reparte los lotes grandes de firmas y
+    verificaciones en pools de procesos (ECDSA es CPU puro y no suelta el
+    GIL).
+
+    Un pool para firmar y otro para verificar, creados con el primer lote que
+    los necesita y reutilizados: cada proceso parsea la clave una sola vez en
+    el initializer, y los de verificación solo reciben la clave pública. Los
+    tramos viajan sin la clave. Los lotes menores que min_parallel_items se
+    resuelven en el proceso actual, donde el envío a otro proceso costaría
+    más que la firma.
+    """
+
+    def __init__(
+        self,
+        private_key_pem: str,
+        workers: Optional[int] = None,
+        min_parallel_items: int = 256,
+        chunks_per_worker: int = 4,
+    ):
+        super().__init__(private_key_pem)
+        self._private_key_pem = private_key_pem
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_items = min_parallel_items
+        self.chunks_per_worker = chunks_per_worker
+        self._sign_executor: Optional[ProcessPoolExecutor] = None
+        self._verify_executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _new_executor(self, initializer, key_pem: str) -> ProcessPoolExecutor:
+        # spawn: los hijos no heredan el pool de conexiones ni hilos del padre
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=(key_pem,),
+        )
+
+    def _get_sign_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._sign_executor is None:
+                self._sign_executor = self._new_executor(
+                    _init_signer, self._private_key_pem
+                )
+                logger.info("WORM signing pool started", workers=self.workers)
+            return self._sign_executor
+
+    def _get_verify_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._verify_executor is None:
+                self._verify_executor = self._new_executor(
+                    _init_verifier, self.get_public_key_pem()
+                )
+                logger.info("WORM verification pool started", workers=self.workers)
+            return self._verify_executor
+
+    def _chunks(self, items: list) -> list[list]:
+        size = -(-len(items) // (self.workers * self.chunks_per_worker))
+        return [items[start : start + size] for start in range(0, len(items), size)]
+
+    def _parallel(self, items: list) -> bool:
+        return self.workers > 1 and len(items) >= self.min_parallel_items
+
+    def sign_many(self, payloads: list[str]) -> list[str]:
+        if not self._parallel(payloads):
+            return super().sign_many(payloads)
+        results = self._get_sign_executor().map(_sign_chunk, self._chunks(payloads))
+        return [signature for chunk in results for signature in chunk]
+
+    def verify_many(self, items: list[tuple[str, str]]) -> list[bool]:
+        if not self._parallel(items):
+            return super().verify_many(items)
+        results = self._get_verify_executor().map(_verify_chunk, self._chunks(items))
+        return [valid for chunk in results for valid in chunk]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for executor in (self._sign_executor, self._verify_executor):
+                if executor is not None:
+                    executor.shutdown()
+            self._sign_executor = self._verify_executor = None
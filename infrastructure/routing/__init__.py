@@ -0,0 +1,3 @@
+from .file_bank_routing_source import FileBankRoutingSource
+
+__all__ = ["FileBankRoutingSource"]
@@ -0,0 +1,36 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from domain.entities import BankRoutingCatalogEntity
+from domain.repositories import IBankRoutingSource
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent / "data" / "cl_cmf_banks.json"
+
+
+class FileBankRoutingSource(IBankRoutingSource):
+    """
+    Catálogo de bancos desde un archivo JSON versionado.
+
+    has_changed compara mtime y tamaño con los del último load, así el job
+    de recarga solo relee y reindexa cuando el archivo se reemplazó.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else DEFAULT_CATALOG_PATH
+        self._fingerprint: Optional[tuple[int, int]] = None
+
+    def _stat(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> BankRoutingCatalogEntity:
+        fingerprint = self._stat()
+        with open(self.path, encoding="utf-8") as f:
+            catalog = BankRoutingCatalogEntity.model_validate(json.load(f))
+        self._fingerprint = fingerprint
+        return catalog
+
+    def has_changed(self) -> bool:
+        return self._stat() != self._fingerprint
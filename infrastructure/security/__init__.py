@@ -0,0 +1,12 @@
+from .cached_jwt_validation_service import CachedJWTValidationService
+from .jwt_config import get_jwt_key_provider, get_jwt_validation_service
+from .local_jwt_key_provider import LocalJWTKeyProvider
+from .remote_jwks_key_provider import RemoteJWKSKeyProvider
+
+__all__ = [
+    "CachedJWTValidationService",
+    "LocalJWTKeyProvider",
+    "RemoteJWKSKeyProvider",
+    "get_jwt_key_provider",
+    "get_jwt_validation_service",
+]
@@ -0,0 +1,37 @@
+import hashlib
+import time
+
+from domain.services import JWTValidationService
+from infrastructure.cache import TTLCache
+
+
+class CachedJWTValidationService(JWTValidationService):
+    """
+    Validación JWT con caché LRU de payloads ya verificados.
+
+    La clave es el SHA-256 del token (el token no queda en memoria) y cada
+    entrada expira en el `exp` del token o en el TTL de la caché si es antes.
+    Solo se cachean tokens válidos: un token inválido se verifica siempre.
+    """
+
+    def __init__(self, payload_cache: TTLCache, **kwargs):
+        super().__init__(**kwargs)
+        self.payload_cache = payload_cache
+
+    def validate_token(self, token: str) -> dict:
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self.payload_cache.get(key)
+        if payload is not None:
+            return payload
+
+        payload = super().validate_token(token)
+        exp = payload.get("exp")
+        if exp:
+            remaining = exp - time.time()
+            if remaining > 0:
+                self.payload_cache.set(
+                    key,
+                    payload,
+                    ttl_seconds=min(remaining, self.payload_cache.ttl_seconds),
+                )
+        return payload
@@ -1,17 +1,60 @@
+from functools import lru_cache
+from typing import Optional
+
 from core import settings
+from domain.repositories import IJWTKeyProvider
 from domain.services import JWTValidationService
+from infrastructure.cache import TTLCache
 from utils import MESSAGES
 
+from .cached_jwt_validation_service import CachedJWTValidationService
+from .local_jwt_key_provider import LocalJWTKeyProvider
+from .remote_jwks_key_provider import RemoteJWKSKeyProvider
+
+
+@lru_cache
+def get_jwt_key_provider() -> Optional[IJWTKeyProvider]:
+    """
+    Claves asimétricas del proceso: locales si hay JWT_PRIVATE_KEY (emisor),
+    o el JWKS remoto si solo hay JWT_JWKS_URL (réplica verificadora)
+    """
+    if settings.JWT_ALG.startswith("HS"):
+        return None
+
+    if settings.JWT_PRIVATE_KEY:
+        return LocalJWTKeyProvider(
+            algorithm=settings.JWT_ALG,
+            private_key_pem=settings.JWT_PRIVATE_KEY,
+            key_id=settings.JWT_KEY_ID,
+            previous_public_keys_pem=settings.JWT_PREVIOUS_PUBLIC_KEYS,
+        )
+    if settings.JWT_JWKS_URL:
+        return RemoteJWKSKeyProvider(
+            url=settings.JWT_JWKS_URL,
+            algorithm=settings.JWT_ALG,
+            min_refresh_seconds=settings.JWT_JWKS_MIN_REFRESH_SECONDS,
+        )
+    raise ValueError(MESSAGES.ERROR.VALIDATION.JWT_SIGNING_KEY_NOT_CONFIGURED.CODE)
+
 
+@lru_cache
 def get_jwt_validation_service() -> JWTValidationService:
-    """Factory para el servicio de validación JWT"""
+    """Servicio de validación JWT único por proceso, con caché de payloads"""
+    key_provider = get_jwt_key_provider()
     secret = settings.JWT_SECRET
-    if not secret:
+    if key_provider is None and not secret:
         raise ValueError(MESSAGES.ERROR.VALIDATION.JWT_NOT_CONFIGURED_IN_ENV.CODE)
 
-    return JWTValidationService(
-        secret=secret,
+    return CachedJWTValidationService(
+        payload_cache=TTLCache(
+            max_entries=settings.JWT_PAYLOAD_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.JWT_PAYLOAD_CACHE_TTL_SECONDS,
+        ),
+        secret=secret if key_provider is None else None,
         algorithm=settings.JWT_ALG,
         audience=settings.JWT_AUDIENCE,
         issuer=settings.JWT_ISSUER,
+        signing_key=getattr(key_provider, "signing_key", None),
+        key_id=getattr(key_provider, "key_id", None),
+        key_provider=key_provider,
     )
@@ -0,0 +1,64 @@
+import base64
+import hashlib
+import json
+from typing import Any, Optional
+
+from cryptography.hazmat.primitives import serialization
+from jwt.algorithms import get_default_algorithms
+
+from domain.repositories import IJWTKeyProvider
+
+# Miembros requeridos por tipo de clave para el thumbprint (RFC 7638)
+THUMBPRINT_MEMBERS = {"EC": ("crv", "kty", "x", "y"), "OKP": ("crv", "kty", "x")}
+
+
+def jwk_thumbprint(jwk: dict) -> str:
+    members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk["kty"]]}
+    digest = hashlib.sha256(
+        json.dumps(members, sort_keys=True, separators=(",", ":")).encode()
+    ).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+class LocalJWTKeyProvider(IJWTKeyProvider):
+    """
+    Claves del emisor: la privada firma y las públicas (actual + anteriores
+    aún vigentes) verifican y se publican como JWKS. Todas se parsean una vez
+    al construir; el kid es el thumbprint RFC 7638 si no se configura otro.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        private_key_pem: str,
+        key_id: Optional[str] = None,
+        previous_public_keys_pem: Optional[list[str]] = None,
+    ):
+        self.algorithm = algorithm
+        self._jwk_algorithm = get_default_algorithms()[algorithm]
+        self.signing_key = serialization.load_pem_private_key(
+            private_key_pem.encode(), password=None
+        )
+
+        current_jwk = self._to_jwk(self.signing_key.public_key())
+        self.key_id = key_id or jwk_thumbprint(current_jwk)
+
+        self._keys: dict[str, Any] = {self.key_id: self.signing_key.public_key()}
+        self._jwks = [{**current_jwk, "kid": self.key_id}]
+        for pem in previous_public_keys_pem or []:
+            public_key = serialization.load_pem_public_key(pem.encode())
+            jwk = self._to_jwk(public_key)
+            kid = jwk_thumbprint(jwk)
+            if kid not in self._keys:
+                self._keys[kid] = public_key
+                self._jwks.append({**jwk, "kid": kid})
+
+    def _to_jwk(self, public_key: Any) -> dict:
+        jwk = self._jwk_algorithm.to_jwk(public_key, as_dict=True)
+        return {**jwk, "use": "sig", "alg": self.algorithm}
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        return self._keys.get(kid)
+
+    def get_jwks(self) -> dict:
+        return {"keys": self._jwks}
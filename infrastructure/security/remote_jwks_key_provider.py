@@ -0,0 +1,96 @@
+import json
+import threading
+import time
+import urllib.request
+from typing import Any, Optional
+
+import jwt
+
+from core.logger import get_logger
+from domain.repositories import IJWTKeyProvider
+
+logger = get_logger("infrastructure.security.remote_jwks")
+
+
+class RemoteJWKSKeyProvider(IJWTKeyProvider):
+    """
+    Verificador sin clave privada: cachea en memoria las claves públicas del
+    JWKS del emisor, ya parseadas por kid.
+
+    El refresco periódico lo hace el scheduler. Un kid desconocido (rotación)
+    no espera el fetch: la validación lo trata como clave desconocida en el
+    acto y se lanza un refresco en un hilo aparte, uno solo a la vez y como
+    mucho cada min_refresh_seconds. Así un token con kid inventado no bloquea
+    el event loop; tras una rotación real las requests validan en cuanto
+    termina ese fetch. Si el fetch falla se conservan las claves anteriores.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        algorithm: str,
+        min_refresh_seconds: float = 30,
+        timeout_seconds: float = 5,
+    ):
+        self.url = url
+        self.algorithm = algorithm
+        self.min_refresh_seconds = min_refresh_seconds
+        self.timeout_seconds = timeout_seconds
+        self._keys: dict[str, Any] = {}
+        self._jwks: list[dict] = []
+        self._last_fetch = float("-inf")
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def refresh(self) -> bool:
+        """Descarga el JWKS y reemplaza las claves en un solo paso"""
+        self._last_fetch = time.monotonic()
+        try:
+            with urllib.request.urlopen(self.url, timeout=self.timeout_seconds) as r:
+                document = json.load(r)
+        except Exception as e:
+            logger.warning("JWKS refresh failed", url=self.url, error=str(e))
+            return False
+
+        keys, jwks = {}, []
+        for entry in document.get("keys", []):
+            kid = entry.get("kid")
+            if not kid or entry.get("alg", self.algorithm) != self.algorithm:
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(entry, algorithm=self.algorithm).key
+            except jwt.PyJWTError as e:
+                logger.warning("JWKS key skipped", kid=kid, error=str(e))
+                continue
+            jwks.append(entry)
+
+        self._keys, self._jwks = keys, jwks
+        return True
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        key = self._keys.get(kid)
+        if key is None and kid is not None:
+            self._refresh_in_background()
+        return key
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if (
+                self._refreshing
+                or time.monotonic() - self._last_fetch < self.min_refresh_seconds
+            ):
+                return
+            self._refreshing = True
+            self._last_fetch = time.monotonic()
+        threading.Thread(
+            target=self._run_refresh, name="jwks-refresh", daemon=True
+        ).start()
+
+    def _run_refresh(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+
+    def get_jwks(self) -> dict:
+        return {"keys": self._jwks}
@@ -4,6 +4,7 @@ from fastapi.responses import RedirectResponse
 
 from api import routers
 from core import http_error_handler_middleware, settings
+from core.lifespan import lifespan
 from core.middleware.logging import LoggingMiddleware
 from core.setup_logger import setup_logging
 
@@ -16,6 +17,7 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -0,0 +1,91 @@
+"""
+Benchmark de POST /api/v1/aliases/bulk
+
+Genera N alias sintéticos en NDJSON, los envía en una sola petición y lee el
+stream de resultados, reportando alias/s y el conteo por estado. Solo usa la
+librería estándar.
+
+    python scripts/bench/alias_bulk_register.py --token $JWT --count 100000
+"""
+import argparse
+import http.client
+import json
+import time
+import uuid
+from collections import Counter
+from urllib.parse import urlparse
+
+
+def build_payload(count: int, prefix: str, bank: str) -> bytes:
+    lines = (
+        json.dumps(
+            {
+                "alias": f"{prefix}{i:08d}",
+                "bank": bank,
+                "account_type": "CTA_VISTA",
+                "last_4": f"{i % 10000:04d}",
+            }
+        )
+        for i in range(count)
+    )
+    return ("\n".join(lines) + "\n").encode()
+
+
+def run(args) -> dict:
+    parsed = urlparse(args.base_url)
+    prefix = args.prefix or f"b{uuid.uuid4().hex[:6]}"
+    payload = build_payload(args.count, prefix, args.bank)
+
+    conn = http.client.HTTPConnection(
+        parsed.hostname or "localhost", parsed.port or 80, timeout=args.timeout
+    )
+    started = time.perf_counter()
+    conn.request(
+        "POST",
+        f"{parsed.path.rstrip('/')}/api/v1/aliases/bulk",
+        body=payload,
+        headers={
+            "Authorization": f"Bearer {args.token}",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+    response = conn.getresponse()
+    if response.status != 200:
+        message = f"HTTP {response.status}: {response.read()[:500]!r}"
+        raise RuntimeError(message)
+
+    statuses: Counter[str] = Counter()
+    first_result_ms = None
+    summary = None
+    for line in response:
+        if first_result_ms is None:
+            first_result_ms = (time.perf_counter() - started) * 1000
+        record = json.loads(line)
+        if "status" in record:
+            statuses[record["status"]] += 1
+        else:
+            summary = record
+    elapsed = time.perf_counter() - started
+    conn.close()
+
+    return {
+        "count": args.count,
+        "elapsed_s": round(elapsed, 2),
+        "aliases_per_s": round(args.count / elapsed, 1),
+        "first_result_ms": round(first_result_ms or 0.0, 1),
+        "statuses": dict(statuses),
+        "summary": summary,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de registro masivo")
+    parser.add_argument("--base-url", default="http://localhost:8050")
+    parser.add_argument("--token", required=True, help="JWT de tenant (Bearer)")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--bank", default="Banco Estado")
+    parser.add_argument("--prefix", help="Prefijo de alias (por defecto aleatorio)")
+    parser.add_argument("--timeout", type=float, default=600.0)
+
+    result = run(parser.parse_args())
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark de la normalización de alias
+
+Compara, sobre el mismo lote sintético:
+
+- legacy: strip().lower() (normalización anterior, sin plegado Unicode)
+- normalize: AliasNormalizer.normalize por alias
+- normalize_many: AliasNormalizer.normalize_many sobre el lote completo
+
+Una fracción configurable de los alias lleva caracteres no ASCII
+(mayúsculas de ancho completo, tildes, homoglifos cirílicos, espacios de
+ancho cero). Al final comprueba que las variantes de un mismo alias
+colisionan en la forma normalizada.
+
+    python scripts/bench/alias_normalizer.py --aliases 1000000 --unicode-ratio 0.05
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from domain.services.alias_normalizer import AliasNormalizer
+
+VARIANTS = {
+    "juan.perez": [
+        "Juan.Perez",
+        " juan.perez ",
+        "ｊｕａｎ.ｐｅｒｅｚ",
+        "juаn.pеrez",
+        "juán.pérez",
+        "juan​.perez",
+        "JUAN.PÉREZ",
+    ],
+    "pago-rapido": ["pago–rapido", "pago‑rápido", "раgo-rapido"],
+}
+
+_UNICODE_MUTATIONS = (
+    lambda alias: alias.replace("a", "á", 1),
+    lambda alias: alias.replace("o", "о", 1),
+    lambda alias: alias[:2] + "​" + alias[2:],
+    lambda alias: "".join(chr(ord(char) + 0xFEE0) for char in alias[:3]) + alias[3:],
+)
+
+
+def build_aliases(count: int, unicode_ratio: float, distinct: int) -> list[str]:
+    rng = random.Random(42)
+    base = [f"Usuario.{index:06d}_pago" for index in range(distinct)]
+    aliases = []
+    for _ in range(count):
+        alias = rng.choice(base)
+        if rng.random() < unicode_ratio:
+            alias = rng.choice(_UNICODE_MUTATIONS)(alias)
+        aliases.append(alias)
+    return aliases
+
+
+def timed(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aliases", type=int, default=1_000_000)
+    parser.add_argument("--unicode-ratio", type=float, default=0.05)
+    parser.add_argument("--distinct", type=int, default=50_000)
+    args = parser.parse_args()
+
+    aliases = build_aliases(args.aliases, args.unicode_ratio, args.distinct)
+    normalizer = AliasNormalizer()
+
+    cases = [
+        ("legacy", lambda: [alias.strip().lower() for alias in aliases]),
+        ("normalize", lambda: [normalizer.normalize(alias) for alias in aliases]),
+        ("normalize_many", lambda: normalizer.normalize_many(aliases)),
+    ]
+    print(f"{'case':>15} {'total_s':>8} {'ns_per_alias':>13}")
+    for name, fn in cases:
+        elapsed, _ = timed(fn)
+        print(f"{name:>15} {elapsed:>8.3f} {elapsed / len(aliases) * 1e9:>13.0f}")
+
+    print(f"cache: {normalizer.cache_stats()}")
+
+    failures = 0
+    for expected, variants in VARIANTS.items():
+        for variant in variants:
+            normalized = normalizer.normalize(variant)
+            if normalized != expected:
+                failures += 1
+                print(f"collision missed: {variant!r} -> {normalized!r}")
+    print(f"homoglyph collisions: {'ok' if not failures else f'{failures} missed'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark de carga para GET /api/v1/aliases/{alias}
+
+Mide latencia p50/p99 y throughput con N clientes concurrentes (keep-alive),
+usando solo la librería estándar para no agregar dependencias.
+
+Uso típico (antes / después de un cambio):
+
+    python scripts/bench/alias_resolve_load.py --token $JWT --alias demo1234 \\
+        --label before --save bench_before.json
+    python scripts/bench/alias_resolve_load.py --token $JWT --alias demo1234 \\
+        --label after --save bench_after.json
+    python scripts/bench/alias_resolve_load.py --compare bench_before.json bench_after.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlparse
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """Lee una respuesta HTTP/1.1 completa y retorna el status code"""
+    status_line = await reader.readline()
+    if not status_line:
+        message = "connection closed by server"
+        raise ConnectionError(message)
+    status_code = int(status_line.split()[1])
+
+    content_length = 0
+    chunked = False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            content_length = int(value.strip())
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif content_length:
+        await reader.readexactly(content_length)
+
+    return status_code
+
+
+async def _client(
+    host: str,
+    port: int,
+    request: bytes,
+    deadline: float,
+    latencies: list[float],
+    errors: list[int],
+):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_code = await _read_response(reader)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status_code >= 400:
+                errors.append(status_code)
+    finally:
+        writer.close()
+
+
+async def run_load(args) -> dict:
+    parsed = urlparse(args.base_url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 80
+    path = f"{parsed.path.rstrip('/')}/api/v1/aliases/{args.alias}"
+    request = (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        f"Authorization: Bearer {args.token}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    ).encode()
+
+    latencies: list[float] = []
+    errors: list[int] = []
+
+    # Warm-up para llenar pools de conexiones (HTTP y base de datos)
+    warmup_deadline = time.perf_counter() + args.warmup
+    await asyncio.gather(
+        *[
+            _client(host, port, request, warmup_deadline, [], [])
+            for _ in range(args.concurrency)
+        ]
+    )
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(
+        *[
+            _client(host, port, request, deadline, latencies, errors)
+            for _ in range(args.concurrency)
+        ]
+    )
+    elapsed = time.perf_counter() - started
+
+    return {
+        "label": args.label,
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+    }
+
+
+def print_result(result: dict):
+    print(
+        f"[{result['label']}] c={result['concurrency']} "
+        f"reqs={result['requests']} errors={result['errors']} "
+        f"rps={result['throughput_rps']} p50={result['p50_ms']}ms "
+        f"p99={result['p99_ms']}ms"
+    )
+
+
+def compare(before_path: str, after_path: str):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    print_result(before)
+    print_result(after)
+    for key in ("p50_ms", "p99_ms", "throughput_rps"):
+        if before[key]:
+            ratio = after[key] / before[key]
+            print(f"  {key}: {before[key]} -> {after[key]} (x{ratio:.2f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test de resolución de alias")
+    parser.add_argument("--base-url", default="http://localhost:8050")
+    parser.add_argument("--token", help="JWT de tenant (Bearer)")
+    parser.add_argument("--alias", help="Alias activo del tenant")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--save", help="Archivo JSON donde guardar el resultado")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Comparar dos runs"
+    )
+
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        if not args.token or not args.alias:
+            parser.error("--token y --alias son obligatorios para ejecutar la carga")
+        result = asyncio.run(run_load(args))
+        print_result(result)
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(result, f, indent=2)
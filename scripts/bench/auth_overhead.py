@@ -0,0 +1,112 @@
+"""
+Micro-benchmark del coste de autenticación por request
+
+Resuelve en proceso las dependencias de auth de un endpoint (tenant, roles y
+datos del tenant) sobre requests sintéticas y compara:
+
+- legacy: un JWTValidationService nuevo y un decode por dependencia
+- cold: contexto compartido, caché de payloads vacía (una verificación)
+- warm: contexto compartido con el payload en caché (ninguna verificación)
+
+    python scripts/bench/auth_overhead.py --requests 20000 --tokens 100
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from starlette.requests import Request
+
+from core.auth import get_auth_context, get_current_tenant
+from core.config import settings
+from core.dependencies.tenant import get_current_roles, get_current_tenant_data
+from domain.services import JWTValidationService
+from infrastructure.security import get_jwt_validation_service
+
+
+def build_request(token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def legacy_auth(token: str, decodes: int) -> None:
+    for _ in range(decodes):
+        JWTValidationService(
+            secret=settings.JWT_SECRET,
+            algorithm=settings.JWT_ALG,
+            audience=settings.JWT_AUDIENCE,
+            issuer=settings.JWT_ISSUER,
+        ).validate_token(token)
+
+
+async def shared_auth(token: str) -> None:
+    request = build_request(token)
+    authorization = request.headers["authorization"]
+    await get_current_tenant(request, authorization)
+    context = get_auth_context(request, authorization)
+    get_current_roles(context)
+    get_current_tenant_data(context)
+
+
+def per_request_us(label: str, total: int, started: float) -> dict:
+    elapsed = time.perf_counter() - started
+    return {"mode": label, "us_per_request": round(elapsed / total * 1e6, 2)}
+
+
+async def run(args) -> list[dict]:
+    service = get_jwt_validation_service()
+    tokens = [
+        service.create_tenant_token(f"T{i:04d}", str(uuid.uuid4()), roles=["admin"])
+        for i in range(args.tokens)
+    ]
+    results = []
+
+    started = time.perf_counter()
+    for i in range(args.requests):
+        legacy_auth(tokens[i % len(tokens)], args.legacy_decodes)
+    results.append(per_request_us("legacy", args.requests, started))
+
+    started = time.perf_counter()
+    for i in range(args.requests):
+        service.payload_cache.clear()
+        await shared_auth(tokens[i % len(tokens)])
+    results.append(per_request_us("cold", args.requests, started))
+
+    service.payload_cache.clear()
+    started = time.perf_counter()
+    for i in range(args.requests):
+        await shared_auth(tokens[i % len(tokens)])
+    results.append(per_request_us("warm", args.requests, started))
+    results.append({"mode": "cache", **service.payload_cache.stats()})
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--tokens", type=int, default=100, help="Tokens distintos")
+    parser.add_argument(
+        "--legacy-decodes",
+        type=int,
+        default=3,
+        help="Decodes por request en el flujo anterior",
+    )
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args)):
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Stress de appends concurrentes sobre cadenas calientes
+
+Lanza --requests appends RESOLVE repartidos en --chains cadenas de un tenant
+de bench, con --concurrency a la vez, por dos caminos:
+
+- inline: ChainAppendService.append + commit por request (sesión propia)
+- group: BatchedChainEventWriter en group_commit (un commit por lote)
+
+Después de cada fase comprueba que cada cadena sigue siendo lineal: seq 1..n
+sin huecos ni repetidos, previous_hash = current_hash anterior y hash
+recalculado; sale con código 1 si alguna se bifurcó.
+
+    python scripts/bench/chain_append_contention.py --requests 5000 --chains 1
+    python scripts/bench/chain_append_contention.py --cleanup
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import delete, select
+
+from core.database import AsyncSessionLocal
+from core.dependencies.alias_event import build_chain_append_service
+from domain.entities import GENESIS_HASH
+from domain.services import HashChainService
+from infrastructure.database.models import AliasChainHeadModel, AliasEventModel
+from infrastructure.jobs import BatchedChainEventWriter
+from utils import EEventType
+
+BENCH_TENANT = uuid.UUID("00000000-0000-0000-0000-00000000c4a1")
+
+hash_chain_service = HashChainService()
+
+
+def chain_aliases(chains: int) -> list[str]:
+    return [f"benchhot{index}" for index in range(chains)]
+
+
+async def inline_append(alias_normalized: str) -> None:
+    async with AsyncSessionLocal() as db:
+        service = build_chain_append_service(db, hash_chain_service)
+        await service.append(
+            tenant_id=BENCH_TENANT,
+            alias_normalized=alias_normalized,
+            event_type=EEventType.RESOLVE,
+            correlation_id=uuid.uuid4(),
+        )
+        await db.commit()
+
+
+async def run_phase(append, aliases: list[str], requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await append(aliases[index % len(aliases)])
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "req_s": round(requests / elapsed),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2),
+        "errors": errors,
+    }
+
+
+async def verify_linear(aliases: list[str]) -> dict[str, str]:
+    """Primera ruptura por cadena; vacío si todas son lineales"""
+    events = AliasEventModel.__table__
+    broken = {}
+    async with AsyncSessionLocal() as db:
+        for alias_normalized in aliases:
+            rows = await db.execute(
+                select(
+                    events.c.seq,
+                    events.c.event_type,
+                    events.c.timestamp,
+                    events.c.previous_hash,
+                    events.c.current_hash,
+                )
+                .where(
+                    events.c.tenant_id == BENCH_TENANT,
+                    events.c.alias_normalized == alias_normalized,
+                )
+                .order_by(events.c.seq)
+            )
+            previous_hash = GENESIS_HASH
+            for expected_seq, row in enumerate(rows, start=1):
+                recomputed = hash_chain_service.calculate_event_hash(
+                    tenant_id=BENCH_TENANT,
+                    alias=alias_normalized,
+                    event_type=row.event_type,
+                    timestamp=row.timestamp,
+                    previous_hash=previous_hash,
+                )
+                if row.seq != expected_seq:
+                    broken[alias_normalized] = f"seq {row.seq} != {expected_seq}"
+                elif row.previous_hash != previous_hash:
+                    broken[alias_normalized] = f"fork at seq {row.seq}"
+                elif row.current_hash != recomputed:
+                    broken[alias_normalized] = f"hash mismatch at seq {row.seq}"
+                if alias_normalized in broken:
+                    break
+                previous_hash = row.current_hash
+    return broken
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        deleted = (
+            await db.execute(
+                delete(AliasEventModel).where(AliasEventModel.tenant_id == BENCH_TENANT)
+            )
+        ).rowcount
+        await db.execute(
+            delete(AliasChainHeadModel).where(
+                AliasChainHeadModel.tenant_id == BENCH_TENANT
+            )
+        )
+        await db.commit()
+    print(f"Eventos de bench eliminados: {deleted}")
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--chains", type=int, default=1, help="Cadenas calientes")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--flush-ms", type=int, default=5)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        await cleanup()
+        return 0
+
+    aliases = chain_aliases(args.chains)
+    writer = BatchedChainEventWriter(
+        session_factory=AsyncSessionLocal,
+        chain_append_factory=lambda db: build_chain_append_service(
+            db, hash_chain_service
+        ),
+        durability="group_commit",
+        batch_size=args.batch_size,
+        flush_interval_ms=args.flush_ms,
+    )
+
+    async def group_append(alias_normalized: str) -> None:
+        await writer.submit(
+            BENCH_TENANT, alias_normalized, EEventType.RESOLVE, uuid.uuid4()
+        )
+
+    failed = False
+    print(f"{'mode':>7} {'req/s':>8} {'p50_ms':>8} {'p99_ms':>8} {'errors':>7} linear")
+    for mode, append in (("inline", inline_append), ("group", group_append)):
+        if mode == "group":
+            await writer.start()
+        result = await run_phase(append, aliases, args.requests, args.concurrency)
+        if mode == "group":
+            await writer.stop()
+            result["batches"] = writer.stats()["batches"]
+
+        broken = await verify_linear(aliases)
+        failed = failed or bool(broken)
+        print(
+            f"{mode:>7} {result['req_s']:>8} {result['p50_ms']:>8} "
+            f"{result['p99_ms']:>8} {result['errors']:>7} "
+            f"{'yes' if not broken else broken}"
+            + (f" batches={result['batches']}" if "batches" in result else "")
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,113 @@
+"""
+Micro-benchmark del coste de los providers de servicios de dominio por request
+
+Compara, por servicio, construirlo en cada request (comportamiento anterior)
+con la instancia compartida del proceso que devuelve el provider:
+
+- hash_chain: HashChainService
+- signature: DigitalSignatureService + get_public_key_pem (parseo del PEM)
+- merkle: MerkleTreeService
+- bank_routing: BankRoutingService con el catálogo leído e indexado
+- worm_request: dependencias de un request de evidencia WORM completo
+
+Sin WORM_PRIVATE_KEY usa una clave P-256 generada para la corrida.
+
+    python scripts/bench/dependency_overhead.py --requests 5000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from core.config import settings
+from core.dependencies.alias_event import get_hash_chain_service
+from core.dependencies.interop import get_bank_routing_service
+from core.dependencies.worm import (
+    get_digital_signature_service,
+    get_merkle_tree_service,
+)
+from domain.services import (
+    BankRoutingRegistry,
+    BankRoutingService,
+    DigitalSignatureService,
+    HashChainService,
+    MerkleTreeService,
+)
+from infrastructure.routing import FileBankRoutingSource
+
+
+def ensure_worm_key() -> None:
+    if settings.WORM_PRIVATE_KEY:
+        return
+    settings.WORM_PRIVATE_KEY = (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+def per_request_signature() -> None:
+    DigitalSignatureService(settings.WORM_PRIVATE_KEY).get_public_key_pem()
+
+
+def shared_signature() -> None:
+    get_digital_signature_service().get_public_key_pem()
+
+
+def per_request_bank_routing() -> None:
+    BankRoutingService(BankRoutingRegistry(FileBankRoutingSource().load()))
+
+
+def per_request_worm() -> None:
+    MerkleTreeService()
+    per_request_signature()
+
+
+def shared_worm() -> None:
+    get_merkle_tree_service()
+    shared_signature()
+
+
+def us_per_call(fn, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        fn()
+    return round((time.perf_counter() - started) / requests * 1e6, 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    ensure_worm_key()
+    cases = [
+        ("hash_chain", HashChainService, get_hash_chain_service),
+        ("signature", per_request_signature, shared_signature),
+        ("merkle", MerkleTreeService, get_merkle_tree_service),
+        ("bank_routing", per_request_bank_routing, get_bank_routing_service),
+        ("worm_request", per_request_worm, shared_worm),
+    ]
+
+    print(f"{'service':>13} {'per_request_us':>15} {'shared_us':>10} {'speedup':>8}")
+    for name, per_request, shared in cases:
+        shared()
+        before = us_per_call(per_request, args.requests)
+        after = us_per_call(shared, args.requests)
+        print(
+            f"{name:>13} {before:>15} {after:>10} "
+            f"{round(before / after) if after else '-':>8}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
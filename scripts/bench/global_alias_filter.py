@@ -0,0 +1,71 @@
+"""
+Tasa de falsos positivos y memoria del filtro de alias globales
+
+Carga --aliases alias sintéticos en un BloomFilter dimensionado como en la
+reconstrucción (capacidad = alias × 1.5) para cada tasa objetivo de
+--rates, y consulta otros --probes alias que no existen:
+
+- memory_mb / bits_alias: tamaño del bit array (total y por alias)
+- fp_measured / fp_estimated: falsos positivos observados vs fórmula
+- add_us / lookup_us: coste por alta y por consulta
+
+    python scripts/bench/global_alias_filter.py --aliases 1000000 --rates 0.01,0.001
+"""
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.config import settings
+from infrastructure.cache import BloomFilter
+
+
+def synthetic_aliases(count: int, prefix: str) -> list[str]:
+    return [f"{prefix}{uuid.uuid4().hex[:16]}" for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aliases", type=int, default=1_000_000)
+    parser.add_argument("--probes", type=int, default=1_000_000)
+    parser.add_argument(
+        "--rates", default=f"{settings.GLOBAL_ALIAS_FILTER_FALSE_POSITIVE_RATE},0.001"
+    )
+    parser.add_argument("--growth", type=float, default=1.5)
+    args = parser.parse_args()
+
+    present = synthetic_aliases(args.aliases, "a")
+    # Prefijo distinto: ningún probe puede estar cargado
+    absent = synthetic_aliases(args.probes, "z")
+
+    print(
+        f"{'target':>8} {'memory_mb':>10} {'bits_alias':>10} {'k':>3} "
+        f"{'fp_measured':>12} {'fp_estimated':>12} {'add_us':>7} {'lookup_us':>9}"
+    )
+    for rate in (float(value) for value in args.rates.split(",")):
+        bloom = BloomFilter(int(args.aliases * args.growth), rate)
+
+        started = time.perf_counter()
+        for alias in present:
+            bloom.add(alias)
+        add_us = (time.perf_counter() - started) / len(present) * 1e6
+
+        started = time.perf_counter()
+        false_positives = sum(1 for alias in absent if alias in bloom)
+        lookup_us = (time.perf_counter() - started) / len(absent) * 1e6
+
+        assert all(alias in bloom for alias in present[:10_000]), "false negative"
+        print(
+            f"{rate:>8} {bloom.memory_bytes / 1_048_576:>10.2f} "
+            f"{bloom.bit_count / args.aliases:>10.2f} {bloom.hash_count:>3} "
+            f"{false_positives / len(absent):>12.5f} "
+            f"{bloom.estimated_false_positive_rate():>12.5f} "
+            f"{add_us:>7.2f} {lookup_us:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
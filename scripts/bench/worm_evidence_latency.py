@@ -0,0 +1,184 @@
+"""
+Benchmark de latencia de evidencia WORM vs tamaño de alias_events
+
+Completa alias_events con eventos sintéticos (tenant propio, repartidos en
+--days días) hasta cada tamaño de --sizes y, para un día intermedio, mide:
+
+- cast_ms: filtro anterior cast(timestamp, Date) = día (sin índice ni pruning)
+- range_ms: rango [inicio, fin) de get_events_by_date
+- partitions: particiones que recorre el plan del rango (pruning)
+- seal_ms / evidence_ms: sellado del día y lectura del sello (con --seal)
+
+    python scripts/bench/worm_evidence_latency.py --sizes 100000,1000000,5000000
+    python scripts/bench/worm_evidence_latency.py --cleanup
+"""
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from datetime import time as dt_time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import text
+
+from application.use_cases import GenerateWormEvidenceUseCase, SealWormDayUseCase
+from core.config import settings
+from core.database import SessionLocal, engine
+from core.dependencies.worm import (
+    get_digital_signature_service,
+    get_merkle_tree_service,
+)
+from infrastructure.database.alias_event_partitions import AliasEventPartitionManager
+from infrastructure.database.repositories import (
+    AliasEventRepository,
+    WormSealRepository,
+)
+
+BENCH_TENANT = uuid.UUID("00000000-0000-0000-0000-00000000be7c")
+
+
+def bench_count(conn) -> int:
+    return conn.execute(
+        text("SELECT COUNT(*) FROM alias_events WHERE tenant_id = :tenant"),
+        {"tenant": BENCH_TENANT},
+    ).scalar()
+
+
+def top_up(target: int, first_day: date, days: int) -> None:
+    """Inserta eventos server-side hasta que el tenant de bench tenga target"""
+    with engine.begin() as conn:
+        current = bench_count(conn)
+        if current >= target:
+            return
+        conn.execute(
+            text(
+                """
+                INSERT INTO alias_events (
+                    id, alias_normalized, tenant_id, seq, event_type,
+                    correlation_id, previous_hash, current_hash, "timestamp",
+                    created_at
+                )
+                SELECT
+                    gen_random_uuid(), 'bench' || g, :tenant, 1, 'RESOLVE',
+                    gen_random_uuid(), repeat('0', 64), md5(g::text) || md5(g::text),
+                    :start + (g % :days) * interval '1 day'
+                           + (g % 86400) * interval '1 second',
+                    now()
+                FROM generate_series(:first, :last) AS g
+                """
+            ),
+            {
+                "tenant": BENCH_TENANT,
+                "start": datetime.combine(first_day, dt_time.min, tzinfo=timezone.utc),
+                "days": days,
+                "first": current + 1,
+                "last": target,
+            },
+        )
+
+
+def timed_ms(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def measure(day: date, with_seal: bool) -> dict:
+    day_start = datetime.combine(day, dt_time.min, tzinfo=timezone.utc)
+    params = {"start": day_start, "end": day_start + timedelta(days=1), "day": day}
+    result = {}
+
+    with engine.connect() as conn:
+        result["cast_ms"] = timed_ms(
+            lambda: conn.execute(
+                text(
+                    'SELECT COUNT(*) FROM alias_events WHERE CAST("timestamp" AS date) = :day'
+                ),
+                params,
+            ).scalar()
+        )
+        plan = conn.execute(
+            text(
+                "EXPLAIN (FORMAT JSON) SELECT * FROM alias_events "
+                'WHERE "timestamp" >= :start AND "timestamp" < :end'
+            ),
+            params,
+        ).scalar()
+        result["partitions"] = json.dumps(plan).count('"Relation Name"')
+
+    db = SessionLocal()
+    try:
+        repository = AliasEventRepository(db)
+        events = []
+        result["range_ms"] = timed_ms(
+            lambda: events.extend(repository.get_events_by_date(day))
+        )
+        result["day_events"] = len(events)
+
+        if with_seal:
+            repo = WormSealRepository(db)
+            signer = get_digital_signature_service()
+            sealer = SealWormDayUseCase(repo, get_merkle_tree_service(), signer)
+            result["seal_ms"] = timed_ms(lambda: sealer.execute(day))
+            evidence = GenerateWormEvidenceUseCase(repo, sealer, signer)
+            result["evidence_ms"] = timed_ms(lambda: evidence.execute(day))
+    finally:
+        db.close()
+
+    return result
+
+
+def cleanup() -> None:
+    with engine.begin() as conn:
+        deleted = conn.execute(
+            text("DELETE FROM alias_events WHERE tenant_id = :tenant"),
+            {"tenant": BENCH_TENANT},
+        ).rowcount
+    print(f"Eventos de bench eliminados: {deleted}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--seal", action="store_true", help="Medir sello WORM")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=args.days + 1)
+    # Con --seal cada tamaño usa un día distinto: un día sellado no cambia
+    measured_days = [first_day + timedelta(days=args.days // 2 + i) for i in range(8)]
+
+    months = (today.year - first_day.year) * 12 + today.month - first_day.month
+    AliasEventPartitionManager(engine).ensure_partitions(
+        months + settings.ALIAS_EVENTS_PARTITION_MONTHS_AHEAD, from_month=first_day
+    )
+
+    print(f"{'size':>10} {'cast_ms':>9} {'range_ms':>9} {'parts':>6} extra")
+    for i, size in enumerate(int(value) for value in args.sizes.split(",")):
+        top_up(size, first_day, args.days)
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE alias_events"))
+        result = measure(measured_days[i % len(measured_days)], args.seal)
+        extra = {
+            key: result[key]
+            for key in ("day_events", "seal_ms", "evidence_ms")
+            if key in result
+        }
+        print(
+            f"{size:>10} {result['cast_ms']:>9} {result['range_ms']:>9} "
+            f"{result['partitions']:>6} {extra}"
+        )
+
+
+if __name__ == "__main__":
+    main()
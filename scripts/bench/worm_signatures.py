@@ -0,0 +1,102 @@
+"""
+Firma y verificación en lote de sellos WORM: proceso actual vs pool
+
+Genera --periods días × --tenants tenants de sellos sintéticos (texto
+firmado igual que SealWormDayUseCase) y mide:
+
+- serial: DigitalSignatureService.sign_many / verify_many en el proceso
+- pool: ProcessPoolSignatureService con --workers procesos (incluye el
+  arranque del pool en la primera llamada)
+
+Sin WORM_PRIVATE_KEY usa una clave P-256 generada para la corrida.
+
+    python scripts/bench/worm_signatures.py --periods 30 --tenants 1000 --workers 8
+"""
+import argparse
+import hashlib
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from application.use_cases.alias.seal_worm_day import worm_signature_payload
+from core.config import settings
+from domain.services import DigitalSignatureService
+from infrastructure.jobs import ProcessPoolSignatureService
+
+
+def worm_key() -> str:
+    if settings.WORM_PRIVATE_KEY:
+        return settings.WORM_PRIVATE_KEY
+    return (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+def synthetic_payloads(periods: int, tenants: int) -> list[str]:
+    first_day = date.today() - timedelta(days=periods)
+    return [
+        worm_signature_payload(
+            first_day + timedelta(days=day),
+            hashlib.sha256(f"{day}:{tenant}".encode()).hexdigest(),
+            hashlib.sha256(f"tenant{tenant}".encode()).hexdigest()[:16],
+        )
+        for day in range(periods)
+        for tenant in range(tenants)
+    ]
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, round(time.perf_counter() - started, 3)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--periods", type=int, default=30)
+    parser.add_argument("--tenants", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    private_key_pem = worm_key()
+    payloads = synthetic_payloads(args.periods, args.tenants)
+    serial = DigitalSignatureService(private_key_pem)
+    pool = ProcessPoolSignatureService(
+        private_key_pem, workers=args.workers, min_parallel_items=1
+    )
+
+    print(f"seals={len(payloads)} workers={pool.workers}")
+    print(f"{'mode':>7} {'sign_s':>8} {'verify_s':>9} {'verify/s':>9} all_valid")
+    failed = False
+    try:
+        for mode, signer in (("serial", serial), ("pool", pool)):
+            signatures, sign_s = timed(lambda s=signer: s.sign_many(payloads))
+            valid, verify_s = timed(
+                lambda s=signer, sigs=signatures: s.verify_many(
+                    list(zip(payloads, sigs))
+                )
+            )
+            failed = failed or not all(valid)
+            print(
+                f"{mode:>7} {sign_s:>8} {verify_s:>9} "
+                f"{round(len(payloads) / verify_s):>9} {all(valid)}"
+            )
+    finally:
+        pool.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Mantenimiento de particiones mensuales de alias_events
+
+Uso:
+    python scripts/db/partitions.py --list
+    python scripts/db/partitions.py --ensure 6
+    python scripts/db/partitions.py --archive-before 2026-01-01 --archive-schema archive
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.database import engine
+from infrastructure.database.alias_event_partitions import AliasEventPartitionManager
+
+if __name__ == "__main__":
+    import argparse
+    from datetime import date
+
+    parser = argparse.ArgumentParser(description="Particiones de alias_events")
+    parser.add_argument("--list", action="store_true", help="Listar particiones")
+    parser.add_argument(
+        "--ensure", type=int, metavar="MESES", help="Crear meses futuros"
+    )
+    parser.add_argument(
+        "--archive-before",
+        type=date.fromisoformat,
+        help="Desacoplar y archivar meses anteriores a esta fecha",
+    )
+    parser.add_argument("--archive-schema", default="archive")
+    parser.add_argument(
+        "--no-concurrently",
+        action="store_true",
+        help="DETACH sin CONCURRENTLY (Postgres < 14)",
+    )
+
+    args = parser.parse_args()
+    manager = AliasEventPartitionManager(engine)
+
+    if args.ensure is not None:
+        print(f"Creadas: {manager.ensure_partitions(args.ensure)}")
+    if args.archive_before:
+        archived = manager.archive_before(
+            args.archive_before, args.archive_schema, not args.no_concurrently
+        )
+        print(f"Archivadas en {args.archive_schema}: {archived}")
+    if args.list:
+        for name, month in manager.list_partitions():
+            print(f"{name}\t{month:%Y-%m}")
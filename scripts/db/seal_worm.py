@@ -0,0 +1,76 @@
+"""
+Sellado WORM manual (recuperación de días sin sellar o backfill)
+
+Uso:
+    python scripts/db/seal_worm.py --date 2026-10-17
+    python scripts/db/seal_worm.py --from 2026-09-01 --to 2026-09-30
+    python scripts/db/seal_worm.py --append-leaves
+    python scripts/db/seal_worm.py --check-late --from 2026-10-01 --to 2026-10-17
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from application.use_cases import SealWormDayUseCase
+from core.database import SessionLocal
+from core.dependencies.worm import (
+    get_digital_signature_service,
+    get_merkle_tree_service,
+)
+from infrastructure.database.repositories import WormSealRepository
+
+
+def build_use_case(db, signer) -> SealWormDayUseCase:
+    return SealWormDayUseCase(WormSealRepository(db), get_merkle_tree_service(), signer)
+
+
+if __name__ == "__main__":
+    import argparse
+    from datetime import date, timedelta
+
+    parser = argparse.ArgumentParser(description="Sellado WORM diario")
+    parser.add_argument("--date", type=date.fromisoformat, help="Día UTC a sellar")
+    parser.add_argument(
+        "--from", dest="start", type=date.fromisoformat, help="Backfill: primer día"
+    )
+    parser.add_argument(
+        "--to", dest="end", type=date.fromisoformat, help="Backfill: último día"
+    )
+    parser.add_argument(
+        "--append-leaves", action="store_true", help="Agregar hojas del día en curso"
+    )
+    parser.add_argument(
+        "--check-late",
+        action="store_true",
+        help="Solo contar eventos sin hoja en días ya sellados (--date o --from/--to)",
+    )
+
+    args = parser.parse_args()
+
+    signer = get_digital_signature_service()
+    db = SessionLocal()
+    try:
+        use_case = build_use_case(db, signer)
+        if args.check_late:
+            day = args.date or args.start
+            last = args.date or args.end or args.start
+            while day and day <= last:
+                print(f"{day} eventos sin hoja: {use_case.check_late_events(day)}")
+                day += timedelta(days=1)
+        else:
+            if args.append_leaves:
+                print(f"Hojas agregadas: {use_case.append_leaves()}")
+            if args.date:
+                seal = use_case.execute(args.date)
+                print(
+                    f"{seal.seal_date} root={seal.root_hash} tenants={seal.leaf_count}"
+                )
+            if args.start:
+                for seal in use_case.execute_range(args.start, args.end or args.start):
+                    print(
+                        f"{seal.seal_date} root={seal.root_hash} tenants={seal.leaf_count}"
+                    )
+    finally:
+        db.close()
+        signer.shutdown()
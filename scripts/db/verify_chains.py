@@ -0,0 +1,71 @@
+"""
+Job de verificación masiva de cadenas de hashes (todas o por tenant)
+
+Uso:
+    python scripts/db/verify_chains.py
+    python scripts/db/verify_chains.py --tenant <uuid> --workers 8 --output reporte.json
+    python scripts/db/verify_chains.py --run-queued   # jobs encolados por la API
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from application.use_cases import VerifyAllChainsUseCase
+from core.database import SessionLocal
+from core.dependencies.alias_event import build_chain_verification_jobs_use_case
+from infrastructure.jobs import ProcessPoolChainBatchVerifier
+
+
+def verify_chains(tenant_id=None, workers=None, output=None):
+    """Verificar cadenas y escribir el reporte JSON"""
+    use_case = VerifyAllChainsUseCase(ProcessPoolChainBatchVerifier(SessionLocal))
+    return use_case.execute(tenant_id=tenant_id, workers=workers, output=output)
+
+
+def run_queued_jobs():
+    """Ejecutar los jobs de POST /regulatory/verify-chains hasta vaciar la cola"""
+    db = SessionLocal()
+    try:
+        use_case = build_chain_verification_jobs_use_case(db)
+        job_ids = []
+        while job_id := use_case.run_next():
+            job_ids.append(job_id)
+        return job_ids
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    from uuid import UUID
+
+    parser = argparse.ArgumentParser(description="Verificación masiva de cadenas")
+    parser.add_argument("--tenant", type=UUID, help="Verificar solo un tenant")
+    parser.add_argument("--workers", type=int, help="Procesos (default: CPUs)")
+    parser.add_argument("--output", help="Ruta del reporte JSON")
+    parser.add_argument(
+        "--run-queued",
+        action="store_true",
+        help="Ejecutar los jobs encolados por la API (reporte en la base)",
+    )
+
+    args = parser.parse_args()
+
+    if args.run_queued:
+        for job_id in run_queued_jobs():
+            print(f"Job {job_id} ejecutado")
+        sys.exit(0)
+
+    report = verify_chains(args.tenant, args.workers, args.output)
+    print(
+        f"{report.total_chains} cadenas / {report.total_events} eventos en "
+        f"{report.duration_seconds:.1f}s ({report.events_per_second:,.0f} ev/s) "
+        f"con {report.workers} procesos"
+    )
+    print(f"Cadenas rotas: {report.broken_count}")
+    for broken in report.broken_chains:
+        print(f"  {broken.tenant_id} {broken.alias_normalized} seq={broken.break_seq}")
+    print(f"Reporte: {report.report_path}")
+
+    sys.exit(1 if report.broken_count else 0)
@@ -0,0 +1,19 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.database import engine
+
+
+@pytest.fixture(scope="session")
+def postgres():
+    """
+    Base de datos de settings (DATABASE_URL o DB_*) migrada con alembic; sin
+    ella los tests de integración se saltan
+    """
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1 FROM alias_chain_heads LIMIT 1"))
+    except SQLAlchemyError as e:
+        pytest.skip(f"Postgres no disponible o sin migrar: {e.__class__.__name__}")
+    return engine
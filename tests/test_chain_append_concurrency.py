@@ -0,0 +1,108 @@
+"""
+Appends concurrentes sobre una misma cadena (requiere Postgres migrado)
+
+Mezcla appends simples (ChainAppendService.append con un commit por request)
+con RESOLVE e INTEROP_RESOLVE en group commit de dos escritores, como dos
+workers, sobre una cadena que todavía no tiene cabeza: todos compiten por
+crearla y después por avanzarla.
+"""
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from core.database import AsyncSessionLocal, SessionLocal, async_engine
+from core.dependencies.alias_event import build_chain_append_service
+from domain.entities import GENESIS_HASH
+from domain.services import HashChainService
+from infrastructure.database.models import AliasChainHeadModel, AliasEventModel
+from infrastructure.database.repositories import AliasEventRepository
+from infrastructure.jobs import BatchedChainEventWriter
+from utils import EEventType
+
+INLINE_APPENDS = 40
+BATCHED_APPENDS = 80
+
+hash_chain_service = HashChainService()
+
+
+@pytest.fixture
+def tenant_id(postgres):
+    tenant_id = uuid.uuid4()
+    yield tenant_id
+    with SessionLocal() as db:
+        db.execute(
+            delete(AliasEventModel).where(AliasEventModel.tenant_id == tenant_id)
+        )
+        db.execute(
+            delete(AliasChainHeadModel).where(
+                AliasChainHeadModel.tenant_id == tenant_id
+            )
+        )
+        db.commit()
+
+
+def _writer() -> BatchedChainEventWriter:
+    return BatchedChainEventWriter(
+        session_factory=AsyncSessionLocal,
+        chain_append_factory=lambda db: build_chain_append_service(
+            db, hash_chain_service
+        ),
+        durability="group_commit",
+        batch_size=16,
+        flush_interval_ms=2,
+    )
+
+
+async def _append_concurrently(tenant_id: uuid.UUID, alias_normalized: str) -> None:
+    async def inline_append() -> None:
+        async with AsyncSessionLocal() as db:
+            await build_chain_append_service(db, hash_chain_service).append(
+                tenant_id, alias_normalized, EEventType.REGISTER, uuid.uuid4()
+            )
+            await db.commit()
+
+    writers = [_writer(), _writer()]
+    for writer in writers:
+        await writer.start()
+    try:
+        appends = [inline_append() for _ in range(INLINE_APPENDS)] + [
+            writers[index % 2].submit(
+                tenant_id,
+                alias_normalized,
+                EEventType.RESOLVE if index % 2 else EEventType.INTEROP_RESOLVE,
+                uuid.uuid4(),
+            )
+            for index in range(BATCHED_APPENDS)
+        ]
+        await asyncio.gather(*appends)
+    finally:
+        for writer in writers:
+            await writer.stop()
+        # El pool async queda atado a este event loop
+        await async_engine.dispose()
+
+
+def test_concurrent_appends_keep_chain_linear(tenant_id):
+    alias_normalized = "concurrentchain"
+    asyncio.run(_append_concurrently(tenant_id, alias_normalized))
+
+    with SessionLocal() as db:
+        events = list(
+            AliasEventRepository(db).iter_events_for_alias(alias_normalized, tenant_id)
+        )
+        result = hash_chain_service.verify_chain_stream(
+            AliasEventRepository(db).iter_events_for_alias(alias_normalized, tenant_id)
+        )
+
+    total = INLINE_APPENDS + BATCHED_APPENDS
+    assert [event.seq for event in events] == list(range(1, total + 1))
+    assert len({event.previous_hash for event in events}) == total
+    assert events[0].previous_hash == GENESIS_HASH
+    assert all(
+        event.previous_hash == previous.current_hash
+        for previous, event in zip(events, events[1:])
+    )
+    assert result.is_valid
+    assert result.verified_events == total
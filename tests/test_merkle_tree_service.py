@@ -0,0 +1,115 @@
+"""
+Formato del árbol de Merkle de los sellos WORM: raíces y pruebas de
+inclusión que recorren los mismos caminos que el sellado, el export y
+GetWormInclusionProofUseCase (sin base de datos)
+"""
+import hashlib
+
+import pytest
+
+from domain.entities import MerkleProofStep
+from domain.services import MerkleTreeService
+from domain.services.merkle_tree_service import EMPTY_ROOT
+
+merkle = MerkleTreeService()
+
+SIZES = [1, 2, 3, 4, 5, 7, 8, 9, 16, 17, 33]
+
+
+def _leaves(count: int) -> list[str]:
+    return [
+        merkle.event_leaf(f"event-{index}", f"hash-{index}") for index in range(count)
+    ]
+
+
+def test_rfc6962_prefixes_and_odd_node_promotion():
+    a, b, c = (merkle.leaf_hash(data) for data in "abc")
+    assert a == hashlib.sha256(b"\x00a").hexdigest()
+
+    ab = hashlib.sha256(b"\x01" + bytes.fromhex(a) + bytes.fromhex(b)).hexdigest()
+    # c sube sin re-hashear y se combina en el nivel siguiente
+    expected = hashlib.sha256(
+        b"\x01" + bytes.fromhex(ab) + bytes.fromhex(c)
+    ).hexdigest()
+    assert merkle.root([a, b, c]) == expected
+    assert (
+        expected == "36642e73c2540ab121e3a6bf9545b0a24982cd830eb13d3cd19de3ce6c021ec1"
+    )
+
+
+def test_empty_root():
+    assert merkle.root([]) == EMPTY_ROOT
+    assert merkle.frontier_root([]) == EMPTY_ROOT
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_streaming_and_block_roots_match_root(count):
+    leaves = _leaves(count)
+    frontier: list[tuple[int, str]] = []
+    for leaf in leaves:
+        merkle.push_leaf(frontier, leaf)
+
+    assert merkle.frontier_root(frontier) == merkle.root(leaves)
+    for block_level in range(4):
+        block_roots = merkle.block_roots(iter(leaves), block_level)
+        assert merkle.build_levels(block_roots)[-1][0] == merkle.root(leaves)
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_inclusion_proof_round_trip(count):
+    leaves = _leaves(count)
+    levels = merkle.build_levels(leaves)
+    root = levels[-1][0]
+
+    for index, leaf in enumerate(leaves):
+        proof = merkle.proof(levels, index)
+        assert merkle.verify_proof(leaf, proof, root)
+        assert not merkle.verify_proof(merkle.leaf_hash("tampered"), proof, root)
+        if proof:
+            flipped = [
+                MerkleProofStep(
+                    position="right" if step.position == "left" else "left",
+                    hash=step.hash,
+                )
+                for step in proof
+            ]
+            assert not merkle.verify_proof(leaf, flipped, root)
+
+
+@pytest.mark.parametrize("count", SIZES)
+@pytest.mark.parametrize("stored_level", [0, 1, 2, 3])
+def test_block_proof_with_stored_nodes_round_trip(count, stored_level):
+    """Prueba dentro del bloque + hermanos persistidos desde stored_level"""
+    leaves = _leaves(count)
+    root = merkle.root(leaves)
+    block_roots = merkle.block_roots(iter(leaves), stored_level)
+    stored = {
+        (stored_level + height, index): node_hash
+        for height, level in enumerate(merkle.build_levels(block_roots))
+        for index, node_hash in enumerate(level)
+    }
+
+    for index, leaf in enumerate(leaves):
+        block = index >> stored_level
+        start = block << stored_level
+        block_leaves = leaves[start : start + (1 << stored_level)]
+        steps = merkle.proof(merkle.build_levels(block_leaves), index - start)
+        steps.extend(
+            MerkleProofStep(position=position, hash=stored[(level, node_index)])
+            for level, node_index, position in merkle.sibling_path(
+                count, stored_level, block
+            )
+        )
+        assert merkle.verify_proof(leaf, steps, root)
+
+
+def test_global_proof_over_tenant_roots():
+    tenant_roots = [
+        ("hash-b", merkle.root(_leaves(3))),
+        ("hash-a", merkle.root(_leaves(5))),
+    ]
+    global_leaves = [merkle.tenant_leaf(*item) for item in sorted(tenant_roots)]
+    levels = merkle.build_levels(global_leaves)
+
+    for index, leaf in enumerate(global_leaves):
+        assert merkle.verify_proof(leaf, merkle.proof(levels, index), levels[-1][0])
@@ -2,7 +2,9 @@ from .messages import MESSAGES
 from .value_objects import (
     AliasStatus,
     EAccountType,
+    EBulkItemStatus,
     EEventType,
+    EJobStatus,
     EQueryType,
     TenantRole,
     TenantStatus,
@@ -18,4 +20,6 @@ __all__ = [
     "TenantType",
     "EAccountType",
     "EQueryType",
+    "EBulkItemStatus",
+    "EJobStatus",
 ]
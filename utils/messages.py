@@ -42,6 +42,16 @@ class ErrorMessages:
         WORM_PRIVATE_KEY_INVALID = MessageCode("EV024")
         TENANT_NOT_FOUND = MessageCode("EV025")
         INVALID_ROUTING_CODE = MessageCode("EV026")
+        BULK_PAYLOAD_INVALID = MessageCode("EV027")
+        BULK_TOO_MANY_ITEMS = MessageCode("EV028")
+        CHAIN_HEAD_CONFLICT = MessageCode("EV029")
+        WORM_DAY_NOT_SEALED = MessageCode("EV030")
+        WORM_EVENT_NOT_SEALED = MessageCode("EV031")
+        JWT_SIGNING_KEY_NOT_CONFIGURED = MessageCode("EV032")
+        API_KEY_NOT_FOUND = MessageCode("EV033")
+        BANK_ROUTING_CATALOG_INVALID = MessageCode("EV034")
+        ALIAS_INVALID_CHARACTERS = MessageCode("EV035")
+        CHAIN_VERIFICATION_JOB_NOT_FOUND = MessageCode("EV036")
 
     class AUTH:
         UNAUTHORIZED = MessageCode("EA001")
@@ -59,6 +69,7 @@ class ErrorMessages:
         REGULATOR_ROLE_REQUIRED = MessageCode("EA013")
         CUB_PEPPER_NOT_SET = MessageCode("EA014")
         ALIAS_NOT_OWNED = MessageCode("EA015")
+        ADMIN_ROLE_REQUIRED = MessageCode("EA016")
 
 
 class MESSAGES:
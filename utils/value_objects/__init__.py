@@ -1,7 +1,9 @@
 from .enums import (
     AliasStatus,
     EAccountType,
+    EBulkItemStatus,
     EEventType,
+    EJobStatus,
     EQueryType,
     TenantRole,
     TenantStatus,
@@ -16,4 +18,6 @@ __all__ = [
     "TenantStatus",
     "TenantType",
     "EQueryType",
+    "EBulkItemStatus",
+    "EJobStatus",
 ]
@@ -40,6 +40,23 @@ class EAccountType(str, enum.Enum):
     CTA_PLATINUM = "CTA_PLATINUM"
 
 
+class EBulkItemStatus(str, enum.Enum):
+    """Resultado por ítem de una carga masiva"""
+
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+class EJobStatus(str, enum.Enum):
+    """Estado de un job en segundo plano encolado por la API"""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 class EQueryType(str, enum.Enum):
     """Tipos de consultas de interoperabilidad"""
 